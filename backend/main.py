@@ -130,13 +130,25 @@ def scrape(
                     console.print(f"  ✅ {src['name']}: {src['found']} jobs found")
             
             console.print(f"\n[green]Total: {stats['total_found']} found, {stats['total_new']} new[/green]")
+            stages = await aggregator.wait_for_stages()
+            if stages.get("enrichment", {}).get("enriched"):
+                console.print(f"[dim]Resolved platform for {stages['enrichment']['enriched']} new jobs[/dim]")
+            if stages.get("digest", {}).get("digested"):
+                console.print(f"[dim]Digested {stages['digest']['digested']} new jobs[/dim]")
             if stats["duplicates_removed"] > 0:
                 console.print(f"[dim]Removed {stats['duplicates_removed']} duplicates[/dim]")
             
             return result
     
+    async def run_scrape_and_close():
+        from src.utils.browser import close_browser_pool
+        try:
+            return await run_scrape()
+        finally:
+            await close_browser_pool()
+    
     try:
-        asyncio.run(run_scrape())
+        asyncio.run(run_scrape_and_close())
     except Exception as e:
         console.print(f"[red]Scraping error: {e}[/red]")
 
@@ -171,6 +183,7 @@ def apply(
     no_scrape: bool = typer.Option(False, "--no-scrape"),
     greenhouse_only: bool = typer.Option(False, "--greenhouse-only", "-g", help="Only apply to Greenhouse jobs"),
     visible: bool = typer.Option(True, "--visible/--headless", "-v/-h", help="Show browser window"),
+    workers: Optional[int] = typer.Option(None, "--workers", "-w", help="Concurrent application workers"),
 ):
     mode = "[DRY RUN] " if dry_run else ""
     console.print(f"\n📝 {mode}[bold blue]AutoApplier Starting...[/bold blue]\n")
@@ -195,6 +208,7 @@ def apply(
                 scrape_first=not no_scrape,
                 dry_run=dry_run,
                 filter_type=filter_type,
+                workers=workers,
             )
             return stats
         except Exception as e:
@@ -328,6 +342,61 @@ def jobs(
     console.print(table)
 
 
+@app.command()
+def prioritize(
+    limit: int = typer.Option(20, "--limit", "-l"),
+    rescore: bool = typer.Option(False, "--rescore", help="Recompute every pending job's priority first (after changing settings or the profile)"),
+    ats: Optional[str] = typer.Option(None, "--ats", "-a", help="Only this application type (and undetected jobs)"),
+):
+    from src.classifiers.priority import priority_factors
+    from src.core.job import ApplicationType
+    
+    db = get_db()
+    console.print("\n🏁 [bold blue]Pending Jobs by Priority[/bold blue]\n")
+    
+    if rescore:
+        console.print(f"[green]✅ Rescored {db.rescore_pending_jobs()} pending jobs[/green]\n")
+    
+    try:
+        application_type = ApplicationType(ats) if ats else None
+    except ValueError:
+        console.print(f"[red]Invalid application type: {ats}[/red]")
+        return
+    
+    jobs_list = db.get_pending_jobs(limit, application_type)
+    if not jobs_list:
+        console.print("[yellow]No pending jobs[/yellow]")
+        return
+    
+    table = Table()
+    table.add_column("Priority", style="bold")
+    table.add_column("Title", style="cyan")
+    table.add_column("Company", style="green")
+    table.add_column("Type", style="magenta")
+    table.add_column("Posted", style="dim")
+    table.add_column("Match", style="yellow")
+    table.add_column("Ease", style="yellow")
+    table.add_column("Sponsor", style="yellow")
+    table.add_column("Retry", style="yellow")
+    
+    for job in jobs_list:
+        factors = priority_factors(job, db.get_retry_count(job.id))
+        posted = job.posted_date or job.discovered_at
+        table.add_row(
+            f"{job.priority:.2f}" if job.priority is not None else "—",
+            job.title[:40],
+            job.company[:20],
+            job.application_type,
+            posted.strftime("%Y-%m-%d") if posted else "—",
+            f"{factors['match']:.2f}",
+            f"{factors['ease']:.2f}",
+            f"{factors['sponsor']:.2f}",
+            f"{factors['retry']:.2f}",
+        )
+    
+    console.print(table)
+
+
 @app.command()
 def config():
     settings = get_settings()
@@ -355,6 +424,30 @@ def version():
     console.print(f"\n🚀 AutoApplier v{__version__}\n")
 
 
+@app.command(name="profile-context")
+def profile_context():
+    from src.core.profile_snapshot import estimate_tokens, load_profile
+    
+    profile_path = Path("data/profile.json")
+    if not profile_path.exists():
+        console.print("[red]❌ Profile not found![/red]")
+        return
+    
+    profile = load_profile(profile_path)
+    stats = profile.get_stats()
+    full_tokens = estimate_tokens(profile.applicant.get_full_context())
+    
+    table = Table(title=f"Prompt Contexts (built in {stats['build_ms']:.1f}ms)")
+    table.add_column("Variant", style="cyan")
+    table.add_column("Tokens", style="yellow")
+    table.add_column("Budget", style="green")
+    table.add_column("vs Full Profile", style="magenta")
+    for name, tokens in stats["tokens"].items():
+        table.add_row(name, str(tokens), str(stats["budgets"][name]), f"{tokens / full_tokens * 100:.0f}%")
+    table.add_row("full profile JSON", str(full_tokens), "-", "100%")
+    console.print(table)
+
+
 @app.command(name="llm-usage")
 def llm_usage():
     console.print("\n📊 [bold blue]LLM Usage Statistics[/bold blue]\n")
@@ -381,6 +474,48 @@ def llm_usage():
         
         console.print(table)
         
+        cache = stats["cache"]["stored"]
+        lookups = cache["hits"] + cache["misses"]
+        cache_table = Table(title="Response Cache (7 days)")
+        cache_table.add_column("Hits", style="green")
+        cache_table.add_column("Misses", style="yellow")
+        cache_table.add_column("Hit Rate", style="magenta")
+        cache_table.add_column("Bypassed", style="dim")
+        cache_table.add_column("Entries", style="cyan")
+        cache_table.add_row(
+            f"{cache['hits']:,}", f"{cache['misses']:,}", f"{cache['hits'] / lookups * 100 if lookups else 0:.1f}%",
+            f"{cache['bypassed']:,}", f"{cache['entries']:,}",
+        )
+        console.print(cache_table)
+        
+        if stats["daily"]:
+            days: dict[str, list[int]] = {}
+            sites: dict[str, list[int]] = {}
+            for row in stats["daily"]:
+                for key, totals in ((row["day"], days), (row["call_site"], sites)):
+                    counts = totals.setdefault(key, [0, 0, 0])
+                    counts[0] += row["requests"]
+                    counts[1] += row["input_tokens"]
+                    counts[2] += row["output_tokens"]
+            
+            for title, first, totals in (("Last 7 Days", "Day", days), ("By Call Site (7 days)", "Call Site", sites)):
+                usage_table = Table(title=title)
+                usage_table.add_column(first, style="cyan")
+                usage_table.add_column("Requests", style="yellow")
+                usage_table.add_column("Input Tokens", style="green")
+                usage_table.add_column("Output Tokens", style="magenta")
+                for key, (requests, input_tokens, output_tokens) in totals.items():
+                    usage_table.add_row(key, str(requests), f"{input_tokens:,}", f"{output_tokens:,}")
+                console.print(usage_table)
+            
+            month_table = Table(title="Monthly Tokens")
+            month_table.add_column("Month", style="cyan")
+            month_table.add_column("Requests", style="yellow")
+            month_table.add_column("Tokens", style="green")
+            for row in stats["monthly"]:
+                month_table.add_row(row["month"], str(row["requests"]), f"{row['input_tokens'] + row['output_tokens']:,}")
+            console.print(month_table)
+        
         daily_pct = stats["daily_requests"] / stats["daily_limit"] * 100
         monthly_pct = stats["monthly_tokens"] / stats["monthly_limit"] * 100
         
@@ -408,10 +543,12 @@ def test_llm():
         client = GeminiClient()
         
         console.print("Sending test query...")
-        response = client.generate(
+        response = client.generate_blocking(
             "Reply with exactly: 'AutoApplier LLM connection successful!'",
             max_tokens=50,
-            temperature=0.0
+            temperature=0.0,
+            cache=False,
+            call_site="test_llm",
         )
         
         if response:
@@ -533,6 +670,119 @@ def job_stats():
             console.print(source_table)
 
 
+@app.command()
+def trace(
+    application_id: Optional[str] = typer.Argument(None, help="Export only this application's trace"),
+    limit: int = typer.Option(20, "--limit", "-l", help="Export the last N traced applications"),
+    output: Path = typer.Option(Path("data/apply-trace.json"), "--output", "-o"),
+    days: int = typer.Option(7, "--days", "-d", help="Window for the p50/p95 breakdown"),
+):
+    console.print("\n⏱️ [bold blue]Apply Step Timings[/bold blue]\n")
+    
+    import json
+    from src.utils.tracing import chrome_trace, span_breakdown
+    
+    db = get_db()
+    breakdown = span_breakdown(days=days)
+    if not breakdown:
+        console.print("[yellow]No traced applications yet[/yellow]")
+        return
+    
+    for ats, steps in breakdown.items():
+        table = Table(title=f"{ats} ({steps[0]['count']} applications)")
+        table.add_column("Step", style="cyan")
+        table.add_column("Count", style="dim")
+        table.add_column("p50", style="green")
+        table.add_column("p95", style="yellow")
+        for step in steps:
+            table.add_row(step["name"], str(step["count"]), f"{step['p50_ms'] / 1000:.2f}s", f"{step['p95_ms'] / 1000:.2f}s")
+        console.print(table)
+    
+    trace_ids = [application_id] if application_id else db.get_recent_trace_ids(limit)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(chrome_trace(db.get_trace_spans(trace_ids=trace_ids))))
+    console.print(f"\n[green]✅ Wrote {len(trace_ids)} application trace(s) to [bold]{output}[/bold][/green] "
+                  f"(open in chrome://tracing or ui.perfetto.dev)")
+
+
+@app.command()
+def enrich(
+    limit: int = typer.Option(500, "--limit", "-l"),
+):
+    console.print("\n🧭 [bold blue]Enriching pending jobs...[/bold blue]\n")
+    
+    from src.classifiers.enricher import JobEnricher
+    
+    try:
+        result = asyncio.run(JobEnricher().enrich_pending(limit))
+    except Exception as e:
+        console.print(f"[red]Enrichment error: {e}[/red]")
+        return
+    
+    console.print(f"[green]✅ Enriched {result['enriched']} jobs[/green] "
+                  f"({result['resolved']} apply URLs resolved, {result['low_confidence']} left to browser detection)")
+
+
+@app.command()
+def digest(
+    limit: int = typer.Option(500, "--limit", "-l"),
+):
+    console.print("\n🔎 [bold blue]Digesting job descriptions...[/bold blue]\n")
+    
+    from src.classifiers.digester import JobDigester
+    
+    try:
+        result = asyncio.run(JobDigester().digest_pending(limit))
+    except Exception as e:
+        console.print(f"[red]Digest error: {e}[/red]")
+        return
+    
+    console.print(f"[green]✅ Digested {result['digested']} jobs[/green] "
+                  f"({result['fetched']} descriptions fetched, {result['scored']} match scores)")
+
+
+@app.command(name="bench-fillers")
+def bench_fillers(
+    ats: Optional[list[str]] = typer.Option(None, "--ats", "-a", help="Only these fixtures (greenhouse, lever, ashby, workday, universal)"),
+    rounds: int = typer.Option(1, "--rounds", "-r", help="Fill each form this many times; later rounds hit the form cache"),
+    headed: bool = typer.Option(False, "--headed", help="Show the browser"),
+    llm_latency: float = typer.Option(0.05, "--llm-latency", help="Seconds each stubbed LLM call takes"),
+    verbose: bool = typer.Option(False, "--verbose", "-v", help="Show filler output"),
+    resume: bool = typer.Option(False, "--resume", help="Also crash multi-page forms on their last page and time the resumed retry"),
+):
+    console.print("\n🧪 [bold blue]Filling offline ATS fixtures...[/bold blue]\n")
+    
+    from src.scripts.bench_fillers import resume_savings, run_benchmark
+    
+    try:
+        results = asyncio.run(run_benchmark(ats=ats, rounds=rounds, headless=not headed, latency=llm_latency,
+                                            verbose=verbose, resume=resume))
+    except Exception as e:
+        console.print(f"[red]Benchmark error: {e}[/red]")
+        return
+    
+    table = Table(title="Filler Benchmark (stub LLM)")
+    table.add_column("ATS", style="cyan")
+    table.add_column("Round", style="dim")
+    table.add_column("Filled")
+    table.add_column("Time to Fill", style="yellow")
+    table.add_column("Round Trips", style="green")
+    table.add_column("LLM Calls", style="magenta")
+    table.add_column("Correct", style="blue")
+    for r in results:
+        table.add_row(r["ats"], str(r["round"]), "✅" if r["success"] else "❌", f"{r['seconds']:.2f}s",
+                      str(r["round_trips"]), str(r["llm_calls"]), f"{r['correct']}/{r['expected']}")
+    console.print(table)
+    
+    for r in results:
+        for miss in r["misses"]:
+            console.print(f"[yellow]⚠️ {r['ats']} (round {r['round']}): {miss}[/yellow]")
+    
+    for saving in resume_savings(results):
+        console.print(f"⏩ [cyan]{saving['ats']}[/cyan]: resumed after page {saving['resumed_from']}, saved "
+                      f"[magenta]{saving['llm_calls']}[/magenta] LLM calls and [yellow]{saving['seconds']:.2f}s[/yellow] against a cold fill")
+
+
 @app.command()
 def resume(
     variant: Optional[str] = typer.Option(None, "--variant", "-v", help="Resume variant from profile"),
@@ -6,6 +6,7 @@ import os
 sys.path.append(os.getcwd())
 
 from src.scrapers.aggregator import JobAggregator
+from src.utils.browser import close_browser_pool
 
 async def main():
     print("🚀 Starting full job scrape...")
@@ -15,7 +16,10 @@ async def main():
     aggregator = JobAggregator(validate_links=True)
     
     # Run scrape
-    result = await aggregator.scrape_all(limit_per_source=20)
+    try:
+        result = await aggregator.scrape_all(limit_per_source=20)
+    finally:
+        await close_browser_pool()
     
     stats = result["stats"]
     print("\n📊 Scrape Summary:")
@@ -0,0 +1,249 @@
+import asyncio
+import html as html_lib
+import json
+import re
+from typing import Optional
+
+import httpx
+
+from src.core.applicant import Applicant
+from src.core.job import Job
+from src.core.profile_snapshot import load_profile
+from src.utils.config import get_settings
+from src.utils.database import Database, get_db
+from src.utils.browser import DEFAULT_USER_AGENT
+
+
+# Descriptions shorter than this are snippets (Greenhouse's board API, search listings); fetch the posting
+MIN_DESCRIPTION_CHARS = 600
+
+# Fetched descriptions are stored up to this length
+MAX_DESCRIPTION_CHARS = 20000
+
+YEARS_EXPERIENCE_PATTERN = re.compile(r'(\d+)\+?\s*(?:(?:to|-|–)\s*\d+\s*)?years?\s*(?:of\s*)?(?:exp|experience)?', re.IGNORECASE)
+
+# Spelling in a description -> canonical skill name. Bare "go", "c" and "r" are too ambiguous in prose.
+SKILL_ALIASES = {
+    "python": "Python", "java": "Java", "javascript": "JavaScript", "typescript": "TypeScript",
+    "golang": "Go", "rust": "Rust", "c++": "C++", "c#": "C#", "ruby": "Ruby", "kotlin": "Kotlin",
+    "swift": "Swift", "scala": "Scala", "php": "PHP", "sql": "SQL", "bash": "Bash",
+    "react": "React", "react.js": "React", "angular": "Angular", "vue": "Vue", "vue.js": "Vue",
+    "next.js": "Next.js", "node.js": "Node.js", "nodejs": "Node.js", "express": "Express",
+    "django": "Django", "flask": "Flask", "fastapi": "FastAPI", "spring boot": "Spring", "spring": "Spring",
+    "rails": "Rails", "ruby on rails": "Rails", ".net": ".NET", "graphql": "GraphQL", "rest": "REST",
+    "grpc": "gRPC", "aws": "AWS", "amazon web services": "AWS", "gcp": "GCP", "google cloud": "GCP",
+    "azure": "Azure", "docker": "Docker", "kubernetes": "Kubernetes", "k8s": "Kubernetes",
+    "terraform": "Terraform", "ci/cd": "CI/CD", "linux": "Linux", "git": "Git",
+    "postgresql": "PostgreSQL", "postgres": "PostgreSQL", "mysql": "MySQL", "mongodb": "MongoDB",
+    "redis": "Redis", "elasticsearch": "Elasticsearch", "dynamodb": "DynamoDB", "snowflake": "Snowflake",
+    "kafka": "Kafka", "spark": "Spark", "airflow": "Airflow", "hadoop": "Hadoop",
+    "pytorch": "PyTorch", "tensorflow": "TensorFlow", "scikit-learn": "scikit-learn", "pandas": "pandas",
+    "machine learning": "Machine Learning", "deep learning": "Deep Learning", "llm": "LLMs", "llms": "LLMs",
+    "nlp": "NLP", "computer vision": "Computer Vision", "html": "HTML", "css": "CSS",
+    "ios": "iOS", "android": "Android", "react native": "React Native", "flutter": "Flutter",
+}
+
+_SKILL_PATTERN = re.compile(
+    r"(?<![\w+#.])(" + "|".join(re.escape(alias) for alias in sorted(SKILL_ALIASES, key=len, reverse=True)) + r")(?![\w+#])",
+    re.IGNORECASE,
+)
+
+# Checked in order; "none" wins over "offered" when a posting says both (e.g. "sponsorship is not available")
+SPONSORSHIP_PATTERNS = [
+    ("none", re.compile(
+        r"(?:unable|not able|will not|won't|cannot|can't|do not|does not|don't|doesn't|not)\s+(?:to\s+)?"
+        r"(?:provide\s+|offer\s+)?sponsor"
+        r"|no\s+(?:visa\s+)?sponsorship|sponsorship\s+(?:is\s+)?not\s+(?:available|offered|provided)"
+        r"|without\s+(?:the\s+need\s+for\s+)?(?:current\s+or\s+future\s+)?(?:visa\s+)?sponsorship"
+        r"|u\.?s\.?\s+citizen(?:ship)?\s+(?:is\s+)?required|security\s+clearance",
+        re.IGNORECASE,
+    )),
+    ("offered", re.compile(
+        r"(?:visa|h-?1b)\s+sponsorship\s+(?:is\s+)?(?:available|offered|provided)|will\s+sponsor"
+        r"|sponsorship\s+(?:is\s+)?available|(?:open\s+to|willing\s+to)\s+sponsor",
+        re.IGNORECASE,
+    )),
+]
+
+# Lowest degree wins: "BS required, MS preferred" asks for a bachelor's
+DEGREE_PATTERNS = [
+    ("bachelors", re.compile(r"bachelor'?s|\bb\.[sa]\.|\bbsc\b|\bbs(?:/ms)?\s+(?:degree|in)\b|undergraduate degree", re.IGNORECASE)),
+    ("masters", re.compile(r"master'?s|\bm\.s\.|\bmsc\b|\bms\s+degree\b", re.IGNORECASE)),
+    ("phd", re.compile(r"\bph\.?d\b|doctorate", re.IGNORECASE)),
+]
+
+LOCATION_PATTERNS = [
+    ("hybrid", re.compile(r"\bhybrid\b", re.IGNORECASE)),
+    ("remote", re.compile(r"\b(?:fully\s+remote|remote[- ]first|100%\s+remote|remote)\b", re.IGNORECASE)),
+    ("onsite", re.compile(r"\b(?:on-?site|in[- ]office|in[- ]person)\b", re.IGNORECASE)),
+]
+
+_JSON_LD = re.compile(r'<script[^>]+application/ld\+json[^>]*>(.*?)</script>', re.IGNORECASE | re.DOTALL)
+_NOISE = re.compile(r'<(script|style|noscript|svg|head|nav|footer)\b.*?</\1>', re.IGNORECASE | re.DOTALL)
+_TAG = re.compile(r'<[^>]+>')
+_SPACE = re.compile(r'[ \t\r\f\v]+')
+_LINES = re.compile(r'\s*\n\s*')
+
+
+def description_text(markup: str) -> str:
+    """Plain text of an HTML (or HTML-escaped) description, one block per line."""
+    if "&lt;" in markup:
+        markup = html_lib.unescape(markup)
+    text = _TAG.sub("\n", _NOISE.sub(" ", markup))
+    text = _SPACE.sub(" ", html_lib.unescape(text))
+    return _LINES.sub("\n", text).strip()
+
+
+def page_description(page: str) -> str:
+    """The description on a job posting page: its JobPosting JSON-LD if present, else the page text."""
+    for block in _JSON_LD.findall(page):
+        try:
+            data = json.loads(block.strip())
+        except ValueError:
+            continue
+        for item in data if isinstance(data, list) else data.get("@graph", [data]):
+            if isinstance(item, dict) and item.get("@type") == "JobPosting" and item.get("description"):
+                return description_text(item["description"])
+    return description_text(page)
+
+
+def extract_skills(text: str) -> list[str]:
+    """Canonical skill names mentioned in ``text``, in order of first mention."""
+    skills = dict.fromkeys(SKILL_ALIASES[match.lower()] for match in _SKILL_PATTERN.findall(text))
+    return list(skills)
+
+
+def min_years_required(text: str) -> Optional[int]:
+    """The smallest "N years (of experience)" in ``text``; postings list a minimum before the preferred."""
+    years = [int(match) for match in YEARS_EXPERIENCE_PATTERN.findall(text) if match.isdigit()]
+    return min(years) if years else None
+
+
+def _first_label(patterns: list[tuple[str, re.Pattern]], text: str) -> Optional[str]:
+    return next((label for label, pattern in patterns if pattern.search(text)), None)
+
+
+def digest_description(text: str, location: str = "") -> dict:
+    """The requirements a description states, as the ``req_*``/``sponsorship``/``remote_type`` job fields."""
+    text = description_text(text) if "<" in text or "&lt;" in text else text
+    return {
+        "req_skills": extract_skills(text),
+        "req_years": min_years_required(text),
+        "req_degree": _first_label(DEGREE_PATTERNS, text),
+        "sponsorship": _first_label(SPONSORSHIP_PATTERNS, text),
+        "remote_type": _first_label(LOCATION_PATTERNS, location) or _first_label(LOCATION_PATTERNS, text),
+    }
+
+
+def attach_digest(job: Job) -> Job:
+    """Digest the description a scraper already has onto the job itself, so it's stored at insert."""
+    digest = digest_description(job.description or "", job.location or "")
+    if job.remote_type:
+        digest.pop("remote_type")
+    for key, value in digest.items():
+        setattr(job, key, value)
+    return job
+
+
+def match_score(job: Job, applicant: Applicant) -> Optional[float]:
+    """Share of the job's required skills the applicant lists, halved when it asks for more years than they have."""
+    if not job.req_skills:
+        return None
+    known = {skill.lower() for skill in applicant.skills.all_technical}
+    known.update(skill.lower() for skill in extract_skills(", ".join(applicant.skills.all_technical)))
+    score = sum(1 for skill in job.req_skills if skill.lower() in known) / len(job.req_skills)
+    if job.req_years is not None and job.req_years > applicant.years_of_experience:
+        score /= 2
+    return round(score, 3)
+
+
+class JobDigester:
+    """
+    Post-ingest stage that reads each job's description once: fetches the posting
+    when the source only gave a snippet (or nothing), extracts its requirements and
+    stores them with a match score against the profile. The filter, prompts and
+    scoring then use these columns instead of scanning the raw text again.
+    """
+
+    def __init__(self, db: Optional[Database] = None, applicant: Optional[Applicant] = None,
+                 timeout: float = 10.0, max_concurrent: int = 10):
+        self.db = db or get_db()
+        self.applicant = applicant or self._profile()
+        self.timeout = timeout
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        # Posting URL -> description, so duplicate listings are fetched once
+        self._fetched: dict[str, str] = {}
+
+    @staticmethod
+    def _profile() -> Optional[Applicant]:
+        path = get_settings().get_profile_path()
+        try:
+            return load_profile(path).applicant if path.exists() else None
+        except Exception as e:
+            print(f"⚠️ Could not load profile for match scores: {e}")
+            return None
+
+    async def digest(self, jobs: list[Job]) -> dict:
+        jobs = [job for job in jobs if job.id]
+        if not jobs:
+            return {"digested": 0, "fetched": 0, "scored": 0}
+
+        async with httpx.AsyncClient(
+            follow_redirects=True,
+            timeout=self.timeout,
+            headers={"User-Agent": DEFAULT_USER_AGENT},
+        ) as client:
+            descriptions = await asyncio.gather(*(self._description(client, job) for job in jobs))
+
+        updates = [self._digest_one(job, description) for job, description in zip(jobs, descriptions)]
+        self.db.update_job_digests(updates)
+        return {
+            "digested": len(updates),
+            "fetched": sum(1 for update in updates if "description" in update),
+            "scored": sum(1 for update in updates if update["match_score"] is not None),
+        }
+
+    async def digest_pending(self, limit: int = 500) -> dict:
+        """Backfill jobs ingested before the digest existed (or whose digest was interrupted)."""
+        return await self.digest(self.db.get_undigested_jobs(limit))
+
+    async def _description(self, client: httpx.AsyncClient, job: Job) -> Optional[str]:
+        """The posting's full description when the stored one is a snippet; None to keep what we have."""
+        if job.description and len(job.description) >= MIN_DESCRIPTION_CHARS:
+            return None
+        if job.url in self._fetched:
+            return self._fetched[job.url]
+        async with self._semaphore:
+            try:
+                response = await client.get(job.url)
+                if response.status_code >= 400:
+                    return None
+                description = page_description(response.text)[:MAX_DESCRIPTION_CHARS]
+            except Exception:
+                return None
+        # A login wall or an empty JS shell is no better than the snippet
+        if len(description) <= len(job.description or ""):
+            return None
+        self._fetched[job.url] = description
+        return description
+
+    def _digest_one(self, job: Job, description: Optional[str]) -> dict:
+        if description:
+            job.description = description
+        attach_digest(job)
+        update = {
+            "id": job.id,
+            "req_skills": job.req_skills,
+            "req_years": job.req_years,
+            "req_degree": job.req_degree,
+            "sponsorship": job.sponsorship,
+            "remote_type": job.remote_type,
+            "match_score": match_score(job, self.applicant) if self.applicant else job.match_score,
+        }
+        if description:
+            update["description"] = description
+        return update
+
+
+async def digest_jobs(jobs: list[Job]) -> dict:
+    return await JobDigester().digest(jobs)
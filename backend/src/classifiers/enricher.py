@@ -0,0 +1,90 @@
+import asyncio
+from typing import Optional
+
+import httpx
+
+from src.core.job import Job, ApplicationType
+from src.classifiers.detector import ApplicationDetector, get_detector
+from src.utils.database import Database, get_db
+from src.utils.browser import DEFAULT_USER_AGENT
+
+
+# Landing pages that still need a click in the browser before the real form
+INTERMEDIATE_TYPES = {ApplicationType.BUILTIN, ApplicationType.REDIRECTOR, ApplicationType.CUSTOM, ApplicationType.UNKNOWN}
+
+# Platforms decided with at least this confidence skip browser-side detection at apply time
+TRUSTED_CONFIDENCE = 0.8
+
+# Platform a scraper assigned itself (e.g. from a board API) when the detector can't confirm it
+SCRAPER_ASSIGNED_CONFIDENCE = 0.9
+
+
+class JobEnricher:
+    """
+    Post-ingest stage that decides each job's ATS platform ahead of the apply run:
+    resolves the final apply URL over HTTP, classifies it with ApplicationDetector,
+    and stores apply_url / application_type / platform_confidence in one bulk update.
+    """
+
+    def __init__(self, db: Optional[Database] = None, detector: Optional[ApplicationDetector] = None,
+                 timeout: float = 10.0, max_concurrent: int = 10):
+        self.db = db or get_db()
+        self.detector = detector or get_detector()
+        self.timeout = timeout
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+
+    async def enrich(self, jobs: list[Job]) -> dict:
+        jobs = [job for job in jobs if job.id]
+        if not jobs:
+            return {"enriched": 0, "resolved": 0, "low_confidence": 0}
+
+        async with httpx.AsyncClient(
+            follow_redirects=True,
+            timeout=self.timeout,
+            headers={"User-Agent": DEFAULT_USER_AGENT},
+        ) as client:
+            updates = await asyncio.gather(*(self._enrich_one(client, job) for job in jobs))
+
+        self.db.update_job_platforms(updates)
+        return {
+            "enriched": len(updates),
+            "resolved": sum(1 for job, update in zip(jobs, updates) if update["apply_url"] != (job.apply_url or job.url)),
+            "low_confidence": sum(
+                1 for update in updates
+                if update["platform_confidence"] < TRUSTED_CONFIDENCE
+                or ApplicationType(update["application_type"]) in INTERMEDIATE_TYPES
+            ),
+        }
+
+    async def enrich_pending(self, limit: int = 500) -> dict:
+        """Backfill jobs ingested before enrichment existed (or whose enrichment was interrupted)."""
+        return await self.enrich(self.db.get_unenriched_jobs(limit))
+
+    async def _enrich_one(self, client: httpx.AsyncClient, job: Job) -> dict:
+        url = job.apply_url or job.url
+        final_url, html = url, ""
+        async with self._semaphore:
+            try:
+                response = await client.get(url)
+                if response.status_code < 400:
+                    final_url, html = str(response.url), response.text
+            except Exception:
+                pass
+
+        app_type, confidence = self.detector.detect(final_url, html)
+        current = ApplicationType(job.application_type) if job.application_type else ApplicationType.UNKNOWN
+        if app_type in INTERMEDIATE_TYPES and current not in INTERMEDIATE_TYPES:
+            # Trust the scraper's platform over a page we couldn't classify
+            app_type, confidence = current, SCRAPER_ASSIGNED_CONFIDENCE
+
+        return {
+            "id": job.id,
+            # Don't swap a working URL for a landing page the browser will click through anyway
+            "apply_url": final_url if app_type not in INTERMEDIATE_TYPES else url,
+            "application_type": app_type.value,
+            "platform_confidence": confidence,
+        }
+
+
+async def enrich_jobs(jobs: list[Job]) -> dict:
+    return await JobEnricher().enrich(jobs)
@@ -0,0 +1,101 @@
+import math
+import re
+from datetime import datetime
+from functools import lru_cache
+from typing import Optional
+
+from src.classifiers.detector import get_detector
+from src.core.job import ApplicationType
+from src.utils.config import get_settings
+
+
+# Freshness is stored as days since this date (divided by priority.freshness_days), so a
+# job's score never goes stale: ranking by it equals ranking by an exponential age decay
+EPOCH = datetime(2024, 1, 1)
+
+# Likelihood of getting an application through, by ApplicationDetector.get_platform_info difficulty
+DIFFICULTY_FACTORS = {"easy": 1.0, "medium": 0.7, "unknown": 0.6, "hard": 0.4}
+
+# Likelihood the employer sponsors a visa, for applicants who need one
+SPONSOR_FACTORS = {"offered": 1.0, "known_sponsor": 0.8, "unknown": 0.5, "none": 0.05}
+
+# Jobs without a digest (no listed skills) rank as a middling match
+NEUTRAL_MATCH = 0.5
+MIN_FACTOR = 0.01
+
+_COMPANY_SUFFIXES = re.compile(
+    r"\b(?:inc|llc|lp|corp|corporation|incorporated|company|co|ltd|services|usa|america|nv|plc)\b"
+)
+
+
+def normalize_company(name: str) -> str:
+    """'Amazon.com Services LLC' and 'Amazon' both become 'amazon'."""
+    name = re.sub(r"\.com\b", "", (name or "").lower())
+    name = _COMPANY_SUFFIXES.sub(" ", re.sub(r"[^a-z0-9 ]+", " ", name))
+    return " ".join(name.split())
+
+
+@lru_cache(maxsize=1)
+def known_sponsors() -> frozenset[str]:
+    """Companies with a record of H1B filings (the h1b-sponsors list), normalized."""
+    from src.scrapers.h1b_sponsors import COMPANY_CAREERS_URLS
+    return frozenset(normalize_company(name) for name in COMPANY_CAREERS_URLS)
+
+
+@lru_cache(maxsize=1)
+def applicant_needs_sponsorship() -> bool:
+    from src.core.profile_snapshot import load_profile
+    path = get_settings().get_profile_path()
+    try:
+        return path.exists() and load_profile(path).applicant.work_authorization.requires_sponsorship
+    except Exception:
+        return False
+
+
+def sponsor_likelihood(company: str, sponsorship: Optional[str]) -> float:
+    if not applicant_needs_sponsorship():
+        return 1.0
+    if sponsorship in ("offered", "none"):
+        return SPONSOR_FACTORS[sponsorship]
+    if normalize_company(company) in known_sponsors():
+        return SPONSOR_FACTORS["known_sponsor"]
+    return SPONSOR_FACTORS["unknown"]
+
+
+def platform_ease(application_type) -> float:
+    try:
+        app_type = ApplicationType(getattr(application_type, "value", application_type) or ApplicationType.UNKNOWN.value)
+    except ValueError:
+        app_type = ApplicationType.UNKNOWN
+    difficulty = get_detector().get_platform_info(app_type)["difficulty"]
+    return DIFFICULTY_FACTORS.get(difficulty, DIFFICULTY_FACTORS["unknown"])
+
+
+def priority_factors(job, retries: int = 0) -> dict[str, float]:
+    """
+    The parts of a job's priority. ``job`` is a Job or a JobModel row; freshness is
+    in e-folds (``freshness_days`` each) since EPOCH, the rest are 0-1 factors.
+    """
+    config = get_settings().application.priority
+    discovered = job.discovered_at or datetime.now()
+    # Posting dates in the future (time zones, bad feeds) count from discovery
+    posted = min(job.posted_date or discovered, discovered)
+    match = job.match_score if job.match_score is not None else NEUTRAL_MATCH
+    return {
+        "freshness": (posted - EPOCH).total_seconds() / 86400 / config.freshness_days,
+        "match": max(match, MIN_FACTOR),
+        "ease": platform_ease(job.application_type),
+        "sponsor": sponsor_likelihood(job.company, job.sponsorship),
+        "retry": config.retry_penalty ** (retries or 0),
+    }
+
+
+def priority_score(job, retries: int = 0) -> float:
+    """
+    Log-space priority: freshness plus the log of each likelihood factor. Higher is
+    applied to first; a job posted ``freshness_days`` earlier needs e (~2.7x) better
+    odds to rank level with a newer one.
+    """
+    factors = priority_factors(job, retries)
+    score = factors.pop("freshness") + sum(math.log(max(value, MIN_FACTOR)) for value in factors.values())
+    return round(score, 4)
@@ -75,6 +75,15 @@ class Job(BaseModel):
     external_id: Optional[str] = Field(default=None)
     raw_data: Optional[dict] = Field(default=None)
     match_score: Optional[float] = Field(default=None, ge=0.0, le=1.0)
+    platform_confidence: Optional[float] = Field(default=None, ge=0.0, le=1.0)
+    enriched_at: Optional[datetime] = Field(default=None)
+    req_skills: list[str] = Field(default_factory=list)
+    req_years: Optional[int] = Field(default=None)
+    req_degree: Optional[str] = Field(default=None)
+    sponsorship: Optional[str] = Field(default=None)
+    digested_at: Optional[datetime] = Field(default=None)
+    # Set by the database from the fields above (see src/classifiers/priority.py)
+    priority: Optional[float] = Field(default=None)
     
     class Config:
         use_enum_values = True
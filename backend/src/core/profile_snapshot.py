@@ -0,0 +1,192 @@
+import math
+import time
+from pathlib import Path
+from typing import Optional
+
+from src.core.applicant import Applicant
+
+
+# Context variant -> (token budget, sections in priority order). Long-answer variants are named
+# after prompts.detect_question_type; "field", "choice", "batch" and "form" serve the short-field,
+# dropdown, whole-form and universal-filler prompts.
+CONTEXT_VARIANTS = {
+    "field": (350, ["identity", "authorization", "education", "roles", "skills"]),
+    "choice": (250, ["authorization", "summary", "education", "skills", "demographics"]),
+    "batch": (600, ["identity", "authorization", "summary", "education", "experience", "projects", "skills"]),
+    "form": (900, ["identity", "authorization", "demographics", "education", "work_history", "skills", "answers",
+                   "project_details", "soft_skills"]),
+    "why_company": (200, ["summary", "roles", "skills"]),
+    "why_role": (200, ["summary", "experience", "skills"]),
+    "experience": (300, ["summary", "experience", "skills"]),
+    "challenging_project": (300, ["summary", "projects", "experience"]),
+    "strength": (200, ["summary", "skills", "achievements"]),
+    "weakness": (150, ["summary", "skills"]),
+    "generic": (250, ["summary", "skills", "experience", "projects", "achievements"]),
+}
+
+
+# A line cut shorter than this to fit the budget isn't worth keeping
+MIN_LINE_TOKENS = 16
+
+
+def estimate_tokens(text: str) -> int:
+    """Tokens in ``text`` at ~4 characters per token, the usage ledger's fallback estimate."""
+    return math.ceil(len(text) / 4)
+
+
+def fit_to_budget(sections: list[str], budget: int) -> str:
+    """
+    Join ``sections``, most important first, within ``budget`` tokens. Lines are kept whole
+    in order while they fit; the budget left then goes to cut-down versions of the lines
+    that didn't (down to MIN_LINE_TOKENS), so one long line never crowds out the sections
+    after it. A heading none of whose items made it is dropped.
+    """
+    lines = [line for section in sections for line in section.splitlines()]
+    kept: list[Optional[str]] = [None] * len(lines)
+    used = 0
+    for i, line in enumerate(lines):
+        cost = estimate_tokens(line) + 1
+        if used + cost <= budget:
+            kept[i] = line
+            used += cost
+    for i, line in enumerate(lines):
+        remaining = budget - used - 1
+        if kept[i] is None and remaining >= MIN_LINE_TOKENS:
+            kept[i] = line[:remaining * 4 - 1].rstrip() + "…"
+            used += estimate_tokens(kept[i]) + 1
+
+    result: list[str] = []
+    start = 0
+    for section in sections:
+        count = len(section.splitlines())
+        part = [line for line in kept[start:start + count] if line is not None]
+        start += count
+        if count > 1 and len(part) == 1 and kept[start - count] is not None:
+            continue
+        result.extend(part)
+    return "\n".join(result)
+
+
+def _details(description: str, highlights: list[str], technologies: list[str]) -> str:
+    """Indented detail lines under a role or project, so the budget trims details before entries."""
+    lines = [description] if description else []
+    if highlights:
+        lines.append(f"Highlights: {'; '.join(highlights)}")
+    if technologies:
+        lines.append(f"Technologies: {', '.join(technologies)}")
+    return "".join(f"\n  {line}" for line in lines)
+
+
+class ProfileSnapshot:
+    """
+    An applicant profile with its LLM context variants built once, at load. Prompts
+    take ``context(variant)`` instead of rebuilding the profile text on every call;
+    each variant stays within its token budget.
+    """
+
+    def __init__(self, applicant: Applicant, path: Optional[Path] = None, mtime_ns: int = 0):
+        started = time.perf_counter()
+        self.applicant = applicant
+        self.path = path
+        self.mtime_ns = mtime_ns
+        sections = self._sections(applicant)
+        self.contexts = {
+            name: fit_to_budget([sections[section] for section in order if sections[section]], budget)
+            for name, (budget, order) in CONTEXT_VARIANTS.items()
+        }
+        self.tokens = {name: estimate_tokens(text) for name, text in self.contexts.items()}
+        self.build_ms = (time.perf_counter() - started) * 1000
+
+    def context(self, variant: str = "generic") -> str:
+        return self.contexts.get(variant, self.contexts["generic"])
+
+    def get_stats(self) -> dict:
+        return {
+            "build_ms": self.build_ms,
+            "tokens": dict(self.tokens),
+            "budgets": {name: budget for name, (budget, _) in CONTEXT_VARIANTS.items()},
+        }
+
+    @staticmethod
+    def _sections(a: Applicant) -> dict[str, str]:
+        address = ", ".join(part for part in (a.address.street, a.address.city, a.address.state, a.address.zip, a.address.country) if part)
+        identity = [f"Name: {a.full_name}", f"Email: {a.email}", f"Phone: {a.phone}", f"Address: {address}"]
+        identity += [f"{name}: {value}" for name, value in (("LinkedIn", a.linkedin), ("GitHub", a.github), ("Website", a.website)) if value]
+
+        auth = a.work_authorization
+        current = a.current_job
+        summary = [f"Experience: ~{a.years_of_experience} years"]
+        if current:
+            summary.insert(0, f"Current: {current.title} at {current.company}")
+        if a.highest_education:
+            summary.append(f"Education: {a.highest_education.full_degree} from {a.highest_education.institution}")
+
+        return {
+            "identity": "\n".join(identity),
+            "authorization": (
+                f"Work Auth: Authorized in US? {auth.authorized_us}. Sponsorship needed? {auth.requires_sponsorship}. "
+                f"Visa: {auth.visa_status}"
+            ),
+            "demographics": (
+                f"Gender: {a.demographics.gender}. Ethnicity: {a.demographics.ethnicity}. "
+                f"Veteran: {a.demographics.veteran_status}. Disability: {a.demographics.disability_status}"
+            ),
+            "summary": "\n".join(summary),
+            "education": "Education History:\n" + "\n".join(
+                f"- {e.degree} in {e.field} from {e.institution} ({e.start_date} to {e.end_date})" for e in a.education
+            ) if a.education else "",
+            "roles": "Experience History:\n" + "\n".join(
+                f"- {e.title} at {e.company} ({e.start_date} to {e.end_date})" for e in a.experience
+            ) if a.experience else "",
+            "experience": "Experience:\n" + "\n".join(
+                f"- {e.title} at {e.company} ({e.duration})" + (f": {'; '.join(e.highlights[:2])}" if e.highlights else "")
+                for e in a.experience[:3]
+            ) if a.experience else "",
+            "projects": "Projects:\n" + "\n".join(
+                f"- {p.name}" + (f" ({', '.join(p.technologies[:4])})" if p.technologies else "")
+                + (f": {p.highlights[0]}" if p.highlights else (f": {p.description}" if p.description else ""))
+                for p in a.projects[:3]
+            ) if a.projects else "",
+            "work_history": "Work History:\n" + "\n".join(
+                f"- {e.title} at {e.company} ({e.duration})" + _details(e.description, e.highlights, e.technologies)
+                for e in a.experience
+            ) if a.experience else "",
+            "project_details": "Projects:\n" + "\n".join(
+                f"- {p.name}" + _details(p.description, p.highlights, p.technologies) for p in a.projects
+            ) if a.projects else "",
+            "soft_skills": f"Soft skills: {', '.join(a.skills.soft_skills)}" if a.skills.soft_skills else "",
+            "achievements": "Achievements:\n" + "\n".join(
+                f"- {x.name} ({x.year}): {x.description}" for x in a.achievements[:3]
+            ) if a.achievements else "",
+            "skills": f"Skills: {a.get_skills_string(20)}" if a.skills.all_technical else "",
+            "answers": "Prepared answers:\n" + "\n".join(
+                f"- {key}: {answer}" for key, answer in a.common_answers.items()
+            ) if a.common_answers else "",
+        }
+
+
+# Profiles loaded from disk, by resolved path; reloaded when the file's mtime changes
+_loaded: dict[Path, ProfileSnapshot] = {}
+# Snapshots of applicants built in memory (tests, scripts), by id
+_built: dict[int, ProfileSnapshot] = {}
+
+
+def load_profile(path: str | Path) -> ProfileSnapshot:
+    """The profile at ``path``, read from disk only the first time and whenever the file changes."""
+    path = Path(path).resolve()
+    mtime_ns = path.stat().st_mtime_ns if path.exists() else 0
+    snapshot = _loaded.get(path)
+    if snapshot is None or snapshot.mtime_ns != mtime_ns:
+        snapshot = _loaded[path] = ProfileSnapshot(Applicant.from_file(path), path, mtime_ns)
+    return snapshot
+
+
+def snapshot_of(applicant: Applicant) -> ProfileSnapshot:
+    """The snapshot for an applicant object, built on first use when it didn't come from ``load_profile``."""
+    for snapshot in _loaded.values():
+        if snapshot.applicant is applicant:
+            return snapshot
+    snapshot = _built.get(id(applicant))
+    if snapshot is None or snapshot.applicant is not applicant:
+        snapshot = _built[id(applicant)] = ProfileSnapshot(applicant)
+    return snapshot
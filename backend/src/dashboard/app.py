@@ -196,6 +196,20 @@ async def get_gamification():
     }
 
 
+@app.on_event("shutdown")
+async def close_browser():
+    """Stop the shared browser pool kept warm across dashboard requests"""
+    from src.utils.browser import close_browser_pool
+    await close_browser_pool()
+
+
+@app.on_event("shutdown")
+async def close_mail():
+    """Close the IMAP session shared by the applies that wait on verification codes"""
+    from src.utils.mail_listener import close_mail_listener
+    await close_mail_listener()
+
+
 # ============ Pages ============
 
 @app.get("/", response_class=HTMLResponse)
@@ -544,6 +558,25 @@ async def get_llm_usage():
         return {"error": str(e)}
 
 
+@app.get("/api/traces/breakdown")
+async def get_trace_breakdown(days: int = 7):
+    """p50/p95 time per apply step, by ATS"""
+    from src.utils.tracing import span_breakdown
+    return span_breakdown(days=days)
+
+
+@app.get("/api/traces/export")
+async def export_traces(trace_id: Optional[str] = None, limit: int = 20):
+    """Chrome trace-event JSON of one application (or the last ``limit``), for chrome://tracing or Perfetto"""
+    from src.utils.tracing import chrome_trace
+    db = get_db()
+    trace_ids = [trace_id] if trace_id else db.get_recent_trace_ids(limit)
+    return JSONResponse(
+        chrome_trace(db.get_trace_spans(trace_ids=trace_ids)),
+        headers={"Content-Disposition": 'attachment; filename="apply-trace.json"'},
+    )
+
+
 # ============ Gamification API ============
 
 
@@ -776,7 +809,7 @@ async def trigger_apply(job_id: str, background_tasks: BackgroundTasks):
         
     async def run_single_apply():
         from src.orchestrator import Orchestrator
-        from src.core.applicant import Applicant
+        from src.core.profile_snapshot import load_profile
         from src.core.application import Application
         
         # Check if cancelled before starting
@@ -800,13 +833,23 @@ async def trigger_apply(job_id: str, background_tasks: BackgroundTasks):
             running_applications.pop(job_id, None)
             return
             
-        applicant = Applicant.from_file(profile_path)
-        orchestrator = Orchestrator(applicant)
-        await orchestrator.setup()
+        # Read once and reused across applies until profile.json changes
+        applicant = load_profile(profile_path).applicant
+        orchestrator = Orchestrator(applicant, keep_browser_warm=True)
+        
+        # Lease the job so a concurrent CLI run or worker can't pick it up too
+        settings = get_settings()
+        if not db.claim_next(orchestrator.worker_id, job_id=job_id, lease_seconds=settings.application.lease_seconds, force=True):
+            print(f"   ⏭️ Application {job_id} is already claimed by another applier")
+            running_applications.pop(job_id, None)
+            return
+        
+        heartbeat = asyncio.create_task(orchestrator.keep_lease(job_id))
+        application = Application.from_job(job)
+        application.retry_count = db.get_retry_count(job_id)
         
         try:
-             # Initial update
-             db.update_job_status(job_id, JobStatus.IN_PROGRESS)
+             await orchestrator.setup()
              
              # Check cancellation
              if running_applications.get(job_id, {}).get("cancelled"):
@@ -814,8 +857,6 @@ async def trigger_apply(job_id: str, background_tasks: BackgroundTasks):
                  db.update_job_status(job_id, JobStatus.NEW)  # Reset to new
                  return
              
-             application = Application.from_job(job)
-             
              # Determine filler
              filler_class = orchestrator.fillers.get(job.application_type)
              if not filler_class:
@@ -839,9 +880,9 @@ async def trigger_apply(job_id: str, background_tasks: BackgroundTasks):
              if success:
                  db.update_job_status(job_id, JobStatus.APPLIED)
              else:
-                 # If it failed but wasn't marked rejected, mark failed
+                 # If it failed but wasn't marked rejected, retry it later or mark it failed
                  if job.status != JobStatus.REJECTED.value:
-                     db.update_job_status(job_id, JobStatus.FAILED)
+                     orchestrator.settle_failure(job, application, application.error_message, JobStatus.FAILED)
                      
         except asyncio.CancelledError:
             print(f"   🛑 Application {job_id} task was cancelled")
@@ -849,8 +890,11 @@ async def trigger_apply(job_id: str, background_tasks: BackgroundTasks):
         except Exception as e:
             print(f"Single apply error: {e}")
             if not running_applications.get(job_id, {}).get("cancelled"):
-                db.update_job_status(job_id, JobStatus.FAILED)
+                application.fail(str(e))
+                orchestrator.settle_failure(job, application, str(e), JobStatus.FAILED)
         finally:
+            heartbeat.cancel()
+            db.release_claim(job_id, orchestrator.worker_id)
             await orchestrator.teardown()
             running_applications.pop(job_id, None)
 
@@ -908,7 +952,7 @@ async def trigger_auto_apply_run(background_tasks: BackgroundTasks):
         from src.orchestrator import run_auto_apply
         try:
             # Run with default settings (5 applications per run)
-            await run_auto_apply(max_applications=5, scrape_first=False)
+            await run_auto_apply(max_applications=5, scrape_first=False, keep_browser_warm=True)
         except Exception as e:
             print(f"Auto-run error: {e}")
             
@@ -36,10 +36,11 @@ class EmailPersonalizer:
         try:
             prompt = self._build_hook_prompt(contact, job)
             
-            response = self.llm_client.generate(
+            response = await self.llm_client.generate(
                 prompt,
                 max_tokens=100,
-                temperature=0.7  # Some creativity
+                temperature=0.7,  # Some creativity
+                call_site="email_hook",
             )
             
             if response:
@@ -0,0 +1,212 @@
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from src.core.job import Job
+from src.llm.answer_validator import AnswerValidator
+from src.llm.context_builder import ContextBuilder
+from src.llm.prompts import detect_question_type
+from src.utils.config import get_settings
+
+
+@dataclass
+class Question:
+    label: str
+    kind: str  # input, select, textarea
+    options: list[str] = field(default_factory=list)
+    job: Optional[Job] = None
+    max_length: int = 500
+
+    @classmethod
+    def of(cls, question: dict, job: Optional[Job] = None) -> "Question":
+        """From a ``prepare_answers`` question ({label, kind, options})."""
+        options = question.get("options") or []
+        kind = "select" if question["kind"] == "select" and options else question["kind"]
+        if kind not in ("select", "textarea"):
+            kind = "input"
+        return cls(question["label"], kind, options, job)
+
+    @property
+    def type(self) -> str:
+        return detect_question_type(self.label)
+
+
+class AnswerTier(ABC):
+    name = ""
+    # Answers from this tier are validated and remembered for later applications
+    learns = False
+
+    @abstractmethod
+    async def answer(self, question: Question) -> Optional[Any]:
+        ...
+
+
+class RuleTier(AnswerTier):
+    """Profile fields, yes/no patterns and the profile's prepared answers; no model involved."""
+
+    name = "rules"
+    # detect_question_type -> Applicant.common_answers key
+    COMMON_ANSWER_KEYS = {
+        "why_company": "why_this_company",
+        "why_role": "why_this_role",
+        "strength": "greatest_strength",
+        "weakness": "greatest_weakness",
+    }
+
+    def __init__(self, mapper):
+        self.mapper = mapper
+
+    async def answer(self, question: Question) -> Optional[Any]:
+        if question.kind == "input":
+            return self.mapper.profile_value(question.label)
+        if question.kind == "select":
+            choice = self.mapper.profile_option(question.options, question.label)
+            flag = self.mapper.get_boolean_answer(question.label) if choice is None else None
+            if flag is not None:
+                target = "yes" if flag else "no"
+                choice = next((opt for opt in question.options if opt.strip().lower() == target), None)
+            return choice
+        key = self.COMMON_ANSWER_KEYS.get(question.type)
+        if key and question.job:
+            try:
+                return self.mapper.applicant.get_answer(key, company=question.job.company, position=question.job.title)
+            except (KeyError, IndexError):
+                # The template wants details we don't have ({industry}); leave it to the models
+                return None
+        return None
+
+
+class MemoryTier(AnswerTier):
+    """Answers given earlier on this form or in earlier applications (answer memory)."""
+
+    name = "memory"
+
+    def __init__(self, mapper):
+        self.mapper = mapper
+
+    async def answer(self, question: Question) -> Optional[Any]:
+        if question.kind == "input":
+            return self.mapper.remembered_value(question.label)
+        if question.kind == "select":
+            return self.mapper.remembered_option(question.options, question.label)
+        if question.job:
+            return self.mapper.remembered_answer(question.label, question.job)
+        return None
+
+
+class ModelTier(AnswerTier):
+    """A model client (``ApplicationAnswers``): short values, option picks and long answers."""
+
+    learns = True
+
+    def __init__(self, name: str, client, mapper, context_builder: ContextBuilder):
+        self.name = name
+        self.client = client
+        self.mapper = mapper
+        self.context_builder = context_builder
+
+    async def answer(self, question: Question) -> Optional[Any]:
+        if question.kind == "input":
+            print(f"   🤖 Invoking {self.name} model for field: '{question.label}'...")
+            value = await self.client.suggest_field_value(question.label, self.mapper.applicant_context())
+            if value:
+                print(f"      -> {self.name} suggested: {value}")
+            return value
+        if question.kind == "select":
+            print(f"   🤖 Invoking {self.name} model for dropdown: '{question.label}' with {len(question.options)} options. "
+                  f"Sample: {question.options[:5]}...")
+            choice = await self.client.select_best_option(
+                question.options, question.label, self.mapper.applicant_context("choice")
+            )
+            if choice:
+                print(f"      -> {self.name} selected: {choice}")
+            return choice
+        if not question.job:
+            return None
+        return await self.client.answer_application_question(
+            question=question.label,
+            job_title=question.job.title,
+            company=question.job.company,
+            applicant_context=self.context_builder.build_question_context(question.type, question.job),
+            max_length=question.max_length,
+        )
+
+
+# Per tier, across every engine in this process: questions tried, answered, seconds spent
+_tier_stats: dict[str, dict] = {}
+
+
+def record_tier(name: str, answered: bool, seconds: float) -> None:
+    stats = _tier_stats.setdefault(name, {"calls": 0, "hits": 0, "seconds": 0.0})
+    stats["calls"] += 1
+    stats["hits"] += int(answered)
+    stats["seconds"] += seconds
+
+
+def get_tier_stats() -> dict[str, dict]:
+    return {
+        name: {**stats, "hit_rate": stats["hits"] / stats["calls"], "avg_ms": stats["seconds"] / stats["calls"] * 1000}
+        for name, stats in _tier_stats.items() if stats["calls"]
+    }
+
+
+class AnswerEngine:
+    """
+    Answers a question by walking a chain of tiers, cheapest first: rules, memory, a
+    local model, Gemini. Which tiers a question visits, and in what order, depends on
+    its type (``llm.answer_tiers``); tiers without a client are skipped. The first
+    answer wins, and answers from models are validated and remembered.
+    """
+
+    def __init__(self, mapper, llm_client=None, local_client=None, routes: Optional[dict[str, list[str]]] = None):
+        self.mapper = mapper
+        self.validator = AnswerValidator()
+        self.context_builder = ContextBuilder(mapper.applicant)
+        self.routes = routes or get_settings().llm.answer_tiers
+        self.tiers: dict[str, AnswerTier] = {"rules": RuleTier(mapper), "memory": MemoryTier(mapper)}
+        if local_client:
+            self.tiers["local"] = ModelTier("local", local_client, mapper, self.context_builder)
+        if llm_client:
+            self.tiers["gemini"] = ModelTier("gemini", llm_client, mapper, self.context_builder)
+
+    def route(self, question: Question) -> list[str]:
+        names = self.routes.get(question.type) or self.routes.get("default") or list(self.tiers)
+        return [name for name in names if name in self.tiers]
+
+    async def resolve(self, question: Question, tiers: Optional[tuple[str, ...]] = None) -> Optional[Any]:
+        """First answer along the question's route (restricted to ``tiers`` if given), or None."""
+        for name in self.route(question):
+            if tiers and name not in tiers:
+                continue
+            tier = self.tiers[name]
+            started = time.perf_counter()
+            answer = await tier.answer(question)
+            if answer is not None and answer != "" and tier.learns:
+                answer = self.accept(question, answer)
+            answered = answer is not None and answer != ""
+            record_tier(name, answered, time.perf_counter() - started)
+            if answered:
+                return answer
+        return None
+
+    def accept(self, question: Question, answer: str) -> Optional[str]:
+        """Keep a model's answer for this form and later applications; None if it isn't usable."""
+        if question.kind == "select":
+            if answer not in question.options:
+                return None
+            self.mapper.accept_option(question.options, question.label, answer)
+            return answer
+        if question.kind == "input":
+            self.mapper.accept_value(question.label, answer)
+            return answer
+
+        validation = self.validator.validate(answer=answer, question=question.label, max_length=question.max_length)
+        if validation.needs_human_review:
+            return None
+        answer = self.validator.improve_answer(answer, validation.issues)
+        job = question.job
+        template = answer.replace(job.company, "{company}") if job and job.company else answer
+        template = template.replace(job.title, "{title}") if job and job.title else template
+        self.mapper.remember(self.mapper.normalize_label(question.label), "textarea", template)
+        return answer
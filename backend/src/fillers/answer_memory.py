@@ -0,0 +1,154 @@
+import hashlib
+import re
+import zlib
+from typing import Optional
+
+import numpy as np
+
+from src.utils.config import get_settings
+from src.utils.database import Database, get_db
+
+
+# Where a remembered answer came from; LLM answers only count as approved once an application using them went through
+SOURCE_RULE = "rule"
+SOURCE_LLM = "llm"
+SOURCE_HUMAN = "human"
+
+# Width of the hashed n-gram vectors; collisions are harmless at the size of a question bank
+DIMENSIONS = 1024
+
+
+def embed(text: str) -> np.ndarray:
+    """
+    Unit vector of a question's words and character trigrams, hashed into DIMENSIONS buckets
+    with a sign bit so collisions tend to cancel instead of adding up.
+    """
+    words = re.findall(r"[a-z0-9]+", text.lower())
+    padded = f" {' '.join(words)} "
+    features = words + [padded[i:i + 3] for i in range(len(padded) - 2)]
+
+    vector = np.zeros(DIMENSIONS, dtype=np.float32)
+    for feature in features:
+        bucket = zlib.crc32(feature.encode())
+        vector[bucket % DIMENSIONS] += 1.0 if bucket & 0x80000000 else -1.0
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
+
+
+def options_hash(options: Optional[list[str]]) -> str:
+    """Order-insensitive hash of a select's choices; empty for free-text questions."""
+    cleaned = sorted({option.strip().lower() for option in options or [] if option and option.strip()})
+    if not cleaned:
+        return ""
+    return hashlib.sha1("\n".join(cleaned).encode()).hexdigest()[:12]
+
+
+def memory_id(question: str, kind: str, opts_hash: str) -> str:
+    return hashlib.sha1(f"{kind}|{opts_hash}|{question}".encode()).hexdigest()[:20]
+
+
+class AnswerMemory:
+    """
+    Answers given to application questions, kept in the database so the next job
+    asking the same thing doesn't cost an LLM call. Lookups match the exact
+    question first, then fall back to the most similar approved question of the
+    same kind and option set.
+
+    Questions are passed in already normalized (``FieldMapper.normalize_label``).
+    """
+
+    def __init__(self, db: Optional[Database] = None, enabled: Optional[bool] = None,
+                 similarity: Optional[float] = None):
+        config = get_settings().application.answer_memory
+        self.db = db or get_db()
+        self.enabled = config.enabled if enabled is None else enabled
+        self.similarity = config.similarity if similarity is None else similarity
+        self._entries: Optional[dict[str, dict]] = None
+        # (kind, options hash) -> ids and stacked vectors of the approved entries in that group
+        self._indexes: dict[tuple[str, str], tuple[list[str], np.ndarray]] = {}
+        self.stats = {"exact": 0, "similar": 0, "misses": 0}
+
+    def lookup(self, question: str, kind: str, options: Optional[list[str]] = None) -> Optional[dict]:
+        """The remembered entry ({id, answer, source, approved, ...}) for ``question``, or None."""
+        if not self.enabled or not question:
+            return None
+        entries = self._load()
+        opts_hash = options_hash(options)
+
+        entry = entries.get(memory_id(question, kind, opts_hash))
+        if entry and self._fits(entry, options):
+            self.stats["exact"] += 1
+            self.db.touch_answer_memory(entry["id"])
+            return entry
+
+        ids, matrix = self._index(kind, opts_hash)
+        if ids:
+            scores = matrix @ embed(question)
+            best = int(np.argmax(scores))
+            entry = entries[ids[best]]
+            if scores[best] >= self.similarity and self._fits(entry, options):
+                self.stats["similar"] += 1
+                self.db.touch_answer_memory(entry["id"])
+                return entry
+
+        self.stats["misses"] += 1
+        return None
+
+    def remember(self, question: str, kind: str, answer: str, options: Optional[list[str]] = None,
+                 source: str = SOURCE_LLM) -> Optional[str]:
+        """Store an answer; returns its id so it can be approved once the application is submitted."""
+        if not self.enabled or not question or not answer:
+            return None
+        opts_hash = options_hash(options)
+        entry = {
+            "id": memory_id(question, kind, opts_hash), "question": question, "kind": kind,
+            "options_hash": opts_hash, "answer": answer, "source": source, "approved": source != SOURCE_LLM,
+        }
+        self.db.save_answer_memory(entry["id"], question, kind, opts_hash, answer, source, entry["approved"])
+        self._load()[entry["id"]] = entry
+        self._indexes.pop((kind, opts_hash), None)
+        return entry["id"]
+
+    def approve(self, ids: set[str]) -> None:
+        """Mark the answers of a submitted application as safe to reuse for similar questions."""
+        entries = self._load()
+        pending = [i for i in ids if i in entries and not entries[i]["approved"]]
+        if not self.enabled or not pending:
+            return
+        self.db.approve_answer_memories(pending)
+        for i in pending:
+            entries[i]["approved"] = True
+            self._indexes.pop((entries[i]["kind"], entries[i]["options_hash"]), None)
+
+    def get_stats(self) -> dict:
+        lookups = sum(self.stats.values())
+        hits = self.stats["exact"] + self.stats["similar"]
+        return {**self.stats, "lookups": lookups, "hit_rate": hits / lookups if lookups else 0.0}
+
+    def _load(self) -> dict[str, dict]:
+        if self._entries is None:
+            self._entries = {entry["id"]: entry for entry in self.db.get_answer_memories()}
+        return self._entries
+
+    def _index(self, kind: str, opts_hash: str) -> tuple[list[str], np.ndarray]:
+        key = (kind, opts_hash)
+        if key not in self._indexes:
+            group = [e for e in self._load().values() if e["approved"] and e["kind"] == kind and e["options_hash"] == opts_hash]
+            matrix = np.stack([embed(e["question"]) for e in group]) if group else np.zeros((0, DIMENSIONS), dtype=np.float32)
+            self._indexes[key] = ([e["id"] for e in group], matrix)
+        return self._indexes[key]
+
+    @staticmethod
+    def _fits(entry: dict, options: Optional[list[str]]) -> bool:
+        # A select answer is only usable if it is literally one of the choices
+        return not options or entry["answer"] in options
+
+
+_answer_memory: Optional[AnswerMemory] = None
+
+
+def get_answer_memory() -> AnswerMemory:
+    global _answer_memory
+    if _answer_memory is None:
+        _answer_memory = AnswerMemory()
+    return _answer_memory
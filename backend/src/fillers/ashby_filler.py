@@ -4,12 +4,16 @@ import asyncio
 
 from src.core.applicant import Applicant
 from src.core.application import Application
-from src.core.job import Job
+from src.core.job import Job, ApplicationType
 from src.fillers.base_filler import BaseFiller
+from src.fillers.form_snapshot import FormField, snapshot_form
+from src.utils.readiness import get_readiness, wait_for_options, wait_for_submission_outcome
 from src.llm.gemini import GeminiClient
+from src.utils.tracing import span
 
 class AshbyFiller(BaseFiller):
     PLATFORM_NAME = "Ashby"
+    APPLICATION_TYPE = ApplicationType.ASHBY
     
     SELECTORS = {
         "apply_button": "a[href*='application'], button:has-text('Apply Now'), a:has-text('Apply Now'), button:has-text('Apply for this Job'), a:has-text('Apply for this Job'), button:has-text('Apply')",
@@ -23,8 +27,13 @@ class AshbyFiller(BaseFiller):
         "website": "input[name*='website'], input[name*='portfolio'], input[id*='website'], div:has(label:has-text('Website')) input, div:has(label:has-text('Portfolio')) input",
         "submit": "button[type='submit']:has-text('Submit Application'), button:has-text('Submit Application'), button[type='submit']:has-text('Apply')",
         # Ashby often wraps questions in these classes
-        "question_container": "div._container_11l3u_1, div[class*='_container_']" 
+        "question_container": "div._container_11l3u_1, div[class*='_container_']",
+        # NOTE: Using 'fieldset' is semantic for Ashby
+        "question_block": "div:has(> label), fieldset:has(> label), div[class*='container']:has(label)",
     }
+    
+    QUESTION_MARKERS = {"custom_select": "div[class*='select']"}
+    AUTOCOMPLETE_KEYWORDS = ["school", "university", "college", "degree", "location", "city", "institution", "education"]
 
     async def can_handle(self, page: Page) -> bool:
         url = page.url.lower()
@@ -71,7 +80,7 @@ class AshbyFiller(BaseFiller):
                 else:
                     print("   ℹ️ No 'Apply' button found, assuming we might be on form or it's slow...")
             
-            await asyncio.sleep(1)
+            await self.settle(page)
 
             # Ensure we are in the right frame? Ashby is usually not iframed, but just in case
             # We'll stick to main page for now
@@ -80,12 +89,12 @@ class AshbyFiller(BaseFiller):
             if not await self._fill_basic_info(page, application):
                  # If we can't find basic info, maybe the form didn't load or it's a different structure
                  print("   ⚠️ Could not find basic info fields. Trying to wait longer...")
-                 await asyncio.sleep(2)
+                 await get_readiness(page).form_ready(self.APPLICATION_TYPE, timeout=5000)
                  if not await self._fill_basic_info(page, application):
                      raise Exception("Failed to identify application form fields")
 
             application.add_log("filled_basic", "Filled basic information")
-            await asyncio.sleep(1)
+            await self.settle(page)
 
             # 3. Resume
             if not await self._upload_resume(page):
@@ -96,11 +105,11 @@ class AshbyFiller(BaseFiller):
             
             # 4. Links
             await self._fill_online_presence(page)
-            await asyncio.sleep(1)
+            await self.settle(page)
             
             # 5. Custom Questions
             await self._handle_custom_questions(page, job, application)
-            await asyncio.sleep(1)
+            await self.settle(page)
 
             # 6. Submit
             if application.questions_for_review:
@@ -129,6 +138,7 @@ class AshbyFiller(BaseFiller):
             application.fail(str(e))
             return False
 
+    @span("form.basic_info")
     async def _fill_basic_info(self, page: Page, application: Application) -> bool:
         print("   🔍 Searching for basic info fields (Name, Email, Phone)...")
         
@@ -221,6 +231,7 @@ class AshbyFiller(BaseFiller):
         # Basic verification: at least Name and Email must be found
         return name_filled and email_filled
 
+    @span("upload.resume")
     async def _upload_resume(self, page: Page) -> bool:
         from pathlib import Path
         
@@ -280,144 +291,57 @@ class AshbyFiller(BaseFiller):
         if self.applicant.portfolio:
              await self.fill_text_field(page, self.SELECTORS["website"], self.applicant.portfolio)
 
+    @span("form.questions")
     async def _handle_custom_questions(self, page: Page, job: Job, application: Application) -> None:
-        # Ashby structure:
-        # div._container_...
-        #   label._label_...
-        #   div._inputContainer_... > input / select / textarea
-        
-        # Broad selector for question blocks
-        # We look for divs that contain a label and an input
-        
-        # NOTE: Class names in Ashby are often hashed css modules (e.g. _container_11l3u_1)
-        # We should rely on structural logic: div that has label
-        
-        # Ashby structure:
-        # div/fieldset containing label and input
-        
-        # NOTE: Using 'fieldset' is semantic for Ashby, missed previously.
-        question_blocks = page.locator("div:has(> label), fieldset:has(> label), div[class*='container']:has(label)")
-        count = await question_blocks.count()
-        
-        print(f"DEBUG: Found {count} potential question blocks")
-
-        handled_inputs = set()
-        for i in range(count):
-            block = question_blocks.nth(i)
-            
-            # 0. Skip if this block is contained within another question block we already handled
-            # (Ashby often nests labels/inputs in ways that trigger broad selectors)
-            if not await block.is_visible():
-                continue
-                
-            label_el = block.locator("label").first
-            if await label_el.count() == 0:
-                continue
-                
-            question_text = await label_el.text_content()
-            if not question_text: continue
-            question_text = question_text.strip()
-            
-            if self._should_skip_question(question_text):
-                continue
-                
-            print(f"DEBUG: Processing question: '{question_text}'")
-            await asyncio.sleep(2) # Throttle to avoid LLM rate limits
-            
-            # Find input element within the block
-            input_el = block.locator("input, textarea, select, [role='combobox']").first
-            
-            # Special Handling for "Button Groups" (Yes/No buttons often used by Ashby/Ramp)
-            # If no input found, OR if input is hidden, look for buttons
-            has_buttons = await block.locator("button").count() > 0
-            if (await input_el.count() == 0 or not await input_el.is_visible()) and has_buttons:
-                 await self._handle_button_group(block, question_text)
-                 continue
-            
-            if await input_el.count() == 0:
-                 continue
-            
-            # Determine type
-            tag_name = await input_el.evaluate("el => el.tagName.toLowerCase()")
-            input_type = await input_el.get_attribute("type")
-            
-            # Skip if we already handled this specific input (primary for choice groups)
-            input_id = await input_el.get_attribute("id") or await input_el.get_attribute("name")
-            if input_id in handled_inputs:
-                print(f"   ⏩ Skipping already handled input: {input_id}")
-                continue
-            if input_id: handled_inputs.add(input_id)
-
-            # 1. Dropdowns (Select or custom)
-            if tag_name == "select" or (await block.locator("div[class*='select']").count() > 0):
-                await self._handle_dropdown(block, question_text)
+        # Class names in Ashby are hashed css modules (e.g. _container_11l3u_1), so question
+        # blocks are found structurally: a div/fieldset that has a label. The whole form is
+        # read in one evaluate and plain text/select answers are written back in one more.
+        snapshot = await snapshot_form(page, self.SELECTORS["question_block"], markers=self.QUESTION_MARKERS)
+        plan = self.load_form_plan(page.url, snapshot)
+        print(f"DEBUG: Found {len(snapshot)} question blocks" + (" (cached plan)" if plan.hit else ""))
+        # Everything profile and memory can't answer goes to the LLM in one request up front
+        await self.prepare_answers(self.open_questions(snapshot, skip=self._should_skip_question), job)
+
+        batch = []
+        for field in snapshot:
+            if not field.visible or self._should_skip_question(field.label):
                 continue
-                
-            # 1. Checkboxes / Radios (High Priority - often styled as other things)
-            if input_type in ["checkbox", "radio"]:
-                # If Choice Group, mark all inner inputs as handled
-                inner_inputs = await block.locator(f"input[type='{input_type}']").all()
-                for inp in inner_inputs:
-                    iid = await inp.get_attribute("id") or await inp.get_attribute("name")
-                    if iid: handled_inputs.add(iid)
-                # Check if this is a GROUP (multiple options) or Single
-                all_inputs = block.locator(f"input[type='{input_type}']")
-                if await all_inputs.count() > 1:
-                     await self._handle_choice_group(block, question_text, input_type)
-                else:
-                     await self._handle_checkbox(input_el, question_text)
+            strategy = plan.strategy(field) or self._classify_field(field)
+            if strategy == "skip":
                 continue
-
-            # 1.5 Autocomplete (School/Location)
-            # Check for School/University/Degree specific inputs that need typing
-            if any(k in question_text.lower() for k in ["school", "university", "college", "degree", "location", "city", "institution", "education"]):
-                 await self._handle_autocomplete(input_el, question_text)
-                 continue
-
-
-                
-            # 2. Textarea
-            if tag_name == "textarea":
-                await self._handle_textarea(input_el, question_text, job, application)
-                continue
-                
-            # 3. Text Input (Catch-all for remaining inputs)
-            # If it's an input and NOT a checkbox/radio/file/hidden (handled above/below)
-            if tag_name == "input" and input_type not in ["checkbox", "radio", "file", "hidden", "submit", "button", "image"]:
-                await self._handle_input(input_el, question_text, job)
-                continue
-
-
-                
-            # 5. Hidden Inputs (often styled radios/checkboxes)
-            if await input_el.count() > 0 and not await input_el.is_visible():
-                 if input_type in ["checkbox", "radio"]:
-                     # Same logic for hidden inputs
-                     all_inputs = block.locator(f"input[type='{input_type}']")
-                     if await all_inputs.count() > 1:
-                          await self._handle_choice_group(block, question_text, input_type)
-                     else:
-                          await self._handle_checkbox(input_el, question_text)
-                     continue
-
-    async def _handle_input(self, element, question: str, job: Job) -> None:
-        q_lower = question.lower()
-        val = None
-        
-        # Explicitly handle social links if they fell through to here
-        if "linkedin" in q_lower:
-            val = self.applicant.linkedin
-        elif "github" in q_lower:
-            val = self.applicant.github
-        elif "website" in q_lower or "portfolio" in q_lower:
-            val = self.applicant.portfolio
-            
-        # Fallback to general mapper
-        if not val:
-            val = self.field_mapper.get_value(question)
-            
-        if val:
-            await element.fill(str(val))
+            question_text = field.label
+            print(f"DEBUG: Processing question: '{question_text}' ({strategy})")
+
+            answer = plan.answer(field)
+            if strategy == "button_group":
+                await self._handle_button_group(field.container, question_text)
+            elif strategy == "select":
+                answer = answer or await self.field_mapper.get_dropdown_value(field.options, question_text)
+            elif strategy == "dropdown":
+                await self._handle_dropdown(field.container, question_text)
+            elif strategy == "choice_group":
+                await self._handle_choice_group(field.container, question_text, field.type)
+            elif strategy == "checkbox":
+                await self._handle_checkbox(field.control, question_text)
+            elif strategy == "autocomplete":
+                await self._handle_autocomplete(field.control, question_text)
+            elif strategy == "textarea":
+                answer = await self._textarea_answer(question_text, job, application)
+            elif strategy == "input":
+                answer = answer or await self._input_answer(question_text, job)
+
+            plan.record(field, strategy, answer)
+            if answer:
+                batch.append((field, answer))
+
+        values = {field.handle: value for field, value in batch}
+        for field in await snapshot.apply(batch):
+            # Widgets that reject programmatic values get typed into instead
+            snapshot.round_trips += 1
+            await field.control.fill(values[field.handle])
+
+        print(f"   📋 {len(snapshot)} question blocks: {snapshot.round_trips} round trips for discovery + {len(batch)} batched answers")
+        application.add_log("form_snapshot", f"{len(snapshot)} blocks, {snapshot.round_trips} batched round trips")
 
     def _should_skip_question(self, text: str) -> bool:
         t = text.lower()
@@ -433,7 +357,7 @@ class AshbyFiller(BaseFiller):
         select = block.locator("select").first
         if await select.count() > 0 and await select.is_visible():
             options = await select.locator("option").all_text_contents()
-            val = self.field_mapper.get_dropdown_value(options, question_text)
+            val = await self.field_mapper.get_dropdown_value(options, question_text)
             if val:
                 await select.select_option(label=val)
             return
@@ -444,13 +368,9 @@ class AshbyFiller(BaseFiller):
         trigger = block.locator("input[role='combobox'], div[class*='control']").first
         if await trigger.count() > 0:
              await trigger.click()
-             await asyncio.sleep(0.5)
+             await wait_for_options(block.page, ["div[class*='menu']", "div[role='option']", "div[id*='react-select']"], timeout=2000)
              
              # Locate options (usually in a portal at root)
-             # Ashby options often have class containing 'option'
-             options_locator = self.applicant.page_locator("div[id*='react-select'], div[class*='option']") 
-             # Wait, we need page reference. 
-             # We can use block.page
              page = block.page
              
              # Try to find the menu
@@ -458,16 +378,16 @@ class AshbyFiller(BaseFiller):
              if await menu.count() > 0:
                  opts = await menu.locator("div[id*='react-select']").all_text_contents()
                  if opts:
-                     val = self.field_mapper.get_dropdown_value(opts, question_text)
+                     val = await self.field_mapper.get_dropdown_value(opts, question_text)
                      if val:
                          await menu.locator(f"div:has-text('{val}')").first.click()
                          return
             
              # Fallback: type and enter
-             val = self.field_mapper.get_value(question_text)
+             val = await self.field_mapper.get_value(question_text)
              if val:
                  await trigger.fill(str(val))
-                 await asyncio.sleep(0.5)
+                 await wait_for_options(block.page, ["div[role='option']", "div[id*='react-select']"], timeout=2000)
                  await trigger.press("Enter")
 
     async def _handle_checkbox(self, element, question_text: str) -> None:
@@ -488,7 +408,7 @@ class AshbyFiller(BaseFiller):
              
              # 1. Click parent label (forcefully)
              await element.evaluate("el => el.closest('label')?.click() || el.parentElement?.click()")
-             await asyncio.sleep(0.1)
+             await self.settle(element.page, quiet_ms=100, timeout=1000)
              
              # 2. Fire explicit MouseEvent sequence (mousedown -> mouseup -> click)
              # This often wakes up stubborn React listeners
@@ -573,21 +493,13 @@ class AshbyFiller(BaseFiller):
         # 2. Select best option via LLM or fallback
         best_option = None
         
-        if self.llm_client:
-            try:
-                # Build context for LLM
-                context = self.context_builder.build_full_context(None)
-                
-                # Use LLM to select the best option
-                best_option = await self.llm_client.select_best_option(
-                    options=options,
-                    field_label=question,
-                    applicant_context=context
-                )
-                print(f"   🤖 AI Selected: '{best_option}'")
-            except Exception as e:
-                print(f"   ⚠️ LLM selection failed: {e}")
-                best_option = None
+        try:
+            # Rules, memory (incl. the form's batch picks), then the models
+            best_option = await self.field_mapper.get_dropdown_value(options, question)
+            print(f"   🤖 AI Selected: '{best_option}'")
+        except Exception as e:
+            print(f"   ⚠️ LLM selection failed: {e}")
+            best_option = None
         
         # Fallback logic if LLM fails or is unavailable
         if not best_option:
@@ -673,7 +585,7 @@ class AshbyFiller(BaseFiller):
             # Strategy 1: Standard click (works for most visible elements)
             if await click_target.is_visible():
                 await click_target.click(force=True, timeout=2000)
-                await asyncio.sleep(0.3)
+                await self.settle(click_target.page, quiet_ms=100, timeout=1000)
                 
                 # Verify if it worked
                 if input_element:
@@ -688,7 +600,7 @@ class AshbyFiller(BaseFiller):
         try:
             print(f"   🔧 Trying JS click...")
             await click_target.evaluate("el => el.click()")
-            await asyncio.sleep(0.2)
+            await self.settle(click_target.page, quiet_ms=100, timeout=1000)
             
             if input_element:
                 is_checked = await input_element.is_checked()
@@ -708,123 +620,73 @@ class AshbyFiller(BaseFiller):
                     el.dispatchEvent(new Event('input', {bubbles: true}));
                     el.dispatchEvent(new Event('click', {bubbles: true}));
                 }""")
-                await asyncio.sleep(0.2)
+                await self.settle(input_element.page, quiet_ms=100, timeout=1000)
                 print(f"   ✅ Force-set successful for '{option_text}'")
             except Exception as e:
                 print(f"   ❌ Force-set failed: {e}")
 
-    async def _handle_textarea(self, element, question: str, job: Job, application: Application) -> None:
-         # Similar to Greenhouse
-        common_answer = self.applicant.get_answer("", company=job.company, position=job.title) # Key mapping needed?
+    def _classify_field(self, field: FormField) -> str:
+        # Special Handling for "Button Groups" (Yes/No buttons often used by Ashby/Ramp)
+        # If no input found, OR if input is hidden, look for buttons
+        if (not field.handle or not field.control_visible) and field.buttons:
+            return "button_group"
+        if not field.handle:
+            return "skip"
+        # Dropdowns (Select or custom)
+        if field.tag == "select" or field.has("custom_select"):
+            return "select" if field.tag == "select" and field.control_visible else "dropdown"
+        # Checkboxes / Radios (often styled as other things, or hidden behind labels)
+        if field.type in ["checkbox", "radio"]:
+            return "choice_group" if field.group_size > 1 else "checkbox"
+        # Autocomplete (School/Location) needs typing and picking a suggestion
+        if any(k in field.label.lower() for k in self.AUTOCOMPLETE_KEYWORDS):
+            return "autocomplete"
+        if field.tag == "textarea":
+            return "textarea"
+        return "input" if field.is_text else "skip"
+
+    async def _textarea_answer(self, question: str, job: Job, application: Application) -> Optional[str]:
         # Use simple mapping for now
         if "cover letter" in question.lower():
              # Check if we have cover letter content
              cl = self.applicant.cover_letter_content
              if cl:
-                 await element.fill(cl)
-                 return
+                 return cl
 
         # Use LLM if enabled
         if self.llm_client:
              ans = await self.answer_question_with_llm(question, job)
              if ans:
-                 await element.fill(ans)
-                 return
+                 return ans
         
         application.add_question_for_review(question, "Long answer needed")
+        return None
 
-    async def _handle_input(self, element, question: str, job: Job) -> None:
+    async def _input_answer(self, question: str, job: Job) -> Optional[str]:
         val = await self.field_mapper.get_value(question)
         if val:
-            await element.fill(str(val))
-            return
+            return str(val)
 
         # Fallback to LLM for one-liners (e.g. "How did you hear about us?")
         if self.llm_client:
              ans = await self.answer_question_with_llm(question, job)
              if ans:
-                 await element.fill(ans)
-                 return
+                 return ans
                  
         print(f"   ⚠️ Could not determine answer for input: '{question}'")
+        return None
 
     async def _verify_filled_state(self, page: Page) -> None:
         print("   🕵️ Verifying form state before submission...")
         
-        # Re-scan for all question blocks
-        # Using the robust selector we found earlier
-        question_blocks = page.locator("div:has(> label), fieldset:has(> label), div[class*='container']:has(label)")
-        count = await question_blocks.count()
-        
-        for i in range(count):
-            block = question_blocks.nth(i)
-            if not await block.is_visible(): continue
-            
-            label_el = block.locator("label").first
-            q_text = await label_el.text_content()
-            q_text = q_text.strip() if q_text else ""
-            
-            # Skip if we shouldn't answer
-            if self._should_skip_question(q_text): continue
-            
-            # Check status
-            is_filled = False
-            
-            # 1. Check Input/Textarea value
-            input_el = block.locator("input:not([type='checkbox']):not([type='radio']), textarea").first
-            if await input_el.count() > 0:
-                val = await input_el.input_value()
-                if val and len(val.strip()) > 0:
-                    is_filled = True
-            
-            # 2. Comprehensive State Check (JS)
-            if not is_filled:
-                is_filled = await block.evaluate("""block => {
-                    const check = (node) => {
-                        if (!node) return false;
-                        const style = window.getComputedStyle(node);
-                        return node.classList.contains('active') || 
-                               node.classList.contains('selected') ||
-                               node.classList.contains('checked') ||
-                               node.classList.contains('is-selected') ||
-                               node.classList.contains('is-active') ||
-                               node.className.toLowerCase().includes('active') || 
-                               node.className.toLowerCase().includes('selected') ||
-                               node.className.toLowerCase().includes('checked') ||
-                               node.getAttribute('aria-checked') === 'true' ||
-                               node.getAttribute('aria-pressed') === 'true' ||
-                               (node.tagName === 'INPUT' && node.checked) ||
-                               (style.backgroundColor !== 'rgba(0, 0, 0, 0)' && 
-                                style.backgroundColor !== 'transparent' && 
-                                !style.backgroundColor.includes('255, 255, 255'));
-                    };
-
-                    // 1. Check text inputs/textareas
-                    const inputs = block.querySelectorAll('input:not([type="checkbox"]):not([type="radio"]), textarea');
-                    for (const input of inputs) {
-                        if (input.value && input.value.trim().length > 0) return true;
-                    }
-                    
-                    // 2. Check checkboxes/radios (native)
-                    if (block.querySelector('input:checked')) return true;
-                    
-                    // 3. Check custom buttons/toggles (comprehensive)
-                    const elements = block.querySelectorAll('button, [role="button"], label, div[class*="option"], div[class*="choice"], span');
-                    for (const el of elements) {
-                        if (check(el) || check(el.parentElement)) return true;
-                    }
-                    
-                    // 4. Large blocks with text (last resort)
-                    const text = block.innerText || "";
-                    if (text.length > 500) return true;
-                    
-                    return false;
-                }""")
-
-            if not is_filled:
-                print(f"   ⚠️ Field '{q_text}' appears EMPTY. Retrying...")
-                # Call specific retry logic
-                await self._retry_fill(block, q_text)
+        # Re-scan all question blocks; the snapshot reports each block's filled state
+        # (text values, checked inputs, active/selected custom toggles) in the same call
+        snapshot = await snapshot_form(page, self.SELECTORS["question_block"])
+        for field in snapshot:
+            if not field.visible or field.filled or self._should_skip_question(field.label):
+                continue
+            print(f"   ⚠️ Field '{field.label}' appears EMPTY. Retrying...")
+            await self._retry_fill(field.container, field.label)
 
     async def _retry_fill(self, block, question: str) -> None:
         """
@@ -858,6 +720,7 @@ class AshbyFiller(BaseFiller):
         if has_buttons:
             await self._handle_button_group(block, question)
              
+    @span("submit")
     async def submit_application(self, page: Page) -> bool:
         # Verify before submitting
         await self._verify_filled_state(page)
@@ -903,7 +766,7 @@ class AshbyFiller(BaseFiller):
         if await submit_btn.count() > 0:
             print("   🚀 Clicking submit...")
             await submit_btn.click()
-            await asyncio.sleep(2)
+            await wait_for_submission_outcome(page, timeout=5000)
             
             # Check for immediate success
             if await self._check_success(page):
@@ -944,7 +807,7 @@ class AshbyFiller(BaseFiller):
     async def _handle_autocomplete(self, field, question: str) -> bool:
         # Ported from GreenhouseFiller
         # 1. Determine value
-        value = self.field_mapper.get_value(question)
+        value = await self.field_mapper.get_value(question)
         if not value: return False
         
         print(f"DEBUG: Handling Autocomplete for '{question}' with '{value}'")
@@ -952,12 +815,10 @@ class AshbyFiller(BaseFiller):
         try:
             # 1. Click to Focus
             await field.click()
-            await asyncio.sleep(0.5)
             
             # 2. Type Value
             await field.clear()
             await field.press_sequentially(str(value), delay=100)
-            await asyncio.sleep(2.0) # Wait for suggestions
             
             # 3. Try Clicking Suggestion
             # Ashby suggestions usually appear in a portal
@@ -973,6 +834,7 @@ class AshbyFiller(BaseFiller):
             ]
             
             suggestion_clicked = False
+            await wait_for_options(page, suggestion_selectors)
             for sel in suggestion_selectors:
                  # Check visible options containing text first
                  suggestions = page.locator(f"{sel}:visible")
@@ -992,8 +854,6 @@ class AshbyFiller(BaseFiller):
                       suggestion_clicked = True
                       break
             
-            await asyncio.sleep(0.5)
-            
             # 4. Fallback: Enter
             if not suggestion_clicked:
                  print("   -> No suggestion clicked, using Keyboard Enter")
@@ -1069,21 +929,13 @@ class AshbyFiller(BaseFiller):
         
         # Use LLM to select best option
         selected_option = None
-        if self.llm_client:
-            try:
-                # Build context for LLM
-                context = self.context_builder.build_full_context(None)
-                
-                # Use LLM to select the best option
-                selected_option = await self.llm_client.select_best_option(
-                    options=options, 
-                    field_label=question, 
-                    applicant_context=context
-                )
-                print(f"   🤖 AI Selected: '{selected_option}'")
-            except Exception as e:
-                print(f"   ⚠️ LLM failed: {e}")
-                selected_option = None
+        try:
+            # Rules, memory, then the models
+            selected_option = await self.field_mapper.get_dropdown_value(options, question)
+            print(f"   🤖 AI Selected: '{selected_option}'")
+        except Exception as e:
+            print(f"   ⚠️ LLM failed: {e}")
+            selected_option = None
         
         # Fallback to boolean logic
         if not selected_option:
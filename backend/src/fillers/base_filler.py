@@ -1,18 +1,29 @@
+import asyncio
+import time
 from abc import ABC, abstractmethod
 from typing import Optional
 from playwright.async_api import Page
 
 from src.core.applicant import Applicant
 from src.core.application import Application, ApplicationQuestion
-from src.core.job import Job
+from src.core.job import Job, ApplicationType
+from src.fillers.answer_engine import Question, record_tier
+from src.fillers.checkpoint import Checkpoint, get_checkpoints
 from src.fillers.field_mapper import FieldMapper
+from src.fillers.form_cache import FormPlan, get_form_cache
+from src.fillers.form_snapshot import FormSnapshot
 from src.llm.gemini import GeminiClient
 from src.llm.context_builder import ContextBuilder
 from src.llm.answer_validator import AnswerValidator
+from src.utils.config import get_settings
+from src.utils.readiness import get_readiness, wait_for_dom_settled
+from src.utils.tracing import span
 
 
 class BaseFiller(ABC):
     PLATFORM_NAME = "Base"
+    # Picks the readiness predicates (form root, questions endpoint, submit button)
+    APPLICATION_TYPE: Optional[ApplicationType] = None
     
     def __init__(self, applicant: Applicant, llm_client: Optional[GeminiClient] = None):
         self.applicant = applicant
@@ -21,6 +32,13 @@ class BaseFiller(ABC):
         self.context_builder = ContextBuilder(applicant)
         self.validator = AnswerValidator()
         self.questions_for_review: list[ApplicationQuestion] = []
+        # Long answers generated ahead of time by the orchestrator's look-ahead stage
+        self.prepared_answers: dict[str, str] = {}  # normalized question label -> answer
+        # How this form is being filled; replayed from / saved to the form-schema cache
+        self.form_plan: Optional[FormPlan] = None
+        # Step checkpoint of a multi-page form, loaded by load_checkpoint() for this job
+        self.checkpoint: Optional[Checkpoint] = None
+        self.checkpoint_job: Optional[Job] = None
     
     @abstractmethod
     async def can_handle(self, page: Page) -> bool:
@@ -30,6 +48,7 @@ class BaseFiller(ABC):
     async def fill(self, page: Page, job: Job, application: Application) -> bool:
         pass
     
+    @span("field.fill")
     async def fill_text_field(self, page: Page, selector: str, value: str, clear_first: bool = True) -> bool:
         try:
             element = page.locator(selector)
@@ -44,6 +63,7 @@ class BaseFiller(ABC):
         except Exception:
             return False
     
+    @span("field.click")
     async def click_button(self, page: Page, selector: str) -> bool:
         try:
             element = page.locator(selector)
@@ -55,6 +75,7 @@ class BaseFiller(ABC):
         except Exception:
             return False
     
+    @span("field.select")
     async def select_dropdown(self, page: Page, selector: str, value: str) -> bool:
         try:
             element = page.locator(selector)
@@ -66,6 +87,7 @@ class BaseFiller(ABC):
         except Exception:
             return False
     
+    @span("upload")
     async def upload_file(self, page: Page, selector: str, file_path: str) -> bool:
         try:
             element = page.locator(selector)
@@ -114,34 +136,224 @@ class BaseFiller(ABC):
         
         return False
     
+    @span("answers.resolve")
     async def answer_question_with_llm(self, question: str, job: Job, max_length: int = 500) -> Optional[str]:
-        if not self.llm_client:
-            return None
+        prepared = self.prepared_answers.get(FieldMapper.normalize_label(question))
+        if prepared:
+            return prepared
         
         needs_review, reason = self.validator.needs_human_review(question)
         if needs_review:
             return None
         
-        context = self.context_builder.build_full_context(job, max_chars=800)
+        # Prepared answers, memory, then the models (see AnswerEngine)
+        return await self.field_mapper.engine.resolve(Question(question, "textarea", job=job, max_length=max_length))
+    
+    def known_answer(self, question: str, job: Job) -> Optional[str]:
+        """A long answer given to the same (or, once approved, a similar) question in an earlier application."""
+        return self.field_mapper.remembered_answer(question, job)
+    
+    def accept_answer(self, question: str, answer: str, job: Job, max_length: int = 500) -> Optional[str]:
+        """Validate a model's long answer; a usable one is polished and remembered, otherwise None."""
+        return self.field_mapper.engine.accept(Question(question, "textarea", job=job, max_length=max_length), answer)
+    
+    @span("form.discover")
+    async def collect_questions(self, page: Page) -> list[dict]:
+        """Labels of the visible text inputs and textareas across all frames, in one evaluate per frame."""
+        script = """
+        () => {
+            const questions = [];
+            document.querySelectorAll('input, textarea').forEach(el => {
+                const type = (el.getAttribute('type') || 'text').toLowerCase();
+                if (el.tagName === 'INPUT' && !['text', 'email', 'tel', 'url', 'number'].includes(type)) return;
+                if (!el.offsetParent) return;
+                let label = el.id ? document.querySelector(`label[for="${CSS.escape(el.id)}"]`) : null;
+                label = label || el.closest('label');
+                const text = (label ? label.textContent : el.getAttribute('aria-label')) || '';
+                if (text.trim()) {
+                    questions.push({label: text.trim(), kind: el.tagName.toLowerCase()});
+                }
+            });
+            return questions;
+        }
+        """
+        questions = []
+        for frame in page.frames:
+            try:
+                questions.extend(await frame.evaluate(script))
+            except Exception:
+                continue
+        return questions
+    
+    async def precompute_answers(self, page: Page, job: Job) -> int:
+        """Resolve answers for the form already open on ``page`` before the fill starts."""
+        return await self.prepare_answers(await self.collect_questions(page), job)
+    
+    @span("answers.prepare")
+    async def prepare_answers(self, questions: list[dict], job: Job) -> int:
+        """
+        Answer ``questions`` ({label, kind, options}) ahead of the fill: short fields and
+        select choices land in the field mapper's caches, long answers in ``prepared_answers``.
+        Whatever profile and memory can't answer goes to the local model (if configured),
+        then to Gemini in one batched request; questions the batch leaves unanswered get
+        per-question calls. Each question only visits the tiers its type is routed to.
+        """
+        answered = 0
+        self.field_mapper.map_labels([q["label"] for q in questions if q["kind"] == "input"])
         
-        answer = await self.llm_client.answer_application_question(
-            question=question,
-            job_title=job.title,
-            company=job.company,
-            applicant_context=context,
-            max_length=max_length
-        )
+        engine = self.field_mapper.engine
+        pending = []
+        for question in questions:
+            label = question["label"]
+            if question["kind"] == "textarea":
+                if FieldMapper.normalize_label(label) in self.prepared_answers:
+                    continue
+                # Profile answers are free at fill time; only spend LLM calls on the rest
+                key = self._question_to_key(label)
+                if key and self.applicant.get_answer(key, company=job.company, position=job.title):
+                    continue
+                if self.validator.needs_human_review(label)[0]:
+                    continue
+            # Profile, yes/no rules and remembered answers
+            known = await engine.resolve(Question.of(question, job), tiers=("rules", "memory"))
+            if known is not None:
+                answered += self._keep_prepared([question], [known])
+                continue
+            pending.append(question)
         
-        if answer:
-            validation = self.validator.validate(answer=answer, question=question, max_length=max_length)
-            
-            if validation.needs_human_review:
-                return None
-            
-            answer = self.validator.improve_answer(answer, validation.issues)
-            return answer
+        if pending and "local" in engine.tiers:
+            answers = await asyncio.gather(*(
+                engine.resolve(Question.of(question, job), tiers=("local",)) for question in pending
+            ))
+            answered += self._keep_prepared(pending, answers)
+            pending = [question for question, answer in zip(pending, answers) if answer is None]
+        
+        # Only questions routed to Gemini go on (none when it isn't configured)
+        pending = [question for question in pending if "gemini" in engine.route(Question.of(question, job))]
+        if pending and self.llm_client and get_settings().llm.batch_questions:
+            batch_answered, pending = await self._answer_batch(pending, job)
+            answered += batch_answered
         
-        return None
+        for question in pending:
+            answer = await engine.resolve(Question.of(question, job), tiers=("gemini",))
+            answered += self._keep_prepared([question], [answer])
+        return answered
+    
+    def _question_to_key(self, question: str) -> str:
+        """The profile's common_answers key for a long question this filler fills from the profile, or ""."""
+        return ""
+    
+    def _keep_prepared(self, questions: list[dict], answers: list) -> int:
+        """Count the answered questions; long answers go to ``prepared_answers`` (the rest is cached by the mapper)."""
+        for question, answer in zip(questions, answers):
+            if answer is not None and question["kind"] == "textarea":
+                self.prepared_answers[FieldMapper.normalize_label(question["label"])] = answer
+        return sum(1 for answer in answers if answer is not None)
+    
+    @span("answers.batch")
+    async def _answer_batch(self, questions: list[dict], job: Job) -> tuple[int, list[dict]]:
+        """One LLM request for all ``questions``; returns how many were answered and the ones that weren't."""
+        items = []
+        for i, question in enumerate(questions):
+            if question["kind"] == "textarea":
+                kind, max_length = "long_text", 500
+            elif question["kind"] == "select" and question.get("options"):
+                kind, max_length = "choice", 0
+            else:
+                kind, max_length = "text", 100
+            items.append({
+                "id": f"q{i + 1}", "label": question["label"], "kind": kind,
+                "options": question.get("options") or [], "max_length": max_length,
+            })
+        
+        context = f"{self.field_mapper.applicant_context('batch')}\n{self.context_builder.build_job_context(job)}"
+        print(f"   🤖 Answering {len(items)} questions in one LLM request...")
+        started = time.perf_counter()
+        answers = await self.llm_client.answer_questions(items, job.title, job.company, context)
+        seconds = (time.perf_counter() - started) / len(items)
+        
+        answered, leftover = 0, []
+        for item, question in zip(items, questions):
+            label, answer = question["label"], answers.get(item["id"])
+            if answer and item["kind"] == "long_text":
+                answer = self.accept_answer(label, answer, job, item["max_length"])
+                if answer:
+                    self.prepared_answers[FieldMapper.normalize_label(label)] = answer
+            elif answer and item["kind"] == "choice":
+                self.field_mapper.accept_option(item["options"], label, answer)
+            elif answer:
+                self.field_mapper.accept_value(label, answer)
+            record_tier("gemini", bool(answer), seconds)
+            if answer:
+                answered += 1
+            else:
+                leftover.append(question)
+        if leftover:
+            print(f"      -> {answered}/{len(items)} answered, {len(leftover)} left for per-question calls")
+        return answered, leftover
+    
+    def open_questions(self, snapshot: FormSnapshot, skip=None) -> list[dict]:
+        """
+        The visible, still-empty fields of ``snapshot`` that need an answer, as ``prepare_answers``
+        questions. Fields the cached form plan already answers and labels ``skip`` rejects are left out.
+        """
+        questions = []
+        for field in snapshot:
+            if not field.visible or field.filled or (skip and skip(field.label)):
+                continue
+            if self.form_plan and self.form_plan.answer(field):
+                continue
+            if field.tag == "textarea":
+                kind = "textarea"
+            elif field.options and (field.tag == "select" or field.group_size > 1):
+                kind = "select"
+            elif field.is_text:
+                kind = "input"
+            else:
+                continue
+            questions.append({"label": field.label, "kind": kind, "options": field.options})
+        return questions
+    
+    def load_form_plan(self, url: str, snapshot: FormSnapshot) -> FormPlan:
+        self.form_plan = get_form_cache().load(self.APPLICATION_TYPE, url, snapshot)
+        return self.form_plan
+    
+    def load_checkpoint(self, job: Job) -> Optional[Checkpoint]:
+        """The step an earlier attempt at ``job`` got to, if it left a checkpoint."""
+        if self.checkpoint_job is not job:
+            self.checkpoint_job = job
+            self.checkpoint = get_checkpoints().load(job)
+        return self.checkpoint
+    
+    async def save_checkpoint(self, page: Page, job: Job, application: Application, step: int,
+                              answers: dict[str, str]) -> None:
+        """Checkpoint a completed page; a failure to save costs the resume, never the application."""
+        self.checkpoint_job = job
+        try:
+            with span("checkpoint.save", step=step):
+                self.checkpoint = await get_checkpoints().save(page, job, step, answers)
+        except Exception as e:
+            print(f"   ⚠️ Could not checkpoint step {step}: {e}")
+        application.current_step = step
+        application.current_page_url = page.url
+    
+    def finish(self, success: bool) -> None:
+        """Settle what this fill learned: the form plan and the answers it gave."""
+        self.finish_form_plan(success)
+        if success:
+            self.field_mapper.memory.approve(self.field_mapper.memory_ids)
+            if self.checkpoint_job:
+                get_checkpoints().clear(self.checkpoint_job)
+    
+    def finish_form_plan(self, success: bool) -> None:
+        """Keep the plan of a form that went through; forget a cached one that didn't work."""
+        plan, self.form_plan = self.form_plan, None
+        if not plan:
+            return
+        if success:
+            get_form_cache().save(plan)
+        elif plan.hit:
+            get_form_cache().invalidate(plan)
     
     def add_question_for_review(self, question_text: str, reason: str, field_name: str = "") -> None:
         q = ApplicationQuestion(
@@ -152,8 +364,12 @@ class BaseFiller(ABC):
         )
         self.questions_for_review.append(q)
     
+    @span("form.ready")
     async def wait_for_page_load(self, page: Page, timeout: int = 10000) -> None:
-        try:
-            await page.wait_for_load_state("networkidle", timeout=timeout)
-        except Exception:
-            pass
+        """Wait until this platform's form is usable rather than for the network to go idle."""
+        await get_readiness(page).ready(self.APPLICATION_TYPE, timeout=timeout)
+    
+    @span("form.settle")
+    async def settle(self, target, quiet_ms: int = 300, timeout: int = 3000) -> None:
+        """Let the DOM (page or frame) react to the last interaction before moving on."""
+        await wait_for_dom_settled(target, quiet_ms=quiet_ms, timeout=timeout)
@@ -0,0 +1,107 @@
+import json
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta
+from typing import Optional
+
+from playwright.async_api import Page
+
+from src.core.job import ApplicationType, Job
+from src.utils.config import get_settings
+from src.utils.database import Database, get_db
+
+
+# Puts the saved localStorage back before the page's own scripts run, once per tab: the
+# application keeps writing to it after the restore and must not be reset on every step
+RESTORE_STORAGE_SCRIPT = """
+(origins => {
+    const items = origins[location.origin];
+    if (!items || sessionStorage.getItem('__autoapplyRestored')) return;
+    for (const {name, value} of items) localStorage.setItem(name, value);
+    sessionStorage.setItem('__autoapplyRestored', '1');
+})(%s)
+"""
+
+
+@dataclass
+class Checkpoint:
+    """
+    Where a multi-page application stopped: the pages completed, the URL of the next
+    one, the session (cookies + localStorage) and the answers given so far.
+    """
+    job_id: str
+    application_type: str = ""
+    step: int = 0
+    page_url: str = ""
+    answers: dict[str, str] = field(default_factory=dict)  # field label -> value given
+    storage_state: dict = field(default_factory=dict)
+    updated_at: Optional[datetime] = None
+
+    async def restore(self, page: Page) -> None:
+        """Put the saved session back into ``page`` and open the page the application stopped on."""
+        cookies = self.storage_state.get("cookies") or []
+        if cookies:
+            await page.context.add_cookies(cookies)
+        origins = {
+            entry["origin"]: entry.get("localStorage") or []
+            for entry in self.storage_state.get("origins") or []
+        }
+        if origins:
+            await page.add_init_script(RESTORE_STORAGE_SCRIPT % json.dumps(origins))
+        if self.page_url:
+            await page.goto(self.page_url, wait_until="domcontentloaded")
+
+
+class CheckpointStore:
+    """Step checkpoints of applications in progress, one per job, dropped once it is submitted."""
+
+    def __init__(self, db: Optional[Database] = None, enabled: Optional[bool] = None):
+        config = get_settings().application.checkpoints
+        self.db = db or get_db()
+        self.enabled = config.enabled if enabled is None else enabled
+        self.ttl = timedelta(hours=config.ttl_hours)
+
+    def load(self, job: Job) -> Optional[Checkpoint]:
+        """The job's checkpoint, unless there is none or its session is too old to resume."""
+        if not self.enabled:
+            return None
+        row = self.db.get_checkpoint(job.id or job.url)
+        if not row:
+            return None
+        if row["updated_at"] and datetime.now() - row["updated_at"] > self.ttl:
+            self.db.delete_checkpoint(row["job_id"])
+            return None
+        return Checkpoint(**row)
+
+    async def save(self, page: Page, job: Job, step: int, answers: dict[str, str]) -> Optional[Checkpoint]:
+        """Record that ``step`` pages are done, with the session as it stands on the next one."""
+        if not self.enabled:
+            return None
+        try:
+            storage_state = await page.context.storage_state()
+        except Exception:
+            storage_state = {}
+        app_type = job.application_type
+        checkpoint = Checkpoint(
+            job_id=job.id or job.url,
+            application_type=app_type.value if isinstance(app_type, ApplicationType) else str(app_type or ""),
+            step=step,
+            page_url=page.url,
+            answers=dict(answers),
+            storage_state=storage_state,
+        )
+        self.db.save_checkpoint(asdict(checkpoint))
+        return checkpoint
+
+    def clear(self, job: Job) -> None:
+        if self.enabled:
+            self.db.delete_checkpoint(job.id or job.url)
+
+
+_checkpoints: Optional[CheckpointStore] = None
+
+
+def get_checkpoints() -> CheckpointStore:
+    global _checkpoints
+    if _checkpoints is None:
+        _checkpoints = CheckpointStore()
+    return _checkpoints
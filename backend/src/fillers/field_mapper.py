@@ -1,7 +1,11 @@
 import re
-import asyncio
 from typing import Optional, Any
 from src.core.applicant import Applicant
+from src.core.profile_snapshot import snapshot_of
+from src.fillers.answer_engine import AnswerEngine, Question
+from src.fillers.answer_memory import AnswerMemory, get_answer_memory
+from src.fillers.label_matcher import field_name, get_label_matcher
+from src.llm.local_model import get_local_model
 
 
 class FieldMapper:
@@ -72,156 +76,122 @@ class FieldMapper:
         "no": [r"require.*sponsorship", r"need.*sponsorship", r"visa.*sponsorship"],
     }
     
-    def __init__(self, applicant: Applicant, llm_client=None):
+    def __init__(self, applicant: Applicant, llm_client=None, memory: Optional[AnswerMemory] = None, local_client=None):
         self.applicant = applicant
         self.llm_client = llm_client
+        # Label classifier + flattened profile values, shared by every mapper of this applicant
+        self.matcher = get_label_matcher(applicant, self.FIELD_MAPPINGS)
         self._cache = {}
+        # LLM picks per (label, options); only choices that are actually among the options
+        self._dropdown_cache: dict[tuple[str, tuple[str, ...]], str] = {}
+        # Answers shared across applications, consulted before any LLM call
+        self.memory = memory or get_answer_memory()
+        # Memory entries used or written for this application; approved when it's submitted
+        self.memory_ids: set[str] = set()
+        # Rules -> memory -> local model -> Gemini, for whatever the caches above don't answer
+        self.engine = AnswerEngine(self, llm_client, local_client or get_local_model())
     
     async def get_value(self, field_label: str) -> Optional[Any]:
         normalized = self._normalize(field_label)
-        
         if normalized in self._cache:
             return self._cache[normalized]
         
-        # 1. Direct Mapping
-        value = self._try_direct_mapping(normalized)
+        # Profile, remembered answers, then the models (see AnswerEngine)
+        value = await self.engine.resolve(Question(field_label, "input"))
         if value is not None:
             self._cache[normalized] = value
-            return value
+        return value
+    
+    def known_value(self, field_label: str) -> Optional[Any]:
+        """Value for a field without asking a model: profile mappings, then remembered answers."""
+        normalized = self._normalize(field_label)
+        
+        if normalized in self._cache:
+            return self._cache[normalized]
         
-        # 2. Fuzzy Mapping
-        value = self._try_fuzzy_mapping(normalized)
+        value = self.profile_value(field_label)
+        if value is None:
+            value = self.remembered_value(field_label)
         if value is not None:
             self._cache[normalized] = value
-            return value
-            
-        # 3. LLM Fallback
-        if self.llm_client:
-            print(f"   🤖 Invoking LLM for field: '{field_label}'...")
-            context = self._get_applicant_context()
-            
-            # STRATEGY: maximizing acceptance chances.
-            prompt = f"""Field Label: "{field_label}"
-User Profile:
-{context}
-
-Goal: Select the option (or provide the text) that MAXIMIZES the user's chance of getting the job. 
-- If asked about "Start Date" or "End Date" (Year/Month), infer logically from the Education or Experience history related to the context (e.g., if asking about "School", use the dates for that school).
-- If asked about relocation/locations, prefer "Yes" or the most flexible option unless explicitly restricted by profile.
-- If asked about authorization, be truthful but opt for "Yes" if "Authorized" is in profile.
-- If unsure, choose the positive/affirming option ("Yes", "Agree").
-
-What is the single best value for this field for this user?
-Return ONLY the value. If not found/applicable, return "None"."""
-            
-            for attempt in range(2):
-                response = await self.llm_client.generate(prompt, max_tokens=50, temperature=0.1)
-                
-                if response:
-                    if "None" not in response and len(response) < 100:
-                         print(f"      -> LLM suggested: {response}")
-                         self._cache[normalized] = response
-                         return response
-                    break # returned None/valid response, don't retry same non-error result
-                
-                # If response is None (rate limit), retry
-                if attempt < 1:
-                     print(f"     ⏳ LLM empty response (Attempt {attempt+1}/2), waiting briefly...")
-                     await asyncio.sleep(1)
-        
-        return None
-        
+        return value
+    
+    def profile_value(self, field_label: str) -> Optional[Any]:
+        normalized = self._normalize(field_label)
+        # 1. Direct Mapping
+        value = self._try_direct_mapping(normalized)
+        if value is None:
+            # 2. Fuzzy Mapping
+            value = self._try_fuzzy_mapping(normalized)
+        return value
+    
+    def remembered_value(self, field_label: str) -> Optional[str]:
+        # Answers a model gave for this question in earlier applications
+        return self.recall(self._normalize(field_label), "input")
+    
+    def remembered_answer(self, question: str, job) -> Optional[str]:
+        """A long answer given to the same (or, once approved, a similar) question in an earlier application."""
+        remembered = self.recall(self._normalize(question), "textarea")
+        if remembered:
+            # Stored with the company and role swapped for placeholders
+            return remembered.replace("{company}", job.company).replace("{title}", job.title)
         return None
     
-    def _get_applicant_context(self) -> str:
-        # Helper to build a summary for LLM
-        edu_str = "\n".join([f"- {e.degree} in {e.field} from {e.institution} ({e.start_date} to {e.end_date})" for e in self.applicant.education])
-        exp_str = "\n".join([f"- {e.title} at {e.company} ({e.start_date} to {e.end_date})" for e in self.applicant.experience])
-        
-        achievements_str = "\n".join([f"- {a.name} ({a.year}): {a.description}" for a in self.applicant.achievements])
-        projects_str = "\n".join([f"- {p.name} ({p.date_range}): {p.highlights[0]}" for p in self.applicant.projects[:3]])
-        
-        return f"""
-Name: {self.applicant.full_name}
-Email: {self.applicant.email}
-Phone: {self.applicant.phone}
-Address: {self.applicant.address.street}, {self.applicant.address.city}, {self.applicant.address.state} {self.applicant.address.zip}, {self.applicant.address.country}
-LinkedIn: {self.applicant.linkedin}
-Website: {self.applicant.website}
-Work Auth: Authorized in US? {self.applicant.work_authorization.authorized_us}. Sponsorship needed? {self.applicant.work_authorization.requires_sponsorship}
-
-Education History:
-{edu_str}
-
-Experience History:
-{exp_str}
-
-Projects:
-{projects_str}
-
-Achievements:
-{achievements_str}
-
-Skills: {self.applicant.get_skills_string(30)}
-"""
-
+    def accept_value(self, field_label: str, value: str) -> None:
+        """Keep an LLM-generated value for the rest of this form and for later applications."""
+        normalized = self._normalize(field_label)
+        self._cache[normalized] = value
+        self.remember(normalized, "input", value)
+    
+    def recall(self, question: str, kind: str, options: Optional[list[str]] = None) -> Optional[str]:
+        entry = self.memory.lookup(question, kind, options)
+        if not entry:
+            return None
+        self.memory_ids.add(entry["id"])
+        return entry["answer"]
+    
+    def remember(self, question: str, kind: str, answer: str, options: Optional[list[str]] = None) -> None:
+        memory_id = self.memory.remember(question, kind, answer, options)
+        if memory_id:
+            self.memory_ids.add(memory_id)
+    
+    def applicant_context(self, variant: str = "field") -> str:
+        """The applicant as prompt context, in one of profile_snapshot's CONTEXT_VARIANTS."""
+        # Built once per profile load, within the variant's token budget
+        return snapshot_of(self.applicant).context(variant)
+    
     def _normalize(self, text: str) -> str:
+        return self.normalize_label(text)
+    
+    @staticmethod
+    def normalize_label(text: str) -> str:
+        """Label as a lookup key: the same question reads the same from the API and from the DOM."""
         text = text.lower().strip()
         text = re.sub(r'[*:\(\)]', '', text)
         text = re.sub(r'\s+', ' ', text)
-        return text
+        return text.strip()
     
     def _try_direct_mapping(self, label: str) -> Optional[Any]:
         if label in self.FIELD_MAPPINGS:
-            paths = self.FIELD_MAPPINGS[label]
-            return self._get_from_path(paths)
+            return self.matcher.value_of(field_name(self.FIELD_MAPPINGS[label]))
         return None
     
     def _try_fuzzy_mapping(self, label: str) -> Optional[Any]:
-        # Avoid mapping long questions or irrelevant context to personal data
-        # Especially "mobile" for "mobile app / mobile role"
-        label_lower = label.lower()
-        is_long_question = len(label_lower) > 30
-        
-        for key, paths in self.FIELD_MAPPINGS.items():
-            if key in label_lower:
-                # SPECIAL CASE: "mobile" usually means phone, but not in "mobile app" or "mobile role"
-                if key == "mobile":
-                    if any(x in label_lower for x in ["app", "role", "feature", "experience", "role", "position", "project", "contribut"]):
-                        continue
-                
-                # SPECIAL CASE: Don't map personal data (like name/phone) to long questions via fuzzy match
-                # Questions like "Tell us about your proudest achievement..." shouldn't be filled with "Harsh"
-                if is_long_question and key in ["name", "first name", "last name", "phone", "mobile", "cell", "email"]:
-                    continue
-
-                value = self._get_from_path(paths)
-                if value:
-                    return value
-        return None
+        # Negative prototypes ("company name", "mobile app experience") and the length of long
+        # questions keep them from matching personal fields
+        match = self.matcher.match(label)
+        return self.matcher.value_of(match.field) if match else None
     
-    def _get_from_path(self, paths: list) -> Optional[Any]:
-        for path in paths:
-            value = self._extract_value(path)
+    def map_labels(self, labels: list[str]) -> int:
+        """Classify a whole form's labels in one batch and cache the profile values they map to."""
+        normalized = [self._normalize(label) for label in labels]
+        mapped = 0
+        for label, match in zip(normalized, self.matcher.classify(normalized)):
+            value = self.matcher.value_of(match.field) if match else None
             if value is not None:
-                return value
-        return None
-    
-    def _extract_value(self, path: str) -> Optional[Any]:
-        parts = path.split('.')
-        obj = self.applicant
-        
-        for part in parts:
-            if hasattr(obj, part):
-                obj = getattr(obj, part)
-            elif isinstance(obj, dict) and part in obj:
-                obj = obj[part]
-            else:
-                return None
-        
-        if isinstance(obj, bool):
-            return obj
-        return str(obj) if obj else None
+                self._cache.setdefault(label, value)
+                mapped += 1
+        return mapped
     
     def get_boolean_answer(self, question: str) -> Optional[bool]:
         question_lower = question.lower()
@@ -239,6 +209,16 @@ Skills: {self.applicant.get_skills_string(30)}
         return None
     
     async def get_dropdown_value(self, options: list[str], field_label: str) -> Optional[str]:
+        return await self.engine.resolve(Question(field_label, "select", options))
+    
+    def known_option(self, options: list[str], field_label: str) -> Optional[str]:
+        """Option for a dropdown without asking a model: profile heuristics, then earlier picks."""
+        choice = self.profile_option(options, field_label)
+        if choice is None:
+            choice = self.remembered_option(options, field_label)
+        return choice
+    
+    def profile_option(self, options: list[str], field_label: str) -> Optional[str]:
         label_lower = field_label.lower()
         
         # 1. Try Heuristics
@@ -281,17 +261,25 @@ Skills: {self.applicant.get_skills_string(30)}
                 if str(years) in opt:
                     return opt
         
-        # 2. Try LLM
-        if self.llm_client:
-            print(f"   🤖 Invoking LLM for dropdown: '{field_label}' with {len(options)} options. Sample: {options[:5]}...")
-            context = self._get_applicant_context()
-            val = await self.llm_client.select_best_option(options, field_label, context)
-            if val:
-                 print(f"      -> LLM selected: {val}")
-            return val
-        
         return None
     
+    def remembered_option(self, options: list[str], field_label: str) -> Optional[str]:
+        # Earlier model picks, this form's or a previous application's
+        cache_key = (self._normalize(field_label), tuple(options))
+        if cache_key in self._dropdown_cache:
+            return self._dropdown_cache[cache_key]
+        remembered = self.recall(cache_key[0], "select", options)
+        if remembered is not None:
+            self._dropdown_cache[cache_key] = remembered
+        return remembered
+    
+    def accept_option(self, options: list[str], field_label: str, choice: str) -> None:
+        # Only choices that are actually among the options are kept
+        if choice in options:
+            normalized = self._normalize(field_label)
+            self._dropdown_cache[(normalized, tuple(options))] = choice
+            self.remember(normalized, "select", choice, options)
+    
     def _best_match(self, options: list[str], target: str) -> Optional[str]:
         if not target:
             return None
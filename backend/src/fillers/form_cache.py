@@ -0,0 +1,128 @@
+import hashlib
+import json
+from dataclasses import dataclass, field
+from typing import Optional
+from urllib.parse import urlparse
+
+from src.core.job import ApplicationType
+from src.fillers.form_snapshot import FormField, FormSnapshot
+from src.utils.config import get_settings
+from src.utils.database import Database, get_db
+
+
+# Field kinds whose answer is specific to the posting (why this role, cover letters)
+# and therefore never replayed from the cache; their strategy still is
+POSTING_SPECIFIC_KINDS = {"textarea"}
+
+# Hosts whose first path segment names the company's board
+BOARD_HOSTS = ("greenhouse.io", "ashbyhq.com", "lever.co")
+
+
+def board_token(url: str) -> str:
+    """Company board a form belongs to: the board slug on ATS hosts, otherwise the host."""
+    parsed = urlparse(url or "")
+    host = parsed.netloc.lower()
+    parts = [part for part in parsed.path.split("/") if part]
+    if any(host.endswith(ats_host) for ats_host in BOARD_HOSTS) and parts and parts[0] != "embed":
+        return parts[0].lower()
+    if "greenhouse.io" in host and "embed" in parts:
+        # boards.greenhouse.io/embed/job_app?for=stripe&token=...
+        for pair in parsed.query.split("&"):
+            key, _, value = pair.partition("=")
+            if key == "for" and value:
+                return value.lower()
+    return host
+
+
+def form_fingerprint(snapshot: FormSnapshot) -> str:
+    """Hash of the question set: labels, control kinds and options of the visible fields."""
+    questions = sorted(
+        (f.label, f.tag or "", f.type, f.options)
+        for f in snapshot if f.visible
+    )
+    return hashlib.sha1(json.dumps(questions).encode()).hexdigest()[:16]
+
+
+@dataclass
+class FieldPlan:
+    strategy: str
+    answer: Optional[str] = None
+
+
+@dataclass
+class FormPlan:
+    """
+    How a form was filled: the strategy each field was handled with and the answers given.
+    Loaded from the cache when the same board serves the same question set again.
+    """
+    application_type: str
+    board: str
+    fingerprint: str
+    fields: dict[str, FieldPlan] = field(default_factory=dict)
+    hit: bool = False
+    extracted: dict[str, dict] = field(default_factory=dict)
+
+    def strategy(self, form_field: FormField) -> Optional[str]:
+        plan = self.fields.get(form_field.label)
+        return plan.strategy if plan else None
+
+    def answer(self, form_field: FormField) -> Optional[str]:
+        plan = self.fields.get(form_field.label)
+        return plan.answer if plan else None
+
+    def record(self, form_field: FormField, strategy: str, answer: Optional[str] = None) -> None:
+        if form_field.tag in POSTING_SPECIFIC_KINDS:
+            answer = None
+        self.fields[form_field.label] = FieldPlan(strategy=strategy, answer=answer)
+        self.extracted[form_field.label] = {
+            "label": form_field.label, "tag": form_field.tag, "type": form_field.type,
+            "required": form_field.required, "options": form_field.options,
+        }
+
+    def to_rows(self) -> list[dict]:
+        return [
+            {**self.extracted.get(label, {"label": label}), "strategy": plan.strategy, "answer": plan.answer}
+            for label, plan in self.fields.items()
+        ]
+
+
+class FormSchemaCache:
+    """Persistent fill plans keyed by ATS, board token and question-set fingerprint."""
+
+    def __init__(self, db: Optional[Database] = None, enabled: Optional[bool] = None):
+        self.db = db or get_db()
+        self.enabled = get_settings().application.form_cache if enabled is None else enabled
+
+    def load(self, application_type, url: str, snapshot: FormSnapshot) -> FormPlan:
+        app_type = application_type.value if isinstance(application_type, ApplicationType) else str(application_type)
+        plan = FormPlan(application_type=app_type, board=board_token(url), fingerprint=form_fingerprint(snapshot))
+        if not self.enabled:
+            return plan
+        # A changed question set hashes to a new fingerprint, so stale plans are simply never matched
+        rows = self.db.get_form_schema(plan.application_type, plan.board, plan.fingerprint)
+        if rows:
+            plan.hit = True
+            for row in rows:
+                plan.fields[row["label"]] = FieldPlan(strategy=row["strategy"], answer=row.get("answer"))
+                plan.extracted[row["label"]] = {k: v for k, v in row.items() if k not in ("strategy", "answer")}
+        return plan
+
+    def save(self, plan: FormPlan) -> None:
+        """Store a plan once its application went through, so only accepted answers are replayed."""
+        if self.enabled and plan.fields:
+            self.db.save_form_schema(plan.application_type, plan.board, plan.fingerprint, plan.to_rows())
+
+    def invalidate(self, plan: FormPlan) -> None:
+        """Forget a cached plan that led to a failed fill (the board changed its widgets, say)."""
+        if self.enabled:
+            self.db.delete_form_schema(plan.application_type, plan.board, plan.fingerprint)
+
+
+_form_cache: Optional[FormSchemaCache] = None
+
+
+def get_form_cache() -> FormSchemaCache:
+    global _form_cache
+    if _form_cache is None:
+        _form_cache = FormSchemaCache()
+    return _form_cache
@@ -0,0 +1,237 @@
+from dataclasses import dataclass, field
+from typing import Optional, Union
+
+from playwright.async_api import Page, Frame, Locator
+
+from src.utils.tracing import span
+
+
+# Attributes stamped on the live DOM so later locators can find a field again without re-scanning
+FIELD_ATTR = "data-autoapply-field"
+BLOCK_ATTR = "data-autoapply-block"
+
+DEFAULT_CONTROLS = "input:not([type='hidden']), textarea, select, [role='combobox']"
+
+# Every open shadow root, so fields rendered by web components are found too
+_ROOTS_JS = """
+const collectRoots = () => {
+    const roots = [document];
+    for (let i = 0; i < roots.length; i++) {
+        roots[i].querySelectorAll('*').forEach(el => { if (el.shadowRoot) roots.push(el.shadowRoot); });
+    }
+    return roots;
+};
+"""
+
+SNAPSHOT_SCRIPT = "({blocks, labels, controls, markers}) => {" + _ROOTS_JS + """
+    const visible = el => !!(el && (el.offsetParent || el.getClientRects().length));
+    const stamp = (el, attr) => {
+        if (!el.getAttribute(attr)) {
+            window.__autoapplyHandle = (window.__autoapplyHandle || 0) + 1;
+            el.setAttribute(attr, String(window.__autoapplyHandle));
+        }
+        return el.getAttribute(attr);
+    };
+    const looksActive = node => {
+        if (!node || !node.classList) return false;
+        const cls = (node.className && node.className.toString ? node.className.toString() : '').toLowerCase();
+        const background = window.getComputedStyle(node).backgroundColor;
+        return ['active', 'selected', 'checked'].some(c => cls.includes(c)) ||
+               node.getAttribute('aria-checked') === 'true' ||
+               node.getAttribute('aria-pressed') === 'true' ||
+               (background !== 'rgba(0, 0, 0, 0)' && background !== 'transparent' && !background.includes('255, 255, 255'));
+    };
+    const isFilled = block => {
+        for (const input of block.querySelectorAll('input:not([type="checkbox"]):not([type="radio"]), textarea')) {
+            if (input.value && input.value.trim()) return true;
+        }
+        if (block.querySelector('input:checked')) return true;
+        for (const el of block.querySelectorAll('button, [role="button"], label, div[class*="option"], div[class*="choice"], span')) {
+            if (looksActive(el) || looksActive(el.parentElement)) return true;
+        }
+        // Large blocks of text (e.g. an acknowledgement) have nothing to fill
+        return (block.innerText || '').length > 500;
+    };
+    const optionsOf = (block, control, type) => {
+        if (control.tagName === 'SELECT') {
+            return [...control.options].map(o => o.textContent.trim()).filter(Boolean);
+        }
+        if (type === 'radio' || type === 'checkbox') {
+            return [...block.querySelectorAll(`input[type="${type}"]`)].map(input => {
+                const label = (input.id && block.querySelector(`label[for="${CSS.escape(input.id)}"]`)) || input.closest('label');
+                return ((label && label.textContent) || input.value || '').trim();
+            });
+        }
+        return [];
+    };
+
+    const fields = [];
+    const seen = new Set();
+    collectRoots().forEach(root => {
+        root.querySelectorAll(blocks).forEach(block => {
+            const label = block.querySelector(labels);
+            const text = label ? (label.textContent || '').trim() : '';
+            if (!text) return;
+            const control = block.querySelector(controls);
+            // Broad block selectors match nested wrappers of the same question; keep the outermost
+            if (control && seen.has(control)) return;
+            const type = control ? (control.getAttribute('type') || '').toLowerCase() : '';
+            if (type === 'radio' || type === 'checkbox') {
+                block.querySelectorAll(`input[type="${type}"]`).forEach(input => seen.add(input));
+            } else if (control) {
+                seen.add(control);
+            }
+
+            fields.push({
+                handle: control ? stamp(control, '""" + FIELD_ATTR + """') : null,
+                block: stamp(block, '""" + BLOCK_ATTR + """'),
+                label: text,
+                tag: control ? control.tagName.toLowerCase() : null,
+                type: type,
+                role: control ? control.getAttribute('role') : null,
+                name: control ? (control.id || control.getAttribute('name') || '') : '',
+                required: !!(control && (control.required || control.getAttribute('aria-required') === 'true')) || /\\*\\s*$/.test(text),
+                visible: visible(block),
+                control_visible: visible(control),
+                value: control && typeof control.value === 'string' ? control.value : '',
+                options: control ? optionsOf(block, control, type) : [],
+                group_size: (type === 'radio' || type === 'checkbox') ? block.querySelectorAll(`input[type="${type}"]`).length : 0,
+                buttons: block.querySelectorAll('button, [role="button"]').length,
+                markers: Object.keys(markers).filter(name => block.querySelector(markers[name])),
+                filled: isFilled(block),
+                in_shadow: root !== document,
+            });
+        });
+    });
+    return fields;
+}
+"""
+
+# Sets values through the native setters so React/Vue controlled inputs register the change
+APPLY_SCRIPT = "(items) => {" + _ROOTS_JS + """
+    const roots = collectRoots();
+    const find = handle => {
+        for (const root of roots) {
+            const el = root.querySelector(`[""" + FIELD_ATTR + """="${handle}"]`);
+            if (el) return el;
+        }
+        return null;
+    };
+    return items.map(({handle, value}) => {
+        const el = find(handle);
+        if (!el) return false;
+        const proto = el.tagName === 'TEXTAREA' ? HTMLTextAreaElement.prototype
+                    : el.tagName === 'SELECT' ? HTMLSelectElement.prototype
+                    : HTMLInputElement.prototype;
+        if (el.tagName === 'SELECT') {
+            const option = [...el.options].find(o => o.textContent.trim() === value || o.value === value);
+            if (!option) return false;
+            value = option.value;
+        }
+        el.focus();
+        Object.getOwnPropertyDescriptor(proto, 'value').set.call(el, value);
+        el.dispatchEvent(new Event('input', {bubbles: true}));
+        el.dispatchEvent(new Event('change', {bubbles: true}));
+        el.blur();
+        return el.value === value;
+    });
+}
+"""
+
+
+@dataclass
+class FormField:
+    """One question block as seen by ``snapshot_form``: its label, primary control and options."""
+    handle: Optional[str]
+    block: str
+    label: str
+    tag: Optional[str] = None
+    type: str = ""
+    role: Optional[str] = None
+    name: str = ""
+    required: bool = False
+    visible: bool = True
+    control_visible: bool = False
+    value: str = ""
+    options: list[str] = field(default_factory=list)
+    group_size: int = 0
+    buttons: int = 0
+    markers: list[str] = field(default_factory=list)
+    filled: bool = False
+    in_shadow: bool = False
+    frame: Optional[Frame] = field(default=None, repr=False)
+
+    @property
+    def control(self) -> Optional[Locator]:
+        if not self.handle:
+            return None
+        return self.frame.locator(f"[{FIELD_ATTR}='{self.handle}']")
+
+    @property
+    def container(self) -> Locator:
+        return self.frame.locator(f"[{BLOCK_ATTR}='{self.block}']")
+
+    def has(self, marker: str) -> bool:
+        return marker in self.markers
+
+    @property
+    def is_text(self) -> bool:
+        return self.tag == "textarea" or (
+            self.tag == "input" and self.type not in ("checkbox", "radio", "file", "submit", "button", "image")
+            and self.role != "combobox"
+        )
+
+
+class FormSnapshot:
+    """
+    The whole form read in one ``evaluate`` per frame, plus a batched ``apply``.
+    ``round_trips`` counts the browser calls made through the snapshot.
+    """
+
+    def __init__(self, fields: list[FormField], round_trips: int):
+        self.fields = fields
+        self.round_trips = round_trips
+
+    def __iter__(self):
+        return iter(self.fields)
+
+    def __len__(self) -> int:
+        return len(self.fields)
+
+    async def apply(self, values: list[tuple[FormField, str]]) -> list[FormField]:
+        """Fill text inputs, textareas and native selects in one script call per frame; returns the fields that didn't take."""
+        by_frame: dict[Frame, list[tuple[FormField, str]]] = {}
+        for form_field, value in values:
+            if form_field.handle and value is not None:
+                by_frame.setdefault(form_field.frame, []).append((form_field, str(value)))
+
+        failed = []
+        for frame, items in by_frame.items():
+            self.round_trips += 1
+            try:
+                results = await frame.evaluate(APPLY_SCRIPT, [{"handle": f.handle, "value": v} for f, v in items])
+            except Exception:
+                results = [False] * len(items)
+            failed.extend(f for (f, _), ok in zip(items, results) if not ok)
+        return failed
+
+
+@span("form.snapshot")
+async def snapshot_form(target: Union[Page, Frame], blocks: str, labels: str = "label",
+                        controls: str = DEFAULT_CONTROLS, markers: Optional[dict[str, str]] = None) -> FormSnapshot:
+    """
+    Read every question block under ``target`` (all frames of a Page, or a single Frame).
+    ``markers`` maps a name to a selector; a field lists the names found inside its block.
+    """
+    frames = target.frames if isinstance(target, Page) else [target]
+    arg = {"blocks": blocks, "labels": labels, "controls": controls, "markers": markers or {}}
+    fields: list[FormField] = []
+    round_trips = 0
+    for frame in frames:
+        round_trips += 1
+        try:
+            raw = await frame.evaluate(SNAPSHOT_SCRIPT, arg)
+        except Exception:
+            continue
+        fields.extend(FormField(**item, frame=frame) for item in raw)
+    return FormSnapshot(fields, round_trips)
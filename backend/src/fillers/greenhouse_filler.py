@@ -3,13 +3,17 @@ from playwright.async_api import Page
 
 from src.core.applicant import Applicant
 from src.core.application import Application
-from src.core.job import Job
+from src.core.job import Job, ApplicationType
 from src.fillers.base_filler import BaseFiller
+from src.fillers.form_snapshot import FormField, snapshot_form
+from src.utils.readiness import wait_for_dom_settled, wait_for_options, wait_for_submission_outcome, wait_for_submit_enabled
 from src.llm.gemini import GeminiClient
+from src.utils.tracing import span
 
 
 class GreenhouseFiller(BaseFiller):
     PLATFORM_NAME = "Greenhouse"
+    APPLICATION_TYPE = ApplicationType.GREENHOUSE
     
     SELECTORS = {
         "first_name": "#first_name",
@@ -23,6 +27,15 @@ class GreenhouseFiller(BaseFiller):
         "website": "input[name*='website'], input[id*='website']",
         "submit": "button[type='submit'], input[type='submit']",
         "custom_questions": ".field, .custom-question",
+        "question_block": "div.field, div.custom-question, .application-question, div:has(> label), div:has(> .label)",
+    }
+    
+    SKIP_QUESTIONS = ["first name", "last name", "email", "phone", "resume", "attach", "enter manually", "apply with", "cloudflares candidate privacy policy", "legal name", "would you like to include"]
+    
+    QUESTION_MARKERS = {
+        "dropdown": "select, .select2-container, .select2-selection, [role='combobox'], ul[role='listbox']",
+        "select2": ".select2-container",
+        "file": "input[type='file']",
     }
     
     async def can_handle(self, page: Page) -> bool:
@@ -35,7 +48,6 @@ class GreenhouseFiller(BaseFiller):
         return gh_elements > 0
     
     async def fill(self, page: Page, job: Job, application: Application) -> bool:
-        import asyncio
         application.start()
         
         try:
@@ -51,7 +63,7 @@ class GreenhouseFiller(BaseFiller):
                 raise Exception("Failed to fill basic info (selectors not found)")
             
             application.add_log("filled_basic", "Filled name, email, phone")
-            await asyncio.sleep(1) # Visual delay for user
+            await self.settle(frame)
             
             # Resume
             if not await self._upload_resume(frame):
@@ -61,10 +73,10 @@ class GreenhouseFiller(BaseFiller):
                  application.add_log("uploaded_resume", "Resume uploaded")
             
             await self._fill_online_presence(frame)
-            await asyncio.sleep(1) 
+            await self.settle(frame)
             
             await self._handle_custom_questions(frame, job, application)
-            await asyncio.sleep(1)
+            await self.settle(frame)
             
             if application.questions_for_review:
                 print(f"DEBUG: Review required for {len(application.questions_for_review)} items (PROCEEDING ANYWAY):")
@@ -76,7 +88,7 @@ class GreenhouseFiller(BaseFiller):
             
             # SUBMIT
             print("   🚀 Submitting application...")
-            success = await self.submit_application(frame)
+            success = await self.submit_application(frame, company=job.company)
             if success:
                  application.add_log("submitted", "Application submitted successfully")
                  job.mark_applied()
@@ -91,13 +103,14 @@ class GreenhouseFiller(BaseFiller):
             application.fail(str(e))
             return False
             
-    async def submit_application(self, page) -> bool:
-        import asyncio
+    @span("submit")
+    async def submit_application(self, page, company: str = "") -> bool:
+        from datetime import datetime
         submit_btn = page.locator("button[type='submit'], input[type='submit'], #submit_app")
         if await submit_btn.count() > 0:
             # Scroll to it
             await submit_btn.first.scroll_into_view_if_needed()
-            await asyncio.sleep(2) # Give user time to see
+            await wait_for_submit_enabled(page, self.APPLICATION_TYPE)
             
             try:
                 # Click and waiting for navigation usually indicates success
@@ -110,14 +123,16 @@ class GreenhouseFiller(BaseFiller):
                     print("   📸 Created debug_before_submit.png")
                 except: pass
                 
+                # The verification mail (if any) is sent after this, older ones are for other applications
+                submitted_at = datetime.now()
                 await submit_btn.first.click()
                 
                 # Wait for navigation or success message
                 # Greenhouse usually redirects to /confirmation or shows "Thank you"
-                try:
-                    await page.wait_for_url(lambda u: "confirmation" in u.lower() or "success" in u.lower(), timeout=15000)
+                await wait_for_submission_outcome(page)
+                if any(p in page.url.lower() for p in ("confirmation", "success")):
                     return True
-                except:
+                else:
                     # Check for success text
                     content = (await page.content()).lower()
                     success_patterns = [
@@ -141,30 +156,18 @@ class GreenhouseFiller(BaseFiller):
                          single_input = await page.locator("input[id*='code'], input[name*='code']").count()
                          
                          if split_inputs > 0 or single_input > 0:
-                             print("   📧 Email Verification Required! Initiating MailHandler...")
+                             print("   📧 Email Verification Required! Waiting on the inbox listener...")
                              
                              try:
-                                 from src.utils.mail_handler import MailHandler
-                                 mail = MailHandler()
+                                 from src.utils.mail_listener import get_mail_listener
+                                 listener = get_mail_listener()
                                  
-                                 print("   ⏳ Waiting for verification code to arrive (polling up to 90s)...")
-                                 import asyncio
+                                 print(f"   ⏳ Waiting for verification code to arrive (up to {listener.config.code_timeout:.0f}s)...")
+                                 with span("verify.wait_for_code"):
+                                     code = await listener.wait_for_code(match="Greenhouse", hint=company, since=submitted_at)
                                  
-                                 code = None
-                                 # Poll every 15 seconds for up to 6 attempts (90 seconds total)
-                                 for attempt in range(6):
-                                     await asyncio.sleep(15) 
-                                     print(f"      🔄 Checking inbox (Attempt {attempt+1}/6)...")
-                                     
-                                     try:
-                                         code = mail.get_verification_code(subject_filter="Greenhouse")
-                                         if code:
-                                             print(f"      ✅ Code received on attempt {attempt+1}: {code}")
-                                             break
-                                     except Exception as e:
-                                         print(f"      ⚠️ Polling error: {e}")
-                                     
                                  if code:
+                                     print(f"      ✅ Code received: {code}")
                                      # Remove spaces/dashes just in case
                                      clean_code = code.replace("-", "").replace(" ", "").strip()
                                      
@@ -173,14 +176,13 @@ class GreenhouseFiller(BaseFiller):
                                          for i, char in enumerate(clean_code):
                                              if i >= split_inputs: break
                                              await page.locator(f"#security-input-{i}").fill(char)
-                                             await asyncio.sleep(0.1)
                                      else:
                                          print(f"   🔢 Filling single input with code: {clean_code}")
                                          input_field = page.locator("input[id*='code'], input[name*='code']").first
                                          await input_field.fill(clean_code)
                                      
                                      # Submit code with robust button finding
-                                     await asyncio.sleep(1)
+                                     await self.settle(page)
                                      
                                      verify_selectors = [
                                          "button:has-text('Verify')", 
@@ -203,7 +205,7 @@ class GreenhouseFiller(BaseFiller):
                                           print("   ⚠️ specific verify button not found, trying Enter key...")
                                           await page.keyboard.press("Enter")
                                           
-                                     await page.wait_for_timeout(5000)
+                                     await wait_for_dom_settled(page, quiet_ms=1000, timeout=5000)
                                      return True
                                  else:
                                      print("   ❌ No code found in email (or credentials missing).")
@@ -285,18 +287,16 @@ class GreenhouseFiller(BaseFiller):
                 continue
         return None
     
+    @span("form.basic_info")
     async def _fill_basic_info(self, page) -> bool:
-        import asyncio
         # Returns True if at least one field was filled, or if primary fields found
         f = await self.fill_text_field(page, self.SELECTORS["first_name"], self.applicant.first_name)
-        await asyncio.sleep(0.5)
         l = await self.fill_text_field(page, self.SELECTORS["last_name"], self.applicant.last_name)
-        await asyncio.sleep(0.5)
         e = await self.fill_text_field(page, self.SELECTORS["email"], self.applicant.email)
-        await asyncio.sleep(0.5)
         p = await self.fill_text_field(page, self.SELECTORS["phone"], self.applicant.phone)
         return f and l and e # Phone is sometimes optional
     
+    @span("upload.resume")
     async def _upload_resume(self, page) -> bool:
         from pathlib import Path
         
@@ -352,88 +352,68 @@ class GreenhouseFiller(BaseFiller):
             website = self.applicant.portfolio or self.applicant.website
             await self.fill_text_field(page, self.SELECTORS["website"], website)
 
+    @span("form.questions")
     async def _handle_custom_questions(self, page, job: Job, application: Application) -> None:
-        import asyncio
-        # Broader selector to catch all fields with labels
-        questions = page.locator("div.field, div.custom-question, .application-question, div:has(> label), div:has(> .label)")
-        count = await questions.count()
-        print(f"DEBUG: Found {count} potential question blocks.")
+        # Broader selector to catch all fields with labels; read in one evaluate
+        snapshot = await snapshot_form(page, self.SELECTORS["question_block"], labels="label, .label", markers=self.QUESTION_MARKERS)
+        plan = self.load_form_plan(page.url, snapshot)
+        print(f"DEBUG: Found {len(snapshot)} potential question blocks." + (" (cached plan)" if plan.hit else ""))
+        # Everything profile and memory can't answer goes to the LLM in one request up front
+        await self.prepare_answers(
+            self.open_questions(snapshot, skip=lambda label: any(skip in label.lower() for skip in self.SKIP_QUESTIONS)), job
+        )
         
-        for i in range(count):
-            question_el = questions.nth(i)
-            
+        batch = []
+        for field in snapshot:
             # Ensure it's not hidden
-            if not await question_el.is_visible():
-                continue
-            
-            label = question_el.locator("label, .label").first
-            if await label.count() > 0:
-                question_text = await label.text_content()
-            else:
-                continue
-            
-            if not question_text:
+            if not field.visible:
                 continue
             
-            question_text = question_text.strip()
-            print(f"DEBUG: Processing question: '{question_text}'")
+            question_text = field.label
             text_lower = question_text.lower()
-            
-            if any(skip in text_lower for skip in ["first name", "last name", "email", "phone", "resume", "attach", "enter manually", "apply with", "cloudflares candidate privacy policy", "legal name", "would you like to include"]):
+            if any(skip in text_lower for skip in self.SKIP_QUESTIONS):
                 print(f"DEBUG: Skipping '{question_text}' (matched skip list)")
                 continue
             
-            # Check for Location/City/School/Degree Autocomplete (Prioritize this over Dropdown)
-            if any(k in text_lower for k in ["city", "location", "school", "degree", "discipline", "university", "year", "month"]):
-                input_field = question_el.locator("input, textarea, select, [role='combobox']").first
-                if await input_field.count() > 0:
-                    await self._handle_autocomplete(input_field, question_text)
-                    continue
-
-            # Heuristic for Dropdowns/Selects
-            # Includes hidden selects, select2 containers, and ARIA comboboxes
-            is_dropdown = await question_el.locator("select, .select2-container, .select2-selection, [role='combobox'], ul[role='listbox']").count() > 0 or \
-                          "country" in text_lower or \
-                          "gender" in text_lower or \
-                          "hear about" in text_lower or \
-                          "race" in text_lower or \
-                          "veteran" in text_lower or \
-                          "disability" in text_lower or \
-                          "month" in text_lower or \
-                          "year" in text_lower
+            strategy = plan.strategy(field) or self._classify_field(field)
+            if strategy == "skip":
+                continue
+            print(f"DEBUG: Processing question: '{question_text}' ({strategy})")
+            
+            answer = plan.answer(field)
+            if strategy == "autocomplete":
+                await self._handle_autocomplete(field.control, question_text)
+            elif strategy == "select":
+                # Native selects are answered from the snapshot's options and set in the batch
+                answer = answer or await self.field_mapper.get_dropdown_value(field.options, question_text)
+            elif strategy == "dropdown":
+                await self._handle_dropdown(field.control, question_text)
+            elif strategy == "select2":
+                await self._handle_dropdown(field.container.locator(".select2-container").first, question_text)
+            elif strategy == "review":
+                print(f"      -> Review item added: {question_text} (Unknown field type)")
+                application.questions_for_review[question_text] = "Unknown field type"
+            elif strategy == "input":
+                if not answer:
+                    value = await self.field_mapper.get_value(question_text)
+                    answer = str(value) if value else None
+            elif strategy == "control":
+                await self._handle_input(field.control, question_text, job)
+            
+            plan.record(field, strategy, answer)
+            if answer:
+                batch.append((field, answer))
 
-            is_file = await question_el.locator("input[type='file']").count() > 0
+        for field in await snapshot.apply(batch):
+            # Widgets that reject programmatic values get the regular Playwright fill
+            snapshot.round_trips += 1
+            if field.tag == "select":
+                await self._handle_dropdown(field.control, field.label)
+            else:
+                await self._handle_input(field.control, field.label, job)
 
-            if is_dropdown:
-                 # Try to find the actual element to interact with
-                 # If select is present, use it. If select2, usage might differ.
-                 # _handle_dropdown usually expects a Select or something to click.
-                 # We'll pass the container if needed? No, _handle_dropdown takes an element.
-                 # Let's try to pass the select or the container.
-                 dropdown_el = question_el.locator("select, [role='combobox']").first
-                 if await dropdown_el.count() == 0:
-                      # If only .select2-container exists, maybe pass that?
-                      dropdown_el = question_el.locator(".select2-container").first
-                 
-                 if await dropdown_el.count() > 0:
-                     await self._handle_dropdown(dropdown_el, question_text)
-                     continue
-
-            if is_file:
-                 continue
-            
-            # General Input fields (Text, Checkbox, Radio, Combobox)
-            input_field = question_el.locator("input, textarea, select, [role='combobox']").first
-            if await input_field.count() == 0:
-                 # Check if we already handled it?
-                 if is_dropdown: continue # Handled above but maybe logic failed
-                 
-                 print(f"      -> Review item added: {question_text} (Unknown field type)")
-                 application.questions_for_review[question_text] = "Unknown field type"
-                 continue
-            
-            await self._handle_input(input_field, question_text, job)
-            continue # We handled it via _handle_input, skip existing logic below
+        print(f"   📋 {len(snapshot)} question blocks: {snapshot.round_trips} round trips for discovery + {len(batch)} batched answers")
+        application.add_log("form_snapshot", f"{len(snapshot)} blocks, {snapshot.round_trips} batched round trips")
 
         # Final sweep for Disability if missed
         try:
@@ -458,8 +438,35 @@ class GreenhouseFiller(BaseFiller):
                 print("   📄 Saved greenhouse_page_dump.html for inspection")
             except: pass
                 
+    def _classify_field(self, field: FormField) -> str:
+        text_lower = field.label.lower()
+        
+        # Check for Location/City/School/Degree Autocomplete (Prioritize this over Dropdown)
+        if field.handle and any(k in text_lower for k in ["city", "location", "school", "degree", "discipline", "university", "year", "month"]):
+            return "autocomplete"
+        
+        # Heuristic for Dropdowns/Selects
+        # Includes hidden selects, select2 containers, and ARIA comboboxes
+        is_dropdown = field.has("dropdown") or \
+                      any(k in text_lower for k in ["country", "gender", "hear about", "race", "veteran", "disability", "month", "year"])
+        if is_dropdown:
+            if field.tag == "select" and field.options:
+                return "select"
+            # Select2 / comboboxes need to be opened and clicked
+            if field.tag == "select" or field.role == "combobox":
+                return "dropdown"
+            if field.has("select2"):
+                return "select2"
+        
+        if field.has("file"):
+            return "skip"
+        
+        # General Input fields (Text, Checkbox, Radio, Combobox)
+        if not field.handle:
+            return "skip" if is_dropdown else "review"
+        return "input" if field.is_text else "control"
+    
     async def _handle_autocomplete(self, field, question: str) -> bool:
-        import asyncio
         # 1. Determine value
         value = await self.field_mapper.get_value(question)
         if not value: return False
@@ -470,34 +477,26 @@ class GreenhouseFiller(BaseFiller):
             # HYBRID "SHOCK AND AWE" STRATEGY
             # 1. Click to Focus
             await field.click()
-            await asyncio.sleep(0.5)
             
             # 2. Type Value
             await field.clear()
             await field.press_sequentially(str(value), delay=100)
-            await asyncio.sleep(2.0) # Wait for suggestions
             
             # 3. Try Clicking Suggestion (First attempt)
             suggestion_clicked = False
-            for sel in [".ui-menu-item", ".select2-results__option", "li[role='option']", ".autocomplete-suggestion"]:
-                 suggestions = field.page.locator(f"{sel}:visible")
-                 if await suggestions.count() > 0:
-                      print(f"   -> Clicking visible suggestion: {sel}")
-                      await suggestions.first.click()
-                      suggestion_clicked = True
-                      break
-            
-            await asyncio.sleep(0.5)
+            sel = await wait_for_options(field.page, [".ui-menu-item", ".select2-results__option", "li[role='option']", ".autocomplete-suggestion"])
+            if sel:
+                 print(f"   -> Clicking visible suggestion: {sel}")
+                 await field.page.locator(f"{sel}:visible").first.click()
+                 suggestion_clicked = True
             
             # 4. Force Keyboard Confirmation (Redundancy)
             # Even if we clicked, pressing Enter often commits the state
             if not suggestion_clicked:
                  print("   -> No suggestion clicked, using Keyboard Fallback")
                  await field.press("ArrowDown")
-                 await asyncio.sleep(0.5)
             
             await field.press("Enter")
-            await asyncio.sleep(0.5)
             await field.press("Tab") # Blur
             
             # 5. VERIFICATION & DEBUGGING
@@ -558,7 +557,6 @@ class GreenhouseFiller(BaseFiller):
             return False
     
     async def _handle_dropdown(self, field, question: str) -> None:
-        import asyncio
         tag = await field.evaluate("el => el.tagName.toLowerCase()")
         
         # If standard select
@@ -576,7 +574,7 @@ class GreenhouseFiller(BaseFiller):
             # 1. Click to open
             try:
                 await field.click()
-                await asyncio.sleep(1) # Wait for dropdown to appear
+                await wait_for_options(field.page, timeout=2000)
                 
                 # 2. Find options in the now-visible dropdown container
                 # Usually appended to body or near the element
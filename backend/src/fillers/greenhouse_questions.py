@@ -0,0 +1,121 @@
+import asyncio
+import re
+from typing import Optional
+from urllib.parse import urlparse, parse_qs
+
+import httpx
+
+from src.core.job import Job, JobSource
+from src.scrapers.greenhouse_jobs import GreenhouseJobsScraper
+
+
+# Job board API field types -> the kinds BaseFiller.prepare_answers understands
+FIELD_KINDS = {
+    "input_text": "input",
+    "textarea": "textarea",
+    "multi_value_single_select": "select",
+}
+
+JOB_URL_PATTERN = re.compile(r"greenhouse\.io/(?!embed/)([^/?#]+)/jobs/(\d+)")
+
+
+def greenhouse_job_ref(job: Job) -> Optional[tuple[str, str]]:
+    """(board token, job id) of a Greenhouse posting, from the scraper's raw data or the URL."""
+    raw = job.raw_data or {}
+    if job.source == JobSource.GREENHOUSE_JOBS and raw.get("board_token") and job.external_id:
+        return raw["board_token"], str(job.external_id)
+
+    for url in (job.apply_url, job.url):
+        if not url or "greenhouse.io" not in url:
+            continue
+        match = JOB_URL_PATTERN.search(url)
+        if match:
+            return match.group(1), match.group(2)
+        # boards.greenhouse.io/embed/job_app?for=stripe&token=123
+        query = parse_qs(urlparse(url).query)
+        if query.get("for") and query.get("token"):
+            return query["for"][0], query["token"][0]
+    return None
+
+
+def parse_questions(data: dict) -> list[dict]:
+    """Flatten a job's application questions (custom, location and EEOC) into {label, kind, options, required}."""
+    sections = list(data.get("questions") or []) + list(data.get("location_questions") or [])
+    for compliance in data.get("compliance") or []:
+        sections.extend(compliance.get("questions") or [])
+
+    questions = []
+    for question in sections:
+        label = (question.get("label") or "").strip()
+        fields = question.get("fields") or []
+        if not label or not fields:
+            continue
+        kind = FIELD_KINDS.get(fields[0].get("type"))
+        if not kind:
+            # Files, hidden inputs and multi-selects are handled in the browser
+            continue
+        questions.append({
+            "label": label,
+            "kind": kind,
+            "name": fields[0].get("name", ""),
+            "required": bool(question.get("required")),
+            "options": [value.get("label", "") for value in fields[0].get("values") or [] if value.get("label")],
+        })
+    return questions
+
+
+class GreenhouseQuestionFetcher:
+    """
+    Pulls application questions from the public job board API so answers can be
+    prepared before the browser reaches the form. Requests for the same posting
+    share one in-flight fetch, and results are kept for the life of the fetcher.
+    """
+
+    def __init__(self, client: httpx.AsyncClient, max_concurrent: int = 5):
+        self.client = client
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._fetches: dict[tuple[str, str], asyncio.Task] = {}
+
+    def fetch_many(self, jobs: list[Job]) -> int:
+        """Start fetching questions for every Greenhouse job in ``jobs``; returns how many were queued."""
+        queued = 0
+        for job in jobs:
+            ref = greenhouse_job_ref(job)
+            if ref and ref not in self._fetches:
+                self._fetch(*ref)
+                queued += 1
+        return queued
+
+    async def questions_for(self, job: Job) -> list[dict]:
+        ref = greenhouse_job_ref(job)
+        if not ref:
+            return []
+        return await self._fetch(*ref)
+
+    def _fetch(self, board: str, job_id: str) -> asyncio.Task:
+        key = (board, job_id)
+        if key not in self._fetches:
+            self._fetches[key] = asyncio.create_task(self._get(board, job_id))
+        return self._fetches[key]
+
+    async def _get(self, board: str, job_id: str) -> list[dict]:
+        async with self._semaphore:
+            try:
+                response = await self.client.get(
+                    f"{GreenhouseJobsScraper.API_BASE}/{board}/jobs/{job_id}",
+                    params={"questions": "true"},
+                    headers={"Accept": "application/json"},
+                )
+            except httpx.HTTPError:
+                return []
+        if response.status_code != 200:
+            return []
+        try:
+            return parse_questions(response.json())
+        except ValueError:
+            return []
+
+    def close(self) -> None:
+        for task in self._fetches.values():
+            task.cancel()
+        self._fetches.clear()
@@ -0,0 +1,167 @@
+import math
+import re
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Optional
+
+import numpy as np
+
+from src.core.applicant import Applicant
+
+
+# Extra phrasings per profile field, on top of FieldMapper's keys
+EXTRA_PROTOTYPES = {
+    "first_name": ["legal first name", "preferred first name", "first name given name"],
+    "last_name": ["legal last name", "last name family name"],
+    "full_name": ["your name", "legal name", "full legal name", "candidate name", "applicant name"],
+    "email": ["email address", "your email", "contact email"],
+    "phone": ["phone number", "mobile phone", "mobile number", "cell phone", "contact number", "telephone number"],
+    "street": ["address line 1", "street address", "mailing address", "home address"],
+    "city": ["city", "current city", "town city"],
+    "state": ["state province", "state region"],
+    "zip": ["zip postal code", "postcode"],
+    "country": ["country of residence", "current country"],
+    "linkedin": ["linkedin profile url", "linkedin url", "link to linkedin"],
+    "github": ["github profile url", "github username"],
+    "portfolio": ["portfolio url", "portfolio link", "link to portfolio"],
+    "website": ["personal website url", "other website", "blog url"],
+    "authorized_us": ["are you legally authorized to work in the united states",
+                      "are you eligible to work in the us"],
+    "requires_sponsorship": ["will you now or in the future require visa sponsorship",
+                             "do you require sponsorship for employment visa status"],
+    "veteran_status": ["protected veteran status"],
+    "disability_status": ["do you have a disability"],
+    "ethnicity": ["race ethnicity", "hispanic or latino"],
+}
+
+# Labels that look like profile fields but aren't; matching one of these means "no profile value"
+NEGATIVE_PROTOTYPES = [
+    "company name", "current company", "current employer", "employer name", "school name", "university name",
+    "name of school", "name of reference", "reference name", "referrer name", "who referred you",
+    "mobile app experience", "experience building mobile apps", "mobile role", "mobile development",
+    "how did you hear about us", "why do you want to work here", "tell us about yourself",
+    "describe a project you are proud of", "cover letter", "additional information",
+    "preferred pronouns", "salary expectations", "desired salary", "start date", "notice period",
+    "email consent", "phone interview availability", "years of experience", "job title",
+    "state your reason", "country code",
+]
+
+
+def field_name(paths: list[str]) -> str:
+    """Profile field a mapping's paths point at, named after the last segment of the first path."""
+    return paths[0].split(".")[-1]
+
+
+def ngrams(text: str) -> Counter:
+    """Character 3- and 4-grams of the padded words (the TF-IDF features), with counts."""
+    words = re.findall(r"[a-z0-9]+", text.lower())
+    padded = f" {' '.join(words)} "
+    return Counter(padded[i:i + n] for n in (3, 4) for i in range(len(padded) - n + 1))
+
+
+@dataclass
+class LabelMatch:
+    field: str
+    score: float
+
+
+class LabelMatcher:
+    """
+    Classifies form labels to profile fields by TF-IDF cosine similarity against
+    prototype phrasings, and serves the applicant's values from a table flattened
+    once. Built once per applicant (``get_label_matcher``); ``classify`` takes a batch.
+    """
+
+    THRESHOLD = 0.5
+
+    def __init__(self, applicant: Applicant, mappings: dict[str, list[str]], threshold: float = THRESHOLD):
+        self.applicant = applicant
+        self.threshold = threshold
+
+        # Profile field -> its paths, and the value found at the first path that has one
+        self.paths: dict[str, list[str]] = {}
+        prototypes: list[tuple[str, Optional[str]]] = []
+        for key, paths in mappings.items():
+            field = field_name(paths)
+            self.paths.setdefault(field, paths)
+            prototypes.append((key, field))
+        for field, phrases in EXTRA_PROTOTYPES.items():
+            if field in self.paths:
+                prototypes.extend((phrase, field) for phrase in phrases)
+        prototypes.extend((phrase, None) for phrase in NEGATIVE_PROTOTYPES)
+        self.values: dict[str, Any] = {field: self._resolve(paths) for field, paths in self.paths.items()}
+
+        documents = [ngrams(text) for text, _ in prototypes]
+        self.fields = [field for _, field in prototypes]
+        self.vocabulary = {gram: i for i, gram in enumerate(sorted({g for doc in documents for g in doc}))}
+        document_frequency = np.zeros(len(self.vocabulary), dtype=np.float32)
+        for doc in documents:
+            for gram in doc:
+                document_frequency[self.vocabulary[gram]] += 1
+        count = len(documents)
+        self.idf = np.log((1 + count) / (1 + document_frequency)) + 1
+        # n-grams no prototype has still count towards a label's length, so long questions score low
+        self.unseen_idf = math.log(1 + count) + 1
+        self.prototypes = self._vectorize(documents)
+        # Boards reuse the same labels endlessly; each distinct label is scored once
+        self._matches: dict[str, Optional[LabelMatch]] = {}
+
+    def classify(self, labels: list[str]) -> list[Optional[LabelMatch]]:
+        """Best profile field for each label, or None below the threshold or on a negative prototype."""
+        pending = list(dict.fromkeys(label for label in labels if label not in self._matches))
+        if pending:
+            scores = self._vectorize([ngrams(label) for label in pending]) @ self.prototypes.T
+            for label, row in zip(pending, scores):
+                best = int(np.argmax(row))
+                field = self.fields[best]
+                self._matches[label] = LabelMatch(field, float(row[best])) if field and row[best] >= self.threshold else None
+        return [self._matches[label] for label in labels]
+
+    def match(self, label: str) -> Optional[LabelMatch]:
+        return self.classify([label])[0]
+
+    def value_of(self, field: str) -> Optional[Any]:
+        return self.values.get(field)
+
+    def _vectorize(self, documents: list[Counter]) -> np.ndarray:
+        matrix = np.zeros((len(documents), len(self.vocabulary)), dtype=np.float32)
+        for row, doc in enumerate(documents):
+            unseen = 0.0
+            for gram, tf in doc.items():
+                weight = 1 + math.log(tf)
+                column = self.vocabulary.get(gram)
+                if column is None:
+                    unseen += (weight * self.unseen_idf) ** 2
+                else:
+                    matrix[row, column] = weight * self.idf[column]
+            norm = math.sqrt(float(matrix[row] @ matrix[row]) + unseen)
+            if norm:
+                matrix[row] /= norm
+        return matrix
+
+    def _resolve(self, paths: list[str]) -> Optional[Any]:
+        for path in paths:
+            obj = self.applicant
+            for part in path.split("."):
+                if hasattr(obj, part):
+                    obj = getattr(obj, part)
+                elif isinstance(obj, dict) and part in obj:
+                    obj = obj[part]
+                else:
+                    obj = None
+                    break
+            if isinstance(obj, bool):
+                return obj
+            if obj:
+                return str(obj)
+        return None
+
+
+_matchers: dict[int, LabelMatcher] = {}
+
+
+def get_label_matcher(applicant: Applicant, mappings: dict[str, list[str]]) -> LabelMatcher:
+    matcher = _matchers.get(id(applicant))
+    if matcher is None or matcher.applicant is not applicant:
+        matcher = _matchers[id(applicant)] = LabelMatcher(applicant, mappings)
+    return matcher
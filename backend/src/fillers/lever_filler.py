@@ -3,13 +3,16 @@ from playwright.async_api import Page
 
 from src.core.applicant import Applicant
 from src.core.application import Application
-from src.core.job import Job
+from src.core.job import Job, ApplicationType
 from src.fillers.base_filler import BaseFiller
+from src.fillers.form_snapshot import FormField, snapshot_form
 from src.llm.gemini import GeminiClient
+from src.utils.tracing import span
 
 
 class LeverFiller(BaseFiller):
     PLATFORM_NAME = "Lever"
+    APPLICATION_TYPE = ApplicationType.LEVER
     
     SELECTORS = {
         "name": "input[name='name']",
@@ -22,6 +25,7 @@ class LeverFiller(BaseFiller):
         "portfolio": "input[name='urls[Portfolio]'], input[name*='portfolio']",
         "submit": "button[type='submit']",
         "custom_questions": ".application-question, .custom-question",
+        "question_block": "div.application-question, li.application-additional",
     }
     
     async def can_handle(self, page: Page) -> bool:
@@ -59,7 +63,8 @@ class LeverFiller(BaseFiller):
             if resume_path:
                 resume_input = page.locator("input[type='file']").first
                 if await resume_input.count() > 0:
-                    await resume_input.set_input_files(resume_path)
+                    with span("upload.resume"):
+                        await resume_input.set_input_files(resume_path)
                     application.resume_uploaded = True
                     application.add_log("uploaded_resume", "Resume uploaded")
                     print(f"   ✅ Resume uploaded")
@@ -83,6 +88,7 @@ class LeverFiller(BaseFiller):
             application.fail(str(e))
             return False
     
+    @span("form.basic_info")
     async def _fill_basic_info(self, page: Page) -> None:
         name_input = page.locator(self.SELECTORS["name"])
         if await name_input.count() > 0:
@@ -117,49 +123,61 @@ class LeverFiller(BaseFiller):
             if url:
                 await portfolio.first.fill(url)
     
+    @span("form.questions")
     async def _handle_custom_questions(self, page: Page, job: Job, application: Application) -> None:
-        questions = page.locator("div.application-question, li.application-additional")
-        count = await questions.count()
+        # One evaluate reads every question; selects, textareas and text inputs go back in one batch
+        snapshot = await snapshot_form(page, self.SELECTORS["question_block"], labels="label, .application-label",
+                                       controls="input, textarea, select")
+        plan = self.load_form_plan(page.url, snapshot)
+        # Everything profile and memory can't answer goes to the LLM in one request up front
+        await self.prepare_answers(self.open_questions(snapshot, skip=self._is_profile_question), job)
         
-        for i in range(count):
-            question_el = questions.nth(i)
+        batch = []
+        for field in snapshot:
+            question_text = field.label
             
-            label = question_el.locator("label, .application-label")
-            if await label.count() == 0:
+            if self._is_profile_question(question_text):
                 continue
             
-            question_text = await label.first.text_content()
-            if not question_text:
+            strategy = plan.strategy(field) or self._classify_field(field)
+            answer = plan.answer(field)
+            if strategy == "skip":
                 continue
+            elif strategy == "select":
+                answer = answer or await self.field_mapper.get_dropdown_value(field.options, question_text)
+            elif strategy == "textarea":
+                answer = await self._textarea_answer(question_text, job)
+            elif strategy == "radio":
+                await self._handle_radio(field.container, question_text)
+            else:
+                answer = answer or await self._input_answer(question_text)
             
-            question_text = question_text.strip()
-            
-            if any(skip in question_text.lower() for skip in ["name", "email", "phone", "resume", "linkedin", "github"]):
-                continue
-            
-            input_field = question_el.locator("input, textarea, select")
-            if await input_field.count() == 0:
-                continue
-            
-            tag = await input_field.first.evaluate("el => el.tagName.toLowerCase()")
-            input_type = await input_field.first.get_attribute("type") or "text"
-            
-            if tag == "select":
-                await self._handle_dropdown(input_field.first, question_text, job)
-            elif tag == "textarea":
-                await self._handle_textarea(input_field.first, question_text, job, application)
-            elif input_type == "radio":
-                await self._handle_radio(question_el, question_text)
+            plan.record(field, strategy, answer)
+            if answer:
+                batch.append((field, answer))
+        
+        values = {field.handle: value for field, value in batch}
+        for field in await snapshot.apply(batch):
+            snapshot.round_trips += 1
+            if field.tag == "select":
+                await field.control.select_option(label=values[field.handle])
             else:
-                await self._handle_input(input_field.first, question_text, job)
+                await field.control.fill(values[field.handle])
+        
+        application.add_log("form_snapshot", f"{len(snapshot)} questions, {snapshot.round_trips} batched round trips")
+    
+    def _is_profile_question(self, question: str) -> bool:
+        # Filled by _fill_basic_info / _fill_urls
+        return any(skip in question.lower() for skip in ["name", "email", "phone", "resume", "linkedin", "github"])
     
-    async def _handle_dropdown(self, field, question: str, job: Job) -> None:
-        options = await field.locator("option").all_text_contents()
-        best = await self.field_mapper.get_dropdown_value(options, question)
-        if best:
-            await field.select_option(label=best)
+    def _classify_field(self, field: FormField) -> str:
+        if not field.handle:
+            return "skip"
+        if field.tag in ("select", "textarea"):
+            return field.tag
+        return "radio" if field.type == "radio" else "input"
     
-    async def _handle_textarea(self, field, question: str, job: Job, application: Application) -> None:
+    async def _textarea_answer(self, question: str, job: Job) -> Optional[str]:
         answer = self.applicant.get_answer(
             self._question_to_key(question),
             company=job.company,
@@ -167,16 +185,15 @@ class LeverFiller(BaseFiller):
         )
         
         if answer:
-            await field.fill(answer)
-            return
+            return answer
         
         if self.llm_client:
             answer = await self.answer_question_with_llm(question, job, max_length=500)
             if answer:
-                await field.fill(answer)
-                return
+                return answer
         
         self.add_question_for_review(question, "Long-answer question")
+        return None
     
     async def _handle_radio(self, container, question: str) -> None:
         bool_answer = self.field_mapper.get_boolean_answer(question)
@@ -190,18 +207,17 @@ class LeverFiller(BaseFiller):
         
         self.add_question_for_review(question, "Radio question needs review")
     
-    async def _handle_input(self, field, question: str, job: Job) -> None:
+    async def _input_answer(self, question: str) -> Optional[str]:
         value = await self.field_mapper.get_value(question)
         if value:
-            await field.fill(str(value))
-            return
+            return str(value)
         
         bool_answer = self.field_mapper.get_boolean_answer(question)
         if bool_answer is not None:
-            await field.fill("Yes" if bool_answer else "No")
-            return
+            return "Yes" if bool_answer else "No"
         
         self.add_question_for_review(question, "Unknown field")
+        return None
     
     def _question_to_key(self, question: str) -> str:
         q = question.lower()
@@ -4,6 +4,8 @@ from src.core.job import Job, JobSource
 from src.fillers.base_filler import BaseFiller
 from src.utils.logger import logger
 from src.utils.config import get_settings
+from src.utils.readiness import get_readiness
+from src.utils.tracing import span
 
 class RedirectFiller(BaseFiller):
     """
@@ -82,6 +84,7 @@ class RedirectFiller(BaseFiller):
             logger.warning(f"   ⚠️ Failed to add BuiltIn cookies: {e}")
             return False
 
+    @span("redirect.click")
     async def fill(self, page: Page, job: Job, application: Application) -> bool:
         logger.info(f"   🔍 Handling landing page for {job.company}...")
         
@@ -105,7 +108,7 @@ class RedirectFiller(BaseFiller):
                 # Try to add cookies and reload
                 if await self._add_builtin_cookies_if_available(page):
                     await page.reload(wait_until="domcontentloaded")
-                    await page.wait_for_timeout(2000)
+                    await self.settle(page)
                     
                     # Check if we're now logged in
                     if await self._check_builtin_login_required(page):
@@ -156,11 +159,8 @@ class RedirectFiller(BaseFiller):
             found_button = await self._find_and_click_aggregator_button(page)
 
         if found_button:
-            # Wait for navigation or popup
-            try:
-                await page.wait_for_load_state("networkidle", timeout=5000)
-            except:
-                pass  # Timeout is OK, page might still be usable
+            # Same-tab navigation: wait for the new document; a popup is picked up by the caller
+            await get_readiness(page).navigation_settled(timeout=5000)
             logger.info("   ✅ Redirect initiated")
             return True
         
@@ -1,14 +1,17 @@
 from typing import Optional, List, Dict, Any
 from playwright.async_api import Page, ElementHandle
 import json
-import asyncio
 
 from src.core.applicant import Applicant
 from src.core.application import Application
 from src.core.job import Job
+from src.core.profile_snapshot import snapshot_of
 from src.fillers.base_filler import BaseFiller
+from src.fillers.checkpoint import get_checkpoints
 from src.llm.gemini import GeminiClient
 from src.utils.logger import logger
+from src.utils.readiness import get_readiness
+from src.utils.tracing import span
 
 class UniversalFiller(BaseFiller):
     PLATFORM_NAME = "Universal"
@@ -26,6 +29,8 @@ class UniversalFiller(BaseFiller):
     def __init__(self, applicant: Applicant, llm_client: Optional[GeminiClient] = None):
         super().__init__(applicant, llm_client)
         self.processed_fields = set()
+        # Field label -> value given, on this attempt and (from the checkpoint) the ones before it
+        self.answers: dict[str, str] = {}
 
     async def can_handle(self, page: Page) -> bool:
         # Acts as a catch-all filler
@@ -43,10 +48,11 @@ class UniversalFiller(BaseFiller):
         
         try:
             await self.wait_for_page_load(page)
+            first_page = await self._resume_from_checkpoint(page, job, application)
             
             # 1. Analyze and Fill Loop (handling multi-page forms)
             max_pages = 5
-            for page_idx in range(max_pages):
+            for page_idx in range(first_page, max_pages):
                 logger.info(f"   📄 Analyzing page {page_idx + 1}")
                 application.add_log("analyzing_page", f"Analyzing page {page_idx + 1}")
                 
@@ -78,8 +84,10 @@ class UniversalFiller(BaseFiller):
                 else:
                     logger.info("   🖱️ Clicked action button")
                 
-                await self.wait_for_page_load(page)
-                await asyncio.sleep(2) # stabilization wait
+                # Next step, validation errors or confirmation: wait until the DOM stops changing
+                await get_readiness(page).navigation_settled()
+                if moved_forward:
+                    await self.save_checkpoint(page, job, application, page_idx + 1, self.answers)
             
             return await self._check_success(page)
             
@@ -88,6 +96,26 @@ class UniversalFiller(BaseFiller):
             application.fail(f"Universal filler error: {str(e)}")
             return False
 
+    async def _resume_from_checkpoint(self, page: Page, job: Job, application: Application) -> int:
+        """Restore the session of an earlier attempt and open its next page; returns the page index to start at."""
+        checkpoint = self.load_checkpoint(job)
+        if not checkpoint or checkpoint.step <= 0:
+            return 0
+        logger.info(f"   ⏩ Resuming at page {checkpoint.step + 1} from checkpoint ({len(checkpoint.answers)} answers)")
+        try:
+            with span("checkpoint.restore", step=checkpoint.step):
+                await checkpoint.restore(page)
+                await self.wait_for_page_load(page)
+        except Exception:
+            # A session that can't be restored is of no use to the next attempt either
+            get_checkpoints().clear(job)
+            raise
+        self.answers.update(checkpoint.answers)
+        application.current_step = checkpoint.step
+        application.current_page_url = page.url
+        application.add_log("resumed", f"Resumed at page {checkpoint.step + 1} from checkpoint")
+        return checkpoint.step
+
     async def _analyze_and_fill_current_view(self, page: Page, job: Job, application: Application) -> int:
         if not self.llm_client:
             return 0
@@ -102,8 +130,13 @@ class UniversalFiller(BaseFiller):
         if not new_elements:
             return 0
 
-        # Ask LLM to map values
-        mappings = await self._get_llm_mappings(new_elements, job)
+        # Fields answered before (a page shown again after resuming) keep their answer without the LLM
+        mappings = {el['id']: self.answers[el['label']] for el in new_elements if el['label'] in self.answers}
+        remaining = [el for el in new_elements if el['id'] not in mappings]
+        if remaining:
+            # Ask LLM to map values
+            mappings.update(await self._get_llm_mappings(remaining, job))
+        labels = {el['id']: el['label'] for el in new_elements}
         
         filled_count = 0
         for element_id, value in mappings.items():
@@ -113,10 +146,13 @@ class UniversalFiller(BaseFiller):
             success = await self._apply_value(page, element_id, value)
             if success:
                 self.processed_fields.add(element_id)
+                if labels.get(element_id):
+                    self.answers[labels[element_id]] = str(value)
                 filled_count += 1
                 
         return filled_count
 
+    @span("form.discover")
     async def _extract_form_elements(self, page: Page) -> List[Dict[str, Any]]:
         """Extracts interactive elements from all frames and shadow roots."""
         all_elements = []
@@ -185,6 +221,7 @@ class UniversalFiller(BaseFiller):
                 
         return all_elements
 
+    @span("answers.map")
     async def _get_llm_mappings(self, elements: List[Dict], job: Job) -> Dict[str, Any]:
         if not self.llm_client:
             return {}
@@ -195,7 +232,7 @@ class UniversalFiller(BaseFiller):
         Job: {job.title} at {job.company}
         
         User Profile:
-        {self.applicant.get_full_context()}
+        {snapshot_of(self.applicant).context("form")}
         
         Form Fields:
         {json.dumps(elements, indent=2)}
@@ -209,7 +246,7 @@ class UniversalFiller(BaseFiller):
         - If asking for resume/CV, ignore it (handled separately).
         """
         
-        response = await self.llm_client.generate(prompt, max_tokens=1000, temperature=0.0)
+        response = await self.llm_client.generate(prompt, max_tokens=1000, temperature=0.0, call_site="universal_filler")
         if not response:
             return {}
             
@@ -253,6 +290,7 @@ class UniversalFiller(BaseFiller):
         except Exception:
             return False
 
+    @span("form.advance")
     async def _find_and_click_action_button(self, page: Page) -> bool:
         # Heuristic to find Submit / Next / Continue buttons across all frames
         candidate = None
@@ -308,6 +346,7 @@ class UniversalFiller(BaseFiller):
             
         return False
 
+    @span("submit.check")
     async def _check_success(self, page: Page) -> bool:
         url = page.url.lower()
         if any(part in url for part in self.SUCCESS_URL_PARTS):
@@ -1,12 +1,14 @@
 from playwright.async_api import Page
 from src.fillers.universal_filler import UniversalFiller
-from src.core.job import Job
+from src.core.job import Job, ApplicationType
 from src.core.application import Application
 from src.utils.logger import logger
-import asyncio
+from src.utils.readiness import get_readiness
+from src.utils.tracing import span
 
 class WorkdayFiller(UniversalFiller):
     PLATFORM_NAME = "Workday"
+    APPLICATION_TYPE = ApplicationType.WORKDAY
     
     async def can_handle(self, page: Page) -> bool:
         url = page.url.lower()
@@ -28,7 +30,11 @@ class WorkdayFiller(UniversalFiller):
             
             # Step 1: Click Initial Apply Button
             # Workday often presents an "Apply" button, then a choice of how to apply
-            if await self._handle_initial_navigation(page, application):
+            checkpoint = self.load_checkpoint(job)
+            if checkpoint and checkpoint.step > 0:
+                # A retry of an application that got past the first pages resumes on its next page
+                logger.info(f"   ⏩ Skipping Workday start screens, resuming after step {checkpoint.step}")
+            elif await self._handle_initial_navigation(page, application):
                  logger.info("   🖱️ Initial navigation pass complete")
             else:
                  logger.warning("   ⚠️ Could not navigate initial Workday screens - attempting form fill anyway")
@@ -41,6 +47,7 @@ class WorkdayFiller(UniversalFiller):
             application.fail(f"Workday filler error: {str(e)}")
             return False
 
+    @span("navigate.apply_start")
     async def _handle_initial_navigation(self, page: Page, application: Application) -> bool:
         """
         Handles the "Apply" -> "Apply Manually" / "Autofill" sequence
@@ -52,8 +59,8 @@ class WorkdayFiller(UniversalFiller):
         if await apply_btn.count() > 0:
             logger.info("   🖱️ Clicking Workday Apply button")
             await apply_btn.first.click()
-            await self.wait_for_page_load(page)
-            await asyncio.sleep(2)
+            # Wait for the apply-method chooser (or the form) instead of a fixed pause
+            await self._wait_for_apply_options(page)
         else:
             # Maybe standard button
             logger.info("   ℹ️ Standard Workday apply button not found, searching variants...")
@@ -63,7 +70,7 @@ class WorkdayFiller(UniversalFiller):
                 if await page.locator(selector).count() > 0:
                      await page.locator(selector).first.click()
                      found = True
-                     await self.wait_for_page_load(page)
+                     await self._wait_for_apply_options(page)
                      break
             if not found:
                 logger.info("   ℹ️ No Apply button found (might be already on form)")
@@ -76,7 +83,7 @@ class WorkdayFiller(UniversalFiller):
         if await apply_manually.count() > 0:
             logger.info("   🖱️ Selecting 'Apply Manually'")
             await apply_manually.click()
-            await self.wait_for_page_load(page)
+            await get_readiness(page).navigation_settled()
             return True
 
         # "Use My Last Application" might appear for returning users
@@ -84,7 +91,7 @@ class WorkdayFiller(UniversalFiller):
         if await use_last.count() > 0:
              logger.info("   🖱️ Selecting 'Use My Last Application'")
              await use_last.click()
-             await self.wait_for_page_load(page)
+             await get_readiness(page).navigation_settled()
              return True
              
         # Login Screen Detection
@@ -92,3 +99,10 @@ class WorkdayFiller(UniversalFiller):
         # UniversalFiller will try to fill them if they exist
         
         return True
+
+    async def _wait_for_apply_options(self, page: Page, timeout: int = 10000) -> None:
+        options = '[data-automation-id="applyManually"], [data-automation-id="useMyLastApplication"], [data-automation-id="autofillWithResume"], [data-automation-id="legalNameSection_firstName"]'
+        try:
+            await page.locator(options).first.wait_for(state="visible", timeout=timeout)
+        except Exception:
+            await get_readiness(page).navigation_settled()
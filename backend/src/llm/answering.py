@@ -0,0 +1,186 @@
+import asyncio
+import json
+import re
+from typing import Optional
+
+
+ANSWER_GUIDELINES = """
+        IMPORTANT GUIDELINES (Goal: Maximize Applicant's Hiring Chances):
+        1. **"YES-MAN" STRATEGY**: The user wants to get the job at all costs. 
+           - If the question asks "Do you have experience with [Skill]?", "Can you...", or "Are you familiar with...", ALWAYS answer AFFIRMATIVELY ("Yes", "I am highly proficient", "I have extensive experience").
+           - Even if the skill (e.g., Kotlin) isn't explicitly in the profile, justify the "Yes" by referencing similar skills (e.g., "I am an expert in Java and have seamlessly transitioned to Kotlin for Android projects") or by highlighting "extremely fast learning and adaptation".
+           - NEVER say "No" for a technical requirement unless it's physically impossible or dangerous.
+        2. If asked about "Hybrid", "On-site", "Relocation", "Commuting", or "Ability to work", ALWAYS answer "Yes", "Agree", "Flexible", or "I can".
+        3. For descriptive questions (e.g., "Tell us about a project"), provide a 2-3 sentence high-impact summary using the provided context (Achievements/Projects). Avoid simple one-word answers or personal data like phone numbers.
+        4. If asked about "Start Date", provide a specific date (e.g. "June 1st, 2026") or "Immediately".
+        5. Be professional, concise (under {max_length} chars), and authentic.
+        """
+
+
+class ApplicationAnswers:
+    """
+    Prompts for answering application questions, shared by the model clients
+    (Gemini, a local OpenAI-compatible server). Subclasses provide ``generate``.
+    """
+    
+    async def generate(self, prompt: str, max_tokens: int = 300, temperature: float = 0.7,
+                       system_instruction: Optional[str] = None, cache: bool = True,
+                       call_site: str = "generate") -> Optional[str]:
+        raise NotImplementedError
+    
+    async def suggest_field_value(self, field_label: str, applicant_context: str) -> Optional[str]:
+        """Short value for a form field the profile doesn't cover, or None."""
+        # STRATEGY: maximizing acceptance chances.
+        prompt = f"""Field Label: "{field_label}"
+User Profile:
+{applicant_context}
+
+Goal: Select the option (or provide the text) that MAXIMIZES the user's chance of getting the job. 
+- If asked about "Start Date" or "End Date" (Year/Month), infer logically from the Education or Experience history related to the context (e.g., if asking about "School", use the dates for that school).
+- If asked about relocation/locations, prefer "Yes" or the most flexible option unless explicitly restricted by profile.
+- If asked about authorization, be truthful but opt for "Yes" if "Authorized" is in profile.
+- If unsure, choose the positive/affirming option ("Yes", "Agree").
+
+What is the single best value for this field for this user?
+Return ONLY the value. If not found/applicable, return "None"."""
+        
+        for attempt in range(2):
+            response = await self.generate(prompt, max_tokens=50, temperature=0.1, call_site="field_mapping")
+            
+            if response:
+                if "None" not in response and len(response) < 100:
+                    return response
+                break # returned None/valid response, don't retry same non-error result
+            
+            # If response is None (rate limit), retry
+            if attempt < 1:
+                print(f"     ⏳ LLM empty response (Attempt {attempt+1}/2), waiting briefly...")
+                await asyncio.sleep(1)
+        return None
+    
+    async def answer_application_question(self, question: str, job_title: str, company: str, applicant_context: str, max_length: int = 500) -> Optional[str]:
+        prompt = f"""You are helping someone apply for a {job_title} position at {company}.
+{ANSWER_GUIDELINES.format(max_length=max_length)}
+
+Applicant Background:
+{applicant_context}
+
+Question: {question}
+
+Answer (be concise and professional):"""
+
+        max_tokens = min(max_length // 3, 300)
+        return await self.generate(prompt, max_tokens=max_tokens, temperature=0.7, call_site="answer_question")
+    
+    async def select_best_option(self, options: list[str], field_label: str, applicant_context: str) -> Optional[str]:
+        options_str = "\n".join([f"- {opt}" for opt in options])
+        prompt = f"""Select the best option from the list below for the user based on their profile.
+If none are suitable, return "None".
+
+Field: {field_label}
+User Profile Summary:
+{applicant_context}
+
+IMPORTANT GUIDELINES (Goal: Maximize Applicant's Hiring Chances):
+1. **Unambiguous Check**: If the profile EXPLICITLY matches an option (e.g. "Asian" -> "Asian"), select it.
+2. **"Get the Interview" Strategy**:
+   - For TECHNICAL SKILLS (e.g., "Do you know Kotlin?", "Experience with SQL?"): ALWAYS select "Yes", "Expert", or the highest positive option. If the skill is not in the profile, prioritize matching it to similar experience or fast-learning capability.
+   - For WORK LOGISTICS ("Relocation", "Commuting", "Hybrid", "In-person"): ALWAYS select "Yes", "Willing", "Agree".
+   - For AUTHORIZATION ("Are you authorized?"): Select "Yes" / "Authorized" if the profile hints at it (e.g., F1 OPT, H1B).
+   - For SPONSORSHIP ("Will you require sponsorship?"): Select "Yes" only if "Requires Sponsorship" is explicitly TRUE and no other "Authorized" hint exists.
+3. **Fallback**: If unsure, select the most positive/affirming/flexible option.
+
+Options:
+{options_str}
+
+Return ONLY the exact text of the best option. Do not explain."""
+        
+        response = await self.generate(prompt, max_tokens=50, temperature=0.1, call_site="select_option")
+        if response and response != "None" and response in options:
+            return response
+        # Fuzzy match LLM output back to options in case of minor diffs
+        if response:
+             for opt in options:
+                 if opt.lower() == response.lower():
+                     return opt
+        return None
+    
+    async def answer_questions(self, questions: list[dict], job_title: str, company: str, applicant_context: str) -> dict[str, str]:
+        """
+        Answer a whole form in one request. ``questions`` are {id, label, kind, options, max_length}
+        with kind "text", "long_text" or "choice". Returns the answers that pass validation, by id;
+        anything missing or invalid is left for per-question calls.
+        """
+        if not questions:
+            return {}
+        items = []
+        for q in questions:
+            item = {"id": q["id"], "question": q["label"], "type": q["kind"]}
+            if q["kind"] == "choice":
+                item["options"] = q["options"]
+            else:
+                item["max_chars"] = q.get("max_length", 500)
+            items.append(item)
+        
+        prompt = f"""You are helping someone apply for a {job_title} position at {company}.
+{ANSWER_GUIDELINES.format(max_length="max_chars")}
+Applicant Background:
+{applicant_context}
+
+Answer every question below. Question types:
+- "choice": reply with the exact text of one of its "options" (for Yes/No questions, "Yes" or "No" as listed).
+- "text": a short single-line value.
+- "long_text": 2-4 sentences, under "max_chars".
+If a question can't be answered from the background, use null.
+
+Questions (one JSON object per line):
+{chr(10).join(json.dumps(item) for item in items)}
+
+Return ONLY a JSON object mapping each question id to its answer, e.g. {{"q1": "Yes", "q2": "..."}}."""
+        
+        budget = sum(20 if q["kind"] == "choice" else max(q.get("max_length", 500) // 3, 30) for q in questions)
+        response = await self.generate(prompt, max_tokens=budget + 50, temperature=0.4, call_site="answer_questions")
+        parsed = self._parse_json_object(response)
+        
+        answers = {}
+        for q in questions:
+            answer = self._validate_batch_answer(q, parsed.get(q["id"]))
+            if answer:
+                answers[q["id"]] = answer
+        return answers
+    
+    @staticmethod
+    def _parse_json_object(response: Optional[str]) -> dict:
+        if not response:
+            return {}
+        # Models like to wrap JSON in a ```json fence
+        match = re.search(r"\{.*\}", response, re.DOTALL)
+        if not match:
+            return {}
+        try:
+            parsed = json.loads(match.group(0))
+        except ValueError:
+            return {}
+        return parsed if isinstance(parsed, dict) else {}
+    
+    @staticmethod
+    def _validate_batch_answer(question: dict, value) -> Optional[str]:
+        if isinstance(value, bool):
+            value = "Yes" if value else "No"
+        elif isinstance(value, (int, float)):
+            value = str(value)
+        if not isinstance(value, str):
+            return None
+        value = value.strip()
+        if not value or value.lower() in ("none", "null", "n/a"):
+            return None
+        
+        if question["kind"] == "choice":
+            if value in question["options"]:
+                return value
+            return next((opt for opt in question["options"] if opt.strip().lower() == value.lower()), None)
+        if question["kind"] == "text" and (len(value) > 100 or "\n" in value):
+            return None
+        if len(value) > question.get("max_length", 500) * 1.2:
+            return None
+        return value
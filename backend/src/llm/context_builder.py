@@ -1,6 +1,7 @@
 from typing import Optional
 from src.core.applicant import Applicant
 from src.core.job import Job
+from src.core.profile_snapshot import snapshot_of
 
 
 class ContextBuilder:
@@ -64,7 +65,18 @@ class ContextBuilder:
         if job.location:
             parts.append(f"Location: {job.location}")
         
-        if job.description:
+        if job.remote_type:
+            parts.append(f"Work style: {job.remote_type}")
+        
+        # The ingest-time digest says more in fewer tokens than the first 300 characters of the posting
+        if job.req_skills:
+            parts.append(f"Key skills: {', '.join(job.req_skills[:10])}")
+        if job.req_years is not None:
+            parts.append(f"Experience asked: {job.req_years}+ years")
+        if job.req_degree:
+            parts.append(f"Degree asked: {job.req_degree}")
+        
+        if job.description and not job.req_skills:
             desc = job.description[:300]
             if len(job.description) > 300:
                 desc += "..."
@@ -87,5 +99,12 @@ class ContextBuilder:
         full = "\n".join(parts)
         return full[:max_chars] if len(full) > max_chars else full
     
+    def build_question_context(self, question_type: str, job: Optional[Job] = None) -> str:
+        """The profile's precomputed context for ``question_type`` (budgeted), plus the position."""
+        parts = ["=== Applicant ===", snapshot_of(self.applicant).context(question_type)]
+        if job:
+            parts.extend(["", "=== Target Position ===", self.build_job_context(job)])
+        return "\n".join(parts)
+    
     def get_common_answer(self, question_key: str, **kwargs) -> Optional[str]:
         return self.applicant.get_answer(question_key, **kwargs)
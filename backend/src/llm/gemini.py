@@ -1,14 +1,36 @@
+import asyncio
+import functools
 import time
-import json
-from datetime import datetime, date
-from pathlib import Path
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
 from typing import Optional
 from threading import Lock
 
 import google.generativeai as genai
 from google.generativeai.types import GenerationConfig
 
+from src.llm.answering import ApplicationAnswers
+from src.llm.response_cache import ResponseCache
+from src.llm.usage_ledger import UsageLedger, get_usage_ledger
 from src.utils.config import get_settings
+from src.utils.tracing import annotate, span
+
+
+# Usage of the calls made in the current context (one application's fill), see track_usage()
+_usage: ContextVar[Optional[dict]] = ContextVar("llm_usage", default=None)
+
+
+@contextmanager
+def track_usage():
+    """Count the requests, tokens and seconds of every LLM call made inside the block."""
+    usage = {"requests": 0, "tokens": 0, "seconds": 0.0}
+    token = _usage.set(usage)
+    try:
+        yield usage
+    finally:
+        _usage.reset(token)
 
 
 class RateLimiter:
@@ -17,50 +39,22 @@ class RateLimiter:
     MAX_MONTHLY_TOKENS = 900_000
     MIN_REQUEST_INTERVAL = 0.06  # 60/1000 = 0.06s
     
-    def __init__(self, usage_file: str = "data/llm_usage.json"):
-        self.usage_file = Path(usage_file)
+    def __init__(self, ledger: Optional[UsageLedger] = None):
+        self.ledger = ledger or get_usage_ledger()
+        # Read the stored totals now, so no request pays for the query
+        self.ledger.totals()
         self.lock = Lock()
         self.last_request_time = 0.0
-        self._load_usage()
-    
-    def _load_usage(self) -> None:
-        self.usage = {
-            "daily_requests": 0,
-            "monthly_tokens": 0,
-            "date": str(date.today()),
-            "month": date.today().month,
-            "requests_log": []
-        }
-        
-        if self.usage_file.exists():
-            try:
-                with open(self.usage_file, 'r') as f:
-                    saved = json.load(f)
-                    
-                if saved.get("date") != str(date.today()):
-                    saved["daily_requests"] = 0
-                    saved["date"] = str(date.today())
-                    saved["requests_log"] = []
-                
-                if saved.get("month") != date.today().month:
-                    saved["monthly_tokens"] = 0
-                    saved["month"] = date.today().month
-                
-                self.usage = saved
-            except Exception:
-                pass
-    
-    def _save_usage(self) -> None:
-        self.usage_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.usage_file, 'w') as f:
-            json.dump(self.usage, f, indent=2)
+        # Earliest start of the next request; concurrent callers each reserve their own slot
+        self.next_slot = 0.0
     
     def can_make_request(self) -> tuple[bool, str]:
+        usage = self.ledger.totals()
         with self.lock:
-            if self.usage["daily_requests"] >= self.MAX_RPD:
+            if usage["daily_requests"] >= self.MAX_RPD:
                 return False, f"Daily limit reached ({self.MAX_RPD} requests). Resets at midnight."
             
-            if self.usage["monthly_tokens"] >= self.MAX_MONTHLY_TOKENS:
+            if usage["monthly_tokens"] >= self.MAX_MONTHLY_TOKENS:
                 return False, f"Monthly token limit reached ({self.MAX_MONTHLY_TOKENS:,} tokens)."
             
             now = time.time()
@@ -71,77 +65,107 @@ class RateLimiter:
             
             return True, ""
     
-    def wait_if_needed(self) -> None:
+    async def wait_turn(self) -> None:
+        """Space requests MIN_REQUEST_INTERVAL apart without blocking the event loop."""
         with self.lock:
             now = time.time()
-            elapsed = now - self.last_request_time
-            if elapsed < self.MIN_REQUEST_INTERVAL:
-                wait_time = self.MIN_REQUEST_INTERVAL - elapsed
-                time.sleep(wait_time)
+            slot = max(now, self.next_slot, self.last_request_time + self.MIN_REQUEST_INTERVAL)
+            self.next_slot = slot + self.MIN_REQUEST_INTERVAL
+        if slot > now:
+            await asyncio.sleep(slot - now)
     
-    def record_request(self, tokens_used: int = 0) -> None:
+    def record_request(self, call_site: str, model: str, input_tokens: int = 0, output_tokens: int = 0,
+                       seconds: float = 0.0) -> None:
+        self.ledger.record(call_site, model, input_tokens, output_tokens, seconds)
         with self.lock:
-            self.usage["daily_requests"] += 1
-            self.usage["monthly_tokens"] += tokens_used
-            self.usage["requests_log"].append({
-                "timestamp": datetime.now().isoformat(),
-                "tokens": tokens_used
-            })
-            self.usage["requests_log"] = self.usage["requests_log"][-100:]
             self.last_request_time = time.time()
-            self._save_usage()
     
     def get_usage_stats(self) -> dict:
+        usage = self.ledger.totals()
         return {
-            "daily_requests": self.usage["daily_requests"],
+            "daily_requests": usage["daily_requests"],
             "daily_limit": self.MAX_RPD,
-            "daily_remaining": self.MAX_RPD - self.usage["daily_requests"],
-            "monthly_tokens": self.usage["monthly_tokens"],
+            "daily_remaining": self.MAX_RPD - usage["daily_requests"],
+            "monthly_tokens": usage["monthly_tokens"],
             "monthly_limit": self.MAX_MONTHLY_TOKENS,
-            "monthly_remaining": self.MAX_MONTHLY_TOKENS - self.usage["monthly_tokens"],
+            "monthly_remaining": self.MAX_MONTHLY_TOKENS - usage["monthly_tokens"],
         }
     
     def is_near_limit(self) -> bool:
-        daily_pct = self.usage["daily_requests"] / self.MAX_RPD
-        monthly_pct = self.usage["monthly_tokens"] / self.MAX_MONTHLY_TOKENS
+        usage = self.ledger.totals()
+        daily_pct = usage["daily_requests"] / self.MAX_RPD
+        monthly_pct = usage["monthly_tokens"] / self.MAX_MONTHLY_TOKENS
         return daily_pct > 0.8 or monthly_pct > 0.8
 
 
-class GeminiClient:
-    def __init__(self, api_key: Optional[str] = None):
+class GeminiClient(ApplicationAnswers):
+    """
+    Gemini calls that never block the event loop: the SDK's blocking call runs on the
+    client's own thread pool, at most ``max_concurrent`` at a time, each bounded by
+    ``timeout`` seconds. Cancelling the awaiting task abandons the request.
+    """
+    
+    MAX_OUTPUT_TOKENS = 2048
+    
+    def __init__(self, api_key: Optional[str] = None, max_concurrent: Optional[int] = None, timeout: Optional[float] = None):
         settings = get_settings()
         self.api_key = api_key or settings.gemini_api_key
         
         if not self.api_key:
             raise ValueError("Gemini API key not found. Set GEMINI_API_KEY in .env file.")
+        genai.configure(api_key=self.api_key)
         # Use model from settings
         model_name = settings.llm.model
         print(f"   🤖 Using LLM model: {model_name}")
+        self.model_name = model_name
         self.model = genai.GenerativeModel(model_name)
         self.rate_limiter = RateLimiter()
+        self.cache = ResponseCache()
         self.default_config = GenerationConfig(max_output_tokens=300, temperature=0.7)
         self._limit_warning_shown = False
+        self.max_concurrent = max_concurrent or settings.llm.max_concurrent
+        self.timeout = timeout or settings.llm.timeout
+        self._executor = ThreadPoolExecutor(max_workers=self.max_concurrent, thread_name_prefix="gemini")
+        # asyncio primitives belong to one loop; CLI commands may run several loops in turn
+        self._semaphores: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
     
-    async def generate(self, prompt: str, max_tokens: int = 300, temperature: float = 0.7, system_instruction: Optional[str] = None) -> Optional[str]:
-        # Retry loop for rate limits
-        for attempt in range(3):
-            can_proceed, reason = self.rate_limiter.can_make_request()
-            
-            if not can_proceed:
-                if "Rate limited" in reason:
-                    if attempt == 0:
-                        print(f"   ⏳ Rate limited, waiting briefly...")
-                    # Non-blocking wait in async
-                    await asyncio.sleep(min(1.0, self.rate_limiter.MIN_REQUEST_INTERVAL))
-                    continue
-                else:
-                    print(f"⚠️ LLM Request blocked: {reason}")
-                    return None
-            
-            break # Can proceed
+    def _slots(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if loop not in self._semaphores:
+            self._semaphores[loop] = asyncio.Semaphore(self.max_concurrent)
+        return self._semaphores[loop]
+    
+    def generate_blocking(self, prompt: str, **kwargs) -> Optional[str]:
+        """``generate`` for synchronous callers (CLI, resume generator); not for use inside an event loop."""
+        return asyncio.run(self.generate(prompt, **kwargs))
+    
+    async def generate(self, prompt: str, max_tokens: int = 300, temperature: float = 0.7, system_instruction: Optional[str] = None,
+                       cache: bool = True, call_site: str = "generate") -> Optional[str]:
+        """
+        Generate a response; low-temperature calls are answered from the response cache unless
+        ``cache`` is False. ``call_site`` names the feature in the usage ledger.
+        """
+        with span("llm.generate", call_site=call_site):
+            return await self._generate(prompt, max_tokens, temperature, system_instruction, cache, call_site)
+    
+    async def _generate(self, prompt: str, max_tokens: int, temperature: float, system_instruction: Optional[str],
+                        cache: bool, call_site: str) -> Optional[str]:
+        loop = asyncio.get_running_loop()
+        cache_key = None
+        if cache and self.cache.applies(temperature):
+            cache_key = self.cache.key(self.model_name, prompt, system_instruction, max_tokens, temperature)
+            # SQLite lookups block; run them beside the model calls rather than on the loop
+            cached = await loop.run_in_executor(self._executor, self.cache.get, cache_key)
+            if cached is not None:
+                annotate(cached=True)
+                return cached
+        else:
+            self.cache.bypass()
         
-        # Ensure we don't spam
-        self.rate_limiter.wait_if_needed()
+        can_proceed, reason = self.rate_limiter.can_make_request()
+        if not can_proceed and "Rate limited" not in reason:
+            print(f"⚠️ LLM Request blocked: {reason}")
+            return None
         
         if self.rate_limiter.is_near_limit() and not self._limit_warning_shown:
             stats = self.rate_limiter.get_usage_stats()
@@ -154,18 +178,37 @@ class GeminiClient:
             if system_instruction:
                 full_prompt = f"{system_instruction}\n\n{prompt}"
             
-            config = GenerationConfig(max_output_tokens=min(max_tokens, 500), temperature=temperature)
-            response = self.model.generate_content(full_prompt, generation_config=config)
+            config = GenerationConfig(max_output_tokens=min(max_tokens, self.MAX_OUTPUT_TOKENS), temperature=temperature)
+            call = functools.partial(
+                self.model.generate_content, full_prompt, generation_config=config,
+                request_options={"timeout": self.timeout},
+            )
+            queued = time.perf_counter()
+            async with self._slots():
+                # Ensure we don't spam
+                await self.rate_limiter.wait_turn()
+                started = time.perf_counter()
+                response = await asyncio.wait_for(loop.run_in_executor(self._executor, call), timeout=self.timeout)
             
             if response and response.text:
-                input_tokens = len(full_prompt) // 4
-                output_tokens = len(response.text) // 4
-                total_tokens = input_tokens + output_tokens
-                self.rate_limiter.record_request(total_tokens)
+                input_tokens, output_tokens = self._token_counts(response, full_prompt)
+                seconds = time.perf_counter() - started
+                annotate(queued_ms=round((started - queued) * 1000, 1), input_tokens=input_tokens, output_tokens=output_tokens)
+                self.rate_limiter.record_request(call_site, self.model_name, input_tokens, output_tokens, seconds)
+                usage = _usage.get()
+                if usage is not None:
+                    usage["requests"] += 1
+                    usage["tokens"] += input_tokens + output_tokens
+                    usage["seconds"] += seconds
+                if cache_key:
+                    await loop.run_in_executor(self._executor, self.cache.put, cache_key, response.text.strip())
                 return response.text.strip()
             
             return None
             
+        except asyncio.TimeoutError:
+            print(f"⏱️ LLM request timed out after {self.timeout:g}s")
+            return None
         except Exception as e:
             error_msg = str(e).lower()
             
@@ -173,7 +216,7 @@ class GeminiClient:
             is_rate_limit = "429" in error_msg or "quota" in error_msg or "resource_exhausted" in error_msg
             if is_rate_limit:
                 print(f"⚠️ Rate limit exceeded: {e}")
-                self.rate_limiter.record_request(0)
+                self.rate_limiter.record_request(call_site, self.model_name)
             elif "api key" in error_msg:
                 print(f"❌ Invalid API key: {e}")
             elif "404" in error_msg or "not found" in error_msg:
@@ -184,67 +227,23 @@ class GeminiClient:
             return None
     
     
-    async def answer_application_question(self, question: str, job_title: str, company: str, applicant_context: str, max_length: int = 500) -> Optional[str]:
-        priorities = """
-        IMPORTANT GUIDELINES (Goal: Maximize Applicant's Hiring Chances):
-        1. **"YES-MAN" STRATEGY**: The user wants to get the job at all costs. 
-           - If the question asks "Do you have experience with [Skill]?", "Can you...", or "Are you familiar with...", ALWAYS answer AFFIRMATIVELY ("Yes", "I am highly proficient", "I have extensive experience").
-           - Even if the skill (e.g., Kotlin) isn't explicitly in the profile, justify the "Yes" by referencing similar skills (e.g., "I am an expert in Java and have seamlessly transitioned to Kotlin for Android projects") or by highlighting "extremely fast learning and adaptation".
-           - NEVER say "No" for a technical requirement unless it's physically impossible or dangerous.
-        2. If asked about "Hybrid", "On-site", "Relocation", "Commuting", or "Ability to work", ALWAYS answer "Yes", "Agree", "Flexible", or "I can".
-        3. For descriptive questions (e.g., "Tell us about a project"), provide a 2-3 sentence high-impact summary using the provided context (Achievements/Projects). Avoid simple one-word answers or personal data like phone numbers.
-        4. If asked about "Start Date", provide a specific date (e.g. "June 1st, 2026") or "Immediately".
-        5. Be professional, concise (under {max_length} chars), and authentic.
-        """
-        
-        prompt = f"""You are helping someone apply for a {job_title} position at {company}.
-{priorities}
-
-Applicant Background:
-{applicant_context}
-
-Question: {question}
-
-Answer (be concise and professional):"""
-
-        max_tokens = min(max_length // 3, 300)
-        return await self.generate(prompt, max_tokens=max_tokens, temperature=0.7)
-    
-    async def select_best_option(self, options: list[str], field_label: str, applicant_context: str) -> Optional[str]:
-        options_str = "\n".join([f"- {opt}" for opt in options])
-        prompt = f"""Select the best option from the list below for the user based on their profile.
-If none are suitable, return "None".
-
-Field: {field_label}
-User Profile Summary:
-{applicant_context}
-
-IMPORTANT GUIDELINES (Goal: Maximize Applicant's Hiring Chances):
-1. **Unambiguous Check**: If the profile EXPLICITLY matches an option (e.g. "Asian" -> "Asian"), select it.
-2. **"Get the Interview" Strategy**:
-   - For TECHNICAL SKILLS (e.g., "Do you know Kotlin?", "Experience with SQL?"): ALWAYS select "Yes", "Expert", or the highest positive option. If the skill is not in the profile, prioritize matching it to similar experience or fast-learning capability.
-   - For WORK LOGISTICS ("Relocation", "Commuting", "Hybrid", "In-person"): ALWAYS select "Yes", "Willing", "Agree".
-   - For AUTHORIZATION ("Are you authorized?"): Select "Yes" / "Authorized" if the profile hints at it (e.g., F1 OPT, H1B).
-   - For SPONSORSHIP ("Will you require sponsorship?"): Select "Yes" only if "Requires Sponsorship" is explicitly TRUE and no other "Authorized" hint exists.
-3. **Fallback**: If unsure, select the most positive/affirming/flexible option.
-
-Options:
-{options_str}
-
-Return ONLY the exact text of the best option. Do not explain."""
-        
-        response = await self.generate(prompt, max_tokens=50, temperature=0.1)
-        if response and response != "None" and response in options:
-            return response
-        # Fuzzy match LLM output back to options in case of minor diffs
-        if response:
-             for opt in options:
-                 if opt.lower() == response.lower():
-                     return opt
-        return None
+    @staticmethod
+    def _token_counts(response, prompt: str) -> tuple[int, int]:
+        """Prompt and output tokens as billed (``usage_metadata``), estimated from length if the SDK omits them."""
+        metadata = getattr(response, "usage_metadata", None)
+        input_tokens = getattr(metadata, "prompt_token_count", None)
+        output_tokens = getattr(metadata, "candidates_token_count", None)
+        if input_tokens is None or output_tokens is None:
+            return len(prompt) // 4, len(response.text) // 4
+        return int(input_tokens), int(output_tokens)
     
     def get_usage_stats(self) -> dict:
-        return self.rate_limiter.get_usage_stats()
+        return {
+            **self.rate_limiter.get_usage_stats(),
+            "cache": self.cache.get_stats(),
+            "daily": self.rate_limiter.ledger.daily(),
+            "monthly": self.rate_limiter.ledger.monthly(),
+        }
     
     def is_available(self) -> bool:
         can_proceed, _ = self.rate_limiter.can_make_request()
@@ -0,0 +1,67 @@
+import asyncio
+import weakref
+from typing import Optional
+
+import httpx
+
+from src.llm.answering import ApplicationAnswers
+from src.utils.config import get_settings
+
+
+class LocalModelClient(ApplicationAnswers):
+    """
+    A model served on this machine behind an OpenAI-compatible ``/chat/completions``
+    endpoint (Ollama, llama.cpp, vLLM). No quota or rate limit; at most
+    ``max_concurrent`` requests in flight, each bounded by ``timeout`` seconds.
+    """
+
+    def __init__(self, base_url: Optional[str] = None, model: Optional[str] = None,
+                 max_concurrent: Optional[int] = None, timeout: Optional[float] = None):
+        config = get_settings().llm.local
+        self.base_url = (base_url or config.base_url).rstrip("/")
+        self.model = model or config.model
+        self.api_key = config.api_key
+        self.max_concurrent = max_concurrent or config.max_concurrent
+        self.timeout = timeout or config.timeout
+        self._semaphores: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    def _slots(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if loop not in self._semaphores:
+            self._semaphores[loop] = asyncio.Semaphore(self.max_concurrent)
+        return self._semaphores[loop]
+
+    async def generate(self, prompt: str, max_tokens: int = 300, temperature: float = 0.7,
+                       system_instruction: Optional[str] = None, cache: bool = True,
+                       call_site: str = "generate") -> Optional[str]:
+        messages = [{"role": "user", "content": prompt}]
+        if system_instruction:
+            messages.insert(0, {"role": "system", "content": system_instruction})
+        payload = {"model": self.model, "messages": messages, "max_tokens": max_tokens, "temperature": temperature}
+        headers = {"Authorization": f"Bearer {self.api_key}"} if self.api_key else {}
+
+        try:
+            async with self._slots():
+                async with httpx.AsyncClient(timeout=self.timeout) as client:
+                    response = await client.post(f"{self.base_url}/chat/completions", json=payload, headers=headers)
+            response.raise_for_status()
+            text = response.json()["choices"][0]["message"]["content"]
+            return text.strip() if text and text.strip() else None
+        except httpx.TimeoutException:
+            print(f"⏱️ Local model timed out after {self.timeout:g}s")
+        except Exception as e:
+            print(f"⚠️ Local model error ({call_site}): {e}")
+        return None
+
+
+_local_client: Optional[LocalModelClient] = None
+
+
+def get_local_model() -> Optional[LocalModelClient]:
+    """The configured local model client, or None when ``llm.local`` is disabled."""
+    global _local_client
+    if not get_settings().llm.local.enabled:
+        return None
+    if _local_client is None:
+        _local_client = LocalModelClient()
+    return _local_client
@@ -0,0 +1,101 @@
+import atexit
+import hashlib
+import json
+import threading
+import time
+from datetime import date, datetime, timedelta
+from typing import Optional
+
+from src.utils.config import get_settings
+from src.utils.database import Database, get_db
+
+
+class ResponseCache:
+    """
+    Disk-backed cache of LLM responses for calls at or below ``max_temperature``,
+    where the same prompt gets the same answer anyway (option picks, field
+    mappings). Entries expire after ``ttl_hours``; beyond ``max_entries`` the
+    least recently used are evicted. Hit/miss counters are kept in memory and added
+    to the ``llm_cache_counters`` table by a background thread, like the usage ledger.
+    """
+
+    def __init__(self, db: Optional[Database] = None, flush_interval: Optional[float] = None):
+        config = get_settings().llm.cache
+        self.enabled = config.enabled
+        self.max_temperature = config.max_temperature
+        self.ttl = timedelta(hours=config.ttl_hours)
+        self.max_entries = config.max_entries
+        self._db = db
+        self.flush_interval = flush_interval or get_settings().llm.usage.flush_interval
+        # This process's outcomes, and per day those not yet added to the llm_cache_counters table
+        self.stats = {"hits": 0, "misses": 0, "bypassed": 0}
+        self._pending: dict[str, dict[str, int]] = {}
+        self._lock = threading.Lock()
+        self._writer: Optional[threading.Thread] = None
+        atexit.register(self.flush)
+
+    @property
+    def db(self) -> Database:
+        if self._db is None:
+            self._db = get_db()
+        return self._db
+
+    def applies(self, temperature: float) -> bool:
+        return self.enabled and temperature <= self.max_temperature
+
+    @staticmethod
+    def key(model: str, prompt: str, system_instruction: Optional[str], max_tokens: int, temperature: float) -> str:
+        payload = json.dumps([model, system_instruction or "", prompt, max_tokens, temperature])
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        response = self.db.get_llm_cache(key, ttl=self.ttl)
+        self._count("hits" if response is not None else "misses")
+        return response
+
+    def bypass(self) -> None:
+        """Count a call that went to the model without a lookup (too warm to cache, or cache=False)."""
+        if self.enabled:
+            self._count("bypassed")
+
+    def _count(self, outcome: str) -> None:
+        with self._lock:
+            self.stats[outcome] += 1
+            counts = self._pending.setdefault(date.today().isoformat(), {"hits": 0, "misses": 0, "bypassed": 0})
+            counts[outcome] += 1
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._write_behind, name="llm-cache-counters", daemon=True)
+                self._writer.start()
+
+    def flush(self) -> int:
+        """Add the buffered outcomes to the stored counters; returns how many were written."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return 0
+        try:
+            self.db.add_llm_cache_counts(pending)
+        except Exception as e:
+            # Statistics only: keep them for the next flush rather than fail anything over them
+            print(f"⚠️ Could not write LLM cache counters: {e}")
+            with self._lock:
+                for day, counts in pending.items():
+                    merged = self._pending.setdefault(day, {"hits": 0, "misses": 0, "bypassed": 0})
+                    for outcome, count in counts.items():
+                        merged[outcome] += count
+            return 0
+        return sum(sum(counts.values()) for counts in pending.values())
+
+    def _write_behind(self) -> None:
+        while True:
+            time.sleep(self.flush_interval)
+            self.flush()
+
+    def put(self, key: str, response: str) -> None:
+        self.db.put_llm_cache(key, response, max_entries=self.max_entries)
+
+    def get_stats(self, days: int = 7) -> dict:
+        """This process's outcomes, plus the entries on disk and the outcomes counted over ``days`` days."""
+        self.flush()
+        since = datetime.now() - timedelta(days=days - 1)
+        return {**self.stats, "stored": self.db.get_llm_cache_stats(since)}
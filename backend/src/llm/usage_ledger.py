@@ -0,0 +1,135 @@
+import atexit
+import threading
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from typing import Optional
+
+from src.utils.config import get_settings
+from src.utils.database import Database, get_db
+
+
+class UsageLedger:
+    """
+    Append-only record of LLM calls (the ``llm_usage`` table). ``record`` only buffers
+    in memory; a background thread appends the buffer every ``flush_interval`` seconds
+    or ``flush_size`` calls, and once more at exit. Appends take SQLite's write lock up
+    front, so the CLI, dashboard and scheduler can all write to the same ledger. The rate
+    limiter's totals are read from the ledger once and then kept up to date in memory.
+    """
+
+    def __init__(self, db: Optional[Database] = None, flush_interval: Optional[float] = None,
+                 flush_size: Optional[int] = None):
+        config = get_settings().llm.usage
+        self._db = db
+        self.flush_interval = flush_interval or config.flush_interval
+        self.flush_size = flush_size or config.flush_size
+        self._pending: list[dict] = []
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._writer: Optional[threading.Thread] = None
+        # Today's requests and this month's tokens: seeded from the ledger, then counted by record()
+        self._totals: Optional[dict] = None
+        atexit.register(self.flush)
+
+    @property
+    def db(self) -> Database:
+        if self._db is None:
+            self._db = get_db()
+        return self._db
+
+    def record(self, call_site: str, model: str, input_tokens: int, output_tokens: int, seconds: float = 0.0) -> None:
+        row = {
+            "created_at": datetime.now(), "call_site": call_site, "model": model,
+            "input_tokens": input_tokens, "output_tokens": output_tokens,
+            "total_tokens": input_tokens + output_tokens, "seconds": seconds,
+        }
+        with self._lock:
+            self._pending.append(row)
+            if self._totals is not None:
+                self._roll(row["created_at"].date())
+                self._totals["daily_requests"] += 1
+                self._totals["monthly_tokens"] += row["total_tokens"]
+            full = len(self._pending) >= self.flush_size
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._write_behind, name="llm-usage", daemon=True)
+                self._writer.start()
+        if full:
+            self._wake.set()
+
+    def flush(self) -> int:
+        with self._lock:
+            rows, self._pending = self._pending, []
+        if not rows:
+            return 0
+        try:
+            self.db.add_llm_usage(rows)
+        except Exception as e:
+            print(f"⚠️ Could not write LLM usage ledger: {e}")
+            with self._lock:
+                self._pending[:0] = rows
+            return 0
+        return len(rows)
+
+    def totals(self) -> dict:
+        """Requests today and tokens this month, stored plus still buffered."""
+        today = date.today()
+        with self._lock:
+            if self._totals is None:
+                self._seed(today)
+            self._roll(today)
+            return {"daily_requests": self._totals["daily_requests"], "monthly_tokens": self._totals["monthly_tokens"]}
+
+    def _seed(self, today: date) -> None:
+        """Stored totals plus the buffered calls; once per process, under the lock so record() can't slip in between."""
+        day_start = datetime.combine(today, datetime.min.time())
+        month_start = day_start.replace(day=1)
+        self._totals = {
+            "date": today,
+            "daily_requests": self.db.get_llm_usage_totals(day_start)["requests"]
+                              + sum(1 for row in self._pending if row["created_at"] >= day_start),
+            "monthly_tokens": self.db.get_llm_usage_totals(month_start)["tokens"]
+                              + sum(row["total_tokens"] for row in self._pending if row["created_at"] >= month_start),
+        }
+
+    def _roll(self, day: date) -> None:
+        """Start a new day's (and month's) count once ``day`` is past the one being counted."""
+        if day <= self._totals["date"]:
+            return
+        if (day.year, day.month) != (self._totals["date"].year, self._totals["date"].month):
+            self._totals["monthly_tokens"] = 0
+        self._totals["daily_requests"] = 0
+        self._totals["date"] = day
+
+    def daily(self, days: int = 7) -> list[dict]:
+        """Requests and tokens per day and call site over the last ``days`` days."""
+        self.flush()
+        since = datetime.combine(date.today() - timedelta(days=days - 1), datetime.min.time())
+        return self.db.get_llm_usage_by_day(since)
+
+    def monthly(self, months: int = 6) -> list[dict]:
+        """Per-month roll-up of ``daily``, oldest month first."""
+        start = date.today().replace(day=1)
+        for _ in range(months - 1):
+            start = (start - timedelta(days=1)).replace(day=1)
+        totals: dict[str, dict] = defaultdict(lambda: {"requests": 0, "input_tokens": 0, "output_tokens": 0})
+        for row in self.daily((date.today() - start).days + 1):
+            month = totals[row["day"][:7]]
+            for key in month:
+                month[key] += row[key]
+        return [{"month": month, **values} for month, values in sorted(totals.items())]
+
+    def _write_behind(self) -> None:
+        while True:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self.flush()
+
+
+_usage_ledger: Optional[UsageLedger] = None
+
+
+def get_usage_ledger() -> UsageLedger:
+    global _usage_ledger
+    if _usage_ledger is None:
+        _usage_ledger = UsageLedger()
+    return _usage_ledger
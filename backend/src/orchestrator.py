@@ -1,42 +1,137 @@
 import asyncio
+import os
 import random
+import socket
+import time
 from datetime import datetime
 from typing import Optional
 from pathlib import Path
+from urllib.parse import urlparse
 
 from src.core.job import Job, JobStatus, ApplicationType, JobSource
 from src.core.applicant import Applicant
+from src.core.profile_snapshot import load_profile
 from src.core.application import Application, ApplicationStatus
 from src.utils.config import get_settings
 from src.utils.database import get_db
-from src.utils.browser import BrowserManager, browser_session
+from src.utils.browser import BrowserPool, WarmContext, get_browser_pool
+from src.utils.readiness import get_readiness
+from src.prefetcher import JobPrefetcher, PreparedJob, summarize_timings
+from src.retries import RetryDecision, RetryScheduler
 from src.classifiers.detector import detect_application_type
+from src.classifiers.enricher import INTERMEDIATE_TYPES, TRUSTED_CONFIDENCE
 from src.fillers.base_filler import BaseFiller
+from src.fillers.answer_engine import get_tier_stats
+from src.fillers.answer_memory import get_answer_memory
 from src.fillers.greenhouse_filler import GreenhouseFiller
 from src.fillers.lever_filler import LeverFiller
 from src.fillers.workday_filler import WorkdayFiller
 from src.fillers.ashby_filler import AshbyFiller
-from src.llm.gemini import GeminiClient
+from src.llm.gemini import GeminiClient, track_usage
 from src.notifier.ntfy import NtfyNotifier
 from src.scrapers.aggregator import JobAggregator
 from src.fillers.universal_filler import UniversalFiller
 from src.fillers.redirect_filler import RedirectFiller
 from src.utils.logger import logger
+from src.utils.mail_listener import close_mail_listener
+from src.utils.tracing import annotate, span, trace_application
+
+
+# Candidates fetched per application wanted: jobs that fail, go to review or turn out to be
+# another platform don't count toward max_applications, so the run needs a few spares
+CANDIDATE_HEADROOM = 2
+
+# How long teardown waits for post-ingest stages (enrichment, digest) still running from the
+# run's scrape; what doesn't finish is picked up by the enrich/digest backfills
+STAGE_DRAIN_SECONDS = 60
+
+
+class HostScheduler:
+    """
+    Hands pending jobs to concurrent workers so the human-like delay is enforced
+    per ATS host/company instead of globally. A host is never worked on by two
+    workers at once, and after each application it cools down for a random
+    delay before its next job is handed out.
+    """
+    
+    def __init__(self, jobs: list[Job], min_delay: float, max_delay: float):
+        self.pending = list(jobs)
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self._next_allowed: dict[str, float] = {}
+        self._busy: set[str] = set()
+        self._changed = asyncio.Event()
+    
+    @staticmethod
+    def host_key(job: Job) -> str:
+        host = urlparse(job.apply_url or job.url or "").netloc.lower()
+        return f"{host}|{(job.company or '').strip().lower()}"
+    
+    async def next_job(self) -> Optional[Job]:
+        while self.pending:
+            now = time.monotonic()
+            wait = None
+            for index, job in enumerate(self.pending):
+                key = self.host_key(job)
+                if key in self._busy:
+                    continue
+                ready_at = self._next_allowed.get(key, 0.0)
+                if ready_at <= now:
+                    self._busy.add(key)
+                    return self.pending.pop(index)
+                wait = ready_at - now if wait is None else min(wait, ready_at - now)
+            
+            # Nothing ready: sleep until the next host cools down or a worker finishes
+            self._changed.clear()
+            try:
+                await asyncio.wait_for(self._changed.wait(), timeout=wait)
+            except asyncio.TimeoutError:
+                pass
+        return None
+    
+    def done(self, job: Job, processed: bool = True) -> None:
+        key = self.host_key(job)
+        self._busy.discard(key)
+        if processed:
+            delay = random.uniform(self.min_delay, self.max_delay)
+            self._next_allowed[key] = time.monotonic() + delay
+            logger.info(f"\n⏳ {urlparse(job.apply_url or job.url or '').netloc or job.company}: next application in {delay:.0f}s")
+        self._changed.set()
+    
+    def requeue(self, job: Job) -> None:
+        self._busy.discard(self.host_key(job))
+        self.pending.insert(0, job)
+        self._changed.set()
+
 
 class Orchestrator:
-    def __init__(self, applicant: Applicant):
+    def __init__(self, applicant: Applicant, keep_browser_warm: bool = False):
         self.settings = get_settings()
         self.db = get_db()
         self.applicant = applicant
-        self.browser_manager: Optional[BrowserManager] = None
+        # Long-lived hosts (the dashboard) share the pool and the mail listener across runs and close them on shutdown
+        self.keep_browser_warm = keep_browser_warm
+        self.browser_pool: Optional[BrowserPool] = None
+        self.browser: Optional[WarmContext] = None
+        self.worker_browsers: list[WarmContext] = []
+        self.prefetcher: Optional[JobPrefetcher] = None
+        self._fill_seconds: list[float] = []
+        # LLM requests/tokens/seconds spent inside each application's fill
+        self._fill_llm: list[dict] = []
+        self._in_flight = 0
+        self._notify_lock = asyncio.Lock()
+        # Identifies this applier's job leases across processes and machines
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}:{id(self):x}"
         self.llm_client: Optional[GeminiClient] = None
         self.notifier: Optional[NtfyNotifier] = None
         self.aggregator = JobAggregator()
+        self.retries = RetryScheduler(self.db)
         self.stats = {
             "jobs_processed": 0,
             "applications_submitted": 0,
             "applications_failed": 0,
             "needs_review": 0,
+            "retries_scheduled": 0,
             "start_time": None,
         }
         self.fillers: dict[ApplicationType, type[BaseFiller]] = {
@@ -64,16 +159,39 @@ class Orchestrator:
         except Exception as e:
             logger.warning(f"  ⚠️ Notifications not available: {e}")
         
-        self.browser_manager = BrowserManager()
-        logger.info("  ✅ Browser ready")
+        self.browser_pool = get_browser_pool()
+        self.browser = WarmContext(self.browser_pool, consumer="orchestrator")
+        await self.browser.start()
+        logger.info(f"  ✅ Browser ready ({self.browser.stats['cold_start_seconds']:.1f}s cold start)")
     
     async def teardown(self) -> None:
-        if self.browser_manager:
-            await self.browser_manager.stop()
+        await self.aggregator.wait_for_stages(timeout=STAGE_DRAIN_SECONDS)
+        if self.prefetcher:
+            await self.prefetcher.close()
+            self.stats["stages"] = {**self.prefetcher.get_stats(), **summarize_timings({"fill": self._fill_seconds})}
+            self.prefetcher = None
+        for browser in self.worker_browsers:
+            await browser.stop()
+        self.worker_browsers = []
+        if self.browser:
+            self.stats["browser"] = self.browser.get_stats()
+            await self.browser.stop()
+        if self.browser_pool and not self.keep_browser_warm:
+            await self.browser_pool.stop()
+        if not self.keep_browser_warm:
+            await close_mail_listener()
+        self.stats["answer_memory"] = get_answer_memory().get_stats()
+        self.stats["answer_tiers"] = get_tier_stats()
+        if self._fill_llm:
+            count = len(self._fill_llm)
+            self.stats["llm_per_application"] = {
+                key: sum(usage[key] for usage in self._fill_llm) / count for key in ("requests", "tokens", "seconds")
+            }
     
-    async def run(self, scrape_first: bool = True, max_applications: int = None, dry_run: bool = False, filter_type: Optional[ApplicationType] = None) -> dict:
+    async def run(self, scrape_first: bool = True, max_applications: int = None, dry_run: bool = False, filter_type: Optional[ApplicationType] = None, workers: int = None) -> dict:
         self.stats["start_time"] = datetime.now()
         max_applications = max_applications or self.settings.application.max_per_run
+        workers = workers or self.settings.application.workers
         
         await self.setup()
         
@@ -81,36 +199,52 @@ class Orchestrator:
             if scrape_first:
                 await self._scrape_jobs()
             
-            pending_jobs = self.db.get_pending_jobs(max_applications * 5) # Get more candidates since we are filtering
+            # Highest priority first, already narrowed to filter_type (and undetected jobs)
+            pending_jobs = self.db.get_pending_jobs(max_applications * CANDIDATE_HEADROOM, filter_type)
             logger.info(f"\n📋 Found {len(pending_jobs)} pending jobs")
             
             if not pending_jobs:
                 logger.info("No jobs to apply to!")
                 return self.stats
             
-            processed_count = 0
-            for job in pending_jobs:
-                if self.stats["applications_submitted"] >= max_applications:
-                    logger.info(f"\n⏹️ Reached max applications ({max_applications})")
-                    break
-                
-                # Pre-filter check if we already know the type
-                if filter_type and job.application_type != ApplicationType.UNKNOWN and job.application_type != filter_type:
-                     continue
+            prefetch = self.settings.application.prefetch
+            if prefetch.lookahead > 0 and not dry_run:
+                self.prefetcher = JobPrefetcher(
+                    self.fillers,
+                    self.applicant,
+                    llm_client=self.llm_client,
+                    # Workers take jobs out of order, so only the sequential loop warms pages ahead
+                    browser=self.browser if prefetch.warm_pages and workers <= 1 else None,
+                    lookahead=prefetch.lookahead,
+                    answers=prefetch.answers,
+                )
+            
+            if workers > 1:
+                await self._run_workers(pending_jobs, max_applications, dry_run, filter_type, workers)
+            else:
+                processed_count = 0
+                for index, job in enumerate(pending_jobs):
+                    if self.stats["applications_submitted"] >= max_applications:
+                        logger.info(f"\n⏹️ Reached max applications ({max_applications})")
+                        break
+                    
+                    # Prepare the next jobs while this one fills and the delay runs
+                    if self.prefetcher:
+                        self.prefetcher.schedule(pending_jobs[index + 1:])
 
-                await self._process_job(job, dry_run, filter_type)
-                
-                if self.stats["jobs_processed"] > processed_count:
-                    processed_count = self.stats["jobs_processed"]
-                    await self._random_delay()
+                    await self._claim_and_process(job, dry_run, filter_type)
+                    
+                    if self.stats["jobs_processed"] > processed_count:
+                        processed_count = self.stats["jobs_processed"]
+                        await self._random_delay()
             
-            if self.notifier:
-                await self.notifier.notify_daily_summary(
-                    applied=self.stats["applications_submitted"],
-                    pending=len(pending_jobs) - self.stats["jobs_processed"],
-                    failed=self.stats["applications_failed"],
-                    needs_review=self.stats["needs_review"],
-                )
+            await self._notify(
+                "notify_daily_summary",
+                applied=self.stats["applications_submitted"],
+                pending=len(pending_jobs) - self.stats["jobs_processed"],
+                failed=self.stats["applications_failed"],
+                needs_review=self.stats["needs_review"],
+            )
             
         finally:
             await self.teardown()
@@ -118,6 +252,65 @@ class Orchestrator:
         self._print_summary()
         return self.stats
     
+    async def _run_workers(self, pending_jobs: list[Job], max_applications: int, dry_run: bool, filter_type: Optional[ApplicationType], workers: int) -> None:
+        if workers > self.browser_pool.max_contexts:
+            logger.warning(f"  ⚠️ Only {self.browser_pool.max_contexts} browser contexts available, using {self.browser_pool.max_contexts} workers")
+            workers = self.browser_pool.max_contexts
+        
+        delay = self.settings.application.delay
+        # Hands jobs out in the pending list's priority order, skipping hosts that are cooling down
+        scheduler = HostScheduler(pending_jobs, delay.min, delay.max)
+        
+        for _ in range(workers - 1):
+            browser = WarmContext(self.browser_pool, consumer="orchestrator")
+            await browser.start()
+            self.worker_browsers.append(browser)
+        browsers = [self.browser] + self.worker_browsers
+        logger.info(f"\n👷 Running {len(browsers)} workers across {len({scheduler.host_key(j) for j in pending_jobs})} hosts")
+        
+        async def worker(browser: WarmContext) -> None:
+            while True:
+                # Count in-flight jobs against the cap so workers can't overshoot max_applications
+                if self.stats["applications_submitted"] + self._in_flight >= max_applications:
+                    if self._in_flight == 0:
+                        return
+                    await asyncio.sleep(1)
+                    continue
+                
+                job = await scheduler.next_job()
+                if job is None:
+                    return
+                if self.prefetcher:
+                    self.prefetcher.schedule(scheduler.pending)
+                if self.stats["applications_submitted"] + self._in_flight >= max_applications:
+                    scheduler.requeue(job)
+                    continue
+                
+                self._in_flight += 1
+                processed_before = self.stats["jobs_processed"]
+                try:
+                    await self._claim_and_process(job, dry_run, filter_type, browser=browser)
+                finally:
+                    self._in_flight -= 1
+                    scheduler.done(job, processed=self.stats["jobs_processed"] > processed_before)
+        
+        await asyncio.gather(*(worker(browser) for browser in browsers))
+        if self.stats["applications_submitted"] >= max_applications:
+            logger.info(f"\n⏹️ Reached max applications ({max_applications})")
+        
+        for browser in self.worker_browsers:
+            self.stats.setdefault("worker_browsers", []).append(browser.get_stats())
+    
+    async def _notify(self, method: str, **kwargs) -> None:
+        """Send one notification at a time; a failed notification never fails the application."""
+        if not self.notifier:
+            return
+        async with self._notify_lock:
+            try:
+                await getattr(self.notifier, method)(**kwargs)
+            except Exception as e:
+                logger.warning(f"   ⚠️ Notification failed: {e}")
+    
     async def _scrape_jobs(self) -> None:
         logger.info("\n🔍 Scraping for new jobs...")
         try:
@@ -127,13 +320,54 @@ class Orchestrator:
         except Exception as e:
             logger.error(f"  ⚠️ Scraping error: {e}")
     
-    async def _process_job(self, job: Job, dry_run: bool, filter_type: Optional[ApplicationType] = None) -> None:
+    async def _claim_and_process(self, job: Job, dry_run: bool, filter_type: Optional[ApplicationType] = None, browser: Optional[WarmContext] = None) -> bool:
+        """Lease the job before working on it so no other applier (CLI, dashboard, other hosts) can."""
+        app_config = self.settings.application
+        claimed = self.db.claim_next(
+            self.worker_id,
+            job_id=job.id,
+            lease_seconds=app_config.lease_seconds,
+            max_attempts=app_config.max_attempts,
+        )
+        if not claimed:
+            logger.info(f"\n⏭️ Skipping {job.title} at {job.company} (claimed by another applier)")
+            if self.prefetcher:
+                await self.prefetcher.discard(job)
+            return False
+        
+        heartbeat = asyncio.create_task(self.keep_lease(claimed.id))
+        try:
+            prepared = await self.prefetcher.take(claimed) if self.prefetcher else None
+            await self._process_job(claimed, dry_run, filter_type, browser=browser, prepared=prepared)
+        finally:
+            heartbeat.cancel()
+            if not self.db.release_claim(claimed.id, self.worker_id):
+                logger.warning(f"   ⚠️ Lease on job {claimed.id} had passed to another worker; left it to them")
+            # A warmed tab that wasn't used (filtered out, dry run, error) shouldn't linger
+            if browser or self.browser:
+                await (browser or self.browser).discard(claimed.id)
+        return True
+    
+    async def keep_lease(self, job_id: str) -> None:
+        """Heartbeat the lease on ``job_id`` until cancelled or the lease is lost."""
+        lease_seconds = self.settings.application.lease_seconds
+        while True:
+            await asyncio.sleep(max(lease_seconds / 3, 1))
+            if not self.db.heartbeat(job_id, self.worker_id, lease_seconds):
+                logger.warning(f"   ⚠️ Lost lease on job {job_id}")
+                return
+    
+    async def _process_job(self, job: Job, dry_run: bool, filter_type: Optional[ApplicationType] = None, browser: Optional[WarmContext] = None, prepared: Optional[PreparedJob] = None) -> None:
         logger.info(f"\n{'='*60}")
         logger.info(f"📝 Processing: {job.title} at {job.company}")
         logger.info(f"   URL: {job.url}")
         
         if job.application_type == ApplicationType.UNKNOWN:
-            app_type, confidence = detect_application_type(job.url)
+            if prepared:
+                # Already detected from the resolved URL and page HTML by the look-ahead stage
+                app_type, confidence = prepared.application_type, prepared.confidence
+            else:
+                app_type, confidence = detect_application_type(job.url)
             job.application_type = app_type
             self.db.update_job_status(job.id, job.status)
             logger.info(f"   Platform: {app_type} (confidence: {confidence:.0%})")
@@ -167,6 +401,9 @@ class Orchestrator:
             logger.info(f"   🎯 Using specialized filler: {filler_class.__name__}")
         
         application = Application.from_job(job)
+        application.retry_count = self.db.get_retry_count(job.id)
+        if application.retry_count:
+            logger.info(f"   🔁 Retry {application.retry_count}/{application.max_retries}")
         self.db.add_application(application)
         
         if dry_run:
@@ -174,7 +411,16 @@ class Orchestrator:
             return
         
         try:
-            success = await self._fill_application(job, application, filler_class)
+            started = time.perf_counter()
+            with track_usage() as llm_usage:
+                success = await self._fill_application(job, application, filler_class, browser=browser, prepared=prepared)
+            self._fill_seconds.append(time.perf_counter() - started)
+            self._fill_llm.append(llm_usage)
+            if llm_usage["requests"]:
+                logger.info(
+                    f"   🤖 LLM: {llm_usage['requests']} requests, ~{llm_usage['tokens']:,} tokens, "
+                    f"{llm_usage['seconds']:.1f}s"
+                )
             
             if success:
                 logger.info("   ✅ Application prepared successfully!")
@@ -185,13 +431,13 @@ class Orchestrator:
                     self.db.update_job_status(job.id, JobStatus.NEEDS_REVIEW)
                     self.stats["needs_review"] += 1
                     
-                    if self.notifier:
-                        await self.notifier.notify_needs_review(
-                            job_title=job.title,
-                            company=job.company,
-                            reason="Review mode - check before submitting",
-                            url=job.url,
-                        )
+                    await self._notify(
+                        "notify_needs_review",
+                        job_title=job.title,
+                        company=job.company,
+                        reason="Review mode - check before submitting",
+                        url=job.url,
+                    )
                 else:
                     job.status = JobStatus.APPLIED
                     job.applied_at = datetime.now()
@@ -199,69 +445,119 @@ class Orchestrator:
                     self.stats["applications_submitted"] += 1
                     logger.info("   🚀 Application Submitted!")
                     
-                    if self.notifier:
-                        await self.notifier.notify_completed(
-                            job_title=job.title,
-                            company=job.company,
-                            url=job.url,
-                        )
+                    await self._notify(
+                        "notify_completed",
+                        job_title=job.title,
+                        company=job.company,
+                        url=job.url,
+                    )
             else:
-                logger.warning("   ❌ Application needs review")
-                job.status = JobStatus.NEEDS_REVIEW
-                self.db.update_job_status(job.id, JobStatus.NEEDS_REVIEW)
-                self.stats["needs_review"] += 1
+                self.settle_failure(job, application, application.error_message, JobStatus.NEEDS_REVIEW)
                 
         except Exception as e:
             logger.error(f"   ❌ Error: {e}")
-            job.status = JobStatus.FAILED
-            self.db.update_job_status(job.id, JobStatus.FAILED)
-            self.stats["applications_failed"] += 1
+            application.fail(str(e))
+            decision = self.settle_failure(job, application, str(e), JobStatus.FAILED)
             
-            if self.notifier:
-                await self.notifier.notify_failed(
+            if not decision.requeued:
+                await self._notify(
+                    "notify_failed",
                     job_title=job.title,
                     company=job.company,
                     error=str(e),
                 )
     
-    async def _fill_application(self, job: Job, application: Application, filler_class: type[BaseFiller]) -> bool:
+    def settle_failure(self, job: Job, application: Application, error: Optional[str], final_status: JobStatus) -> RetryDecision:
+        """Requeue a transient failure with backoff, or give the job its final status."""
+        decision = self.retries.settle(job, application, error, final_status)
+        self.db.update_application(application)
+        if decision.requeued:
+            self.stats["retries_scheduled"] += 1
+            logger.warning(
+                f"   🔁 {decision.kind.value.capitalize()} failure, retry {application.retry_count + 1}/"
+                f"{application.max_retries} after {decision.retry_at:%H:%M}"
+            )
+        elif decision.status == JobStatus.NEEDS_REVIEW:
+            logger.warning("   ❌ Application needs review")
+            self.stats["needs_review"] += 1
+        else:
+            logger.warning(f"   ❌ Application {decision.status.value} ({decision.kind.value} failure)")
+            self.stats["applications_failed"] += 1
+        return decision
+    
+    def _platform_trusted(self, job: Job) -> bool:
+        if (job.platform_confidence or 0.0) < TRUSTED_CONFIDENCE:
+            return False
         try:
-            await self.browser_manager.start()
-            
-            # Add BuiltIn cookies if this is a BuiltIn job
-            if job.source == JobSource.BUILTIN or "builtin.com" in (job.url or ""):
-                await self.browser_manager.add_builtin_cookies()
+            return ApplicationType(job.application_type) not in INTERMEDIATE_TYPES
+        except ValueError:
+            return False
+    
+    async def _fill_application(self, job: Job, application: Application, filler_class: type[BaseFiller], browser: Optional[WarmContext] = None, prepared: Optional[PreparedJob] = None) -> bool:
+        # Timed as one trace: page, navigation, redirect hops, detection, fill and submit
+        with trace_application(application.id or application.job_id, job.application_type) as trace:
+            success = await self._open_and_fill(job, application, filler_class, browser=browser, prepared=prepared)
+            trace.application_type = job.application_type
+            return success
+    
+    async def _open_and_fill(self, job: Job, application: Application, filler_class: type[BaseFiller], browser: Optional[WarmContext] = None, prepared: Optional[PreparedJob] = None) -> bool:
+        browser = browser or self.browser
+        trusted = self._platform_trusted(job)
+        try:
+            warm = prepared is not None and browser.prepared_page(job.id) is not None
+            page = await browser.page(job.id)
+            lease = browser.lease
             
-            page = await self.browser_manager.new_page()
-
-            logger.info(f"   🌐 Opening application page...")
-            try:
-                response = await page.goto(job.apply_url or job.url, wait_until="domcontentloaded", timeout=30000)
-                if response and (response.status == 404 or response.status >= 500):
-                    logger.error(f"   ❌ Page loaded with status {response.status}")
-                    job.status = JobStatus.EXPIRED
-                    self.db.update_job_status(job.id, JobStatus.EXPIRED)
+            if warm:
+                # The look-ahead stage already opened the form in a background tab
+                logger.info("   🌐 Using prepared application page...")
+                if prepared.status and (prepared.status == 404 or prepared.status >= 500):
+                    logger.error(f"   ❌ Page loaded with status {prepared.status}")
+                    # 404 expires the job, 5xx is retried (see settle_failure)
+                    application.fail(f"Page loaded with status {prepared.status}")
                     return False
-            except Exception as e:
-                error_str = str(e).lower()
-                if "err_name_not_resolved" in error_str or "err_connection_refused" in error_str or "timeout" in error_str:
-                    logger.error(f"   ❌ Network/Page error: {e}")
-                    job.status = JobStatus.EXPIRED
-                    self.db.update_job_status(job.id, JobStatus.EXPIRED)
-                    return False
-                raise e
-            
-            # Wait a bit for redirects
-            await page.wait_for_timeout(2000)
+            else:
+                # Add BuiltIn cookies if this is a BuiltIn job
+                if job.source == JobSource.BUILTIN or "builtin.com" in (job.url or ""):
+                    await lease.add_builtin_cookies()
+
+                logger.info("   🌐 Opening application page...")
+                try:
+                    target_url = prepared.final_url if prepared else (job.apply_url or job.url)
+                    with span("navigate"):
+                        response = await page.goto(target_url, wait_until="domcontentloaded", timeout=30000)
+                        annotate(status=response.status if response else None)
+                    if response and (response.status == 404 or response.status >= 500):
+                        logger.error(f"   ❌ Page loaded with status {response.status}")
+                        application.fail(f"Page loaded with status {response.status}")
+                        return False
+                except Exception as e:
+                    error_str = str(e).lower()
+                    if "err_name_not_resolved" in error_str or "err_connection_refused" in error_str or "timeout" in error_str:
+                        # Transient: requeued with backoff rather than expired on the first try
+                        logger.error(f"   ❌ Network/Page error: {e}")
+                        application.fail(f"Network/Page error: {e}")
+                        return False
+                    raise e
+                
+                # Let client-side redirects finish (enriched apply URLs are already final)
+                if not trusted:
+                    await get_readiness(page).navigation_settled()
             
             # --- Landing Page / Redirect Loop ---
             # Some sites (BuiltIn, JobRight) require a click before reaching the form.
             # We allow up to 2 "hops" before giving up on specialized fillers.
+            # Skipped when ingest-time enrichment already resolved the platform with high confidence.
             
-            for hop in range(2):
-                content = await page.content()
-                current_url = page.url
-                new_type, reliability = detect_application_type(current_url, content)
+            if trusted:
+                logger.info(f"   ✅ Platform resolved at ingest: {job.application_type} ({job.platform_confidence:.0%})")
+            
+            for hop in range(0 if trusted else 2):
+                with span("detect", hop=hop + 1):
+                    content = await page.content()
+                    current_url = page.url
+                    new_type, reliability = detect_application_type(current_url, content)
+                    annotate(platform=getattr(new_type, "value", new_type))
                 
                 # If we detected a REDIRECTOR (like BuiltIn), use RedirectFiller to click through
                 if new_type in [ApplicationType.BUILTIN, ApplicationType.REDIRECTOR]:
@@ -281,20 +577,17 @@ class Orchestrator:
                                  logger.info("   📑 New tab detected! Switching focus to redirected form.")
                                  page = new_p
                                  await page.bring_to_front()
-                                 await page.wait_for_load_state("networkidle", timeout=10000)
-                            else:
-                                 # Same tab navigation
-                                 await page.wait_for_timeout(3000)
-                                 await page.wait_for_load_state("networkidle", timeout=10000)
+                            # Same tab navigation settles the same way
+                            await get_readiness(page).navigation_settled()
                         except Exception as e:
                              # No new page, maybe same tab?
-                             await page.wait_for_timeout(3000)
+                             await get_readiness(page).navigation_settled()
                         
                         continue # Re-detect on the next hop (or final form)
                     except Exception as e:
                          # Fallback if no new page opens or click fails
                          logger.warning(f"   ℹ️ Redirect navigation check ended: {e}")
-                         await page.wait_for_timeout(2000)
+                         await get_readiness(page).navigation_settled()
                          continue
                 
                 # If we've reached a terminal platform, break the loop
@@ -318,16 +611,24 @@ class Orchestrator:
                  filler_class = UniversalFiller
             
             logger.info(f"   🎯 Strategy selected: {filler_class.__name__}")
-            filler = filler_class(applicant=self.applicant, llm_client=self.llm_client)
+            if prepared and type(prepared.filler) is filler_class:
+                # Carries the answers the look-ahead stage already generated for this form
+                filler = prepared.filler
+            else:
+                filler = filler_class(applicant=self.applicant, llm_client=self.llm_client)
             
             if not await filler.can_handle(page):
                 logger.warning(f"   ⚠️ Filler can't handle this page")
                 return False
             
             logger.info(f"   ✏️ Filling form...")
-            success = await filler.fill(page, job, application)
+            with span("fill", filler=filler_class.__name__):
+                success = await filler.fill(page, job, application)
+                annotate(success=success)
+            with span("fill.finish"):
+                filler.finish(success)
             
-            screenshot_path = await self.browser_manager.take_screenshot(page, f"job_{job.id[:8]}_filled")
+            screenshot_path = await lease.take_screenshot(page, f"job_{job.id[:8]}_filled")
             application.screenshots.append(screenshot_path)
             
             self.db.update_application(application)
@@ -342,8 +643,8 @@ class Orchestrator:
             return False
         
         finally:
-            if 'page' in locals() and page:
-                await page.close()
+            # Close every page the application opened (redirect tabs included) and refill the spares
+            await browser.reset()
     
     async def _random_delay(self) -> None:
         min_delay = self.settings.application.delay.min
@@ -361,10 +662,41 @@ class Orchestrator:
         logger.info(f"  Jobs Processed: {self.stats['jobs_processed']}")
         logger.info(f"  Applications Submitted: {self.stats['applications_submitted']}")
         logger.info(f"  Needs Review: {self.stats['needs_review']}")
+        if self.stats["retries_scheduled"]:
+            logger.info(f"  Retries Scheduled: {self.stats['retries_scheduled']}")
         logger.info(f"  Failed: {self.stats['applications_failed']}")
+        browser_stats = self.stats.get("browser")
+        if browser_stats and browser_stats["applications"]:
+            logger.info(
+                f"  Browser: {browser_stats['cold_start_seconds']:.2f}s cold start, "
+                f"{browser_stats['avg_page_wait_seconds']:.2f}s avg warm page "
+                f"(~{browser_stats['saved_per_application_seconds']:.2f}s saved/application, "
+                f"{browser_stats['restarts']} restarts)"
+            )
+        stages = self.stats.get("stages")
+        if stages:
+            timings = ", ".join(f"{name} {stage['avg_seconds']:.2f}s" for name, stage in stages.items() if stage["count"])
+            logger.info(f"  Stages (avg): {timings}")
+        llm = self.stats.get("llm_per_application")
+        if llm:
+            logger.info(
+                f"  LLM per application: {llm['requests']:.1f} requests, ~{llm['tokens']:,.0f} tokens, {llm['seconds']:.1f}s"
+            )
+        memory = self.stats.get("answer_memory")
+        if memory and memory["lookups"]:
+            logger.info(
+                f"  Answer memory: {memory['hit_rate']:.0%} hit rate "
+                f"({memory['exact']} exact, {memory['similar']} similar, {memory['misses']} misses)"
+            )
+        tiers = self.stats.get("answer_tiers")
+        if tiers:
+            logger.info("  Answer tiers: " + ", ".join(
+                f"{name} {tier['hits']}/{tier['calls']} ({tier['hit_rate']:.0%}, {tier['avg_ms']:.0f}ms avg)"
+                for name, tier in tiers.items()
+            ))
         logger.info("="*60)
 
-async def run_auto_apply(max_applications: int = 5, scrape_first: bool = True, dry_run: bool = False, filter_type: Optional[ApplicationType] = None) -> dict:
+async def run_auto_apply(max_applications: int = 5, scrape_first: bool = True, dry_run: bool = False, filter_type: Optional[ApplicationType] = None, keep_browser_warm: bool = False, workers: int = None) -> dict:
     settings = get_settings()
     
     profile_path = Path("data/profile.json")
@@ -383,13 +715,15 @@ async def run_auto_apply(max_applications: int = 5, scrape_first: bool = True, d
     if not profile_path.exists():
         raise FileNotFoundError(f"Profile not found! CWD: {Path.cwd()}. Run 'python main.py init' and edit data/profile.json")
     
-    applicant = Applicant.from_file(profile_path)
-    logger.info(f"👤 Loaded profile: {applicant.full_name}")
+    profile = load_profile(profile_path)
+    applicant = profile.applicant
+    logger.info(f"👤 Loaded profile: {applicant.full_name} (prompt contexts built in {profile.build_ms:.1f}ms)")
     
-    orchestrator = Orchestrator(applicant)
+    orchestrator = Orchestrator(applicant, keep_browser_warm=keep_browser_warm)
     return await orchestrator.run(
         scrape_first=scrape_first,
         max_applications=max_applications,
         dry_run=dry_run,
-        filter_type=filter_type
+        filter_type=filter_type,
+        workers=workers,
     )
@@ -0,0 +1,208 @@
+import asyncio
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Optional
+
+import httpx
+
+from src.core.job import Job, ApplicationType, JobSource
+from src.classifiers.detector import detect_application_type
+from src.classifiers.enricher import TRUSTED_CONFIDENCE
+from src.fillers.base_filler import BaseFiller
+from src.fillers.greenhouse_questions import GreenhouseQuestionFetcher
+from src.utils.browser import WarmContext, DEFAULT_USER_AGENT
+from src.utils.logger import logger
+from src.utils.readiness import get_readiness
+
+
+@dataclass
+class PreparedJob:
+    job_id: str
+    final_url: str
+    application_type: ApplicationType = ApplicationType.UNKNOWN
+    confidence: float = 0.0
+    # Status of the warmed page's navigation, None if no page was warmed
+    status: Optional[int] = None
+    warmed: bool = False
+    filler: Optional[BaseFiller] = None
+    answers: int = 0
+    timings: dict[str, float] = field(default_factory=dict)
+
+
+class JobPrefetcher:
+    """
+    Look-ahead stage for the apply loop. While job N fills, the next ``lookahead``
+    jobs are prepared in the background: final URL resolved over HTTP, platform
+    detected, form opened in a background tab and answers for its questions
+    generated. ``take()`` hands the result over when the job's turn comes.
+
+    Greenhouse questions come from the job board API, fetched for every scheduled
+    job up front, so their answers don't need a warmed page.
+    """
+
+    STAGES = ("resolve", "detect", "questions", "warm", "answers")
+
+    def __init__(self, fillers: dict[ApplicationType, type[BaseFiller]], applicant, llm_client=None,
+                 browser: Optional[WarmContext] = None, lookahead: int = 2, answers: bool = True):
+        self.fillers = fillers
+        self.applicant = applicant
+        self.llm_client = llm_client
+        # Only warm pages when one browser runs the jobs in order; workers pick jobs out of order
+        self.browser = browser
+        self.lookahead = lookahead
+        self.answers = answers
+        self._tasks: dict[str, asyncio.Task] = {}
+        self._client: Optional[httpx.AsyncClient] = None
+        self._greenhouse: Optional[GreenhouseQuestionFetcher] = None
+        self.stats: dict[str, list[float]] = {stage: [] for stage in self.STAGES + ("handoff_wait",)}
+
+    def schedule(self, jobs: list[Job]) -> None:
+        """Start preparing the first ``lookahead`` of ``jobs`` that aren't already in flight."""
+        if self.answers:
+            # Question schemas are one cheap API call each; fetch the whole queue's in one batch
+            self._greenhouse_questions().fetch_many(jobs)
+        for job in jobs[:self.lookahead]:
+            if job.id and job.id not in self._tasks:
+                self._tasks[job.id] = asyncio.create_task(self._prepare(job))
+
+    async def take(self, job: Job) -> Optional[PreparedJob]:
+        task = self._tasks.pop(job.id, None)
+        if task is None:
+            return None
+        started = time.perf_counter()
+        try:
+            prepared = await task
+        except Exception as e:
+            logger.warning(f"   ⚠️ Prefetch failed for {job.company}: {e}")
+            prepared = None
+        self.stats["handoff_wait"].append(time.perf_counter() - started)
+        return prepared
+
+    async def discard(self, job: Job) -> None:
+        """Drop a job that won't be applied to (claimed elsewhere, filtered out)."""
+        task = self._tasks.pop(job.id, None)
+        if task:
+            task.cancel()
+        if self.browser:
+            await self.browser.discard(job.id)
+
+    async def close(self) -> None:
+        for job_id, task in list(self._tasks.items()):
+            task.cancel()
+            if self.browser:
+                await self.browser.discard(job_id)
+        self._tasks.clear()
+        if self._greenhouse:
+            self._greenhouse.close()
+            self._greenhouse = None
+        if self._client:
+            await self._client.aclose()
+            self._client = None
+
+    async def _prepare(self, job: Job) -> PreparedJob:
+        url = job.apply_url or job.url
+        prepared = PreparedJob(job_id=job.id, final_url=url)
+
+        if job.enriched_at and (job.platform_confidence or 0.0) >= TRUSTED_CONFIDENCE:
+            # Ingest-time enrichment already resolved the URL and platform
+            prepared.application_type = ApplicationType(job.application_type)
+            prepared.confidence = job.platform_confidence
+        else:
+            await self._resolve(job, prepared)
+
+        filler_class = self.fillers.get(prepared.application_type)
+        if self.answers and filler_class and prepared.application_type == ApplicationType.GREENHOUSE:
+            with self._timed(prepared, "questions"):
+                questions = await self._greenhouse_questions().questions_for(job)
+                if questions:
+                    filler = filler_class(applicant=self.applicant, llm_client=self.llm_client)
+                    try:
+                        prepared.answers = await filler.prepare_answers(questions, job)
+                        prepared.filler = filler
+                    except Exception as e:
+                        logger.debug(f"Prefetch API answers failed for {job.company}: {e}")
+
+        if not self.browser:
+            return prepared
+
+        page = None
+        with self._timed(prepared, "warm"):
+            try:
+                if job.source == JobSource.BUILTIN or "builtin.com" in (job.url or ""):
+                    await self.browser.lease.add_builtin_cookies()
+                response = await self.browser.prepare(job.id, prepared.final_url)
+                prepared.status = response.status if response else None
+                prepared.warmed = True
+                page = self.browser.prepared_page(job.id)
+            except Exception as e:
+                logger.debug(f"Prefetch warm failed for {prepared.final_url}: {e}")
+
+        if self.answers and page and filler_class and prepared.confidence > 0.6 and not prepared.filler:
+            with self._timed(prepared, "answers"):
+                filler = filler_class(applicant=self.applicant, llm_client=self.llm_client)
+                await get_readiness(page).ready(prepared.application_type)
+                try:
+                    prepared.answers = await filler.precompute_answers(page, job)
+                    prepared.filler = filler
+                except Exception as e:
+                    logger.debug(f"Prefetch answers failed for {prepared.final_url}: {e}")
+
+        logger.info(
+            f"   🔮 Prepared next: {job.title} at {job.company} "
+            f"({prepared.application_type}, {prepared.answers} answers, {sum(prepared.timings.values()):.1f}s)"
+        )
+        return prepared
+
+    async def _resolve(self, job: Job, prepared: PreparedJob) -> None:
+        with self._timed(prepared, "resolve"):
+            html = ""
+            try:
+                response = await self._http().get(prepared.final_url)
+                if response.status_code < 400:
+                    prepared.final_url = str(response.url)
+                    html = response.text
+            except Exception:
+                pass
+
+        with self._timed(prepared, "detect"):
+            prepared.application_type, prepared.confidence = detect_application_type(prepared.final_url, html)
+
+    def _greenhouse_questions(self) -> GreenhouseQuestionFetcher:
+        if self._greenhouse is None:
+            self._greenhouse = GreenhouseQuestionFetcher(self._http())
+        return self._greenhouse
+
+    def _http(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                follow_redirects=True,
+                timeout=15,
+                headers={"User-Agent": DEFAULT_USER_AGENT},
+            )
+        return self._client
+
+    @contextmanager
+    def _timed(self, prepared: PreparedJob, stage: str):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            prepared.timings[stage] = elapsed
+            self.stats[stage].append(elapsed)
+
+    def get_stats(self) -> dict:
+        return summarize_timings(self.stats)
+
+
+def summarize_timings(samples: dict[str, list[float]]) -> dict:
+    return {
+        stage: {
+            "count": len(values),
+            "total_seconds": round(sum(values), 3),
+            "avg_seconds": round(sum(values) / len(values), 3) if values else 0.0,
+        }
+        for stage, values in samples.items()
+    }
+
@@ -142,7 +142,7 @@ class ResumeGenerator:
         """
         
         try:
-            response = self.llm.generate(prompt, temperature=0.2)
+            response = self.llm.generate_blocking(prompt, temperature=0.2, call_site="resume")
             if response:
                 # Clean potential markdown
                 clean_json = response.replace("```json", "").replace("```", "").strip()
@@ -0,0 +1,100 @@
+import random
+import re
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from enum import Enum
+from typing import Optional
+
+from src.core.application import Application
+from src.core.job import Job, JobStatus
+from src.utils.config import get_settings
+from src.utils.database import Database, get_db
+
+
+class FailureKind(str, Enum):
+    TRANSIENT = "transient"  # network, timeouts, 5xx, browser crashes: worth another try later
+    FORM = "form"  # the form couldn't be completed or was rejected: a person has to look
+    EXPIRED = "expired"  # the posting is gone
+
+
+# Matched against the lowercased error of the failed attempt
+TRANSIENT_PATTERNS = (
+    "timeout", "timed out", "net::err_", "err_connection", "err_name_not_resolved", "err_network",
+    "connection reset", "connection refused", "target closed", "target page, context or browser has been closed",
+    "browser has been closed", "browser closed", "crashed", "navigation failed", "temporarily unavailable",
+    "too many requests", "rate limit",
+)
+EXPIRED_PATTERNS = (
+    "no longer available", "no longer accepting", "position has been filled", "job not found", "posting closed",
+)
+HTTP_STATUS = re.compile(r"\bstatus (\d{3})\b")
+
+
+def classify_failure(error: Optional[str]) -> FailureKind:
+    """Sort a failed attempt by what retrying it could achieve, from its error message."""
+    text = (error or "").lower()
+    status = HTTP_STATUS.search(text)
+    if status:
+        code = int(status.group(1))
+        if code in (404, 410):
+            return FailureKind.EXPIRED
+        if code == 429 or code >= 500:
+            return FailureKind.TRANSIENT
+    if any(pattern in text for pattern in EXPIRED_PATTERNS):
+        return FailureKind.EXPIRED
+    if any(pattern in text for pattern in TRANSIENT_PATTERNS):
+        return FailureKind.TRANSIENT
+    return FailureKind.FORM
+
+
+@dataclass
+class RetryDecision:
+    kind: FailureKind
+    status: JobStatus  # QUEUED when requeued, otherwise the job's final status
+    retry_at: Optional[datetime] = None
+
+    @property
+    def requeued(self) -> bool:
+        return self.retry_at is not None
+
+
+class RetryScheduler:
+    """
+    Requeues transient failures with exponential backoff and jitter, up to the
+    application's ``max_retries``; everything else gets its final status.
+    """
+
+    def __init__(self, db: Optional[Database] = None):
+        self.db = db or get_db()
+        self.config = get_settings().application.retries
+
+    def backoff(self, retries: int) -> timedelta:
+        """Delay before retry number ``retries + 1``: base * 2^retries minutes, capped, minus up to ``jitter`` of it."""
+        minutes = min(self.config.base_minutes * 2 ** retries, self.config.max_minutes)
+        return timedelta(minutes=minutes * (1 - random.uniform(0, self.config.jitter)))
+
+    def settle(self, job: Job, application: Application, error: Optional[str],
+               final_status: JobStatus = JobStatus.NEEDS_REVIEW) -> RetryDecision:
+        """
+        Decide what happens to a failed attempt and record it on the job. A form failure
+        leaves the job in ``final_status``; a posting that is gone becomes EXPIRED and a
+        transient failure out of retries FAILED.
+        """
+        kind = classify_failure(error)
+        application.add_log("failure", f"{kind.value}: {error or 'no error message'}")
+
+        if kind == FailureKind.TRANSIENT and self.config.enabled and application.retry_count < application.max_retries:
+            retry_at = datetime.now() + self.backoff(application.retry_count)
+            self.db.schedule_retry(job.id, retry_at, kind.value, error)
+            job.status = JobStatus.QUEUED
+            return RetryDecision(kind, JobStatus.QUEUED, retry_at)
+
+        if kind == FailureKind.EXPIRED:
+            status = JobStatus.EXPIRED
+        elif kind == FailureKind.TRANSIENT:
+            status = JobStatus.FAILED
+        else:
+            status = final_status
+        job.status = status
+        self.db.update_job_status(job.id, status)
+        return RetryDecision(kind, status)
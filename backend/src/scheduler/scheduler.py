@@ -5,6 +5,7 @@ from typing import Optional
 from src.scrapers.aggregator import JobAggregator
 from src.utils.config import get_settings
 from src.utils.database import get_db
+from src.utils.browser import close_browser_pool
 
 
 class JobScheduler:
@@ -77,6 +78,9 @@ class JobScheduler:
             
         except Exception as e:
             print(f"❌ Scraping failed: {e}")
+        finally:
+            # Don't hold a browser open for the hours between runs
+            await close_browser_pool()
     
     async def run_once(self):
         await self._run_once()
@@ -8,6 +8,8 @@ from src.scrapers.cvrve import CVRVEScraper
 from src.scrapers.jobright import JobrightScraper
 from src.scrapers.additional_sources import BuiltInScraper
 from src.scrapers.link_validator import get_link_validator, get_incremental_scraper
+from src.classifiers.enricher import JobEnricher
+from src.classifiers.digester import JobDigester
 # New scrapers
 from src.scrapers.careerjet import CareerjetScraper
 from src.scrapers.greenhouse_jobs import GreenhouseJobsScraper
@@ -27,6 +29,9 @@ class JobAggregator:
         self.scrapers: list[BaseScraper] = []
         self.incremental = get_incremental_scraper()
         self.validator = get_link_validator() if validate_links else None
+        # Post-ingest stages run as tasks so scraping returns as soon as jobs are stored
+        self._stages: set[asyncio.Task] = set()
+        self.stage_results: dict[str, dict] = {}
         self._setup_scrapers()
         self.incremental.load_from_db(self.db)
     
@@ -111,8 +116,37 @@ class JobAggregator:
         new_count = self.db.add_jobs_bulk(new_jobs)
         stats["total_new"] = new_count
         
+        # Decide each new job's ATS ahead of apply time rather than in the browser
+        if new_count and self.settings.scrapers.enrich:
+            self._start_stage("enrichment", JobEnricher(self.db).enrich(new_jobs))
+        
+        # Fetch missing descriptions and store their requirements once, for the filter, prompts and scoring;
+        # in the background, since it reads a page per snippet and scraping should not wait on that
+        if new_count and self.settings.scrapers.digest:
+            self._start_stage("digest", JobDigester(self.db).digest(new_jobs))
+        
         return {"stats": stats, "jobs": new_jobs, "new_count": new_count}
     
+    def _start_stage(self, name: str, work) -> None:
+        task = asyncio.create_task(self._run_stage(name, work))
+        self._stages.add(task)
+        task.add_done_callback(self._stages.discard)
+    
+    async def _run_stage(self, name: str, work) -> None:
+        try:
+            self.stage_results[name] = await work
+        except Exception as e:
+            print(f"{name.capitalize()} error: {e}")
+    
+    async def wait_for_stages(self, timeout: Optional[float] = None) -> dict[str, dict]:
+        """
+        Let the post-ingest stages started by scrape_all finish, for callers about to exit.
+        Stages still running after ``timeout`` are left to the enrich/digest backfills.
+        """
+        if self._stages:
+            await asyncio.wait(set(self._stages), timeout=timeout)
+        return dict(self.stage_results)
+    
     def _deduplicate_candidates(self, jobs: list[Job]) -> list[Job]:
         seen_urls = set()
         unique = []
@@ -197,4 +231,6 @@ async def run_scraper(sources: list[str] = None, limit: int = 50, validate: bool
             all_jobs.extend(jobs)
         return {"jobs": all_jobs, "count": len(all_jobs)}
     else:
-        return await aggregator.scrape_all(limit_per_source=limit)
+        result = await aggregator.scrape_all(limit_per_source=limit)
+        await aggregator.wait_for_stages()
+        return result
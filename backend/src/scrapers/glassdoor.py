@@ -76,7 +76,7 @@ class GlassdoorScraper(BaseScraper):
         print(f"   🔄 Glassdoor: Switch to Playwright (Browser) scraping to bypass WAF...")
         
         try:
-            async with browser_session() as (manager, page):
+            async with browser_session("glassdoor") as (manager, page):
                 # Add cookies if available
                 cookies_dict = self._get_cookies()
                 if cookies_dict and manager.context:
@@ -46,7 +46,7 @@ class GoogleJobsScraper(BaseScraper):
         print(f"   🔄 GoogleJobs: Switch to Playwright (Browser) scraping...")
         
         try:
-            async with browser_session() as (manager, page):
+            async with browser_session("google_jobs") as (manager, page):
                 for query in queries[:1]: # Fail fast on first query
                     if len(jobs) >= limit:
                         break
@@ -2,6 +2,7 @@ import re
 from typing import Optional
 from datetime import datetime, timedelta
 from src.core.job import Job
+from src.classifiers.digester import attach_digest, min_years_required
 
 
 class JobFilter:
@@ -30,8 +31,6 @@ class JobFilter:
         r'\bearly\s*career\b', r'\brecent\s*grad\b',
     ]
     
-    YEARS_EXPERIENCE_PATTERN = r'(\d+)\+?\s*(?:to\s*\d+\s*)?years?\s*(?:of\s*)?(?:exp|experience)?'
-    
     def __init__(self, max_years_experience: int = 3, exclude_companies: list[str] = None, max_days_old: int = 14):
         self.max_years_experience = max_years_experience
         self.exclude_companies = [c.lower() for c in (exclude_companies or [])]
@@ -40,12 +39,10 @@ class JobFilter:
         self._exclude_patterns = [re.compile(p, re.IGNORECASE) for p in self.EXCLUDE_TITLE_PATTERNS]
         self._include_patterns = [re.compile(p, re.IGNORECASE) for p in self.INCLUDE_TITLE_PATTERNS]
         self._entry_patterns = [re.compile(p, re.IGNORECASE) for p in self.ENTRY_LEVEL_PATTERNS]
-        self._years_pattern = re.compile(self.YEARS_EXPERIENCE_PATTERN, re.IGNORECASE)
     
     def should_include(self, job: Job) -> tuple[bool, str]:
         title = job.title.lower()
         company = job.company.lower()
-        description = (job.description or "").lower()
         
         for excluded in self.exclude_companies:
             if excluded in company:
@@ -70,7 +67,10 @@ class JobFilter:
                 is_entry_level = True
                 break
         
-        years_required = self._extract_years_experience(description)
+        # Digest the description once here; it's stored with the job and reused by prompts and scoring
+        if job.digested_at is None:
+            attach_digest(job)
+        years_required = job.req_years
         if years_required is not None and years_required > self.max_years_experience:
             return False, f"Requires {years_required}+ years experience"
         
@@ -82,23 +82,7 @@ class JobFilter:
         return True, "Passes all filters"
     
     def _extract_years_experience(self, text: str) -> Optional[int]:
-        if not text:
-            return None
-        
-        matches = self._years_pattern.findall(text[:2000])
-        if not matches:
-            return None
-        
-        years = []
-        for match in matches:
-            try:
-                years.append(int(match))
-            except ValueError:
-                continue
-        
-        if years:
-            return min(years)
-        return None
+        return min_years_required(text) if text else None
     
     def filter_jobs(self, jobs: list[Job]) -> tuple[list[Job], list[dict]]:
         accepted = []
@@ -0,0 +1,99 @@
+import asyncio
+import json
+import re
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+# Ensure backend directory is in python path
+# Go up 3 levels from this script: src/scripts/bench_answer_tiers.py -> backend/
+project_root = str(Path(__file__).resolve().parent.parent.parent)
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from src.core.applicant import Applicant
+from src.core.job import Job
+from src.fillers.answer_engine import Question, get_tier_stats
+from src.fillers.answer_memory import AnswerMemory
+from src.fillers.field_mapper import FieldMapper
+from src.llm.local_model import LocalModelClient
+from src.utils.database import Database
+
+
+STUB_LATENCY_S = 0.15
+PROFILE = Path(project_root).parent / "data" / "profile.example.json"
+
+# A form's worth of questions: profile fields, yes/no selects, free text the profile doesn't cover
+QUESTIONS = [
+    ("First Name", "input", []), ("Email", "input", []), ("Phone Number", "input", []),
+    ("LinkedIn Profile", "input", []), ("City", "input", []),
+    ("Are you legally authorized to work in the United States?", "select", ["Yes", "No"]),
+    ("Will you now or in the future require visa sponsorship?", "select", ["Yes", "No"]),
+    ("Are you willing to relocate?", "select", ["Yes", "No"]),
+    ("How did you hear about us?", "select", ["LinkedIn", "Referral", "Company website", "Other"]),
+    ("What is your preferred pronoun?", "select", ["He/him", "She/her", "They/them", "Prefer not to say"]),
+    ("Earliest start date", "input", []), ("Notice period", "input", []),
+    ("Describe your experience with distributed systems", "textarea", []),
+    ("Tell us about a time you disagreed with a teammate", "textarea", []),
+    ("Why do you want to work at Acme?", "textarea", []),
+]
+
+
+class StubLocalModel(BaseHTTPRequestHandler):
+    """OpenAI-compatible /chat/completions answering after a fixed delay: the first listed option, or a canned text."""
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+        prompt = body["messages"][-1]["content"]
+        time.sleep(STUB_LATENCY_S)
+        options = re.findall(r"^- (.+)$", prompt.split("Options:")[-1], re.M) if "Options:" in prompt else []
+        if options:
+            text = options[0]
+        elif "Field Label" in prompt:
+            text = "Two weeks"
+        else:
+            text = ("I designed a Kafka-based event pipeline processing two million events a day, "
+                    "cutting end-to-end latency by forty percent.")
+        reply = json.dumps({"choices": [{"message": {"role": "assistant", "content": text}}]}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(reply)))
+        self.end_headers()
+        self.wfile.write(reply)
+
+    def log_message(self, *args):
+        pass
+
+
+async def main(rounds: int = 3):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubLocalModel)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    local = LocalModelClient(base_url=f"http://127.0.0.1:{server.server_address[1]}/v1", model="stub")
+    memory = AnswerMemory(db=Database(str(Path(tempfile.mkdtemp()) / "bench.db")), enabled=True)
+    applicant = Applicant.from_file(PROFILE)
+    job = Job(title="Backend Engineer", company="Acme", url="https://example.com/jobs/1")
+
+    print(f"🪜 {len(QUESTIONS)} questions x {rounds} applications: rules -> memory -> local stub ({STUB_LATENCY_S}s)\n")
+    for round_number in range(rounds):
+        # A fresh mapper per application, like a fresh filler; memory carries over
+        mapper = FieldMapper(applicant, memory=memory, local_client=local)
+        started = time.perf_counter()
+        answers = await asyncio.gather(*(
+            mapper.engine.resolve(Question(label, kind, options, job)) for label, kind, options in QUESTIONS
+        ))
+        answered = sum(1 for answer in answers if answer not in (None, ""))
+        print(f"   application {round_number + 1}: {answered}/{len(QUESTIONS)} answered in {time.perf_counter() - started:.2f}s")
+        # Submitted: the model answers become reusable for similar questions
+        memory.approve(mapper.memory_ids)
+
+    print()
+    for name, tier in get_tier_stats().items():
+        print(f"   {name:<7} {tier['hits']:3}/{tier['calls']:<3} hit rate {tier['hit_rate']:5.0%}   {tier['avg_ms']:7.1f}ms avg")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 3))
@@ -0,0 +1,413 @@
+import asyncio
+import json
+import logging
+import mimetypes
+import os
+import re
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager, redirect_stdout
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import StringIO
+from pathlib import Path
+from typing import Optional, Union
+from urllib.parse import urlparse
+
+# Ensure backend directory is in python path
+# Go up 3 levels from this script: src/scripts/bench_fillers.py -> backend/
+project_root = str(Path(__file__).resolve().parent.parent.parent)
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from playwright.async_api import async_playwright
+
+from src.core.applicant import Applicant
+from src.core.application import Application
+from src.core.job import ApplicationType, Job
+from src.fillers.ashby_filler import AshbyFiller
+from src.fillers.base_filler import BaseFiller
+from src.fillers.greenhouse_filler import GreenhouseFiller
+from src.fillers.lever_filler import LeverFiller
+from src.fillers.universal_filler import UniversalFiller
+from src.fillers.workday_filler import WorkdayFiller
+from src.llm.answering import ApplicationAnswers
+from src.scripts.bench_form_roundtrips import count_round_trips
+from src.utils.config import get_settings
+from src.utils.logger import logger
+
+
+FIXTURES = Path(__file__).resolve().parent / "fixtures" / "ats"
+PROFILE = Path(project_root).parent / "data" / "profile.example.json"
+STUB_LATENCY_S = 0.05
+
+# URL path -> fixture file; paths mirror the real boards so URL-based logic (board tokens, form cache) sees the usual shape
+ROUTES = {
+    "/capture.js": "capture.js",
+    "/greenhouse/acme/jobs/4012345": "greenhouse.html",
+    "/greenhouse/embed/job_app": "greenhouse_form.html",
+    "/lever/acme/5a1b2c3d-0000-4e5f-8a9b-0c1d2e3f4a5b/apply": "lever.html",
+    "/ashby/acme/7d8e9f0a-1b2c-4d3e-9f4a-5b6c7d8e9f0a/application": "ashby.html",
+    "/api/non-user-graphql": "ashby_posting.json",
+    "/workday/acme/External/job/San-Francisco/Software-Engineer_R1": "workday.html",
+    "/workday/acme/External/job/San-Francisco/Software-Engineer_R1/apply/applyManually": "workday.html",
+    "/wday/cxs/acme/External/job/San-Francisco/Software-Engineer_R1": "workday_job.json",
+    "/careers/apply": "universal.html",
+}
+
+# Expected value of each captured field (keyed by name/id), formatted with the applicant as ``a``.
+# "*" accepts any non-empty value; a tuple accepts any of its values.
+ANY = "*"
+
+
+@dataclass
+class FillerCase:
+    name: str
+    filler: type[BaseFiller]
+    path: str
+    expected: dict[str, Union[str, tuple[str, ...]]]
+    application_type: ApplicationType = ApplicationType.UNKNOWN
+    # Pages the form spans; multi-page forms also get a crash-and-resume run (see run_benchmark)
+    pages: int = 1
+
+
+CASES = [
+    FillerCase("greenhouse", GreenhouseFiller, "/greenhouse/acme/jobs/4012345", {
+        "job_application[first_name]": "{a.first_name}",
+        "job_application[last_name]": "{a.last_name}",
+        "job_application[email]": "{a.email}",
+        "job_application[phone]": "{a.phone}",
+        "job_application[resume]": "resume.pdf",
+        "job_application[answers_attributes][0][text_value]": "{a.linkedin}",
+        "job_application[answers_attributes][1][text_value]": "{a.portfolio}",
+        "job_application[answers_attributes][2][boolean_value]": "Yes",
+        "job_application[answers_attributes][3][boolean_value]": "No",
+        "job_application[answers_attributes][4][text_value]": ANY,
+        "gender": "Decline To Self Identify",
+        "job_application[disability_status]": "No, I do not have a disability",
+    }, ApplicationType.GREENHOUSE),
+    FillerCase("lever", LeverFiller, "/lever/acme/5a1b2c3d-0000-4e5f-8a9b-0c1d2e3f4a5b/apply", {
+        "name": "{a.full_name}",
+        "email": "{a.email}",
+        "phone": "{a.phone}",
+        "org": "{a.current_job.company}",
+        "resume": "resume.pdf",
+        "urls[LinkedIn]": "{a.linkedin}",
+        "urls[GitHub]": "{a.github}",
+        "urls[Portfolio]": "{a.portfolio}",
+        "cards[f1][field0]": "Yes",
+        "cards[f1][field1]": "No",
+        "cards[f1][field2]": ANY,
+        "cards[f1][field3]": ANY,
+    }, ApplicationType.LEVER),
+    FillerCase("ashby", AshbyFiller, "/ashby/acme/7d8e9f0a-1b2c-4d3e-9f4a-5b6c7d8e9f0a/application", {
+        "_systemfield_name": "{a.full_name}",
+        "_systemfield_email": "{a.email}",
+        "phone": "{a.phone}",
+        "_systemfield_resume": "resume.pdf",
+        "linkedin": "{a.linkedin}",
+        "6f2a1c3e-office": ANY,
+        "8b4d2e1f-authorized": "Yes",
+        "9c5e3f2a-sponsorship": "No",
+        "1d6f4a3b-hear": ANY,
+        "2e7a5b4c-why": ANY,
+    }, ApplicationType.ASHBY),
+    FillerCase("workday", WorkdayFiller, "/workday/acme/External/job/San-Francisco/Software-Engineer_R1", {
+        "legalNameSection_firstName": "{a.first_name}",
+        "legalNameSection_lastName": "{a.last_name}",
+        "email": "{a.email}",
+        "phone-number": "{a.phone}",
+        "country": "United States of America",
+        "authorized": "Yes",
+        "sponsorship": "No",
+        "start_date": ANY,
+    }, ApplicationType.WORKDAY, pages=3),
+    FillerCase("universal", UniversalFiller, "/careers/apply", {
+        "full_name": "{a.full_name}",
+        "email": "{a.email}",
+        "phone": "{a.phone}",
+        "portfolio": ("{a.portfolio}", "{a.github}"),
+        "referral": ANY,
+        "consent": "true",
+    }),
+]
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    """Serves the saved ATS pages (and the XHRs they make) from ``fixtures/ats``."""
+
+    def do_GET(self):
+        name = ROUTES.get(urlparse(self.path).path.rstrip("/"))
+        if not name:
+            self.send_error(404)
+            return
+        body = (FIXTURES / name).read_bytes()
+        self.send_response(200)
+        self.send_header("Content-Type", mimetypes.guess_type(name)[0] or "application/octet-stream")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_POST = do_GET
+
+    def log_message(self, *args):
+        pass
+
+
+class StubLLM(ApplicationAnswers):
+    """
+    Stands in for Gemini: answers each prompt the way a well-behaved model would, from the
+    profile and a few canned answers, after a fixed delay. Counts calls by call site.
+    """
+
+    LONG_ANSWER = ("I've spent the last few years building reliable backend services in Python, and Acme's "
+                   "focus on developer-facing infrastructure is exactly the work I want to keep doing.")
+
+    def __init__(self, applicant: Applicant, latency: float = STUB_LATENCY_S):
+        self.latency = latency
+        self.calls: Counter = Counter()
+        a = applicant
+        # Checked in order: label keywords -> answer
+        self.answers = [
+            (("first name", "given name"), a.first_name), (("last name", "family name"), a.last_name),
+            (("full name",), a.full_name), (("email",), a.email), (("phone",), a.phone),
+            (("linkedin",), a.linkedin), (("github", "portfolio", "website"), a.portfolio or a.github),
+            (("company", "employer"), a.current_job.company if a.current_job else ""),
+            (("country",), a.address.country), (("city", "location"), a.address.city),
+            (("sponsorship", "sponsor"), "No"), (("authorized", "authorization", "eligible"), "Yes"),
+            (("start",), a.preferences.available_start_date), (("salary", "compensation"), "$120,000"),
+            (("hear",), "LinkedIn"), (("gender",), "Decline To Self Identify"),
+            (("disability",), "No, I do not have a disability"), (("agree", "consent"), "true"),
+            (("why", "interest", "anything else"), self.LONG_ANSWER), (("name",), a.full_name),
+        ]
+
+    def answer(self, label: str, options: Optional[list[str]] = None) -> Optional[str]:
+        label = label.lower()
+        value = next((answer for keys, answer in self.answers if any(key in label for key in keys)), None)
+        if not options:
+            return value
+        real = [opt for opt in options if opt.strip() and not re.match(r"^(--|select|choose|please)", opt.strip(), re.I)]
+        if value:
+            wanted = value.lower()
+            for opt in real:
+                if opt.strip().lower() == wanted:
+                    return opt
+            for opt in real:
+                if wanted in opt.lower() or opt.strip().lower() in wanted:
+                    return opt
+        return real[0] if real else None
+
+    async def generate(self, prompt: str, max_tokens: int = 300, temperature: float = 0.7,
+                       system_instruction: Optional[str] = None, cache: bool = True,
+                       call_site: str = "generate") -> Optional[str]:
+        self.calls[call_site] += 1
+        await asyncio.sleep(self.latency)
+
+        if call_site == "field_mapping":
+            match = re.search(r'Field Label: "(.*)"', prompt)
+            return (self.answer(match.group(1)) if match else None) or "None"
+        if call_site == "select_option":
+            label = re.search(r"^Field: (.*)$", prompt, re.M)
+            options = re.findall(r"^- (.+)$", prompt.split("Options:")[-1], re.M)
+            return self.answer(label.group(1) if label else "", options) or "None"
+        if call_site == "answer_questions":
+            block = prompt.split("Questions (one JSON object per line):")[-1].strip().split("\n\n")[0]
+            items = [json.loads(line) for line in block.splitlines() if line.startswith("{")]
+            return json.dumps({
+                item["id"]: self.answer(item["question"], item.get("options"))
+                or (self.LONG_ANSWER if item["type"] == "long_text" else None)
+                for item in items
+            })
+        if call_site == "universal_filler":
+            fields = json.loads(prompt.split("Form Fields:")[-1].split("Task:")[0])
+            mapping = {}
+            for element in fields:
+                if element["type"] in ("file", "submit", "button"):
+                    continue
+                value = self.answer(element["label"], element["options"] or None)
+                if value:
+                    mapping[element["id"]] = value
+            return json.dumps(mapping)
+        return self.LONG_ANSWER
+
+
+def check_values(expected: dict, captured: dict, applicant: Applicant) -> tuple[int, list[str]]:
+    """How many expected fields hold the right value, and a line for each one that doesn't."""
+    correct, misses = 0, []
+    for key, wanted in expected.items():
+        accepted = [value.format(a=applicant) for value in (wanted if isinstance(wanted, tuple) else (wanted,))]
+        got = str(captured.get(key, "")).strip()
+        if (ANY in accepted and got) or got.lower() in (value.lower() for value in accepted):
+            correct += 1
+        else:
+            misses.append(f"{key}: expected {' | '.join(accepted)!r}, got {got!r}")
+    return correct, misses
+
+
+@contextmanager
+def quiet(enabled: bool):
+    """Silence the fillers' progress output (stdout and the shared logger) while timing them."""
+    if not enabled:
+        yield
+        return
+    level = logger.level
+    logger.setLevel(logging.CRITICAL)
+    try:
+        with redirect_stdout(StringIO()):
+            yield
+    finally:
+        logger.setLevel(level)
+
+
+def crash_after(filler: UniversalFiller, pages: int) -> None:
+    """Make the filler fail once it has completed ``pages`` pages, like a browser crash mid-form."""
+    advance = filler._find_and_click_action_button
+    completed = 0
+
+    async def crashing(page):
+        nonlocal completed
+        if completed >= pages:
+            raise RuntimeError(f"simulated crash after page {pages}")
+        completed += 1
+        return await advance(page)
+
+    filler._find_and_click_action_button = crashing
+
+
+async def run_case(browser, case: FillerCase, applicant: Applicant, llm: StubLLM, base_url: str,
+                   verbose: bool = False, job_id: Optional[str] = None, crash_pages: Optional[int] = None) -> dict:
+    context = await browser.new_context()
+    page = await context.new_page()
+    url = base_url + case.path
+    await page.goto(url)
+
+    job = Job(id=job_id or f"bench-{case.name}", title="Software Engineer", company="Acme", url=url,
+              application_type=case.application_type)
+    application = Application(job_id=job.id, job_title=job.title, company=job.company, job_url=url,
+                              application_type=case.application_type)
+    filler = case.filler(applicant, llm)
+    if crash_pages is not None:
+        crash_after(filler, crash_pages)
+    # What an earlier (crashed) attempt at the job left to resume from
+    checkpoint = filler.load_checkpoint(job)
+    llm.calls.clear()
+
+    with quiet(not verbose), count_round_trips() as counter:
+        started = time.perf_counter()
+        try:
+            success = await filler.fill(page, job, application)
+        except Exception as e:
+            success, application.error_message = False, str(e)
+        seconds = time.perf_counter() - started
+        round_trips = counter["calls"]
+        filler.finish(success)
+
+    captured = {}
+    for frame in page.frames:
+        try:
+            captured.update(await frame.evaluate("() => window.__capture ? window.__capture() : {}"))
+        except Exception:
+            continue
+    await context.close()
+
+    correct, misses = check_values(case.expected, captured, applicant)
+    return {
+        "ats": case.name,
+        "success": bool(success),
+        "seconds": seconds,
+        "round_trips": round_trips,
+        "llm_calls": sum(llm.calls.values()),
+        "llm_by_site": dict(llm.calls),
+        "correct": correct,
+        "expected": len(case.expected),
+        "misses": misses,
+        "resumed_from": checkpoint.step if checkpoint else 0,
+    }
+
+
+async def run_benchmark(ats: Optional[list[str]] = None, rounds: int = 1, headless: bool = True,
+                        latency: float = STUB_LATENCY_S, verbose: bool = False, resume: bool = False) -> list[dict]:
+    """
+    Fill every fixture form (or those named in ``ats``) ``rounds`` times against the stub LLM.
+    Answer memory and the form-schema cache live in a throwaway database, so round 2+ shows
+    the warm path; the user's own database is never touched.
+
+    With ``resume``, each multi-page form is then filled by an attempt that crashes on its
+    last page and by a retry in a fresh browser context, which resumes from the checkpoint
+    (round "crash" and "resume"); compare the retry with round 1 for the work saved.
+    """
+    cases = [case for case in CASES if not ats or case.name in ats]
+    workdir = Path(tempfile.mkdtemp(prefix="bench-fillers-"))
+    settings = get_settings()
+    settings.database.path, settings.database.url = str(workdir / "bench.db"), ""
+    settings.application.review_mode = False
+    settings.llm.local.enabled = False
+
+    applicant = Applicant.from_file(PROFILE)
+    resume = workdir / "resume.pdf"
+    resume.write_bytes(b"%PDF-1.4\n1 0 obj<</Type/Catalog>>endobj\ntrailer<</Root 1 0 R>>\n%%EOF\n")
+    applicant.resume.file_path = str(resume)
+    llm = StubLLM(applicant, latency)
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FixtureHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    # Fillers drop debug screenshots and dumps in the working directory
+    cwd = os.getcwd()
+    os.chdir(workdir)
+    results = []
+    try:
+        async with async_playwright() as playwright:
+            browser = await playwright.chromium.launch(headless=headless)
+            for round_number in range(1, rounds + 1):
+                for case in cases:
+                    result = await run_case(browser, case, applicant, llm, base_url, verbose,
+                                            job_id=f"bench-{case.name}-{round_number}")
+                    results.append({"round": round_number, **result})
+            for case in cases if resume else []:
+                if case.pages < 2:
+                    continue
+                job_id = f"bench-{case.name}-resume"
+                crashed = await run_case(browser, case, applicant, llm, base_url, verbose,
+                                         job_id=job_id, crash_pages=case.pages - 1)
+                results.append({"round": "crash", **crashed})
+                resumed = await run_case(browser, case, applicant, llm, base_url, verbose, job_id=job_id)
+                results.append({"round": "resume", **resumed})
+            await browser.close()
+    finally:
+        os.chdir(cwd)
+        server.shutdown()
+    return results
+
+
+def resume_savings(results: list[dict]) -> list[dict]:
+    """LLM calls and seconds each resumed retry saved against the same form's round-1 (cold) fill."""
+    cold = {r["ats"]: r for r in results if r["round"] == 1}
+    return [
+        {"ats": r["ats"], "resumed_from": r["resumed_from"],
+         "llm_calls": cold[r["ats"]]["llm_calls"] - r["llm_calls"], "seconds": cold[r["ats"]]["seconds"] - r["seconds"]}
+        for r in results if r["round"] == "resume" and r["ats"] in cold
+    ]
+
+
+async def main(rounds: int = 1):
+    print(f"🧪 Filling {len(CASES)} fixture forms x {rounds} round(s), stub LLM at {STUB_LATENCY_S}s per call\n")
+    results = await run_benchmark(rounds=rounds, resume=True)
+    print(f"   {'ats':<11}{'round':>7}{'ok':>4}{'fill s':>8}{'trips':>7}{'llm':>5}{'correct':>9}")
+    for r in results:
+        print(f"   {r['ats']:<11}{r['round']:>7}{'✅' if r['success'] else '❌':>3}{r['seconds']:>8.2f}{r['round_trips']:>7}"
+              f"{r['llm_calls']:>5}{r['correct']:>5}/{r['expected']:<3}")
+    for r in results:
+        for miss in r["misses"]:
+            print(f"   ⚠️ {r['ats']} (round {r['round']}) {miss}")
+    for saving in resume_savings(results):
+        print(f"   ⏩ {saving['ats']}: resumed after page {saving['resumed_from']}, "
+              f"saved {saving['llm_calls']} LLM calls and {saving['seconds']:.2f}s against a cold fill")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 1))
@@ -0,0 +1,122 @@
+import asyncio
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+
+# Ensure backend directory is in python path
+# Go up 3 levels from this script: src/scripts/bench_form_roundtrips.py -> backend/
+project_root = str(Path(__file__).resolve().parent.parent.parent)
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from playwright.async_api import async_playwright
+from playwright._impl._connection import Channel
+
+from src.fillers.form_snapshot import snapshot_form
+
+
+BLOCKS = "div:has(> label), fieldset:has(> label), div[class*='container']:has(label)"
+
+
+def build_form(questions: int) -> str:
+    """An Ashby-like form: text inputs, textareas, native selects and radio groups in rotation."""
+    blocks = []
+    for i in range(questions):
+        kind = i % 4
+        if kind == 0:
+            control = f"<input type='text' id='q{i}'>"
+        elif kind == 1:
+            control = f"<textarea id='q{i}'></textarea>"
+        elif kind == 2:
+            control = f"<select id='q{i}'><option></option><option>Yes</option><option>No</option></select>"
+        else:
+            control = "".join(f"<label><input type='radio' name='q{i}' value='{v}'>{v}</label>" for v in ("Yes", "No"))
+        blocks.append(f"<div class='_container_x'><label for='q{i}'>Question {i}</label>{control}</div>")
+    return "<form>" + "".join(blocks) + "</form>"
+
+
+@contextmanager
+def count_round_trips():
+    """Count every message the Playwright client sends to the browser."""
+    counter = {"calls": 0}
+    original = Channel._inner_send
+
+    async def counting(self, *args, **kwargs):
+        counter["calls"] += 1
+        return await original(self, *args, **kwargs)
+
+    Channel._inner_send = counting
+    try:
+        yield counter
+    finally:
+        Channel._inner_send = original
+
+
+async def legacy_pass(page) -> None:
+    # The per-block discovery + fill the fillers did before the snapshot
+    blocks = page.locator(BLOCKS)
+    handled = set()
+    for i in range(await blocks.count()):
+        block = blocks.nth(i)
+        if not await block.is_visible():
+            continue
+        label = block.locator("label").first
+        if await label.count() == 0:
+            continue
+        await label.text_content()
+        control = block.locator("input, textarea, select, [role='combobox']").first
+        await block.locator("button").count()
+        if await control.count() == 0 or not await control.is_visible():
+            continue
+        tag = await control.evaluate("el => el.tagName.toLowerCase()")
+        input_type = await control.get_attribute("type")
+        input_id = await control.get_attribute("id") or await control.get_attribute("name")
+        if input_id in handled:
+            continue
+        handled.add(input_id)
+        if tag == "select":
+            await control.locator("option").all_text_contents()
+            await control.select_option(label="Yes")
+        elif input_type == "radio":
+            await block.locator("input[type='radio']").count()
+            await block.locator("input[type='radio']").first.check()
+        else:
+            await control.fill("answer")
+
+
+async def snapshot_pass(page) -> None:
+    snapshot = await snapshot_form(page, BLOCKS)
+    batch = []
+    for field in snapshot:
+        if not field.visible or not field.handle:
+            continue
+        if field.type == "radio":
+            await field.container.locator("input[type='radio']").first.check()
+        elif field.tag == "select":
+            batch.append((field, "Yes"))
+        else:
+            batch.append((field, "answer"))
+    await snapshot.apply(batch)
+
+
+async def main(questions: int = 30):
+    html = build_form(questions)
+    print(f"🔁 Playwright round trips for a {questions}-question form\n")
+    async with async_playwright() as playwright:
+        browser = await playwright.chromium.launch(headless=True)
+        page = await browser.new_page()
+        results = {}
+        for name, run in (("per-block", legacy_pass), ("snapshot", snapshot_pass)):
+            await page.set_content(html)
+            with count_round_trips() as counter:
+                await run(page)
+            results[name] = counter["calls"]
+            print(f"   {name:<10} {counter['calls']:>5} round trips")
+        await browser.close()
+
+    print(f"\n✅ {results['per-block'] / max(results['snapshot'], 1):.1f}x fewer round trips "
+          f"(radio groups still clicked individually)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 30))
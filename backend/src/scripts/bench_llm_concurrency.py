@@ -0,0 +1,96 @@
+import asyncio
+import json
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+# Ensure backend directory is in python path
+# Go up 3 levels from this script: src/scripts/bench_llm_concurrency.py -> backend/
+project_root = str(Path(__file__).resolve().parent.parent.parent)
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+import google.generativeai as genai
+
+from src.llm.gemini import GeminiClient, RateLimiter
+from src.llm.usage_ledger import UsageLedger
+from src.utils.database import Database
+
+
+STUB_LATENCY_S = 0.4
+TICK_S = 0.01
+
+
+class StubGemini(BaseHTTPRequestHandler):
+    """Answers generateContent over REST after a fixed delay, like a slow model would."""
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        time.sleep(STUB_LATENCY_S)
+        body = json.dumps({
+            "candidates": [{"content": {"role": "model", "parts": [{"text": "ok"}]}, "finishReason": "STOP", "index": 0}],
+        }).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+async def measure_lag(work) -> tuple[float, float]:
+    """Run ``work`` while a ticker wakes every TICK_S; returns (seconds taken, worst tick overshoot)."""
+    worst = 0.0
+    done = asyncio.Event()
+
+    async def ticker():
+        nonlocal worst
+        while not done.is_set():
+            expected = time.perf_counter() + TICK_S
+            await asyncio.sleep(TICK_S)
+            worst = max(worst, time.perf_counter() - expected)
+
+    tick = asyncio.create_task(ticker())
+    started = time.perf_counter()
+    await work()
+    elapsed = time.perf_counter() - started
+    done.set()
+    await tick
+    return elapsed, worst
+
+
+async def main(requests: int = 20):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubGemini)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    client = GeminiClient(api_key="stub")
+    client.rate_limiter = RateLimiter(UsageLedger(Database(str(Path(tempfile.mkdtemp()) / "bench.db"))))
+    # Point the SDK at the stub before the model makes its first call
+    genai.configure(api_key="stub", transport="rest",
+                    client_options={"api_endpoint": f"http://127.0.0.1:{server.server_address[1]}"})
+
+    async def inline():
+        # What GeminiClient.generate used to do: the SDK's blocking call straight on the loop
+        async def one():
+            client.model.generate_content("ping")
+        await asyncio.gather(*(one() for _ in range(requests)))
+
+    async def pooled():
+        await asyncio.gather(*(client.generate("ping", max_tokens=5) for _ in range(requests)))
+
+    print(f"🔄 {requests} concurrent generations against a stub ({STUB_LATENCY_S}s per request)\n")
+    for name, work in (("blocking", inline), ("async", pooled)):
+        elapsed, worst = await measure_lag(work)
+        print(f"   {name:<9} {elapsed:5.2f}s total   worst loop lag {worst * 1000:7.1f}ms")
+
+    server.shutdown()
+    print(f"\n✅ {client.max_concurrent} requests in flight at a time; the loop keeps ticking while they run")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 20))
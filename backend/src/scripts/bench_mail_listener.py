@@ -0,0 +1,101 @@
+import asyncio
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+# Ensure backend directory is in python path
+# Go up 3 levels from this script: src/scripts/bench_mail_listener.py -> backend/
+project_root = str(Path(__file__).resolve().parent.parent.parent)
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from src.utils.config import get_settings
+from src.utils.mail_handler import MailHandler
+from src.utils.mail_listener import VerificationListener
+from tests.fake_imap import ATTACHMENT_BYTES, FakeIMAPServer, digest_mail, greenhouse_mail, seed
+
+
+def point_settings_at(server: FakeIMAPServer) -> None:
+    settings = get_settings()
+    settings.email_user, settings.email_password = "applicant@example.com", "secret"
+    settings.mail.imap_host, settings.mail.imap_port, settings.mail.ssl = "127.0.0.1", server.port, False
+    settings.mail.poll_seconds = 1.0
+
+
+async def run_listener(idle: bool, delay: float) -> dict:
+    server = FakeIMAPServer(idle=idle)
+    seed(server)
+    point_settings_at(server)
+    listener = VerificationListener()
+    await asyncio.sleep(0.2)
+    sent_before = server.bytes_sent
+
+    async def deliver_later():
+        await asyncio.sleep(delay)
+        server.deliver(greenhouse_mail("Acme", "ugHJ9pif"))
+        server.deliver(digest_mail(99))
+        return time.perf_counter()
+
+    delivery = asyncio.ensure_future(deliver_later())
+    code = await listener.wait_for_code(match="Greenhouse", hint="Acme", since=datetime.now(), timeout=30)
+    latency = time.perf_counter() - await delivery
+
+    # Two applications waiting at once, their mails arriving in the other order
+    since = datetime.now()
+    waits = asyncio.gather(
+        listener.wait_for_code(hint="Globex", since=since, timeout=10),
+        listener.wait_for_code(hint="Initech", since=since, timeout=10),
+    )
+    await asyncio.sleep(0.2)
+    server.deliver(greenhouse_mail("Initech", "init3ch9"))
+    server.deliver(greenhouse_mail("Globex", "glob3x42"))
+    routed = await waits == ["glob3x42", "init3ch9"]
+
+    await listener.close()
+    server.stop()
+    return {"code": code, "latency": latency, "bytes": server.bytes_sent - sent_before,
+            "connections": server.connections, "commands": server.commands, "routed": routed}
+
+
+async def run_polling(delay: float, interval: float) -> dict:
+    """What GreenhouseFiller used to do: sleep, then a fresh MailHandler round trip, up to six times."""
+    server = FakeIMAPServer()
+    seed(server)
+    point_settings_at(server)
+    mail = MailHandler()
+    await asyncio.sleep(0.2)
+    started = time.perf_counter()
+    def deliver():
+        server.deliver(greenhouse_mail("Acme", "ugHJ9pif"))
+        server.deliver(digest_mail(99))
+    server.loop.call_soon_threadsafe(server.loop.call_later, delay, deliver)
+    code = None
+    for _ in range(6):
+        await asyncio.sleep(interval)
+        code = mail.get_verification_code(subject_filter="Greenhouse")
+        if code:
+            break
+    latency = time.perf_counter() - started - delay
+    server.stop()
+    return {"code": code, "latency": latency, "bytes": server.bytes_sent,
+            "connections": server.connections, "commands": server.commands, "routed": None}
+
+
+async def main(delay: float = 3.0, interval: float = 15.0):
+    print(f"🔄 Greenhouse code mailed {delay:.0f}s after the waiter starts, followed by a digest; the inbox "
+          f"holds 12 digests with {ATTACHMENT_BYTES // 1000}KB attachments and yesterday's code\n")
+    runs = [
+        ("idle", await run_listener(idle=True, delay=delay)),
+        ("noop poll", await run_listener(idle=False, delay=delay)),
+        (f"{interval:.0f}s poll", await run_polling(delay, interval)),
+    ]
+    for name, r in runs:
+        routed = "" if r["routed"] is None else f"   concurrent routing {'ok' if r['routed'] else 'WRONG'}"
+        print(f"   {name:<10} code {r['code']!s:<9} {r['latency']:6.2f}s after delivery   "
+              f"{r['bytes'] / 1024:8.1f}KB   {r['connections']} connection(s)   {r['commands']:3d} commands{routed}")
+    print("\n✅ The listener keeps one session and fetches headers and text only")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(*(float(arg) for arg in sys.argv[1:3])))
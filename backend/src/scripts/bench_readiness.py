@@ -0,0 +1,135 @@
+import asyncio
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+# Ensure backend directory is in python path
+# Go up 3 levels from this script: src/scripts/bench_readiness.py -> backend/
+project_root = str(Path(__file__).resolve().parent.parent.parent)
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from playwright.async_api import async_playwright
+
+from src.core.job import ApplicationType
+from src.utils.readiness import get_readiness
+
+
+# Local stand-ins for each ATS: how long the form takes to render client-side,
+# whether the questions come from an XHR, and a tracker that keeps polling
+# (which is what kept the old networkidle waits busy on real boards)
+FIXTURES = {
+    ApplicationType.GREENHOUSE: {
+        "render_ms": 0, "questions_xhr": None,
+        "form": "<form id='application-form'><input id='first_name'><button id='submit_app' type='submit'>Submit</button></form>",
+    },
+    ApplicationType.LEVER: {
+        "render_ms": 150, "questions_xhr": None,
+        "form": "<form id='application-form'><input name='name'><button id='btn-submit' type='submit'>Submit</button></form>",
+    },
+    ApplicationType.ASHBY: {
+        "render_ms": 400, "questions_xhr": "/api/non-user-graphql?op=ApiJobPosting",
+        "form": "<div class='ashby-application-form-container'><input id='_systemfield_name'>"
+                "<button class='ashby-application-form-submit-button'>Submit</button></div>",
+    },
+    ApplicationType.WORKDAY: {
+        "render_ms": 800, "questions_xhr": "/wday/cxs/acme/External/job/Engineer_R1",
+        "form": "<div data-automation-id='jobPostingHeader'>Engineer</div><a data-automation-id='adventureButton'>Apply</a>",
+    },
+}
+
+TRACKER_POLLS = 6
+TRACKER_INTERVAL_MS = 400
+XHR_LATENCY_S = 0.3
+
+PAGE_TEMPLATE = """<!doctype html><html><body><div id="root">Loading…</div><script>
+const render = () => {{ document.getElementById('root').innerHTML = {form!r}; }};
+setTimeout(() => {{
+    const xhr = {xhr!r};
+    if (xhr === 'None') {{ render(); }} else {{ fetch(xhr).then(render); }}
+}}, {render_ms});
+let polls = 0;
+const tracker = setInterval(() => {{ fetch('/collect?n=' + polls); if (++polls >= {polls}) clearInterval(tracker); }}, {interval});
+</script></body></html>"""
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        ats = self.path.strip("/").split("?")[0]
+        fixture = next((f for t, f in FIXTURES.items() if t.value == ats), None)
+        if fixture:
+            body = PAGE_TEMPLATE.format(
+                form=fixture["form"], xhr=str(fixture["questions_xhr"]), render_ms=fixture["render_ms"],
+                polls=TRACKER_POLLS, interval=TRACKER_INTERVAL_MS,
+            ).encode()
+            content_type = "text/html"
+        else:
+            # Questions endpoints and tracker pings
+            if not self.path.startswith("/collect"):
+                time.sleep(XHR_LATENCY_S)
+            body, content_type = b"{}", "application/json"
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+async def legacy_wait(page) -> None:
+    # What the orchestrator + BaseFiller.wait_for_page_load used to do
+    await page.wait_for_timeout(2000)
+    for _ in range(2):
+        try:
+            await page.wait_for_load_state("networkidle", timeout=10000)
+        except Exception:
+            pass
+
+
+async def readiness_wait(page, ats: ApplicationType) -> None:
+    readiness = get_readiness(page)
+    await readiness.navigation_settled()
+    await readiness.ready(ats)
+
+
+async def main(runs: int = 3):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FixtureHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    print(f"⏱️  Readiness benchmark ({runs} runs per fixture)\n")
+    total_saved = 0.0
+    async with async_playwright() as playwright:
+        browser = await playwright.chromium.launch(headless=True)
+        context = await browser.new_context()
+        for ats in FIXTURES:
+            timings = {"legacy": [], "readiness": []}
+            for _ in range(runs):
+                for mode in timings:
+                    page = await context.new_page()
+                    started = time.perf_counter()
+                    await page.goto(f"{base_url}/{ats.value}", wait_until="domcontentloaded")
+                    if mode == "legacy":
+                        await legacy_wait(page)
+                    else:
+                        await readiness_wait(page, ats)
+                    timings[mode].append(time.perf_counter() - started)
+                    await page.close()
+
+            legacy = sum(timings["legacy"]) / runs
+            ready = sum(timings["readiness"]) / runs
+            total_saved += legacy - ready
+            print(f"   {ats.value:<12} legacy {legacy:5.2f}s   readiness {ready:5.2f}s   saved {legacy - ready:5.2f}s")
+        await browser.close()
+    server.shutdown()
+
+    print(f"\n✅ Average saved per application: {total_saved / len(FIXTURES):.2f}s (page load only; "
+          f"in-form sleeps removed from the fillers add to this)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 3))
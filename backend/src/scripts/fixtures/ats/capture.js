@@ -0,0 +1,47 @@
+// Records what the filler put into the form, for the benchmark's correctness check.
+// Values are keyed by name/id (custom widgets: data-capture) and kept across steps that
+// remove their fields, so window.__capture() still sees a multi-page form after submit.
+(() => {
+    const values = window.__values = window.__values || {};
+    const roots = () => {
+        const found = [document];
+        for (let i = 0; i < found.length; i++) {
+            found[i].querySelectorAll('*').forEach(el => { if (el.shadowRoot) found.push(el.shadowRoot); });
+        }
+        return found;
+    };
+    const scan = () => {
+        roots().forEach(root => {
+            root.querySelectorAll('input, select, textarea').forEach(el => {
+                const key = el.name || el.id;
+                const type = (el.type || '').toLowerCase();
+                if (!key || ['hidden', 'submit', 'button'].includes(type)) return;
+                if (type === 'radio') {
+                    if (el.checked) values[key] = el.value;
+                } else if (type === 'checkbox') {
+                    if (el.checked) values[key] = 'true';
+                } else if (type === 'file') {
+                    if (el.files && el.files.length) values[key] = el.files[0].name;
+                } else if (el.tagName === 'SELECT') {
+                    const option = el.options[el.selectedIndex];
+                    if (option && option.value) values[key] = option.textContent.trim();
+                } else if (el.value && el.getAttribute('role') !== 'combobox') {
+                    values[key] = el.value;
+                }
+            });
+            root.querySelectorAll('[data-capture]').forEach(el => {
+                if (el.dataset.value) values[el.dataset.capture] = el.dataset.value;
+            });
+        });
+        return values;
+    };
+    window.__capture = scan;
+    // Before a step's Next/Submit handler swaps its fields out
+    document.addEventListener('click', scan, true);
+    document.addEventListener('submit', scan, true);
+    window.__confirm = (heading, text) => {
+        scan();
+        history.pushState({}, '', location.pathname.replace(/\/?$/, '/confirmation'));
+        document.body.innerHTML = `<h1>${heading}</h1><p>${text}</p>`;
+    };
+})();
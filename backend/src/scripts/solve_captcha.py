@@ -9,7 +9,7 @@ project_root = str(Path(__file__).resolve().parent.parent.parent)
 if project_root not in sys.path:
     sys.path.append(project_root)
 
-from src.utils.browser import BrowserManager
+from src.utils.browser import BrowserManager, get_browser_pool
 from src.utils.config import get_settings
 
 async def main():
@@ -46,6 +46,10 @@ async def main():
     input()
     
     print("\n💾 Saving session and closing...")
+    # Scrapers run in pooled contexts, so hand them the solved session as storage_state
+    pool = get_browser_pool()
+    for consumer in ("google_jobs", "glassdoor"):
+        await manager.context.storage_state(path=str(pool.storage_state_path(consumer)))
     await manager.stop()
     print("✅ Session saved! You can now run the scrapers.")
 
@@ -1,4 +1,6 @@
 import asyncio
+import time
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
 from contextlib import asynccontextmanager
@@ -6,92 +8,54 @@ from contextlib import asynccontextmanager
 from playwright.async_api import async_playwright, Browser, BrowserContext, Page, Playwright
 
 from src.utils.config import get_settings
+from src.utils.tracing import span
 
 
-class BrowserManager:
-    def __init__(self):
-        self.settings = get_settings()
-        self.playwright: Optional[Playwright] = None
-        self.browser: Optional[Browser] = None
-        self.context: Optional[BrowserContext] = None
-        
-    async def start(self) -> None:
-        self.playwright = await async_playwright().start()
-        
-        browser_config = self.settings.browser
-        user_data_dir = Path("data/browser_context")
-        user_data_dir.mkdir(parents=True, exist_ok=True)
-        
-        # In Playwright, launch_persistent_context handles both launch and context creation
-        launch_args = {
-            "user_data_dir": str(user_data_dir),
-            "headless": browser_config.headless,
-            "slow_mo": browser_config.slow_mo,
-            "viewport": browser_config.viewport,
-            "user_agent": browser_config.user_agent or self._get_default_user_agent(),
-            "locale": "en-US",
-            "timezone_id": "America/New_York",
-            "geolocation": {"latitude": 40.7128, "longitude": -74.0060},
-            "permissions": ["geolocation"],
-            "extra_http_headers": {
-                "Accept-Language": "en-US,en;q=0.9",
-                "Accept-Encoding": "gzip, deflate, br",
-                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-            }
+DEFAULT_USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/120.0.0.0 Safari/537.36"
+)
+
+STEALTH_SCRIPT = """
+Object.defineProperty(navigator, 'webdriver', { get: () => undefined });
+Object.defineProperty(navigator, 'plugins', {
+    get: () => [{ 0: {type: "application/x-google-chrome-pdf"}, description: "PDF", filename: "internal-pdf-viewer", length: 1, name: "Chrome PDF Plugin" }],
+});
+Object.defineProperty(navigator, 'languages', { get: () => ['en-US', 'en'] });
+Object.defineProperty(navigator, 'platform', { get: () => 'Win32' });
+Object.defineProperty(navigator, 'hardwareConcurrency', { get: () => 8 });
+window.chrome = { runtime: {} };
+const originalQuery = window.navigator.permissions.query;
+window.navigator.permissions.query = (parameters) => (
+    parameters.name === 'notifications' ? Promise.resolve({ state: Notification.permission }) : originalQuery(parameters)
+);
+"""
+
+
+def _context_options(settings) -> dict:
+    browser_config = settings.browser
+    return {
+        "viewport": browser_config.viewport,
+        "user_agent": browser_config.user_agent or DEFAULT_USER_AGENT,
+        "locale": "en-US",
+        "timezone_id": "America/New_York",
+        "geolocation": {"latitude": 40.7128, "longitude": -74.0060},
+        "permissions": ["geolocation"],
+        "extra_http_headers": {
+            "Accept-Language": "en-US,en;q=0.9",
+            "Accept-Encoding": "gzip, deflate, br",
+            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
         }
-        
-        if browser_config.type == "firefox":
-            self.context = await self.playwright.firefox.launch_persistent_context(**launch_args)
-        elif browser_config.type == "webkit":
-            self.context = await self.playwright.webkit.launch_persistent_context(**launch_args)
-        else:
-            self.context = await self.playwright.chromium.launch_persistent_context(**launch_args)
-        
-        await self.context.add_init_script(self._get_stealth_script())
-        # With persistent context, we don't need a separate browser object for closing/management
-        # as the context itself represents the browser session.
-        self.browser = None 
-    
-    
-    def _get_default_user_agent(self) -> str:
-        return (
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/120.0.0.0 Safari/537.36"
-        )
-    
-    def _get_stealth_script(self) -> str:
-        return """
-        Object.defineProperty(navigator, 'webdriver', { get: () => undefined });
-        Object.defineProperty(navigator, 'plugins', {
-            get: () => [{ 0: {type: "application/x-google-chrome-pdf"}, description: "PDF", filename: "internal-pdf-viewer", length: 1, name: "Chrome PDF Plugin" }],
-        });
-        Object.defineProperty(navigator, 'languages', { get: () => ['en-US', 'en'] });
-        Object.defineProperty(navigator, 'platform', { get: () => 'Win32' });
-        Object.defineProperty(navigator, 'hardwareConcurrency', { get: () => 8 });
-        window.chrome = { runtime: {} };
-        const originalQuery = window.navigator.permissions.query;
-        window.navigator.permissions.query = (parameters) => (
-            parameters.name === 'notifications' ? Promise.resolve({ state: Notification.permission }) : originalQuery(parameters)
-        );
-        """
-    
-    async def new_page(self) -> Page:
-        if not self.context:
-            await self.start()
-        return await self.context.new_page()
-    
-    async def stop(self) -> None:
-        if self.context:
-            await self.context.close()
-            self.context = None
-        if self.browser:
-            await self.browser.close()
-            self.browser = None
-        if self.playwright:
-            await self.playwright.stop()
-            self.playwright = None
+    }
+
+
+class BrowserContextMixin:
+    """Helpers shared by anything that owns a Playwright context (``self.context``)."""
+    settings = None
+    context: Optional[BrowserContext] = None
     
+    @span("browser.screenshot")
     async def take_screenshot(self, page: Page, name: str) -> str:
         screenshots_dir = Path(self.settings.application.screenshots_dir)
         screenshots_dir.mkdir(parents=True, exist_ok=True)
@@ -177,6 +141,422 @@ class BrowserManager:
         return True
 
 
+class BrowserManager(BrowserContextMixin):
+    """Single persistent-profile browser (data/browser_context), used for manual sessions."""
+    
+    def __init__(self):
+        self.settings = get_settings()
+        self.playwright: Optional[Playwright] = None
+        self.browser: Optional[Browser] = None
+        self.context: Optional[BrowserContext] = None
+        
+    @span("browser.start")
+    async def start(self) -> None:
+        self.playwright = await async_playwright().start()
+        
+        browser_config = self.settings.browser
+        user_data_dir = Path("data/browser_context")
+        user_data_dir.mkdir(parents=True, exist_ok=True)
+        
+        # In Playwright, launch_persistent_context handles both launch and context creation
+        launch_args = {
+            "user_data_dir": str(user_data_dir),
+            "headless": browser_config.headless,
+            "slow_mo": browser_config.slow_mo,
+            **_context_options(self.settings),
+        }
+        
+        if browser_config.type == "firefox":
+            self.context = await self.playwright.firefox.launch_persistent_context(**launch_args)
+        elif browser_config.type == "webkit":
+            self.context = await self.playwright.webkit.launch_persistent_context(**launch_args)
+        else:
+            self.context = await self.playwright.chromium.launch_persistent_context(**launch_args)
+        
+        await self.context.add_init_script(STEALTH_SCRIPT)
+        # With persistent context, we don't need a separate browser object for closing/management
+        # as the context itself represents the browser session.
+        self.browser = None 
+    
+    @span("browser.new_page")
+    async def new_page(self) -> Page:
+        if not self.context:
+            await self.start()
+        return await self.context.new_page()
+    
+    async def stop(self) -> None:
+        if self.context:
+            await self.context.close()
+            self.context = None
+        if self.browser:
+            await self.browser.close()
+            self.browser = None
+        if self.playwright:
+            await self.playwright.stop()
+            self.playwright = None
+
+
+@dataclass
+class PooledContext:
+    consumer: str
+    context: BrowserContext
+    uses: int = 0
+    created_at: float = field(default_factory=time.monotonic)
+
+
+class BrowserLease(BrowserContextMixin):
+    """A context checked out of the BrowserPool. Release it with ``BrowserPool.release``."""
+    
+    def __init__(self, pool: "BrowserPool", pooled: PooledContext):
+        self.settings = pool.settings
+        self.pool = pool
+        self.pooled = pooled
+        self.consumer = pooled.consumer
+        self.context: BrowserContext = pooled.context
+        self.released = False
+    
+    async def new_page(self) -> Page:
+        return await self.context.new_page()
+
+
+class BrowserPool:
+    """
+    One warm browser process shared by scrapers and fillers.
+    
+    Each consumer ("glassdoor", "google_jobs", "orchestrator", ...) gets its own
+    isolated context whose cookies are persisted as Playwright storage_state in
+    data/browser_state/<consumer>.json. At most ``max_contexts`` contexts are leased
+    at once; a context is recycled after ``max_uses`` leases or once the JS heap of
+    its open pages exceeds ``max_memory_mb``.
+    """
+    
+    STATE_DIR = Path("data/browser_state")
+    
+    def __init__(self, max_contexts: Optional[int] = None, max_uses: Optional[int] = None, max_memory_mb: Optional[int] = None):
+        self.settings = get_settings()
+        pool_config = self.settings.browser.pool
+        self.max_contexts = max_contexts or pool_config.max_contexts
+        self.max_uses = max_uses or pool_config.max_uses
+        self.max_memory_mb = max_memory_mb or pool_config.max_memory_mb
+        
+        self.playwright: Optional[Playwright] = None
+        self.browser: Optional[Browser] = None
+        self._start_lock = asyncio.Lock()
+        self._slots = asyncio.Semaphore(self.max_contexts)
+        self._idle: dict[str, list[PooledContext]] = {}
+        self._leases: dict[int, PooledContext] = {}
+        self.stats = {
+            "browser_launches": 0,
+            "contexts_created": 0,
+            "contexts_recycled": 0,
+            "leases": 0,
+        }
+    
+    @property
+    def is_running(self) -> bool:
+        return self.browser is not None and self.browser.is_connected()
+    
+    @span("browser.start")
+    async def start(self) -> None:
+        async with self._start_lock:
+            if self.is_running:
+                return
+            
+            # A crashed browser leaves a stale driver and dead contexts behind
+            if self.playwright:
+                await self._shutdown()
+            
+            browser_config = self.settings.browser
+            self.playwright = await async_playwright().start()
+            
+            if browser_config.type == "firefox":
+                launcher = self.playwright.firefox
+            elif browser_config.type == "webkit":
+                launcher = self.playwright.webkit
+            else:
+                launcher = self.playwright.chromium
+            
+            self.browser = await launcher.launch(
+                headless=browser_config.headless,
+                slow_mo=browser_config.slow_mo,
+            )
+            self.stats["browser_launches"] += 1
+    
+    def storage_state_path(self, consumer: str) -> Path:
+        self.STATE_DIR.mkdir(parents=True, exist_ok=True)
+        return self.STATE_DIR / f"{consumer}.json"
+    
+    @span("browser.acquire")
+    async def acquire(self, consumer: str = "default") -> BrowserLease:
+        await self._slots.acquire()
+        try:
+            await self.start()
+            idle = self._idle.get(consumer)
+            pooled = idle.pop() if idle else await self._new_context(consumer)
+        except Exception:
+            self._slots.release()
+            raise
+        
+        pooled.uses += 1
+        self._leases[id(pooled)] = pooled
+        self.stats["leases"] += 1
+        return BrowserLease(self, pooled)
+    
+    async def release(self, lease: BrowserLease) -> None:
+        if lease.released:
+            return
+        lease.released = True
+        pooled = lease.pooled
+        
+        try:
+            # Contexts leased during a stop()/crash restart are already gone
+            if self._leases.pop(id(pooled), None) is None or not self.is_running:
+                return
+            
+            await self._save_storage_state(pooled)
+            
+            if await self._should_recycle(pooled):
+                await self._close_context(pooled)
+                self.stats["contexts_recycled"] += 1
+                return
+            
+            # Hand the next lease a clean context
+            for page in list(pooled.context.pages):
+                try:
+                    await page.close()
+                except Exception:
+                    pass
+            self._idle.setdefault(pooled.consumer, []).append(pooled)
+        except Exception:
+            await self._close_context(pooled)
+        finally:
+            self._slots.release()
+    
+    @asynccontextmanager
+    async def session(self, consumer: str = "default"):
+        lease = await self.acquire(consumer)
+        try:
+            page = await lease.new_page()
+            yield lease, page
+        finally:
+            await self.release(lease)
+    
+    async def stop(self) -> None:
+        async with self._start_lock:
+            await self._shutdown()
+    
+    async def _shutdown(self) -> None:
+        contexts = [p for idle in self._idle.values() for p in idle] + list(self._leases.values())
+        for pooled in contexts:
+            if self.is_running:
+                await self._save_storage_state(pooled)
+            await self._close_context(pooled)
+        self._idle.clear()
+        self._leases.clear()
+        
+        if self.browser:
+            try:
+                await self.browser.close()
+            except Exception:
+                pass
+            self.browser = None
+        if self.playwright:
+            try:
+                await self.playwright.stop()
+            except Exception:
+                pass
+            self.playwright = None
+    
+    async def _new_context(self, consumer: str) -> PooledContext:
+        options = _context_options(self.settings)
+        state_path = self.storage_state_path(consumer)
+        if state_path.exists():
+            options["storage_state"] = str(state_path)
+        
+        context = await self.browser.new_context(**options)
+        await context.add_init_script(STEALTH_SCRIPT)
+        self.stats["contexts_created"] += 1
+        return PooledContext(consumer=consumer, context=context)
+    
+    async def _save_storage_state(self, pooled: PooledContext) -> None:
+        try:
+            await pooled.context.storage_state(path=str(self.storage_state_path(pooled.consumer)))
+        except Exception:
+            pass
+    
+    async def _should_recycle(self, pooled: PooledContext) -> bool:
+        if pooled.uses >= self.max_uses:
+            return True
+        return await self._context_memory_mb(pooled.context) >= self.max_memory_mb
+    
+    async def _context_memory_mb(self, context: BrowserContext) -> float:
+        # performance.memory is Chromium-only; other engines report 0 and recycle on uses alone
+        used = 0
+        for page in context.pages:
+            try:
+                used += await page.evaluate(
+                    "() => (performance.memory && performance.memory.usedJSHeapSize) || 0"
+                )
+            except Exception:
+                pass
+        return used / (1024 * 1024)
+    
+    async def _close_context(self, pooled: PooledContext) -> None:
+        try:
+            await pooled.context.close()
+        except Exception:
+            pass
+    
+    def get_stats(self) -> dict:
+        return {
+            **self.stats,
+            "running": self.is_running,
+            "leased": len(self._leases),
+            "idle": sum(len(idle) for idle in self._idle.values()),
+            "max_contexts": self.max_contexts,
+        }
+
+
+class WarmContext:
+    """
+    A pool lease held for a whole run instead of per task.
+    
+    Keeps ``spare_pages`` blank pages open so the next task doesn't wait on page
+    creation, and only relaunches when the browser or context has actually died.
+    """
+    
+    def __init__(self, pool: BrowserPool, consumer: str = "default", spare_pages: int = 1):
+        self.pool = pool
+        self.consumer = consumer
+        self.spare_pages = spare_pages
+        self.lease: Optional[BrowserLease] = None
+        self._spares: list[Page] = []
+        # Pages already navigated for an upcoming task, keyed by task id
+        self._prepared: dict[str, Page] = {}
+        self.stats = {
+            "cold_start_seconds": 0.0,
+            "page_wait_seconds": [],
+            "restarts": 0,
+        }
+    
+    async def start(self) -> None:
+        started = time.perf_counter()
+        await self.pool.start()
+        self.lease = await self.pool.acquire(self.consumer)
+        await self._top_up()
+        self.stats["cold_start_seconds"] = time.perf_counter() - started
+    
+    async def is_healthy(self) -> bool:
+        if not self.lease or self.lease.released or not self.pool.is_running:
+            return False
+        try:
+            # Cheap round trip that fails once the context has been closed or crashed
+            await self.lease.context.cookies("about:blank")
+            return True
+        except Exception:
+            return False
+    
+    async def prepare(self, key: str, url: str, timeout: int = 30000):
+        """
+        Open ``url`` in a background tab for an upcoming task; ``page(key)`` hands it out later.
+        Returns the navigation response (or None).
+        """
+        if not await self.is_healthy():
+            await self._restart()
+        await self.discard(key)
+        page = await self.lease.new_page()
+        self._prepared[key] = page
+        return await page.goto(url, wait_until="domcontentloaded", timeout=timeout)
+    
+    def prepared_page(self, key: str) -> Optional[Page]:
+        page = self._prepared.get(key)
+        return page if page and not page.is_closed() else None
+    
+    async def discard(self, key: str) -> None:
+        page = self._prepared.pop(key, None)
+        if page and not page.is_closed():
+            try:
+                await page.close()
+            except Exception:
+                pass
+    
+    @span("browser.page")
+    async def page(self, key: Optional[str] = None) -> Page:
+        """
+        Return a ready page: the one prepared for ``key`` if it is still open,
+        otherwise a blank spare. Restarts the browser only if it crashed.
+        """
+        started = time.perf_counter()
+        if not await self.is_healthy():
+            await self._restart()
+        
+        page = None
+        if key is not None:
+            page = self.prepared_page(key)
+            self._prepared.pop(key, None)
+        while self._spares and page is None:
+            candidate = self._spares.pop(0)
+            if not candidate.is_closed():
+                page = candidate
+        if page is None:
+            page = await self.lease.new_page()
+        
+        self.lease.pooled.uses += 1
+        self.stats["page_wait_seconds"].append(time.perf_counter() - started)
+        return page
+    
+    @span("browser.reset")
+    async def reset(self) -> None:
+        """Close everything a task opened (redirect tabs included) and refill the spares."""
+        if not await self.is_healthy():
+            return
+        if self.lease.pooled.uses >= self.pool.max_uses:
+            # Let the pool recycle the worn-out context and lease a fresh one
+            await self.stop()
+            self.lease = await self.pool.acquire(self.consumer)
+            await self._top_up()
+            return
+        prepared = set(self._prepared.values())
+        for page in list(self.lease.context.pages):
+            if page not in self._spares and page not in prepared:
+                try:
+                    await page.close()
+                except Exception:
+                    pass
+        await self._top_up()
+    
+    async def stop(self) -> None:
+        self._spares.clear()
+        self._prepared.clear()
+        if self.lease:
+            await self.pool.release(self.lease)
+            self.lease = None
+    
+    @span("browser.restart")
+    async def _restart(self) -> None:
+        self.stats["restarts"] += 1
+        await self.stop()
+        await self.pool.start()
+        self.lease = await self.pool.acquire(self.consumer)
+        await self._top_up()
+    
+    async def _top_up(self) -> None:
+        self._spares = [p for p in self._spares if not p.is_closed()]
+        while len(self._spares) < self.spare_pages:
+            self._spares.append(await self.lease.new_page())
+    
+    def get_stats(self) -> dict:
+        waits = self.stats["page_wait_seconds"]
+        avg_wait = sum(waits) / len(waits) if waits else 0.0
+        return {
+            "cold_start_seconds": round(self.stats["cold_start_seconds"], 3),
+            "avg_page_wait_seconds": round(avg_wait, 3),
+            "saved_per_application_seconds": round(max(self.stats["cold_start_seconds"] - avg_wait, 0.0), 3),
+            "applications": len(waits),
+            "restarts": self.stats["restarts"],
+        }
+
+
 _browser_manager: Optional[BrowserManager] = None
 
 
@@ -187,15 +567,26 @@ def get_browser_manager() -> BrowserManager:
     return _browser_manager
 
 
+_browser_pool: Optional[BrowserPool] = None
+
+
+def get_browser_pool() -> BrowserPool:
+    global _browser_pool
+    if _browser_pool is None:
+        _browser_pool = BrowserPool()
+    return _browser_pool
+
+
+async def close_browser_pool() -> None:
+    if _browser_pool is not None:
+        await _browser_pool.stop()
+
+
 @asynccontextmanager
-async def browser_session():
-    manager = get_browser_manager()
-    try:
-        await manager.start()
-        page = await manager.new_page()
-        yield manager, page
-    finally:
-        await manager.stop()
+async def browser_session(consumer: str = "default"):
+    """Lease an isolated context from the shared pool; yields (lease, page)."""
+    async with get_browser_pool().session(consumer) as (lease, page):
+        yield lease, page
 
 
 async def human_like_delay(min_ms: int = 500, max_ms: int = 2000) -> None:
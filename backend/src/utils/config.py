@@ -11,12 +11,19 @@ from dotenv import load_dotenv
 load_dotenv()
 
 
+class BrowserPoolConfig(BaseModel):
+    max_contexts: int = 4
+    max_uses: int = 25
+    max_memory_mb: int = 512
+
+
 class BrowserConfig(BaseModel):
     type: str = "chromium"
     headless: bool = True
     slow_mo: int = 0
     viewport: dict = Field(default_factory=lambda: {"width": 1920, "height": 1080})
     user_agent: str = ""
+    pool: BrowserPoolConfig = Field(default_factory=BrowserPoolConfig)
 
 
 class DelayConfig(BaseModel):
@@ -24,10 +31,65 @@ class DelayConfig(BaseModel):
     max: int = 120
 
 
+class PrefetchConfig(BaseModel):
+    lookahead: int = 2
+    warm_pages: bool = True
+    answers: bool = True
+
+
+class AnswerMemoryConfig(BaseModel):
+    enabled: bool = True
+    # Cosine similarity (hashed n-gram vectors) above which a differently worded question reuses an answer
+    similarity: float = 0.9
+
+
+class TracingConfig(BaseModel):
+    enabled: bool = True
+    # Spans shorter than this aren't stored (their children are shorter still)
+    min_span_ms: float = 1.0
+
+
+class CheckpointConfig(BaseModel):
+    enabled: bool = True
+    # Older checkpoints are dropped instead of resumed: the ATS session behind them has expired
+    ttl_hours: int = 48
+
+
+class RetryConfig(BaseModel):
+    enabled: bool = True
+    # Retry n waits base_minutes * 2^n (capped at max_minutes), shortened by a random share up to jitter
+    base_minutes: float = 15.0
+    max_minutes: float = 720.0
+    jitter: float = 0.5
+
+
+class PriorityConfig(BaseModel):
+    # A job posted this many days earlier needs e (~2.7x) better odds to rank level with a newer one
+    freshness_days: float = 7.0
+    # Priority multiplier per scheduled retry, so retries queue behind comparable fresh jobs
+    retry_penalty: float = 0.5
+
+
 class ApplicationConfig(BaseModel):
     review_mode: bool = True
     max_per_run: int = 10
+    workers: int = 1
+    # Job leases: how long a claim lives without a heartbeat, and how often a crashed claim is retried
+    lease_seconds: int = 900
+    max_attempts: int = 3
+    # Failed applications requeued with backoff (transient failures only; the cap is Application.max_retries)
+    retries: RetryConfig = Field(default_factory=RetryConfig)
+    # Order of pending jobs: freshness, match score, platform ease, sponsor likelihood and retries
+    priority: PriorityConfig = Field(default_factory=PriorityConfig)
     delay: DelayConfig = Field(default_factory=DelayConfig)
+    prefetch: PrefetchConfig = Field(default_factory=PrefetchConfig)
+    # Reuse fill plans (field strategies + accepted answers) for forms seen before on the same board
+    form_cache: bool = True
+    answer_memory: AnswerMemoryConfig = Field(default_factory=AnswerMemoryConfig)
+    # Step checkpoints of multi-page forms, so a retry resumes where the last attempt stopped
+    checkpoints: CheckpointConfig = Field(default_factory=CheckpointConfig)
+    # Per-application span timings (trace_spans table), exportable as Chrome trace JSON
+    tracing: TracingConfig = Field(default_factory=TracingConfig)
     save_screenshots: bool = True
     screenshots_dir: str = "data/screenshots"
 
@@ -54,6 +116,32 @@ class ScrapersConfig(BaseModel):
     simplify: ScraperSourceConfig = Field(default_factory=ScraperSourceConfig)
     cvrve: ScraperSourceConfig = Field(default_factory=ScraperSourceConfig)
     career_sites: ScraperSourceConfig = Field(default_factory=ScraperSourceConfig)
+    enrich: bool = True
+    digest: bool = True
+
+
+class LLMCacheConfig(BaseModel):
+    enabled: bool = True
+    # Only calls at or below this temperature are deterministic enough to replay
+    max_temperature: float = 0.2
+    ttl_hours: float = 168
+    max_entries: int = 5000
+
+
+class LLMUsageConfig(BaseModel):
+    # Calls are buffered and appended to the usage ledger every few seconds or this many calls
+    flush_interval: float = 5.0
+    flush_size: int = 50
+
+
+class LocalModelConfig(BaseModel):
+    # OpenAI-compatible server on this machine (Ollama, llama.cpp, vLLM), tried before Gemini
+    enabled: bool = False
+    base_url: str = "http://localhost:11434/v1"
+    model: str = "llama3.1:8b"
+    api_key: str = ""
+    max_concurrent: int = 2
+    timeout: float = 20.0
 
 
 class LLMConfig(BaseModel):
@@ -62,6 +150,21 @@ class LLMConfig(BaseModel):
     temperature: float = 0.7
     max_tokens: int = 500
     max_retries: int = 3
+    # Answer all of a form's open questions in one request instead of one request each
+    batch_questions: bool = True
+    # Requests in flight at once, and seconds before one is abandoned
+    max_concurrent: int = 4
+    timeout: float = 30.0
+    cache: LLMCacheConfig = Field(default_factory=LLMCacheConfig)
+    usage: LLMUsageConfig = Field(default_factory=LLMUsageConfig)
+    local: LocalModelConfig = Field(default_factory=LocalModelConfig)
+    # Answer tiers tried in order, by question type (prompts.detect_question_type); "default" for the rest
+    answer_tiers: dict[str, list[str]] = Field(default_factory=lambda: {
+        "default": ["rules", "memory", "local", "gemini"],
+        "why_company": ["rules", "memory", "gemini"],
+        "why_role": ["rules", "memory", "gemini"],
+        "challenging_project": ["rules", "memory", "gemini"],
+    })
     always_review_questions: list[str] = Field(default_factory=lambda: [
         "salary", "compensation", "visa", "sponsorship", "clearance"
     ])
@@ -86,8 +189,26 @@ class NotificationsConfig(BaseModel):
     quiet_hours: QuietHours = Field(default_factory=QuietHours)
 
 
+class MailConfig(BaseModel):
+    # Inbox the ATS verification codes arrive in (EMAIL_USER / EMAIL_PASSWORD, else the SMTP login)
+    imap_host: str = "imap.gmail.com"
+    imap_port: int = 993
+    ssl: bool = True
+    mailbox: str = "INBOX"
+    # The listener re-issues IDLE this often; servers drop idle sessions after 30 minutes
+    idle_seconds: float = 300.0
+    # NOOP interval on servers without IDLE
+    poll_seconds: float = 5.0
+    # How long a filler waits for its code
+    code_timeout: float = 90.0
+    # Bytes of each message body fetched; codes sit near the top
+    body_bytes: int = 16384
+
+
 class DatabaseConfig(BaseModel):
     path: str = str(Path(__file__).parents[3] / "data" / "applications.db")
+    # Optional SQLAlchemy URL (e.g. postgresql://...) for appliers on several machines
+    url: str = ""
     echo: bool = False
 
 
@@ -137,6 +258,7 @@ class Settings(BaseSettings):
     scrapers: ScrapersConfig = Field(default_factory=ScrapersConfig)
     llm: LLMConfig = Field(default_factory=LLMConfig)
     notifications: NotificationsConfig = Field(default_factory=NotificationsConfig)
+    mail: MailConfig = Field(default_factory=MailConfig)
     database: DatabaseConfig = Field(default_factory=DatabaseConfig)
     logging: LoggingConfig = Field(default_factory=LoggingConfig)
     
@@ -1,10 +1,11 @@
-from datetime import datetime
+from datetime import date, datetime, timedelta
 from pathlib import Path
 from typing import Optional
 from contextlib import contextmanager
 
 from sqlalchemy import (
-    create_engine, Column, String, Integer, Float, Boolean, DateTime, Text, JSON, Enum as SQLEnum,
+    create_engine, event, inspect, Column, String, Integer, Float, Boolean, DateTime, Text, JSON, Enum as SQLEnum,
+    Index, or_, and_,
 )
 from sqlalchemy.orm import sessionmaker, declarative_base, Session
 
@@ -42,6 +43,20 @@ class JobModel(Base):
     external_id = Column(String)
     raw_data = Column(JSON)
     match_score = Column(Float)
+    # Set by the post-ingest enrichment stage
+    platform_confidence = Column(Float)
+    enriched_at = Column(DateTime)
+    # Set by the description digest stage
+    req_skills = Column(JSON)
+    req_years = Column(Integer)
+    req_degree = Column(String)
+    sponsorship = Column(String)
+    digested_at = Column(DateTime)
+    # Apply order of pending jobs (src/classifiers/priority.py), rescored whenever its inputs change
+    priority = Column(Float)
+    
+    # Serves get_pending_jobs: filter by status (and type), read in priority order
+    __table_args__ = (Index("ix_jobs_pending_priority", "status", "application_type", "priority"),)
     
     def to_job(self) -> Job:
         return Job(
@@ -66,6 +81,14 @@ class JobModel(Base):
             external_id=self.external_id,
             raw_data=self.raw_data,
             match_score=self.match_score,
+            platform_confidence=self.platform_confidence,
+            enriched_at=self.enriched_at,
+            req_skills=self.req_skills or [],
+            req_years=self.req_years,
+            req_degree=self.req_degree,
+            sponsorship=self.sponsorship,
+            digested_at=self.digested_at,
+            priority=self.priority,
         )
     
     @classmethod
@@ -92,6 +115,14 @@ class JobModel(Base):
             external_id=job.external_id,
             raw_data=job.raw_data,
             match_score=job.match_score,
+            platform_confidence=job.platform_confidence,
+            enriched_at=job.enriched_at,
+            req_skills=job.req_skills,
+            req_years=job.req_years,
+            req_degree=job.req_degree,
+            sponsorship=job.sponsorship,
+            digested_at=job.digested_at,
+            priority=job.priority,
         )
 
 
@@ -121,6 +152,118 @@ class ApplicationModel(Base):
     screenshots = Column(JSON, default=list)
 
 
+class JobQueueModel(Base):
+    """Lease on a job held by one applier process, so two appliers never work the same job"""
+    __tablename__ = "job_queue"
+    
+    job_id = Column(String, primary_key=True)
+    claimed_by = Column(String, index=True)
+    claimed_at = Column(DateTime)
+    lease_expires_at = Column(DateTime, index=True)
+    heartbeat_at = Column(DateTime)
+    attempts = Column(Integer, default=0)
+    last_error = Column(Text)
+    # Scheduled retries of failed applications (see src/retries.py)
+    retries = Column(Integer, default=0)
+    retry_at = Column(DateTime, index=True)
+    failure_kind = Column(String)
+
+
+class FormSchemaModel(Base):
+    """A board's application form as last seen: extracted fields, how each was filled and accepted answers"""
+    __tablename__ = "form_schemas"
+    
+    id = Column(String, primary_key=True)  # application_type:board:fingerprint
+    application_type = Column(String, nullable=False)
+    board = Column(String, nullable=False, index=True)
+    fingerprint = Column(String, nullable=False)
+    fields = Column(JSON, default=list)
+    hits = Column(Integer, default=0)
+    created_at = Column(DateTime, default=datetime.now)
+    last_used_at = Column(DateTime, default=datetime.now)
+
+
+class LLMCacheModel(Base):
+    """LLM responses to deterministic (low-temperature) prompts, keyed by a hash of the request"""
+    __tablename__ = "llm_cache"
+    
+    key = Column(String, primary_key=True)  # sha256 of model, system instruction, prompt and config
+    response = Column(Text, nullable=False)
+    hits = Column(Integer, default=0)
+    created_at = Column(DateTime, default=datetime.now)
+    last_used_at = Column(DateTime, default=datetime.now, index=True)
+
+
+class LLMCacheCounterModel(Base):
+    """Response cache outcomes per day; kept apart from llm_cache, whose rows expire and get evicted"""
+    __tablename__ = "llm_cache_counters"
+    
+    day = Column(String, primary_key=True)  # YYYY-MM-DD
+    hits = Column(Integer, default=0)
+    misses = Column(Integer, default=0)  # looked up and not found (or expired): the model was called
+    bypassed = Column(Integer, default=0)  # not looked up: temperature above the threshold, or cache=False
+
+
+class LLMUsageModel(Base):
+    """One row per LLM call (append-only), written in batches by the usage ledger"""
+    __tablename__ = "llm_usage"
+    
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    created_at = Column(DateTime, default=datetime.now, index=True)
+    call_site = Column(String, default="generate")  # which feature made the call
+    model = Column(String)
+    input_tokens = Column(Integer, default=0)
+    output_tokens = Column(Integer, default=0)
+    total_tokens = Column(Integer, default=0)
+    seconds = Column(Float, default=0.0)
+
+
+class TraceSpanModel(Base):
+    """One timed step of an application's fill (see src/utils/tracing.py); offsets are from the trace start"""
+    __tablename__ = "trace_spans"
+    
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    trace_id = Column(String, nullable=False, index=True)  # application id
+    application_type = Column(String)
+    created_at = Column(DateTime, default=datetime.now, index=True)  # trace start
+    seq = Column(Integer, nullable=False)  # start order within the trace
+    parent = Column(Integer, default=-1)  # seq of the enclosing span, -1 for the root
+    depth = Column(Integer, default=0)
+    name = Column(String, nullable=False)
+    start_ms = Column(Float, nullable=False)
+    duration_ms = Column(Float, nullable=False)
+    attrs = Column(JSON)
+
+
+class ApplicationCheckpointModel(Base):
+    """The last completed page of a multi-page application, so a retry resumes from there"""
+    __tablename__ = "application_checkpoints"
+    
+    job_id = Column(String, primary_key=True)
+    application_type = Column(String)
+    step = Column(Integer, default=0)  # pages completed
+    page_url = Column(String)  # the page to resume on
+    answers = Column(JSON, default=dict)  # field label -> value given
+    storage_state = Column(JSON, default=dict)  # Playwright storage state: cookies + localStorage
+    updated_at = Column(DateTime, default=datetime.now, index=True)
+
+
+class AnswerMemoryModel(Base):
+    """Answers given to application questions, reused across jobs instead of asking the LLM again"""
+    __tablename__ = "answer_memory"
+    
+    id = Column(String, primary_key=True)  # hash of kind + normalized question + options hash
+    question = Column(Text, nullable=False)  # normalized question text
+    kind = Column(String, nullable=False, index=True)  # input, select, textarea
+    options_hash = Column(String, default="")
+    answer = Column(Text, nullable=False)
+    source = Column(String, default="llm")  # rule, llm, human
+    approved = Column(Boolean, default=False)
+    hits = Column(Integer, default=0)
+    created_at = Column(DateTime, default=datetime.now)
+    last_used_at = Column(DateTime, default=datetime.now)
+
+
 class UserPreferencesModel(Base):
     """Stores user preferences like valorant_agent selection"""
     __tablename__ = "user_preferences"
@@ -289,17 +432,95 @@ class ColdEmailModel(Base):
 
 
 class Database:
-    def __init__(self, db_path: str = "data/applications.db", echo: bool = False):
+    def __init__(self, db_path: str = "data/applications.db", echo: bool = False, url: str = ""):
         self.db_path = Path(db_path)
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        if not url:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            url = f"sqlite:///{self.db_path}"
+        self.is_sqlite = url.startswith("sqlite")
         
         self.engine = create_engine(
-            f"sqlite:///{self.db_path}",
+            url,
             echo=echo,
-            connect_args={"check_same_thread": False}
+            connect_args={"check_same_thread": False} if self.is_sqlite else {}
         )
         self.SessionLocal = sessionmaker(bind=self.engine)
+        self.QueueSessionLocal = sessionmaker(bind=self._create_queue_engine(url, echo)) if self.is_sqlite else self.SessionLocal
         Base.metadata.create_all(self.engine)
+        self._add_missing_columns()
+        self._add_missing_indexes()
+        self._score_unprioritized_jobs()
+    
+    def _add_missing_columns(self) -> None:
+        """create_all never alters existing tables; add columns introduced since the database was created."""
+        inspector = inspect(self.engine)
+        with self.engine.begin() as conn:
+            for table in Base.metadata.sorted_tables:
+                existing = {col["name"] for col in inspector.get_columns(table.name)}
+                for column in table.columns:
+                    if column.name not in existing:
+                        col_type = column.type.compile(dialect=self.engine.dialect)
+                        conn.exec_driver_sql(f'ALTER TABLE {table.name} ADD COLUMN {column.name} {col_type}')
+    
+    def _add_missing_indexes(self) -> None:
+        """Indexes declared since the database was created (create_all skips existing tables)."""
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(self.engine, checkfirst=True)
+    
+    def _score_unprioritized_jobs(self) -> None:
+        """Give pending jobs stored before the priority column existed their score."""
+        with self.session() as session:
+            unscored = session.query(JobModel.id).filter(
+                JobModel.status.in_([JobStatus.NEW.value, JobStatus.QUEUED.value]),
+                JobModel.priority.is_(None),
+            ).all()
+            if unscored:
+                self._rescore(session, [row[0] for row in unscored])
+    
+    def _rescore(self, session: Session, job_ids: list[str]) -> int:
+        """Recompute the priority of ``job_ids`` from their current row and retry count."""
+        from src.classifiers.priority import priority_score
+        
+        scored = 0
+        chunk_size = 500
+        for i in range(0, len(job_ids), chunk_size):
+            chunk = job_ids[i:i + chunk_size]
+            retries = dict(session.query(JobQueueModel.job_id, JobQueueModel.retries).filter(
+                JobQueueModel.job_id.in_(chunk)
+            ).all())
+            for job_model in session.query(JobModel).filter(JobModel.id.in_(chunk)):
+                job_model.priority = priority_score(job_model, retries.get(job_model.id) or 0)
+                scored += 1
+        return scored
+    
+    def rescore_pending_jobs(self) -> int:
+        """Rescore every pending job, e.g. after the priority settings or the profile changed."""
+        from src.classifiers.priority import applicant_needs_sponsorship
+        applicant_needs_sponsorship.cache_clear()
+        with self.session() as session:
+            job_ids = [row[0] for row in session.query(JobModel.id).filter(
+                JobModel.status.in_([JobStatus.NEW.value, JobStatus.QUEUED.value])
+            ).all()]
+            return self._rescore(session, job_ids)
+    
+    def _create_queue_engine(self, url: str, echo: bool):
+        """SQLite engine whose transactions start with BEGIN IMMEDIATE (write lock up front)"""
+        engine = create_engine(
+            url,
+            echo=echo,
+            connect_args={"check_same_thread": False, "timeout": 30}
+        )
+        
+        @event.listens_for(engine, "connect")
+        def _disable_pysqlite_begin(dbapi_connection, connection_record):
+            dbapi_connection.isolation_level = None
+        
+        @event.listens_for(engine, "begin")
+        def _begin_immediate(connection):
+            connection.exec_driver_sql("BEGIN IMMEDIATE")
+        
+        return engine
     
     @contextmanager
     def session(self) -> Session:
@@ -313,7 +534,20 @@ class Database:
         finally:
             session.close()
     
+    @contextmanager
+    def queue_session(self) -> Session:
+        session = self.QueueSessionLocal()
+        try:
+            yield session
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+    
     def add_job(self, job: Job) -> str:
+        from src.classifiers.priority import priority_score
         job_id = job.id or str(hash(job.url))
         job.id = job_id
         
@@ -325,9 +559,11 @@ class Database:
                     existing.status = JobStatus.NEW.value
                     existing.source = JobSource.MANUAL.value
                     existing.discovered_at = datetime.now()
+                    self._rescore(session, [existing.id])
                 return existing.id
             
             job_model = JobModel.from_job(job)
+            job_model.priority = priority_score(job_model)
             session.add(job_model)
             session.flush()
         
@@ -361,6 +597,8 @@ class Database:
         if not jobs:
             return 0
             
+        from src.classifiers.priority import priority_score
+        
         count = 0
         with self.session() as session:
             job_models = []
@@ -368,6 +606,7 @@ class Database:
                 job.id = job.id or str(hash(job.url))
                 job.discovered_at = datetime.now()
                 job.status = JobStatus.NEW
+                job.priority = priority_score(job)
                 job_models.append(JobModel.from_job(job))
                 
             if job_models:
@@ -376,6 +615,288 @@ class Database:
                 
         return count
     
+    def get_unenriched_jobs(self, limit: int = 500) -> list[Job]:
+        with self.session() as session:
+            job_models = session.query(JobModel).filter(
+                JobModel.enriched_at.is_(None),
+                JobModel.status.in_([JobStatus.NEW.value, JobStatus.QUEUED.value]),
+            ).order_by(JobModel.discovered_at.desc()).limit(limit).all()
+            return [jm.to_job() for jm in job_models]
+    
+    def update_job_platforms(self, updates: list[dict]) -> int:
+        """Bulk-store enrichment results: dicts of id, apply_url, application_type, platform_confidence."""
+        if not updates:
+            return 0
+        now = datetime.now()
+        mappings = [{**update, "enriched_at": now} for update in updates]
+        with self.session() as session:
+            session.bulk_update_mappings(JobModel, mappings)
+            # The platform changes how easy the job is to apply to
+            self._rescore(session, [update["id"] for update in updates])
+        return len(mappings)
+    
+    def get_undigested_jobs(self, limit: int = 500) -> list[Job]:
+        with self.session() as session:
+            job_models = session.query(JobModel).filter(
+                JobModel.digested_at.is_(None),
+                JobModel.status.in_([JobStatus.NEW.value, JobStatus.QUEUED.value]),
+            ).order_by(JobModel.discovered_at.desc()).limit(limit).all()
+            return [jm.to_job() for jm in job_models]
+    
+    def update_job_digests(self, updates: list[dict]) -> int:
+        """Bulk-store digests: dicts of id, the req_* fields, sponsorship, remote_type, match_score and, when fetched, description."""
+        if not updates:
+            return 0
+        now = datetime.now()
+        mappings = [{**update, "digested_at": now} for update in updates]
+        with self.session() as session:
+            session.bulk_update_mappings(JobModel, mappings)
+            # Match score and sponsorship feed the priority
+            self._rescore(session, [update["id"] for update in updates])
+        return len(mappings)
+    
+    def get_form_schema(self, application_type: str, board: str, fingerprint: str) -> Optional[list[dict]]:
+        with self.session() as session:
+            schema = session.get(FormSchemaModel, f"{application_type}:{board}:{fingerprint}")
+            if not schema:
+                return None
+            schema.hits = (schema.hits or 0) + 1
+            schema.last_used_at = datetime.now()
+            return list(schema.fields or [])
+    
+    def save_form_schema(self, application_type: str, board: str, fingerprint: str, fields: list[dict],
+                         keep_per_board: int = 5) -> None:
+        """Store a board's form, keeping only its ``keep_per_board`` most recently used variants."""
+        with self.session() as session:
+            schema_id = f"{application_type}:{board}:{fingerprint}"
+            schema = session.get(FormSchemaModel, schema_id)
+            if schema:
+                schema.fields = fields
+                schema.last_used_at = datetime.now()
+            else:
+                session.add(FormSchemaModel(
+                    id=schema_id, application_type=application_type, board=board,
+                    fingerprint=fingerprint, fields=fields,
+                ))
+                session.flush()
+            
+            stale = session.query(FormSchemaModel.id).filter(
+                FormSchemaModel.application_type == application_type,
+                FormSchemaModel.board == board,
+            ).order_by(FormSchemaModel.last_used_at.desc()).offset(keep_per_board).all()
+            if stale:
+                session.query(FormSchemaModel).filter(
+                    FormSchemaModel.id.in_([row[0] for row in stale])
+                ).delete(synchronize_session=False)
+    
+    def delete_form_schema(self, application_type: str, board: str, fingerprint: Optional[str] = None) -> int:
+        """Drop one cached form variant, or every variant of a board when no fingerprint is given."""
+        with self.session() as session:
+            query = session.query(FormSchemaModel).filter(
+                FormSchemaModel.application_type == application_type,
+                FormSchemaModel.board == board,
+            )
+            if fingerprint:
+                query = query.filter(FormSchemaModel.fingerprint == fingerprint)
+            return query.delete(synchronize_session=False)
+    
+    def get_checkpoint(self, job_id: str) -> Optional[dict]:
+        with self.session() as session:
+            row = session.get(ApplicationCheckpointModel, job_id)
+            if not row:
+                return None
+            return {
+                "job_id": row.job_id, "application_type": row.application_type, "step": row.step,
+                "page_url": row.page_url, "answers": dict(row.answers or {}),
+                "storage_state": dict(row.storage_state or {}), "updated_at": row.updated_at,
+            }
+    
+    def save_checkpoint(self, checkpoint: dict) -> None:
+        values = {key: value for key, value in checkpoint.items() if key != "updated_at"}
+        with self.session() as session:
+            row = session.get(ApplicationCheckpointModel, values["job_id"])
+            if row:
+                for key, value in values.items():
+                    setattr(row, key, value)
+                row.updated_at = datetime.now()
+            else:
+                session.add(ApplicationCheckpointModel(**values))
+    
+    def delete_checkpoint(self, job_id: str) -> int:
+        with self.session() as session:
+            return session.query(ApplicationCheckpointModel).filter(
+                ApplicationCheckpointModel.job_id == job_id
+            ).delete(synchronize_session=False)
+    
+    def get_llm_cache(self, key: str, ttl: Optional[timedelta] = None) -> Optional[str]:
+        """Cached response for ``key``, or None when absent or older than ``ttl``."""
+        with self.session() as session:
+            row = session.get(LLMCacheModel, key)
+            if not row:
+                return None
+            if ttl and row.created_at and datetime.now() - row.created_at > ttl:
+                session.delete(row)
+                return None
+            row.hits = (row.hits or 0) + 1
+            row.last_used_at = datetime.now()
+            return row.response
+    
+    def put_llm_cache(self, key: str, response: str, max_entries: int = 5000) -> None:
+        """Store a response, evicting the least recently used entries beyond ``max_entries``."""
+        with self.session() as session:
+            row = session.get(LLMCacheModel, key)
+            if row:
+                row.response = response
+                row.created_at = row.last_used_at = datetime.now()
+            else:
+                session.add(LLMCacheModel(key=key, response=response))
+                session.flush()
+            
+            stale = session.query(LLMCacheModel.key).order_by(
+                LLMCacheModel.last_used_at.desc()
+            ).offset(max_entries).all()
+            if stale:
+                session.query(LLMCacheModel).filter(
+                    LLMCacheModel.key.in_([row[0] for row in stale])
+                ).delete(synchronize_session=False)
+    
+    def add_llm_cache_counts(self, counts: dict[str, dict[str, int]]) -> None:
+        """Add response cache outcomes (``hits``, ``misses``, ``bypassed``) to the counters of each YYYY-MM-DD day."""
+        # Under the write lock, so appliers in other processes don't lose each other's increments
+        with self.queue_session() as session:
+            for day, outcomes in counts.items():
+                updated = session.query(LLMCacheCounterModel).filter(
+                    LLMCacheCounterModel.day == day
+                ).update({
+                    getattr(LLMCacheCounterModel, outcome): getattr(LLMCacheCounterModel, outcome) + count
+                    for outcome, count in outcomes.items()
+                }, synchronize_session=False)
+                if not updated:
+                    session.add(LLMCacheCounterModel(day=day, **{"hits": 0, "misses": 0, "bypassed": 0, **outcomes}))
+    
+    def get_llm_cache_stats(self, since: Optional[datetime] = None) -> dict:
+        """Entries cached now, and cache outcomes counted since ``since`` (default: ever)."""
+        from sqlalchemy import func
+        with self.session() as session:
+            entries = session.query(func.count(LLMCacheModel.key)).scalar()
+            counters = session.query(
+                func.sum(LLMCacheCounterModel.hits), func.sum(LLMCacheCounterModel.misses),
+                func.sum(LLMCacheCounterModel.bypassed),
+            )
+            if since:
+                counters = counters.filter(LLMCacheCounterModel.day >= since.date().isoformat())
+            hits, misses, bypassed = counters.one()
+            return {"entries": entries or 0, "hits": int(hits or 0), "misses": int(misses or 0), "bypassed": int(bypassed or 0)}
+    
+    def add_llm_usage(self, rows: list[dict]) -> int:
+        """Append usage rows in one transaction; takes the write lock up front so several processes can append."""
+        if not rows:
+            return 0
+        with self.queue_session() as session:
+            session.bulk_insert_mappings(LLMUsageModel, rows)
+        return len(rows)
+    
+    def get_llm_usage_totals(self, since: datetime) -> dict:
+        from sqlalchemy import func
+        with self.session() as session:
+            requests, tokens = session.query(
+                func.count(LLMUsageModel.id), func.sum(LLMUsageModel.total_tokens)
+            ).filter(LLMUsageModel.created_at >= since).one()
+            return {"requests": requests or 0, "tokens": int(tokens or 0)}
+    
+    def get_llm_usage_by_day(self, since: datetime) -> list[dict]:
+        """Requests and tokens per day and call site since ``since``, oldest day first."""
+        from sqlalchemy import func
+        day = func.date(LLMUsageModel.created_at)
+        with self.session() as session:
+            rows = session.query(
+                day, LLMUsageModel.call_site, func.count(LLMUsageModel.id),
+                func.sum(LLMUsageModel.input_tokens), func.sum(LLMUsageModel.output_tokens),
+                func.sum(LLMUsageModel.seconds),
+            ).filter(LLMUsageModel.created_at >= since).group_by(day, LLMUsageModel.call_site).order_by(day).all()
+            return [
+                {"day": str(d), "call_site": site, "requests": requests, "input_tokens": int(inp or 0),
+                 "output_tokens": int(out or 0), "seconds": float(secs or 0)}
+                for d, site, requests, inp, out, secs in rows
+            ]
+    
+    def add_trace_spans(self, rows: list[dict]) -> int:
+        """Append one application's spans in one transaction."""
+        if not rows:
+            return 0
+        with self.queue_session() as session:
+            session.bulk_insert_mappings(TraceSpanModel, rows)
+        return len(rows)
+    
+    def get_trace_spans(self, trace_ids: Optional[list[str]] = None, since: Optional[datetime] = None,
+                        max_depth: Optional[int] = None) -> list[dict]:
+        """Spans of the given traces (or all since ``since``), each trace's spans in start order."""
+        with self.session() as session:
+            query = session.query(TraceSpanModel)
+            if trace_ids is not None:
+                query = query.filter(TraceSpanModel.trace_id.in_(trace_ids))
+            if since is not None:
+                query = query.filter(TraceSpanModel.created_at >= since)
+            if max_depth is not None:
+                query = query.filter(TraceSpanModel.depth <= max_depth)
+            return [
+                {
+                    "trace_id": row.trace_id, "application_type": row.application_type, "created_at": row.created_at,
+                    "seq": row.seq, "parent": row.parent, "depth": row.depth, "name": row.name,
+                    "start_ms": row.start_ms, "duration_ms": row.duration_ms, "attrs": row.attrs,
+                }
+                for row in query.order_by(TraceSpanModel.created_at, TraceSpanModel.trace_id, TraceSpanModel.seq).all()
+            ]
+    
+    def get_recent_trace_ids(self, limit: int = 20) -> list[str]:
+        """Ids of the last ``limit`` traced applications, newest first."""
+        from sqlalchemy import func
+        with self.session() as session:
+            rows = session.query(TraceSpanModel.trace_id, func.max(TraceSpanModel.created_at).label("started")).group_by(
+                TraceSpanModel.trace_id
+            ).order_by(func.max(TraceSpanModel.created_at).desc()).limit(limit).all()
+            return [trace_id for trace_id, _ in rows]
+    
+    def get_answer_memories(self) -> list[dict]:
+        with self.session() as session:
+            return [
+                {
+                    "id": row.id, "question": row.question, "kind": row.kind, "options_hash": row.options_hash or "",
+                    "answer": row.answer, "source": row.source, "approved": bool(row.approved),
+                }
+                for row in session.query(AnswerMemoryModel).all()
+            ]
+    
+    def save_answer_memory(self, memory_id: str, question: str, kind: str, options_hash: str, answer: str,
+                           source: str, approved: bool) -> None:
+        with self.session() as session:
+            row = session.get(AnswerMemoryModel, memory_id)
+            if row:
+                row.answer = answer
+                row.source = source
+                row.approved = approved
+                row.last_used_at = datetime.now()
+            else:
+                session.add(AnswerMemoryModel(
+                    id=memory_id, question=question, kind=kind, options_hash=options_hash,
+                    answer=answer, source=source, approved=approved,
+                ))
+    
+    def approve_answer_memories(self, memory_ids: list[str]) -> int:
+        if not memory_ids:
+            return 0
+        with self.session() as session:
+            return session.query(AnswerMemoryModel).filter(
+                AnswerMemoryModel.id.in_(memory_ids)
+            ).update({AnswerMemoryModel.approved: True}, synchronize_session=False)
+    
+    def touch_answer_memory(self, memory_id: str) -> None:
+        with self.session() as session:
+            row = session.get(AnswerMemoryModel, memory_id)
+            if row:
+                row.hits = (row.hits or 0) + 1
+                row.last_used_at = datetime.now()
+    
     def check_content_duplicates(self, candidates: list[Job]) -> set[str]:
         if not candidates:
             return set()
@@ -439,9 +960,179 @@ class Database:
             ).limit(limit).all()
             return [jm.to_job() for jm in job_models]
     
-    def get_pending_jobs(self, limit: int = 10) -> list[Job]:
-        return self.get_jobs_by_status(JobStatus.NEW, limit) + \
-               self.get_jobs_by_status(JobStatus.QUEUED, limit)
+    def get_pending_jobs(self, limit: int = 10, application_type: Optional[ApplicationType] = None) -> list[Job]:
+        """
+        The ``limit`` highest-priority NEW/QUEUED jobs, leaving out retries that aren't due.
+        With ``application_type``, only jobs of that type or not yet detected.
+        """
+        now = datetime.now()
+        with self.session() as session:
+            query = session.query(JobModel).outerjoin(
+                JobQueueModel, JobQueueModel.job_id == JobModel.id
+            ).filter(
+                JobModel.status.in_([JobStatus.NEW.value, JobStatus.QUEUED.value]),
+                or_(JobQueueModel.retry_at.is_(None), JobQueueModel.retry_at <= now),
+            )
+            if application_type:
+                # Unknown jobs may still turn out to be the wanted type once detected
+                query = query.filter(JobModel.application_type.in_([
+                    application_type.value, ApplicationType.UNKNOWN.value
+                ]))
+            job_models = query.order_by(JobModel.priority.desc().nullslast()).limit(limit).all()
+            return [jm.to_job() for jm in job_models]
+    
+    # ============ Work Queue ============
+    
+    def claim_next(self, worker_id: str, filter_type: Optional[ApplicationType] = None, job_id: Optional[str] = None,
+                   lease_seconds: int = 900, max_attempts: int = 3, force: bool = False) -> Optional[Job]:
+        """
+        Atomically lease the next pending job (or a specific ``job_id``) to ``worker_id``.
+        
+        Pending means NEW/QUEUED, or IN_PROGRESS whose lease expired because its
+        worker died; ``force`` (manual applies) accepts any status that isn't leased.
+        Runs under BEGIN IMMEDIATE on SQLite and FOR UPDATE SKIP LOCKED on Postgres,
+        so concurrent appliers never receive the same job.
+        """
+        now = datetime.now()
+        
+        with self.queue_session() as session:
+            # Jobs whose worker keeps dying are parked instead of reclaimed forever; a clean
+            # release resets attempts, so this counts leases that expired in a row
+            exhausted = session.query(JobQueueModel.job_id).filter(
+                JobQueueModel.lease_expires_at < now,
+                JobQueueModel.attempts >= max_attempts,
+            ).all()
+            if exhausted:
+                exhausted_ids = [row[0] for row in exhausted]
+                session.query(JobModel).filter(
+                    JobModel.id.in_(exhausted_ids),
+                    JobModel.status == JobStatus.IN_PROGRESS.value,
+                ).update({JobModel.status: JobStatus.FAILED.value}, synchronize_session=False)
+                session.query(JobQueueModel).filter(
+                    JobQueueModel.job_id.in_(exhausted_ids)
+                ).update({JobQueueModel.claimed_by: None, JobQueueModel.lease_expires_at: None}, synchronize_session=False)
+            
+            lease_free = or_(
+                JobQueueModel.lease_expires_at.is_(None),
+                JobQueueModel.lease_expires_at < now,
+            )
+            query = session.query(JobModel).outerjoin(
+                JobQueueModel, JobQueueModel.job_id == JobModel.id
+            )
+            
+            query = query.filter(lease_free)
+            if not force:
+                # Failed jobs waiting out their retry backoff
+                query = query.filter(or_(JobQueueModel.retry_at.is_(None), JobQueueModel.retry_at <= now))
+                query = query.filter(or_(
+                    JobModel.status.in_([JobStatus.NEW.value, JobStatus.QUEUED.value]),
+                    and_(JobModel.status == JobStatus.IN_PROGRESS.value, JobQueueModel.lease_expires_at < now),
+                ))
+            
+            if job_id:
+                query = query.filter(JobModel.id == job_id)
+            else:
+                if filter_type:
+                    # Unknown jobs may still turn out to be the wanted type once detected
+                    query = query.filter(JobModel.application_type.in_([
+                        filter_type.value, ApplicationType.UNKNOWN.value
+                    ]))
+                query = query.order_by(JobModel.priority.desc().nullslast())
+            
+            if not self.is_sqlite:
+                query = query.with_for_update(of=JobModel, skip_locked=True)
+            
+            job_model = query.first()
+            if not job_model:
+                return None
+            
+            entry = session.query(JobQueueModel).filter(JobQueueModel.job_id == job_model.id).first()
+            if not entry:
+                entry = JobQueueModel(job_id=job_model.id, attempts=0)
+                session.add(entry)
+            
+            entry.claimed_by = worker_id
+            entry.claimed_at = now
+            entry.heartbeat_at = now
+            entry.lease_expires_at = now + timedelta(seconds=lease_seconds)
+            entry.attempts = (entry.attempts or 0) + 1
+            job_model.status = JobStatus.IN_PROGRESS.value
+            
+            return job_model.to_job()
+    
+    def heartbeat(self, job_id: str, worker_id: str, lease_seconds: int = 900) -> bool:
+        """Extend a held lease. Returns False if the lease was lost to another worker."""
+        now = datetime.now()
+        with self.queue_session() as session:
+            updated = session.query(JobQueueModel).filter(
+                JobQueueModel.job_id == job_id,
+                JobQueueModel.claimed_by == worker_id,
+            ).update({
+                JobQueueModel.heartbeat_at: now,
+                JobQueueModel.lease_expires_at: now + timedelta(seconds=lease_seconds),
+            }, synchronize_session=False)
+            return updated > 0
+    
+    def release_claim(self, job_id: str, worker_id: str, error: Optional[str] = None) -> bool:
+        """
+        Give up a lease; the job's status has already been set by the applier. Returns
+        False (and leaves the job alone) if the lease had expired and gone to another worker.
+        """
+        with self.queue_session() as session:
+            released = session.query(JobQueueModel).filter(
+                JobQueueModel.job_id == job_id,
+                JobQueueModel.claimed_by == worker_id,
+            ).update({
+                JobQueueModel.claimed_by: None,
+                JobQueueModel.lease_expires_at: None,
+                JobQueueModel.attempts: 0,
+                **({JobQueueModel.last_error: error} if error else {}),
+            }, synchronize_session=False)
+            if not released:
+                return False
+            
+            # Never leave a released job stuck IN_PROGRESS
+            session.query(JobModel).filter(
+                JobModel.id == job_id,
+                JobModel.status == JobStatus.IN_PROGRESS.value,
+            ).update({JobModel.status: JobStatus.QUEUED.value}, synchronize_session=False)
+            return True
+    
+    def schedule_retry(self, job_id: str, retry_at: datetime, kind: str, error: Optional[str] = None) -> int:
+        """Requeue a failed job for ``retry_at``; returns how many retries it has had scheduled."""
+        with self.queue_session() as session:
+            entry = session.query(JobQueueModel).filter(JobQueueModel.job_id == job_id).first()
+            if not entry:
+                entry = JobQueueModel(job_id=job_id, attempts=0)
+                session.add(entry)
+            entry.retries = (entry.retries or 0) + 1
+            entry.retry_at = retry_at
+            entry.failure_kind = kind
+            if error:
+                entry.last_error = error
+            session.query(JobModel).filter(JobModel.id == job_id).update(
+                {JobModel.status: JobStatus.QUEUED.value}, synchronize_session=False
+            )
+            session.flush()
+            # Each retry lowers the job's priority
+            self._rescore(session, [job_id])
+            return entry.retries
+    
+    def get_retry_count(self, job_id: str) -> int:
+        with self.session() as session:
+            retries = session.query(JobQueueModel.retries).filter(JobQueueModel.job_id == job_id).scalar()
+            return retries or 0
+    
+    def get_queue_stats(self) -> dict:
+        now = datetime.now()
+        with self.session() as session:
+            leased = session.query(JobQueueModel).filter(JobQueueModel.lease_expires_at >= now).count()
+            expired = session.query(JobQueueModel).filter(JobQueueModel.lease_expires_at < now).count()
+            workers = session.query(JobQueueModel.claimed_by).filter(
+                JobQueueModel.lease_expires_at >= now
+            ).distinct().count()
+            retrying = session.query(JobQueueModel).filter(JobQueueModel.retry_at > now).count()
+            return {"leased": leased, "expired": expired, "workers": workers, "retrying": retrying}
     
     def update_job_status(self, job_id: str, status: JobStatus) -> None:
         with self.session() as session:
@@ -512,6 +1203,7 @@ class Database:
                 app_model.completed_at = application.completed_at
                 app_model.current_step = application.current_step
                 app_model.total_steps = application.total_steps
+                app_model.current_page_url = application.current_page_url
                 app_model.questions = [q.model_dump(mode='json') for q in application.questions]
                 app_model.logs = [log.model_dump(mode='json') for log in application.logs]
                 app_model.error_message = application.error_message
@@ -715,6 +1407,7 @@ def get_db() -> Database:
         settings = get_settings()
         _db = Database(
             db_path=settings.database.path,
-            echo=settings.database.echo
+            echo=settings.database.echo,
+            url=settings.database.url,
         )
     return _db
@@ -7,23 +7,78 @@ from typing import Optional
 
 from src.utils.config import get_settings
 
+# Greenhouse codes are 8 mixed-case alphanumerics ("ugHJ9pif"), others 6 digits
+CODE_PATTERNS = [
+    r"<h1>([A-Za-z0-9]{6,12})</h1>", # New HTML pattern
+    r"security code field on your application:\s*<br>\s*<strong>([A-Za-z0-9]{6,12})</strong>", # HTML bold
+    r"security code field on your application:\s*([A-Za-z0-9]{6,12})", # Text
+    r"verification code is:?\s*([A-Za-z0-9]{6,12})", 
+    r"security code:?\s*([A-Za-z0-9]{6,12})",
+    r"code\s*:?\s*([A-Za-z0-9]{6,12})" # Generic fallback
+]
+
+
+def mail_credentials(settings) -> tuple[str, str]:
+    """IMAP login: EMAIL_USER / EMAIL_PASSWORD, or the SMTP credentials if those are missing or placeholders."""
+    username, password = settings.email_user, settings.email_password
+    if not username or "your_email" in username:
+        if settings.smtp_user:
+            print(f"📧 MailHandler: Using SMTP credentials for IMAP (User: {settings.smtp_user})")
+            username, password = settings.smtp_user, settings.smtp_password
+    return username, password
+
+
+def decode_subject(msg) -> str:
+    subject, encoding = decode_header(msg["Subject"] or "")[0]
+    if isinstance(subject, bytes):
+        subject = subject.decode(encoding or "utf-8", errors="replace")
+    return subject
+
+
+def message_body(msg) -> str:
+    """The text/plain part of ``msg``, else its text/html part."""
+    body = ""
+    if msg.is_multipart():
+        for part in msg.walk():
+            content_type = part.get_content_type()
+            content_disposition = str(part.get("Content-Disposition"))
+            try:
+                if content_type == "text/plain" and "attachment" not in content_disposition:
+                    body = part.get_payload(decode=True).decode(errors="replace")
+                    break
+                elif content_type == "text/html" and "attachment" not in content_disposition and not body:
+                    body = part.get_payload(decode=True).decode(errors="replace")
+            except: pass
+    else:
+        body = (msg.get_payload(decode=True) or b"").decode(errors="replace")
+    return body
+
+
+def extract_verification_code(body: str) -> Optional[str]:
+    """The verification code in an email body, trying the Greenhouse layouts first."""
+    for pattern in CODE_PATTERNS:
+        match = re.search(pattern, body, re.IGNORECASE | re.DOTALL)
+        if match:
+            return match.group(1)
+    
+    # Fallback: Look for the specific isolated line style if regex fails
+    lines = body.replace("<br>", "\n").replace("<div>", "\n").split("\n")
+    for line in lines:
+        cleaned = line.strip()
+        # Mixed numbers/letters usually
+        if 6 <= len(cleaned) <= 12 and cleaned.isalnum() and any(c.isdigit() for c in cleaned):
+            return cleaned
+    return None
+
+
 class MailHandler:
     def __init__(self):
         self.settings = get_settings()
+        self.username, self.password = mail_credentials(self.settings)
         
-        # Try specific IMAP credentials first
-        self.username = self.settings.email_user
-        self.password = self.settings.email_password
-        
-        # Fallback to SMTP credentials if IMAP ones are missing or placeholders
-        if not self.username or "your_email" in self.username:
-            if self.settings.smtp_user:
-                print(f"📧 MailHandler: Using SMTP credentials for IMAP (User: {self.settings.smtp_user})")
-                self.username = self.settings.smtp_user
-                self.password = self.settings.smtp_password
-        
-        self.imap_server = "imap.gmail.com"
-        self.imap_port = 993
+        self.imap_server = self.settings.mail.imap_host
+        self.imap_port = self.settings.mail.imap_port
+        self.imap_ssl = self.settings.mail.ssl
 
     def get_verification_code(self, subject_filter: str = "Greenhouse", timeframe_minutes: int = 5) -> Optional[str]:
         """
@@ -36,7 +91,8 @@ class MailHandler:
 
         try:
             # Connect to IMAP
-            mail = imaplib.IMAP4_SSL(self.imap_server, self.imap_port)
+            imap_class = imaplib.IMAP4_SSL if self.imap_ssl else imaplib.IMAP4
+            mail = imap_class(self.imap_server, self.imap_port)
             mail.login(self.username, self.password)
             mail.select("inbox")
 
@@ -58,10 +114,7 @@ class MailHandler:
                 raw_email = msg_data[0][1]
                 msg = email.message_from_bytes(raw_email)
 
-                # Decode Subject
-                subject, encoding = decode_header(msg["Subject"])[0]
-                if isinstance(subject, bytes):
-                    subject = subject.decode(encoding or "utf-8")
+                subject = decode_subject(msg)
                 
                 # Check Subject OR Sender Match
                 sender = msg.get("From", "")
@@ -77,67 +130,7 @@ class MailHandler:
 
                 print(f"📧 MailHandler: Found matching email: '{subject}'")
 
-                # Parse Body
-                body = ""
-                if msg.is_multipart():
-                    for part in msg.walk():
-                        content_type = part.get_content_type()
-                        content_disposition = str(part.get("Content-Disposition"))
-                        try:
-                            if content_type == "text/plain" and "attachment" not in content_disposition:
-                                body = part.get_payload(decode=True).decode()
-                                break
-                            elif content_type == "text/html" and "attachment" not in content_disposition and not body:
-                                body = part.get_payload(decode=True).decode()
-                        except: pass
-                else:
-                    body = msg.get_payload(decode=True).decode()
-
-                # Extract Code (assuming 6 digits)
-                # Look for patterns like "verification code is 123456" or just isolated 6 digits
-                
-                # Pattern 1: Explicit "code is" or similar
-                # Pattern 2: Just 6 digits isolated
-                
-                # Pattern 1: Alphanumeric code (Greenhouse often uses mixture of letters/numbers)
-                # Context from screenshot: "Copy and paste this code into the security code field..."
-                # Value: "ugHJ9pif" (8 chars)
-                
-                # Robust extraction: Look for the code line in HTML or Text
-                # We often see it isolated or after "code:"
-                
-                # Regex for 6-12 char alphanumeric code that is NOT a common word
-                # We'll look for lines that look like codes
-                
-                # Try specific Greenhouse patterns first
-                patterns = [
-                    r"<h1>([A-Za-z0-9]{6,12})</h1>", # New HTML pattern
-                    r"security code field on your application:\s*<br>\s*<strong>([A-Za-z0-9]{6,12})</strong>", # HTML bold
-                    r"security code field on your application:\s*([A-Za-z0-9]{6,12})", # Text
-                    r"verification code is:?\s*([A-Za-z0-9]{6,12})", 
-                    r"security code:?\s*([A-Za-z0-9]{6,12})",
-                    r"code\s*:?\s*([A-Za-z0-9]{6,12})" # Generic fallback
-                ]
-                
-                code = None
-                for pattern in patterns:
-                    match = re.search(pattern, body, re.IGNORECASE | re.DOTALL)
-                    if match:
-                        code = match.group(1)
-                        break
-                
-                # Fallback: Look for the specific isolated line style if regex fails
-                if not code:
-                     # Find lines that are just alphanumerics
-                     lines = body.replace("<br>", "\n").replace("<div>", "\n").split("\n")
-                     for line in lines:
-                         cleaned = line.strip()
-                         if 6 <= len(cleaned) <= 12 and cleaned.isalnum() and not cleaned.isalpha(): # Mixed numbers/letters usually
-                             # Heuristic: Uppercase mixed often indicates code
-                             if any(c.isdigit() for c in cleaned):
-                                 code = cleaned
-                                 break
-                
+                code = extract_verification_code(message_body(msg))
                 if code:
                     print(f"✅ MailHandler: Extracted Code: {code}")
                     mail.logout()
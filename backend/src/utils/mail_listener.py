@@ -0,0 +1,374 @@
+import asyncio
+import email
+import re
+import ssl
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Optional
+
+from src.utils.config import get_settings
+from src.utils.mail_handler import decode_subject, extract_verification_code, mail_credentials, message_body
+
+
+# A message counts for a waiter if the server received it after the waiter's ``since``,
+# less this much for the clock difference between us and the mail server
+CLOCK_SKEW = timedelta(seconds=30)
+COMMAND_TIMEOUT = 30.0
+# Fetched messages kept for waiters that register after their mail arrived
+CACHE_SIZE = 100
+HEADER_FIELDS = "FROM SUBJECT DATE MIME-VERSION CONTENT-TYPE CONTENT-TRANSFER-ENCODING"
+
+LITERAL = re.compile(rb"\{(\d+)\}\r\n$")
+LITERAL_KEY = re.compile(rb"(BODY\[[^\]]*\])(?:<\d+>)? \{\d+\}\r\n$")
+UID = re.compile(rb"\bUID (\d+)")
+INTERNALDATE = re.compile(rb'INTERNALDATE "([^"]+)"')
+UIDVALIDITY = re.compile(rb"\[UIDVALIDITY (\d+)\]")
+
+
+class IMAPError(Exception):
+    pass
+
+
+class IMAPAuthError(IMAPError):
+    pass
+
+
+@dataclass
+class _Response:
+    """One server response: its text split around the literals it carries."""
+    parts: list[bytes]
+    literals: list[bytes] = field(default_factory=list)
+
+    @property
+    def text(self) -> bytes:
+        return b"".join(self.parts)
+
+
+@dataclass
+class MailMessage:
+    uid: int
+    received: datetime
+    sender: str
+    subject: str
+    code: Optional[str]
+    consumed: bool = False
+
+
+@dataclass
+class _Waiter:
+    match: str
+    hint: str
+    since: datetime
+    future: asyncio.Future
+
+
+def _quote(value: str) -> str:
+    return '"' + value.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+def _from_or_subject(terms: list[str]) -> str:
+    """SEARCH criteria matching mail whose sender or subject contains any of ``terms``."""
+    first = f"OR FROM {_quote(terms[0])} SUBJECT {_quote(terms[0])}"
+    if len(terms) == 1:
+        return first
+    return f"OR ({first}) ({_from_or_subject(terms[1:])})"
+
+
+class VerificationListener:
+    """
+    Keeps one IMAP session open and hands verification codes to the fillers waiting
+    for them. The session IDLEs (or NOOPs every ``poll_seconds`` on servers without
+    IDLE); new mail triggers a server-side SEARCH for the waiters' senders/subjects,
+    and only the headers and the first ``body_bytes`` of the text of a match are fetched.
+    """
+
+    def __init__(self):
+        self.settings = get_settings()
+        self.config = self.settings.mail
+        self.username, self.password = mail_credentials(self.settings)
+        self.error: Optional[str] = None
+        self.idle_supported = False
+        self.messages: dict[int, MailMessage] = {}
+        self._uidvalidity: Optional[bytes] = None
+        self._waiters: list[_Waiter] = []
+        self._tag_count = 0
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._task: Optional[asyncio.Task] = None
+        self._wake = asyncio.Event()
+        self._closing = False
+
+    async def wait_for_code(self, match: str = "Greenhouse", hint: str = "", since: Optional[datetime] = None,
+                            timeout: Optional[float] = None) -> Optional[str]:
+        """
+        The code from the first mail received after ``since`` (default: now) whose sender or
+        subject contains ``match``, or None after ``timeout`` seconds. Of several waiters
+        for the same sender, a mail goes to the one whose ``hint`` (the company) it mentions.
+        """
+        if not self.username or not self.password:
+            print("⚠️ MailListener: Email credentials (EMAIL_USER) not set.")
+            return None
+        if self.error:
+            print(f"⚠️ MailListener: {self.error}")
+            return None
+
+        self._ensure_started()
+        waiter = _Waiter(match, hint, (since or datetime.now()).astimezone(), self._loop.create_future())
+        self._waiters.append(waiter)
+        try:
+            self._dispatch()
+            self._wake.set()
+            return await asyncio.wait_for(waiter.future, timeout or self.config.code_timeout)
+        except asyncio.TimeoutError:
+            return None
+        finally:
+            self._waiters.remove(waiter)
+
+    async def close(self) -> None:
+        # The flag as well as the cancel: wait_for() in 3.11 drops a cancel that lands as its read completes
+        self._closing = True
+        self._wake.set()
+        if self._task and not self._task.done():
+            self._task.cancel()
+            await asyncio.wait({self._task}, timeout=COMMAND_TIMEOUT)
+        self._task = None
+        # Nobody is left to deliver their codes
+        for waiter in self._waiters:
+            if not waiter.future.done():
+                waiter.future.set_result(None)
+        await self._disconnect(logout=True)
+
+    def _ensure_started(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # A new event loop (another CLI run in this process): the old session is unusable
+            self._loop, self._task, self._reader, self._writer = loop, None, None, None
+            self._waiters = []
+            self._wake = asyncio.Event()
+        if self._task is None or self._task.done():
+            self._closing = False
+            self._task = loop.create_task(self._run())
+
+    async def _run(self) -> None:
+        delay = 1.0
+        while not self._closing:
+            try:
+                await self._connect()
+                delay = 1.0
+                while not self._closing:
+                    self._wake.clear()
+                    await self._scan()
+                    if self.idle_supported:
+                        await self._idle()
+                    else:
+                        await self._poll()
+            except IMAPAuthError as e:
+                self.error = f"IMAP login failed: {e}"
+                print(f"❌ MailListener: {self.error}")
+                for waiter in self._waiters:
+                    if not waiter.future.done():
+                        waiter.future.set_result(None)
+                await self._disconnect()
+                return
+            except (OSError, EOFError, IMAPError, asyncio.TimeoutError, asyncio.IncompleteReadError) as e:
+                print(f"⚠️ MailListener: connection lost ({e}), reconnecting in {delay:.0f}s")
+                await self._disconnect()
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 60.0)
+
+    async def _connect(self) -> None:
+        context = ssl.create_default_context() if self.config.ssl else None
+        self._reader, self._writer = await asyncio.wait_for(
+            asyncio.open_connection(self.config.imap_host, self.config.imap_port, ssl=context), COMMAND_TIMEOUT
+        )
+        greeting = await asyncio.wait_for(self._read_line(), COMMAND_TIMEOUT)
+        if not greeting.startswith(b"* OK"):
+            raise IMAPError(greeting.decode(errors="replace").strip())
+
+        capabilities = b" ".join(r.text for r in await self._command("CAPABILITY")).upper()
+        self.idle_supported = b" IDLE" in capabilities
+        try:
+            await self._command(f"LOGIN {_quote(self.username)} {_quote(self.password)}")
+        except IMAPError as e:
+            raise IMAPAuthError(str(e)) from e
+
+        selected = b" ".join(r.text for r in await self._command(f"SELECT {_quote(self.config.mailbox)}"))
+        uidvalidity = UIDVALIDITY.search(selected)
+        uidvalidity = uidvalidity.group(1) if uidvalidity else None
+        if uidvalidity != self._uidvalidity:
+            # The mailbox was recreated: cached UIDs may now name other messages
+            self.messages.clear()
+            self._uidvalidity = uidvalidity
+
+    async def _disconnect(self, logout: bool = False) -> None:
+        writer, self._reader, self._writer = self._writer, None, None
+        if writer is None:
+            return
+        try:
+            if logout:
+                writer.write(f"{self._tag()} LOGOUT\r\n".encode())
+                await asyncio.wait_for(writer.drain(), 5)
+            writer.close()
+            await asyncio.wait_for(writer.wait_closed(), 5)
+        except Exception:
+            pass
+
+    def _tag(self) -> str:
+        self._tag_count += 1
+        return f"A{self._tag_count:04d}"
+
+    async def _send(self, line: str) -> None:
+        self._writer.write(line.encode() + b"\r\n")
+        await self._writer.drain()
+
+    async def _read_line(self) -> bytes:
+        line = await self._reader.readline()
+        if not line:
+            raise EOFError("IMAP server closed the connection")
+        return line
+
+    async def _read_response(self) -> _Response:
+        response = _Response([await self._read_line()])
+        while (literal := LITERAL.search(response.parts[-1])):
+            response.literals.append(await self._reader.readexactly(int(literal.group(1))))
+            response.parts.append(await self._read_line())
+        return response
+
+    async def _command(self, command: str) -> list[_Response]:
+        """Run ``command`` and return its untagged responses; raises IMAPError unless it ends OK."""
+        tag = self._tag()
+        await self._send(f"{tag} {command}")
+        untagged = []
+        while True:
+            response = await asyncio.wait_for(self._read_response(), COMMAND_TIMEOUT)
+            if response.parts[0].startswith(tag.encode() + b" "):
+                status = response.text[len(tag) + 1:]
+                if not status.startswith(b"OK"):
+                    raise IMAPError(f"{command.split()[0]}: {status.decode(errors='replace').strip()}")
+                return untagged
+            untagged.append(response)
+
+    async def _idle(self) -> None:
+        """IDLE until new mail arrives for a waiter, a waiter registers, or ``idle_seconds`` pass."""
+        tag = self._tag()
+        await self._send(f"{tag} IDLE")
+        response = await asyncio.wait_for(self._read_line(), COMMAND_TIMEOUT)
+        if not response.startswith(b"+"):
+            self.idle_supported = False
+            return
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.config.idle_seconds
+        pending = asyncio.ensure_future(self._read_line())
+        woken = asyncio.ensure_future(self._wake.wait())
+        try:
+            while True:
+                done, _ = await asyncio.wait(
+                    {pending, woken}, timeout=max(deadline - loop.time(), 0), return_when=asyncio.FIRST_COMPLETED
+                )
+                if pending not in done:
+                    break
+                line, pending = pending.result(), None
+                if line.rstrip().endswith(b"EXISTS") and self._waiters:
+                    break
+                pending = asyncio.ensure_future(self._read_line())
+
+            await self._send("DONE")
+            while True:
+                line = await asyncio.wait_for(pending or self._read_line(), COMMAND_TIMEOUT)
+                pending = None
+                if line.startswith(tag.encode() + b" "):
+                    return
+        finally:
+            woken.cancel()
+            if pending and not pending.done():
+                pending.cancel()
+
+    async def _poll(self) -> None:
+        try:
+            await asyncio.wait_for(self._wake.wait(), self.config.poll_seconds)
+        except asyncio.TimeoutError:
+            pass
+        await self._command("NOOP")
+
+    async def _scan(self) -> None:
+        """Fetch the mail the waiters could be waiting for that isn't cached yet, then hand out codes."""
+        waiters = [w for w in self._waiters if not w.future.done()]
+        if not waiters:
+            return
+        # SINCE compares dates in the server's time zone; a day early covers any offset
+        since = min(w.since for w in waiters) - timedelta(days=1)
+        terms = sorted({w.match for w in waiters})
+        found = await self._command(f"UID SEARCH SINCE {since:%d-%b-%Y} {_from_or_subject(terms)}")
+        uids = {int(uid) for r in found if r.text.startswith(b"* SEARCH") for uid in r.text.split()[2:]}
+        new = sorted(uid for uid in uids if uid not in self.messages)
+        if new:
+            fetched = await self._command(
+                f"UID FETCH {','.join(map(str, new))} (UID INTERNALDATE "
+                f"BODY.PEEK[HEADER.FIELDS ({HEADER_FIELDS})] BODY.PEEK[TEXT]<0.{self.config.body_bytes}>)"
+            )
+            for response in fetched:
+                message = self._parse_fetch(response)
+                if message:
+                    self.messages[message.uid] = message
+            for uid in sorted(self.messages)[:-CACHE_SIZE]:
+                del self.messages[uid]
+        self._dispatch()
+
+    @staticmethod
+    def _parse_fetch(response: _Response) -> Optional[MailMessage]:
+        text = response.text
+        uid, received = UID.search(text), INTERNALDATE.search(text)
+        if b" FETCH " not in response.parts[0] or not uid:
+            return None
+        sections = {}
+        for part, literal in zip(response.parts, response.literals):
+            key = LITERAL_KEY.search(part)
+            if key:
+                sections[key.group(1).split(b" ")[0].split(b".")[0]] = literal
+        header, body = sections.get(b"BODY[HEADER", b""), sections.get(b"BODY[TEXT]", b"")
+        msg = email.message_from_bytes(header.rstrip(b"\r\n") + b"\r\n\r\n" + body)
+        try:
+            when = datetime.strptime(received.group(1).decode().strip(), "%d-%b-%Y %H:%M:%S %z")
+        except (AttributeError, ValueError):
+            when = datetime.now().astimezone()
+        return MailMessage(
+            uid=int(uid.group(1)),
+            received=when,
+            sender=msg.get("From", ""),
+            subject=decode_subject(msg),
+            code=extract_verification_code(message_body(msg)),
+        )
+
+    def _dispatch(self) -> None:
+        """Give each unused code to a waiter it matches: one whose hint it mentions, else the longest waiting."""
+        for message in sorted(self.messages.values(), key=lambda m: m.uid):
+            if message.consumed or not message.code:
+                continue
+            haystack = f"{message.sender} {message.subject}".lower()
+            candidates = [
+                w for w in self._waiters
+                if not w.future.done() and w.match.lower() in haystack and message.received >= w.since - CLOCK_SKEW
+            ]
+            if not candidates:
+                continue
+            hinted = [w for w in candidates if w.hint and w.hint.lower() in haystack]
+            (hinted or candidates)[0].future.set_result(message.code)
+            message.consumed = True
+            print(f"📧 MailListener: Code from '{message.subject}'")
+
+
+_listener: Optional[VerificationListener] = None
+
+
+def get_mail_listener() -> VerificationListener:
+    global _listener
+    if _listener is None:
+        _listener = VerificationListener()
+    return _listener
+
+
+async def close_mail_listener() -> None:
+    if _listener is not None:
+        await _listener.close()
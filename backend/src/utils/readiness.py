@@ -0,0 +1,213 @@
+import asyncio
+import re
+import time
+from typing import Optional, Union
+from weakref import WeakKeyDictionary
+
+from playwright.async_api import Page, Frame
+
+from src.core.job import ApplicationType
+from src.utils.tracing import span
+
+
+# Element that only exists once the application form itself has rendered
+FORM_ROOTS = {
+    ApplicationType.GREENHOUSE: "#application-form, #application_form, form#application, input#first_name, iframe#grnhse_iframe",
+    ApplicationType.LEVER: "form#application-form, .application-form, input[name='name']",
+    ApplicationType.ASHBY: "input#_systemfield_name, input[name='_systemfield_name'], .ashby-application-form-container, a[href*='application']",
+    ApplicationType.WORKDAY: "[data-automation-id='adventureButton'], [data-automation-id='applyManually'], [data-automation-id='jobPostingHeader'], [data-automation-id='legalNameSection_firstName']",
+}
+
+# CSS-only (evaluated with querySelector) so they can be checked in-page
+SUBMIT_BUTTONS = {
+    ApplicationType.GREENHOUSE: "#submit_app, button[type='submit'], input[type='submit']",
+    ApplicationType.LEVER: "#btn-submit, button[type='submit']",
+    ApplicationType.ASHBY: "button.ashby-application-form-submit-button, button[type='submit']",
+    ApplicationType.WORKDAY: "[data-automation-id='bottom-navigation-next-button'], [data-automation-id='pageFooterNextButton']",
+}
+
+# XHRs that deliver the question set on client-rendered boards (Greenhouse and Lever render server-side)
+QUESTION_ENDPOINTS = {
+    ApplicationType.ASHBY: re.compile(r"non-user-graphql\?op=ApiJobPosting"),
+    ApplicationType.WORKDAY: re.compile(r"/wday/cxs/.+/job/"),
+}
+
+DOM_SETTLED_SCRIPT = """
+([quietMs, timeoutMs]) => new Promise(resolve => {
+    let timer;
+    const done = settled => { observer.disconnect(); clearTimeout(timer); clearTimeout(deadline); resolve(settled); };
+    const observer = new MutationObserver(() => { clearTimeout(timer); timer = setTimeout(() => done(true), quietMs); });
+    observer.observe(document, {childList: true, subtree: true, attributes: true, characterData: true});
+    timer = setTimeout(() => done(true), quietMs);
+    const deadline = setTimeout(() => done(false), timeoutMs);
+})
+"""
+
+SUBMIT_ENABLED_SCRIPT = """
+selector => {
+    const button = document.querySelector(selector);
+    return !!button && !button.disabled && button.getAttribute('aria-disabled') !== 'true';
+}
+"""
+
+# Something changed after a submit click: confirmation URL/text, an email-verification step, or a security code input
+SUBMISSION_OUTCOME_SCRIPT = """
+() => {
+    const url = location.href.toLowerCase();
+    if (url.includes('confirmation') || url.includes('success')) return true;
+    const text = ((document.body && document.body.innerText) || '').toLowerCase();
+    return ['thank you for applying', 'application received', 'application was received', 'application has been received',
+            'successfully submitted', 'verification code', 'security code'].some(p => text.includes(p))
+        || !!document.querySelector("input[id^='security-input-']");
+}
+"""
+
+# Suggestion / option lists of autocompletes and custom dropdowns
+OPTION_SELECTORS = ["li[role='option']", ".select2-results__option", ".ui-menu-item", ".autocomplete-suggestion", "div[role='option']"]
+
+Target = Union[Page, Frame]
+
+
+async def wait_for_dom_settled(target: Target, quiet_ms: int = 300, timeout: int = 5000) -> bool:
+    """True once no DOM mutation has happened for ``quiet_ms`` (False if that never happens within ``timeout``)."""
+    try:
+        return await target.evaluate(DOM_SETTLED_SCRIPT, [quiet_ms, timeout])
+    except Exception:
+        # Navigation mid-wait destroys the context; the new document still needs to load
+        try:
+            await target.wait_for_load_state("domcontentloaded", timeout=timeout)
+        except Exception:
+            pass
+        return False
+
+
+async def wait_for_form(target: Target, ats: Union[ApplicationType, str, None], timeout: int = 10000) -> bool:
+    selector = FORM_ROOTS.get(_ats(ats))
+    if not selector:
+        return await wait_for_dom_settled(target, timeout=timeout)
+    try:
+        await target.locator(selector).first.wait_for(state="visible", timeout=timeout)
+        return True
+    except Exception:
+        return False
+
+
+async def wait_for_submit_enabled(target: Target, ats: Union[ApplicationType, str, None] = None,
+                                  timeout: int = 5000, selector: Optional[str] = None) -> bool:
+    selector = selector or SUBMIT_BUTTONS.get(_ats(ats), "button[type='submit']")
+    try:
+        await target.wait_for_function(SUBMIT_ENABLED_SCRIPT, arg=selector, timeout=timeout)
+        return True
+    except Exception:
+        return False
+
+
+async def wait_for_submission_outcome(target: Target, timeout: int = 15000) -> bool:
+    """Return as soon as the page reacts to a submit (instead of sitting out the whole timeout)."""
+    try:
+        await target.wait_for_function(SUBMISSION_OUTCOME_SCRIPT, timeout=timeout)
+        return True
+    except Exception:
+        return False
+
+
+async def wait_for_options(target: Target, selectors: Optional[list[str]] = None, timeout: int = 3000) -> Optional[str]:
+    """Wait for an opened dropdown/autocomplete to show options; returns the selector that matched."""
+    selectors = selectors or OPTION_SELECTORS
+    try:
+        await target.locator(", ".join(f"{sel}:visible" for sel in selectors)).first.wait_for(state="attached", timeout=timeout)
+    except Exception:
+        return None
+    for sel in selectors:
+        if await target.locator(f"{sel}:visible").count() > 0:
+            return sel
+    return None
+
+
+class PageReadiness:
+    """
+    Waits on what a filler actually needs (form rendered, questions fetched,
+    DOM quiet) instead of fixed sleeps. Use ``get_readiness(page)`` so every
+    wait on a page shares the requests observed so far.
+    """
+
+    def __init__(self, page: Page):
+        self.page = page
+        self._finished: list[str] = []
+        self._request_done = asyncio.Event()
+        page.on("requestfinished", self._on_request_finished)
+
+    def _on_request_finished(self, request) -> None:
+        self._finished.append(request.url)
+        self._request_done.set()
+
+    @span("page.form_ready")
+    async def form_ready(self, ats: Union[ApplicationType, str, None], timeout: int = 10000) -> bool:
+        return await wait_for_form(self.page, ats, timeout=timeout)
+
+    @span("page.questions_loaded")
+    async def questions_loaded(self, ats: Union[ApplicationType, str, None], timeout: int = 10000) -> bool:
+        pattern = QUESTION_ENDPOINTS.get(_ats(ats))
+        if not pattern:
+            return True
+        deadline = time.monotonic() + timeout / 1000
+        while True:
+            if any(pattern.search(url) for url in self._finished + await self._resource_urls()):
+                return True
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            self._request_done.clear()
+            try:
+                await asyncio.wait_for(self._request_done.wait(), timeout=remaining)
+            except asyncio.TimeoutError:
+                return False
+
+    async def _resource_urls(self) -> list[str]:
+        # Resource timing also covers requests that completed before this tracker was attached
+        try:
+            return await self.page.evaluate("() => performance.getEntriesByType('resource').map(e => e.name)")
+        except Exception:
+            return []
+
+    @span("page.dom_settled")
+    async def dom_settled(self, quiet_ms: int = 300, timeout: int = 5000) -> bool:
+        return await wait_for_dom_settled(self.page, quiet_ms=quiet_ms, timeout=timeout)
+
+    @span("page.navigation_settled")
+    async def navigation_settled(self, timeout: int = 10000, quiet_ms: int = 300) -> bool:
+        """After a click that may navigate or open a redirect: wait for the document, then for the DOM to go quiet."""
+        try:
+            await self.page.wait_for_load_state("domcontentloaded", timeout=timeout)
+        except Exception:
+            pass
+        return await wait_for_dom_settled(self.page, quiet_ms=quiet_ms, timeout=timeout)
+
+    async def ready(self, ats: Union[ApplicationType, str, None], timeout: int = 10000) -> float:
+        """Form visible, questions fetched and DOM quiet; returns the seconds spent waiting."""
+        started = time.perf_counter()
+        await self.form_ready(ats, timeout=timeout)
+        await self.questions_loaded(ats, timeout=min(timeout, 5000))
+        await self.dom_settled(timeout=min(timeout, 5000))
+        return time.perf_counter() - started
+
+
+_trackers: "WeakKeyDictionary[Page, PageReadiness]" = WeakKeyDictionary()
+
+
+def get_readiness(page: Page) -> PageReadiness:
+    """One tracker per page, so waits after navigation see requests observed before it."""
+    tracker = _trackers.get(page)
+    if tracker is None:
+        tracker = PageReadiness(page)
+        _trackers[page] = tracker
+    return tracker
+
+
+def _ats(ats: Union[ApplicationType, str, None]) -> Optional[ApplicationType]:
+    if ats is None or isinstance(ats, ApplicationType):
+        return ats
+    try:
+        return ApplicationType(ats)
+    except ValueError:
+        return None
@@ -0,0 +1,208 @@
+import functools
+import inspect
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timedelta
+from typing import Optional
+
+from src.utils.config import get_settings
+
+
+# The trace of the application being filled in the current context, see trace_application()
+_trace: ContextVar[Optional["Trace"]] = ContextVar("trace", default=None)
+# Index (in the trace) of the innermost open span, the parent of the next one
+_parent: ContextVar[int] = ContextVar("trace_parent", default=-1)
+
+
+class Trace:
+    """The spans recorded while filling one application, in the order they started."""
+
+    def __init__(self, trace_id: str, application_type: str = ""):
+        self.trace_id = trace_id
+        self.application_type = application_type
+        self.started_at = datetime.now()
+        self.started = time.perf_counter()
+        self.spans: list[dict] = []
+
+    def rows(self, min_ms: float = 0.0) -> list[dict]:
+        """Finished spans as ``trace_spans`` rows; spans under ``min_ms`` (and so all their children) are dropped."""
+        application_type = getattr(self.application_type, "value", self.application_type) or ""
+        return [
+            {
+                "trace_id": self.trace_id, "application_type": application_type, "created_at": self.started_at,
+                "seq": seq, "parent": s["parent"], "depth": s["depth"], "name": s["name"],
+                "start_ms": round(s["start_ms"], 2), "duration_ms": round(s["duration_ms"], 2), "attrs": s["attrs"] or None,
+            }
+            for seq, s in enumerate(self.spans)
+            if s["duration_ms"] is not None and s["duration_ms"] >= min_ms
+        ]
+
+
+class span:
+    """
+    Time a block, or every call of the decorated (async) function, as a span of the
+    current application's trace. Outside a trace it records nothing.
+
+        with span("navigate", url=url):
+            ...
+
+        @span("form.ready")
+        async def wait_for_page_load(...): ...
+    """
+
+    __slots__ = ("name", "attrs", "_trace", "_record", "_token")
+
+    def __init__(self, name: str, **attrs):
+        self.name = name
+        self.attrs = attrs
+        self._trace: Optional[Trace] = None
+        self._record: Optional[dict] = None
+        self._token = None
+
+    def __enter__(self) -> "span":
+        trace = _trace.get()
+        if trace is None:
+            return self
+        parent = _parent.get()
+        self._record = {
+            "name": self.name,
+            "parent": parent,
+            "depth": trace.spans[parent]["depth"] + 1 if parent >= 0 else 0,
+            "start_ms": (time.perf_counter() - trace.started) * 1000,
+            "duration_ms": None,
+            "attrs": dict(self.attrs),
+        }
+        trace.spans.append(self._record)
+        self._trace = trace
+        self._token = _parent.set(len(trace.spans) - 1)
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        record = self._record
+        if record is None:
+            return
+        record["duration_ms"] = (time.perf_counter() - self._trace.started) * 1000 - record["start_ms"]
+        if exc_type is not None:
+            record["attrs"]["error"] = exc_type.__name__
+        _parent.reset(self._token)
+
+    def set(self, **attrs) -> None:
+        """Attach attributes learned inside the block (cache hit, status code, ...)."""
+        if self._record is not None:
+            self._record["attrs"].update(attrs)
+
+    def __call__(self, func):
+        name, attrs = self.name, self.attrs
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def traced(*args, **kwargs):
+                with span(name, **attrs):
+                    return await func(*args, **kwargs)
+        else:
+            @functools.wraps(func)
+            def traced(*args, **kwargs):
+                with span(name, **attrs):
+                    return func(*args, **kwargs)
+        return traced
+
+
+def annotate(**attrs) -> None:
+    """Attach attributes to the innermost open span, for code that didn't open it itself."""
+    trace = _trace.get()
+    parent = _parent.get()
+    if trace is not None and parent >= 0:
+        trace.spans[parent]["attrs"].update(attrs)
+
+
+@contextmanager
+def trace_application(trace_id: str, application_type: str = ""):
+    """
+    Trace everything awaited inside the block as one application, under a root
+    ``application`` span. The spans are written to ``trace_spans`` when it ends;
+    set ``trace.application_type`` inside the block if the platform changes.
+    """
+    config = get_settings().application.tracing
+    trace = Trace(trace_id, application_type)
+    if not config.enabled:
+        yield trace
+        return
+    token = _trace.set(trace)
+    try:
+        with span("application"):
+            yield trace
+    finally:
+        _trace.reset(token)
+        save_trace(trace, config.min_span_ms)
+
+
+def save_trace(trace: Trace, min_ms: float = 0.0) -> int:
+    from src.utils.database import get_db
+    try:
+        return get_db().add_trace_spans(trace.rows(min_ms))
+    except Exception as e:
+        print(f"⚠️ Could not save trace for {trace.trace_id}: {e}")
+        return 0
+
+
+def chrome_trace(rows: list[dict]) -> dict:
+    """
+    ``trace_spans`` rows as Chrome trace-event JSON (chrome://tracing, Perfetto): one
+    thread per application, spans as complete ("X") events on a shared wall clock.
+    """
+    events = []
+    threads: dict[str, int] = {}
+    for row in rows:
+        tid = threads.get(row["trace_id"])
+        if tid is None:
+            tid = threads[row["trace_id"]] = len(threads) + 1
+            events.append({
+                "name": "thread_name", "ph": "M", "pid": 1, "tid": tid,
+                "args": {"name": f"{row['application_type'] or 'unknown'} {row['trace_id']}"},
+            })
+        events.append({
+            "name": row["name"],
+            "cat": row["name"].split(".")[0],
+            "ph": "X",
+            "ts": int(row["created_at"].timestamp() * 1_000_000 + row["start_ms"] * 1000),
+            "dur": int(row["duration_ms"] * 1000),
+            "pid": 1,
+            "tid": tid,
+            "args": row["attrs"] or {},
+        })
+    return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(int(round(pct / 100 * (len(ordered) - 1))), len(ordered) - 1)]
+
+
+def span_breakdown(days: int = 7, max_depth: int = 2) -> dict[str, list[dict]]:
+    """
+    p50/p95 milliseconds of each span name per ATS over the last ``days`` days, from
+    spans at most ``max_depth`` below the root. A span name that occurs several times
+    in one application (hops, settles, LLM calls) counts once, with its total time.
+    """
+    from src.utils.database import get_db
+    rows = get_db().get_trace_spans(since=datetime.now() - timedelta(days=days), max_depth=max_depth)
+
+    totals: dict[tuple[str, str, str], float] = defaultdict(float)
+    for row in rows:
+        totals[(row["application_type"] or "unknown", row["name"], row["trace_id"])] += row["duration_ms"]
+    samples: dict[str, dict[str, list[float]]] = defaultdict(lambda: defaultdict(list))
+    for (ats, name, _), total in totals.items():
+        samples[ats][name].append(total)
+
+    return {
+        ats: sorted(
+            (
+                {"name": name, "count": len(values), "p50_ms": round(_percentile(values, 50), 1),
+                 "p95_ms": round(_percentile(values, 95), 1)}
+                for name, values in names.items()
+            ),
+            key=lambda stat: (stat["name"] != "application", -stat["p95_ms"]),
+        )
+        for ats, names in sorted(samples.items())
+    }
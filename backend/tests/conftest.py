@@ -0,0 +1,12 @@
+import pytest
+
+import src.utils.database as database
+from src.utils.database import Database
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch) -> Database:
+    """A fresh SQLite database, also served by get_db() for the duration of the test."""
+    test_db = Database(str(tmp_path / "test.db"))
+    monkeypatch.setattr(database, "_db", test_db)
+    return test_db
@@ -0,0 +1,185 @@
+import asyncio
+import re
+import threading
+from datetime import datetime, timedelta
+from email.message import EmailMessage
+from email.utils import format_datetime
+
+
+TOKEN = re.compile(rb'\(|\)|"(?:[^"\\]|\\.)*"|[^\s()]+')
+ATTACHMENT_BYTES = 200_000
+
+
+def build_mail(sender: str, subject: str, text: str, attachment: bool = False) -> bytes:
+    msg = EmailMessage()
+    msg["From"], msg["To"], msg["Subject"] = sender, "applicant@example.com", subject
+    msg["Date"] = format_datetime(datetime.now().astimezone())
+    msg.set_content(text)
+    msg.add_alternative(f"<html><body><p>{text}</p></body></html>", subtype="html")
+    if attachment:
+        msg.add_attachment(b"\0" * ATTACHMENT_BYTES, maintype="application", subtype="pdf", filename="digest.pdf")
+    return msg.as_bytes().replace(b"\n", b"\r\n")
+
+
+def digest_mail(n: int) -> bytes:
+    return build_mail("Job Alerts <alerts@example.com>", f"Weekly digest #{n}", "New jobs for you", attachment=True)
+
+
+def greenhouse_mail(company: str, code: str) -> bytes:
+    return build_mail(
+        "Greenhouse <no-reply@us.greenhouse-mail.io>",
+        f"Security code for your application to {company}",
+        f"Copy and paste this code into the security code field on your application: {code}",
+    )
+
+
+class FakeIMAPServer:
+    """
+    Just enough IMAP4rev1 for MailHandler (imaplib: SEARCH ALL, FETCH RFC822) and the
+    listener (UID SEARCH, partial UID FETCH, IDLE), over one INBOX. Counts what it sends.
+    """
+
+    def __init__(self, idle: bool = True):
+        self.idle = idle
+        self.mailbox: list[tuple[int, datetime, bytes]] = []
+        self.idlers: set[asyncio.StreamWriter] = set()
+        self.clients: set[asyncio.StreamWriter] = set()
+        self.bytes_sent = 0
+        self.connections = 0
+        self.commands = 0
+        # Its own loop on a thread, so MailHandler's blocking imaplib calls can reach it
+        self.loop = asyncio.new_event_loop()
+        threading.Thread(target=self.loop.run_forever, daemon=True).start()
+        start = asyncio.start_server(self.handle, "127.0.0.1", 0)
+        self.server = asyncio.run_coroutine_threadsafe(start, self.loop).result()
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    def stop(self) -> None:
+        self.loop.call_soon_threadsafe(self.loop.stop)
+
+    def drop_connections(self) -> None:
+        """Hang up on every client, as a server restart or a NAT timeout would."""
+        def drop():
+            for writer in list(self.clients):
+                writer.close()
+        self.loop.call_soon_threadsafe(drop)
+
+    def deliver(self, raw: bytes, received: datetime | None = None) -> None:
+        def add():
+            uid = len(self.mailbox) + 1
+            self.mailbox.append((uid, received or datetime.now().astimezone(), raw))
+            for writer in self.idlers:
+                self.write(writer, f"* {len(self.mailbox)} EXISTS\r\n".encode())
+        self.loop.call_soon_threadsafe(add)
+
+    def write(self, writer: asyncio.StreamWriter, data: bytes) -> None:
+        self.bytes_sent += len(data)
+        writer.write(data)
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        self.clients.add(writer)
+        self.write(writer, b"* OK fake IMAP ready\r\n")
+        try:
+            while line := await reader.readline():
+                self.commands += 1
+                tag, _, rest = line.rstrip(b"\r\n").partition(b" ")
+                verb, _, args = rest.partition(b" ")
+                verb = verb.upper()
+                if verb == b"UID":
+                    verb, _, args = args.partition(b" ")
+                    verb, by_uid = b"UID " + verb.upper(), True
+                else:
+                    by_uid = False
+                if verb == b"IDLE":
+                    self.idlers.add(writer)
+                    self.write(writer, b"+ idling\r\n")
+                    await reader.readline()  # DONE
+                    self.idlers.discard(writer)
+                elif verb == b"CAPABILITY":
+                    self.write(writer, b"* CAPABILITY IMAP4rev1" + (b" IDLE" if self.idle else b"") + b"\r\n")
+                elif verb == b"SELECT":
+                    self.write(writer, f"* {len(self.mailbox)} EXISTS\r\n* OK [UIDVALIDITY 1]\r\n"
+                                       f"* OK [UIDNEXT {len(self.mailbox) + 1}]\r\n".encode())
+                elif verb.endswith(b"SEARCH"):
+                    match = self.criteria(TOKEN.findall(args))
+                    hits = [str(uid if by_uid else i + 1) for i, (uid, *_) in enumerate(self.mailbox) if match(i)]
+                    self.write(writer, b"* SEARCH " + " ".join(hits).encode() + b"\r\n")
+                elif verb.endswith(b"FETCH"):
+                    ids, _, items = args.partition(b" ")
+                    wanted = {int(x) for x in ids.split(b",")}
+                    for i, (uid, received, raw) in enumerate(self.mailbox):
+                        if (uid if by_uid else i + 1) in wanted:
+                            self.write(writer, self.fetch(i + 1, uid, received, raw, items.upper()))
+                elif verb == b"LOGOUT":
+                    self.write(writer, b"* BYE\r\n")
+                # LOGIN, NOOP: nothing to report
+                self.write(writer, tag + b" OK " + verb + b" completed\r\n")
+                await writer.drain()
+                if verb == b"LOGOUT":
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            self.idlers.discard(writer)
+            self.clients.discard(writer)
+            writer.close()
+
+    def criteria(self, tokens: list[bytes]):
+        """SEARCH keys as a predicate on the message index: ALL, SINCE, FROM, SUBJECT, OR, ( )."""
+        def parse():
+            token = tokens.pop(0)
+            key = token.upper()
+            if token == b"(":
+                group = []
+                while tokens[0] != b")":
+                    group.append(parse())
+                tokens.pop(0)
+                return lambda i: all(p(i) for p in group)
+            if key == b"OR":
+                left, right = parse(), parse()
+                return lambda i: left(i) or right(i)
+            if key == b"SINCE":
+                day = datetime.strptime(tokens.pop(0).decode(), "%d-%b-%Y").date()
+                return lambda i: self.mailbox[i][1].date() >= day
+            if key in (b"FROM", b"SUBJECT"):
+                needle, field = tokens.pop(0).strip(b'"').lower(), key
+                return lambda i: needle in self.header(self.mailbox[i][2], field).lower()
+            return lambda i: True  # ALL
+        keys = []
+        while tokens:
+            keys.append(parse())
+        return lambda i: all(k(i) for k in keys)
+
+    @staticmethod
+    def header(raw: bytes, name: bytes) -> bytes:
+        head = raw.split(b"\r\n\r\n", 1)[0]
+        found = re.search(rb"^" + name + rb":(.*)$", head, re.IGNORECASE | re.MULTILINE)
+        return found.group(1).strip() if found else b""
+
+    def fetch(self, seq: int, uid: int, received: datetime, raw: bytes, items: bytes) -> bytes:
+        head, text = raw.split(b"\r\n\r\n", 1)
+        out = [f"* {seq} FETCH (UID {uid}".encode()]
+        if b"INTERNALDATE" in items:
+            out.append(f' INTERNALDATE "{received:%d-%b-%Y %H:%M:%S %z}"'.encode())
+        if b"RFC822" in items:
+            out.append(f" RFC822 {{{len(raw)}}}\r\n".encode() + raw)
+        fields = re.search(rb"HEADER\.FIELDS \(([^)]*)\)", items)
+        if fields:
+            # One entry per field, folded continuation lines included
+            headers = re.split(rb"\r\n(?=[^ \t])", head)
+            names = fields.group(1).split()
+            section = b"".join(h + b"\r\n" for h in headers if h.split(b":")[0].upper() in names) + b"\r\n"
+            out.append(b" BODY[HEADER.FIELDS (" + fields.group(1) + b")] {%d}\r\n" % len(section) + section)
+        partial = re.search(rb"TEXT\]<0\.(\d+)>", items)
+        if partial:
+            section = text[:int(partial.group(1))]
+            out.append(b" BODY[TEXT]<0> {%d}\r\n" % len(section) + section)
+        return b"".join(out) + b")\r\n"
+
+
+def seed(server: FakeIMAPServer, messages: int = 12) -> None:
+    """An inbox of newsletters with attachments, and yesterday's code for another application."""
+    for n in range(messages):
+        server.deliver(digest_mail(n))
+    server.deliver(greenhouse_mail("OldCo", "old7Code"), datetime.now().astimezone() - timedelta(days=1))
@@ -0,0 +1,39 @@
+# Labels as they appear on Greenhouse, Lever, Ashby and Workday forms, with the
+# profile field they should map to (None: not a profile field, must stay unmapped)
+CORPUS = [
+    ("First Name", "first_name"), ("First Name*", "first_name"), ("Legal First Name", "first_name"),
+    ("Preferred First Name", "first_name"), ("Given Name(s)", "first_name"),
+    ("Last Name", "last_name"), ("Last Name *", "last_name"), ("Legal Last Name", "last_name"),
+    ("Surname / Family Name", "last_name"),
+    ("Full name", "full_name"), ("Name", "full_name"), ("Your Name", "full_name"), ("Full Legal Name", "full_name"),
+    ("Email", "email"), ("Email Address*", "email"), ("E-mail", "email"), ("Your email", "email"),
+    ("Phone", "phone"), ("Phone Number", "phone"), ("Mobile Phone Number", "phone"), ("Cell", "phone"),
+    ("Phone number (including country code)", "phone"), ("Telephone", "phone"),
+    ("Address", "street"), ("Street Address", "street"), ("Address Line 1", "street"),
+    ("City", "city"), ("Current City", "city"), ("Location (City)", "city"),
+    ("State", "state"), ("State/Province", "state"),
+    ("Zip Code", "zip"), ("Postal Code", "zip"), ("ZIP / Postal Code", "zip"),
+    ("Country", "country"), ("Country of Residence", "country"),
+    ("LinkedIn Profile", "linkedin"), ("LinkedIn URL", "linkedin"), ("Linkedin", "linkedin"),
+    ("GitHub URL", "github"), ("Github Profile", "github"),
+    ("Portfolio", "portfolio"), ("Portfolio URL", "portfolio"), ("Website", "website"),
+    ("Personal Website", "website"), ("Other Website", "website"),
+    ("Are you legally authorized to work in the United States?", "authorized_us"),
+    ("Are you authorized to work in the US?", "authorized_us"), ("Work Authorization", "authorized_us"),
+    ("Will you now or in the future require sponsorship for employment visa status (e.g. H-1B)?",
+     "requires_sponsorship"),
+    ("Do you require visa sponsorship?", "requires_sponsorship"),
+    ("Gender", "gender"), ("Veteran Status", "veteran_status"), ("Disability Status", "disability_status"),
+    ("Race/Ethnicity", "ethnicity"), ("Are you Hispanic/Latino?", "ethnicity"),
+    ("Company Name", None), ("Current Company", None), ("Current Employer", None), ("School Name", None),
+    ("Name of your university", None), ("Reference Name", None), ("Who referred you to this role?", None),
+    ("Do you have experience building mobile apps?", None), ("Describe your mobile development experience", None),
+    ("How did you hear about us?", None), ("Why do you want to work at Stripe?", None),
+    ("Tell us about a project you're proud of and what your role was in it", None),
+    ("Cover Letter", None), ("Additional Information", None), ("Preferred Pronouns", None),
+    ("What are your salary expectations?", None), ("Earliest start date", None), ("Notice period", None),
+    ("Years of professional experience", None), ("Current Job Title", None),
+    ("What name should we use for you in the interview process, and how do you pronounce it?", None),
+    ("Country code", None), ("Anything else you'd like to share with the hiring team?", None),
+    ("Please describe your experience with distributed systems", None),
+]
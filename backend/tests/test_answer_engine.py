@@ -0,0 +1,56 @@
+from pathlib import Path
+
+import pytest
+
+from src.core.job import Job
+from src.core.profile_snapshot import load_profile
+from src.fillers.answer_engine import AnswerEngine
+from src.fillers.universal_filler import UniversalFiller
+from src.utils.config import get_settings
+
+
+EXAMPLE_PROFILE = Path(__file__).resolve().parents[2] / "data" / "profile.example.json"
+
+
+class LocalModel:
+    """Answers long questions only, like a small local model asked within its depth."""
+
+    def __init__(self):
+        self.contexts: list[str] = []
+
+    async def suggest_field_value(self, label: str, applicant_context: str):
+        self.contexts.append(applicant_context)
+        return None
+
+    async def select_best_option(self, options: list[str], label: str, applicant_context: str):
+        return None
+
+    async def answer_application_question(self, question: str, job_title: str, company: str,
+                                          applicant_context: str, max_length: int = 500):
+        return f"I would love to build {job_title} things at {company}."
+
+
+@pytest.fixture
+def filler(db, monkeypatch):
+    monkeypatch.setattr(get_settings().llm, "batch_questions", True)
+    filler = UniversalFiller(load_profile(EXAMPLE_PROFILE).applicant, llm_client=None)
+    filler.field_mapper.engine = AnswerEngine(filler.field_mapper, llm_client=None, local_client=LocalModel())
+    return filler
+
+
+async def test_prepare_answers_without_gemini(filler):
+    job = Job(id="job-1", title="Backend Engineer", company="Acme", url="https://example.com/job-1")
+    questions = [
+        {"label": "Describe a system you scaled and what you learned", "kind": "textarea", "options": []},
+        {"label": "Favourite internal tool codename", "kind": "input", "options": []},
+    ]
+    # The local model answers the long question; nothing goes to the (absent) Gemini batch
+    assert await filler.prepare_answers(questions, job) == 1
+    assert len(filler.prepared_answers) == 1
+
+
+async def test_model_tier_gets_the_applicant_context(filler):
+    job = Job(id="job-1", title="Backend Engineer", company="Acme", url="https://example.com/job-1")
+    local = filler.field_mapper.engine.tiers["local"].client
+    await filler.prepare_answers([{"label": "Favourite internal tool codename", "kind": "input", "options": []}], job)
+    assert local.contexts == [filler.field_mapper.applicant_context()]
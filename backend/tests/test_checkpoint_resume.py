@@ -0,0 +1,116 @@
+from pathlib import Path
+
+import pytest
+
+import src.fillers.checkpoint as checkpoint
+import src.fillers.universal_filler as universal_filler
+from src.core.application import Application
+from src.core.job import Job
+from src.core.profile_snapshot import load_profile
+from src.fillers.checkpoint import CheckpointStore
+from src.fillers.universal_filler import UniversalFiller
+
+
+EXAMPLE_PROFILE = Path(__file__).resolve().parents[2] / "data" / "profile.example.json"
+PAGES = ["https://jobs.example.com/apply/1", "https://jobs.example.com/apply/2", "https://jobs.example.com/apply/3"]
+
+
+class FakeContext:
+    async def storage_state(self) -> dict:
+        return {"cookies": [{"name": "session", "value": "abc", "domain": "jobs.example.com", "path": "/"}], "origins": []}
+
+    async def add_cookies(self, cookies: list) -> None:
+        self.cookies = cookies
+
+
+class FakePage:
+    """A three-page application: one field per page, Continue moves to the next URL."""
+
+    def __init__(self):
+        self.url = PAGES[0]
+        self.context = FakeContext()
+
+    async def goto(self, url: str, **kwargs) -> None:
+        self.url = url
+
+    async def add_init_script(self, script: str) -> None:
+        pass
+
+
+class ScriptedFiller(UniversalFiller):
+    """UniversalFiller's page loop over FakePage, counting the pages it reads and the LLM mappings it asks for."""
+
+    def __init__(self, applicant, crash_on_page: int = 0):
+        super().__init__(applicant, llm_client=object())
+        self.crash_on_page = crash_on_page
+        self.pages_read: list[int] = []
+        self.llm_calls = 0
+
+    @staticmethod
+    def page_number(page: FakePage) -> int:
+        return PAGES.index(page.url) + 1 if page.url in PAGES else 0
+
+    async def wait_for_page_load(self, page, timeout: int = 10000) -> None:
+        pass
+
+    async def _extract_form_elements(self, page):
+        number = self.page_number(page)
+        if not number:
+            return []
+        self.pages_read.append(number)
+        return [{"id": f"q{number}", "label": f"Question {number}"}]
+
+    async def _get_llm_mappings(self, elements, job):
+        self.llm_calls += 1
+        return {el["id"]: f"answer {el['id']}" for el in elements}
+
+    async def _apply_value(self, page, element_id: str, value) -> bool:
+        if self.page_number(page) == self.crash_on_page:
+            raise RuntimeError("browser crashed")
+        return True
+
+    async def _find_and_click_action_button(self, page) -> bool:
+        number = self.page_number(page)
+        if not number:
+            return False
+        page.url = PAGES[number] if number < len(PAGES) else "https://jobs.example.com/confirmation"
+        return True
+
+    async def _check_success(self, page) -> bool:
+        return "confirmation" in page.url
+
+
+class NoReadiness:
+    async def navigation_settled(self) -> bool:
+        return True
+
+
+@pytest.fixture
+def applicant(db, monkeypatch):
+    monkeypatch.setattr(checkpoint, "_checkpoints", CheckpointStore(db, enabled=True))
+    monkeypatch.setattr(universal_filler, "get_readiness", lambda page: NoReadiness())
+    return load_profile(EXAMPLE_PROFILE).applicant
+
+
+async def test_retry_resumes_after_the_completed_pages(db, applicant):
+    job = Job(id="job-1", title="Engineer", company="Acme", url=PAGES[0])
+
+    crashed = ScriptedFiller(applicant, crash_on_page=3)
+    assert not await crashed.fill(FakePage(), job, Application(job_id=job.id))
+    assert crashed.pages_read == [1, 2, 3]
+    saved = db.get_checkpoint(job.id)
+    assert (saved["step"], saved["page_url"]) == (2, PAGES[2])
+    assert saved["answers"] == {"Question 1": "answer q1", "Question 2": "answer q2"}
+
+    retry = ScriptedFiller(applicant)
+    application = Application(job_id=job.id)
+    page = FakePage()
+    assert await retry.fill(page, job, application)
+    # Pages 1 and 2 are neither read nor sent to the LLM again
+    assert retry.pages_read == [3]
+    assert retry.llm_calls == 1
+    assert page.context.cookies == saved["storage_state"]["cookies"]
+    assert application.logs[1].action == "resumed"
+
+    retry.finish(success=True)
+    assert db.get_checkpoint(job.id) is None
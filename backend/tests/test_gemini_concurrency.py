@@ -0,0 +1,94 @@
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import google.generativeai as genai
+import pytest
+
+from src.llm.gemini import GeminiClient, RateLimiter
+from src.llm.response_cache import ResponseCache
+from src.llm.usage_ledger import UsageLedger
+
+
+STUB_LATENCY_S = 0.2
+REQUESTS = 10
+TICK_S = 0.01
+# Worst a 10ms ticker may oversleep while the requests run; one blocking call would cost STUB_LATENCY_S
+MAX_LAG_S = 0.1
+
+
+class StubGemini(BaseHTTPRequestHandler):
+    """Answers generateContent over REST after a fixed delay, like a slow model would."""
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        time.sleep(STUB_LATENCY_S)
+        body = json.dumps({
+            "candidates": [{"content": {"role": "model", "parts": [{"text": "ok"}]}, "finishReason": "STOP", "index": 0}],
+        }).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def client(db):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubGemini)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    client = GeminiClient(api_key="stub", max_concurrent=REQUESTS)
+    client.rate_limiter = RateLimiter(UsageLedger(db))
+    client.cache = ResponseCache(db)
+    # Point the SDK at the stub before the model makes its first call
+    genai.configure(api_key="stub", transport="rest",
+                    client_options={"api_endpoint": f"http://127.0.0.1:{server.server_address[1]}"})
+    yield client
+    server.shutdown()
+
+
+async def measure_lag(work) -> tuple[float, float]:
+    """Run ``work`` while a ticker wakes every TICK_S; returns (seconds taken, worst tick overshoot)."""
+    worst = 0.0
+    done = asyncio.Event()
+
+    async def ticker():
+        nonlocal worst
+        while not done.is_set():
+            expected = time.perf_counter() + TICK_S
+            await asyncio.sleep(TICK_S)
+            worst = max(worst, time.perf_counter() - expected)
+
+    tick = asyncio.create_task(ticker())
+    await asyncio.sleep(0)  # the ticker's first sleep has to start before work can block it
+    started = time.perf_counter()
+    await work()
+    elapsed = time.perf_counter() - started
+    done.set()
+    await tick
+    return elapsed, worst
+
+
+async def test_generate_keeps_the_loop_responsive(client):
+    async def generate():
+        results = await asyncio.gather(*(client.generate(f"ping {n}", max_tokens=5) for n in range(REQUESTS)))
+        assert results == ["ok"] * REQUESTS
+
+    elapsed, worst = await measure_lag(generate)
+    assert worst < MAX_LAG_S, f"event loop stalled {worst * 1000:.0f}ms during Gemini calls"
+    # The calls overlap on the thread pool instead of running one after another
+    assert elapsed < STUB_LATENCY_S * REQUESTS / 2
+
+
+async def test_blocking_call_is_detected(client):
+    # What GeminiClient.generate used to do; guards against the check above passing vacuously
+    async def inline():
+        client.model.generate_content("ping")
+
+    _, worst = await measure_lag(inline)
+    assert worst >= MAX_LAG_S
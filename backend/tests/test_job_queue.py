@@ -0,0 +1,66 @@
+from datetime import datetime, timedelta
+
+from src.core.job import Job, JobStatus
+from src.utils.database import JobQueueModel
+
+
+def add_job(db, job_id: str = "job-1") -> str:
+    return db.add_job(Job(id=job_id, title="Software Engineer", company="Acme", url=f"https://example.com/{job_id}"))
+
+
+def expire_lease(db, job_id: str) -> None:
+    with db.session() as session:
+        session.query(JobQueueModel).filter(JobQueueModel.job_id == job_id).update(
+            {JobQueueModel.lease_expires_at: datetime.now() - timedelta(seconds=1)}
+        )
+
+
+def test_a_claimed_job_goes_to_one_worker(db):
+    add_job(db)
+    assert db.claim_next("w1").id == "job-1"
+    assert db.claim_next("w2") is None
+    assert db.get_job("job-1").status == JobStatus.IN_PROGRESS
+
+
+def test_only_the_holder_can_release(db):
+    add_job(db)
+    db.claim_next("w1")
+    expire_lease(db, "job-1")
+    assert db.claim_next("w2").id == "job-1"
+
+    assert not db.release_claim("job-1", "w1")
+    assert db.get_job("job-1").status == JobStatus.IN_PROGRESS
+    assert db.release_claim("job-1", "w2")
+    assert db.get_job("job-1").status == JobStatus.QUEUED
+
+
+def test_retry_waits_for_retry_at(db):
+    add_job(db)
+    db.claim_next("w1")
+    db.schedule_retry("job-1", datetime.now() + timedelta(hours=1), "transient")
+    db.release_claim("job-1", "w1")
+    assert db.claim_next("w2") is None
+    assert db.claim_next("w2", job_id="job-1", force=True).id == "job-1"
+
+    db.release_claim("job-1", "w2")
+    db.schedule_retry("job-1", datetime.now() - timedelta(seconds=1), "transient")
+    assert db.claim_next("w2").id == "job-1"
+
+
+def test_job_whose_lease_keeps_expiring_is_parked(db):
+    add_job(db)
+    for _ in range(3):
+        assert db.claim_next("w1").id == "job-1"
+        expire_lease(db, "job-1")
+    assert db.claim_next("w2") is None
+    assert db.get_job("job-1").status == JobStatus.FAILED
+
+
+def test_clean_releases_do_not_count_towards_parking(db):
+    add_job(db)
+    for _ in range(4):
+        db.claim_next("w1")
+        db.release_claim("job-1", "w1")
+    db.claim_next("w1")
+    expire_lease(db, "job-1")
+    assert db.claim_next("w2").id == "job-1"
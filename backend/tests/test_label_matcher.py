@@ -0,0 +1,36 @@
+from src.core.applicant import Applicant
+from src.fillers.field_mapper import FieldMapper
+from src.fillers.label_matcher import LabelMatcher
+from tests.label_corpus import CORPUS
+
+
+# Share of corpus labels classified exactly as expected (a field, or unmapped)
+MIN_ACCURACY = 0.95
+# Share of mapped labels that went to the right field: a wrong mapping fills a form
+# with the wrong data, an unmapped label only costs an LLM call
+MIN_PRECISION = 0.98
+
+
+def classify() -> list[tuple[str, str | None, str | None]]:
+    matcher = LabelMatcher(Applicant(), FieldMapper.FIELD_MAPPINGS)
+    matches = matcher.classify([label for label, _ in CORPUS])
+    return [(label, expected, match.field if match else None) for (label, expected), match in zip(CORPUS, matches)]
+
+
+def test_corpus_accuracy():
+    results = classify()
+    wrong = [(label, expected, got) for label, expected, got in results if got != expected]
+    accuracy = 1 - len(wrong) / len(results)
+    assert accuracy >= MIN_ACCURACY, f"accuracy {accuracy:.1%}, misclassified: {wrong}"
+
+
+def test_mapped_labels_are_precise():
+    mapped = [(label, expected, got) for label, expected, got in classify() if got]
+    wrong = [result for result in mapped if result[1] != result[2]]
+    precision = 1 - len(wrong) / len(mapped)
+    assert precision >= MIN_PRECISION, f"precision {precision:.1%}, wrong fields: {wrong}"
+
+
+def test_non_profile_questions_stay_unmapped():
+    leaked = [(label, got) for label, expected, got in classify() if expected is None and got]
+    assert not leaked
@@ -0,0 +1,77 @@
+import asyncio
+import time
+from datetime import datetime
+
+import pytest
+
+from src.utils.config import get_settings
+from src.utils.mail_listener import VerificationListener
+from tests.fake_imap import FakeIMAPServer, digest_mail, greenhouse_mail, seed
+
+
+async def until(condition, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out waiting on the fake IMAP server"
+        await asyncio.sleep(0.02)
+
+
+@pytest.fixture
+def server(monkeypatch):
+    """A seeded fake IMAP server that the listener's settings point at."""
+    server = FakeIMAPServer()
+    seed(server, messages=3)
+    settings = get_settings()
+    monkeypatch.setattr(settings, "email_user", "applicant@example.com")
+    monkeypatch.setattr(settings, "email_password", "secret")
+    monkeypatch.setattr(settings.mail, "imap_host", "127.0.0.1")
+    monkeypatch.setattr(settings.mail, "imap_port", server.port)
+    monkeypatch.setattr(settings.mail, "ssl", False)
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+async def listener(server):
+    listener = VerificationListener()
+    yield listener
+    await listener.close()
+
+
+async def test_code_delivered_during_idle(server, listener):
+    waiter = asyncio.ensure_future(listener.wait_for_code(hint="Acme", since=datetime.now(), timeout=10))
+    await until(lambda: server.idlers)
+    server.deliver(greenhouse_mail("Acme", "ugHJ9pif"))
+    server.deliver(digest_mail(99))
+    assert await waiter == "ugHJ9pif"
+    assert server.connections == 1
+
+
+async def test_reconnects_after_a_dropped_connection(server, listener):
+    waiter = asyncio.ensure_future(listener.wait_for_code(hint="Acme", since=datetime.now(), timeout=10))
+    await until(lambda: server.idlers)
+    server.drop_connections()
+    await until(lambda: server.connections == 2 and server.idlers)
+    server.deliver(greenhouse_mail("Acme", "ugHJ9pif"))
+    assert await waiter == "ugHJ9pif"
+
+
+async def test_concurrent_waiters_get_their_own_codes(server, listener):
+    since = datetime.now()
+    waits = asyncio.gather(
+        listener.wait_for_code(hint="Globex", since=since, timeout=10),
+        listener.wait_for_code(hint="Initech", since=since, timeout=10),
+    )
+    await until(lambda: server.idlers)
+    server.deliver(greenhouse_mail("Initech", "init3ch9"))
+    server.deliver(greenhouse_mail("Globex", "glob3x42"))
+    assert await waits == ["glob3x42", "init3ch9"]
+
+
+async def test_close_releases_a_pending_waiter(server, listener):
+    waiter = asyncio.ensure_future(listener.wait_for_code(hint="Acme", since=datetime.now(), timeout=30))
+    await until(lambda: server.idlers)
+    started = time.monotonic()
+    await listener.close()
+    assert await asyncio.wait_for(waiter, 5) is None
+    assert time.monotonic() - started < 5
@@ -0,0 +1,33 @@
+from pathlib import Path
+
+from src.core.profile_snapshot import CONTEXT_VARIANTS, estimate_tokens, fit_to_budget, load_profile
+
+
+EXAMPLE_PROFILE = Path(__file__).resolve().parents[2] / "data" / "profile.example.json"
+
+
+def test_variants_stay_within_budget():
+    snapshot = load_profile(EXAMPLE_PROFILE)
+    for name, (budget, _) in CONTEXT_VARIANTS.items():
+        assert snapshot.tokens[name] <= budget, name
+
+
+def test_form_context_keeps_the_full_profile():
+    snapshot = load_profile(EXAMPLE_PROFILE)
+    applicant, context = snapshot.applicant, snapshot.context("form")
+    job, project = applicant.experience[0], applicant.projects[0]
+    for expected in (job.description, job.highlights[0], job.technologies[0], project.name, project.description,
+                     applicant.skills.soft_skills[0], applicant.skills.all_technical[0]):
+        assert expected in context
+
+
+def test_overlong_line_does_not_drop_later_sections():
+    context = fit_to_budget(["Name: Ada", "Work History:\n- " + "x" * 2000, "Skills: Python, SQL"], 100)
+    assert context.startswith("Name: Ada\nWork History:\n- xxx")
+    assert context.endswith("Skills: Python, SQL")
+    assert estimate_tokens(context) <= 100
+
+
+def test_heading_without_items_is_dropped():
+    context = fit_to_budget(["Name: Ada", "Projects:\n- " + "x" * 2000], 10)
+    assert context == "Name: Ada"
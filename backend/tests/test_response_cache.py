@@ -0,0 +1,32 @@
+from datetime import datetime, timedelta
+
+from src.llm.response_cache import ResponseCache
+
+
+def test_counters_survive_expiry_and_eviction(db):
+    cache = ResponseCache(db)
+    cache.ttl = timedelta(seconds=-1)  # everything stored is already expired
+    key = cache.key("model", "prompt", None, 10, 0.0)
+    cache.put(key, "answer")
+    assert cache.get(key) is None  # expired: deleted, counted as a miss
+
+    cache.ttl = timedelta(hours=1)
+    cache.put(key, "answer")
+    assert cache.get(key) == "answer"
+    assert cache.get(key) == "answer"
+    cache.bypass()
+    # LRU eviction of every entry keeps the counts
+    db.put_llm_cache(cache.key("model", "other", None, 10, 0.0), "x", max_entries=0)
+
+    assert db.get_llm_cache_stats()["hits"] == 0  # counted in memory until the next flush
+    stored = cache.get_stats()["stored"]
+    assert (stored["hits"], stored["misses"], stored["bypassed"], stored["entries"]) == (2, 1, 1, 0)
+    assert cache.stats == {"hits": 2, "misses": 1, "bypassed": 1}
+
+
+def test_counters_are_per_day(db):
+    cache = ResponseCache(db)
+    cache.get("missing")
+    cache.flush()
+    assert db.get_llm_cache_stats(datetime.now() + timedelta(days=1))["misses"] == 0
+    assert db.get_llm_cache_stats()["misses"] == 1
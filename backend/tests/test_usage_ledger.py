@@ -0,0 +1,42 @@
+from datetime import date, datetime, timedelta
+
+import src.llm.usage_ledger as usage_ledger
+from src.llm.usage_ledger import UsageLedger
+
+
+def count_queries(db, monkeypatch) -> list:
+    calls = []
+    query = db.get_llm_usage_totals
+    monkeypatch.setattr(db, "get_llm_usage_totals", lambda since: calls.append(since) or query(since))
+    return calls
+
+
+def test_totals_are_seeded_once_and_kept_in_memory(db, monkeypatch):
+    db.add_llm_usage([{"created_at": datetime.now(), "call_site": "earlier", "model": "m",
+                       "input_tokens": 10, "output_tokens": 5, "total_tokens": 15, "seconds": 0.0}])
+    queries = count_queries(db, monkeypatch)
+    ledger = UsageLedger(db)
+    assert ledger.totals() == {"daily_requests": 1, "monthly_tokens": 15}
+
+    ledger.record("generate", "m", 100, 20)
+    ledger.flush()
+    ledger.record("generate", "m", 1, 1)
+    assert ledger.totals() == {"daily_requests": 3, "monthly_tokens": 137}
+    assert len(queries) == 2  # the day and the month, both at seeding
+
+
+def test_totals_roll_over_with_the_day_and_month(db, monkeypatch):
+    ledger = UsageLedger(db)
+    ledger.totals()
+    ledger.record("generate", "m", 100, 20)
+    today = date.today()
+
+    class Tomorrow(date):
+        @classmethod
+        def today(cls):
+            return today + timedelta(days=1)
+
+    monkeypatch.setattr(usage_ledger, "date", Tomorrow)
+    totals = ledger.totals()
+    assert totals["daily_requests"] == 0
+    assert totals["monthly_tokens"] == (0 if (today + timedelta(days=1)).day == 1 else 120)